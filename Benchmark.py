@@ -0,0 +1,400 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import collections, glob, json, os, platform, shutil, subprocess, sys, tempfile, time
+from timeit import default_timer as timer
+
+import Instrumentation, ShaderLexer, ShaderUtility, ShaderVisitor
+from ShaderParser import ShaderParser, NodeInterner
+from ShaderCache import ShaderCache
+from ShaderUtility import Preprocess, PreprocessBatch
+from GLESEnum import Enum
+from GLESContext import Context as GLES
+from Tools.TextureCollector import TextureCollector
+from Tools.ShaderCollector import ShaderCollector
+
+DRAWCALL_NAMES = ('glDrawArrays', 'glDrawElements')
+
+# realistic shaders, taken from captured applications
+VERTEX_SHADER = '''#version 300 es
+uniform highp mat4 mvp;
+uniform highp mat4 mv;
+uniform highp mat4 shadow_matrix0;
+
+in vec3 in_position;
+
+out vec4 out_pos;
+out vec4 shadow_texcoord;
+
+void main()
+{
+    gl_Position = mvp * vec4( in_position, 1.0);
+
+    out_pos.xyz = in_position;
+    out_pos.w = -vec4(mv * vec4( in_position, 1.0)).z;
+    shadow_texcoord = shadow_matrix0 * vec4( in_position, 1.0);
+}'''
+
+FRAGMENT_SHADER = '''#version 300 es
+#ifdef GL_ES
+precision mediump float;
+#endif
+in vec2 out_texcoord0;
+out vec4 frag_color;
+
+uniform lowp sampler2D texture_unit0;
+uniform lowp vec3 color;
+
+void main()
+{
+    vec4 texel = texture( texture_unit0, out_texcoord0) * vec4( color, 1.0);
+    frag_color = vec4( texel.xyz, 0.0);
+}'''
+
+# corpora
+
+def generate_fragment_shader(statements):
+    """ A fragment shader whose main function has the given number of statements
+    """
+    lines = [
+        'precision mediump float;',
+        'varying vec2 v_texcoord;',
+        'uniform sampler2D u_texture;',
+        'uniform vec4 u_color;',
+        'void main()',
+        '{',
+        '    vec4 color = u_color;',
+    ]
+    for index in range(statements):
+        if index % 4 == 0:
+            lines.append('    color = color * texture2D(u_texture, v_texcoord + vec2(%d.0, 0.5));' % index)
+        elif index % 4 == 1:
+            lines.append('    vec4 tmp%d = color * 0.5 + vec4(%d.0);' % (index, index))
+        elif index % 4 == 2:
+            lines.append('    if (color.x > 0.5) color = color - vec4(0.1);')
+        else:
+            lines.append('    color += u_color * %d.0;' % index)
+    lines += [
+        '    gl_FragColor = color;',
+        '}',
+    ]
+    return '\n'.join(lines)
+
+def generate_texture_trace(draws, textures_per_draw=4):
+    """ A trace of texture uploads, bindings and draws
+    """
+    calls = []
+    for draw in range(draws):
+        for unit in range(textures_per_draw):
+            tex_name = (draw * textures_per_draw + unit) % 256 + 1
+            calls += [
+                ('glActiveTexture', (Enum.GL_TEXTURE0 + unit, )),
+                ('glBindTexture', (Enum.GL_TEXTURE_2D, tex_name)),
+                ('glPixelStorei', (Enum.GL_UNPACK_ALIGNMENT, 1)),
+                ('glTexImage2D', (Enum.GL_TEXTURE_2D, 0, Enum.GL_RGBA8, 4, 4, 0, Enum.GL_RGBA, Enum.GL_UNSIGNED_BYTE, None)),
+                ('glTexSubImage2D', (Enum.GL_TEXTURE_2D, 0, 0, 0, 1, 1, Enum.GL_RGBA, Enum.GL_UNSIGNED_BYTE, b'\0\0\0\0')),
+            ]
+        calls.append(('glDrawArrays', (Enum.GL_TRIANGLES, 0, 3)))
+    return calls
+
+def generate_program_capture(programs, draws_per_program=4):
+    """ A trace creating many programs and drawing with each of them,
+        with the fragment shader source updated between draws
+    """
+    calls = []
+    for index in range(programs):
+        program, vertex_shader, fragment_shader = 3 * index + 1, 3 * index + 2, 3 * index + 3
+        calls += [
+            ('glCreateProgram', (program, )),
+            ('glCreateShader', (Enum.GL_VERTEX_SHADER, vertex_shader)),
+            ('glShaderSource', (vertex_shader, 1, [VERTEX_SHADER], None)),
+            ('glCreateShader', (Enum.GL_FRAGMENT_SHADER, fragment_shader)),
+            ('glAttachShader', (program, vertex_shader)),
+            ('glAttachShader', (program, fragment_shader)),
+            ('glUseProgram', (program, )),
+        ]
+        for draw in range(draws_per_program):
+            calls += [
+                ('glShaderSource', (fragment_shader, 1, [FRAGMENT_SHADER + '\n// %d' % draw], None)),
+                ('glDrawArrays', (Enum.GL_TRIANGLES, 0, 3)),
+            ]
+    return calls
+
+def load_shaders(directory):
+    """ Shaders collected by ShaderCollector, as (source, is_fragment_shader)
+    """
+    shaders = []
+    for filename in sorted(glob.glob(os.path.join(directory, '*.vertex')) + glob.glob(os.path.join(directory, '*.fragment'))):
+        if os.path.islink(filename):
+            continue
+        with open(filename) as f:
+            shaders.append((f.read(), filename.endswith('.fragment')))
+    return shaders
+
+# benchmarks, each returns (number of processed items, elapsed seconds)
+
+def benchmark_preprocess(shaders):
+    start = timer()
+    for source, fragment_shader in shaders:
+        Preprocess(source)
+    return len(shaders), timer() - start
+
+def benchmark_preprocess_batch(shaders):
+    start = timer()
+    PreprocessBatch([source for source, fragment_shader in shaders])
+    return len(shaders), timer() - start
+
+def benchmark_lex(texts, lexer_class):
+    # throughput in tokens, building the lexer included
+    lexer = lexer_class()
+    tokens = 0
+    start = timer()
+    for text in texts:
+        lexer.build()
+        tokens += len(lexer.tokenize(text))
+    return tokens, timer() - start
+
+def built_parsers(count, interner=None, lexer_class=ShaderLexer.ShaderLexer):
+    # parser construction (loading of the yacc tables) is not measured
+    parsers = [ShaderParser(interner=interner, lexer_class=lexer_class) for index in range(count)]
+    for parser in parsers:
+        parser.build_parser()
+    return parsers
+
+def benchmark_parse(shaders, interner=None, lazy=False, lexer_class=ShaderLexer.ShaderLexer):
+    parsers = built_parsers(len(shaders), interner, lexer_class)
+    start = timer()
+    for parser, (source, fragment_shader) in zip(parsers, shaders):
+        parser.parse(source, fragment_shader=fragment_shader, lazy=lazy)
+    return len(shaders), timer() - start
+
+def benchmark_parse_interface(shaders):
+    parsers = built_parsers(len(shaders))
+    start = timer()
+    for parser, (source, fragment_shader) in zip(parsers, shaders):
+        parser.parse(source, fragment_shader=fragment_shader, interface_only=True)
+    return len(shaders), timer() - start
+
+def benchmark_parse_cached(shaders):
+    # measures the warm run, the cold run fills the cache
+    directory = tempfile.mkdtemp()
+    try:
+        cache = ShaderCache(directory)
+        for parser, (source, fragment_shader) in zip(built_parsers(len(shaders)), shaders):
+            parser.parse(source, fragment_shader=fragment_shader, cache=cache)
+        start = timer()
+        for source, fragment_shader in shaders:
+            ShaderParser().parse(source, fragment_shader=fragment_shader, cache=cache)
+        return len(shaders), timer() - start
+    finally:
+        shutil.rmtree(directory)
+
+class NodeCounter(ShaderVisitor.NodeVisitor):
+
+    def __init__(self):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.count = 0
+
+    def pre_any(self, node):
+        self.count += 1
+
+def benchmark_visit(shaders, passes=5):
+    """ Runs several visitor passes and one code emission over each parsed shader,
+        counts the visited nodes
+    """
+    parsers = []
+    for source, fragment_shader in shaders:
+        parser = ShaderParser()
+        parser.parse(source, fragment_shader=fragment_shader)
+        parsers.append(parser)
+
+    counter = NodeCounter()
+    start = timer()
+    for parser in parsers:
+        for index in range(passes):
+            counter.visit(list(parser.variable_declarations.values()) + list(parser.function_definitions.values()))
+        parser.to_str()
+    return counter.count, timer() - start
+
+def benchmark_dispatch(calls):
+    context = GLES()
+    start = timer()
+    for call_name, call_args in calls:
+        f = getattr(context, call_name, None)
+        if f:
+            f(*call_args)
+    return len(calls), timer() - start
+
+def benchmark_collector(collector, calls):
+    """ Replays calls and only measures the collector at each draw call
+    """
+    context = GLES()
+    collects, elapsed = 0, 0.0
+    for call_name, call_args in calls:
+        f = getattr(context, call_name, None)
+        if f:
+            f(*call_args)
+        if call_name in DRAWCALL_NAMES:
+            start = timer()
+            collector.collect(context)
+            elapsed += timer() - start
+            collects += 1
+    return collects, elapsed
+
+def benchmark_shader_collector(calls):
+    # ShaderCollector writes the shaders into the working directory
+    cwd = os.getcwd()
+    directory = tempfile.mkdtemp()
+    try:
+        os.chdir(directory)
+        return benchmark_collector(ShaderCollector(), calls)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory)
+
+def benchmark_scaling(sizes=(1000, 10000, 100000), tolerance=2.0):
+    """ Parses generated shaders of increasing statement counts and checks the
+        parse time per statement grows by less than tolerance, i.e. near-linearly
+    """
+    results = collections.OrderedDict()
+    for statements in sizes:
+        items, seconds = benchmark_parse([(generate_fragment_shader(statements), True)])
+        results[statements] = seconds
+        logger.info('%d statements parsed in %.3fs, %.1fus per statement' % (statements, seconds, seconds / statements * 1e6))
+
+    smallest, largest = min(sizes), max(sizes)
+    growth = (results[largest] / largest) / (results[smallest] / smallest)
+    if growth > tolerance:
+        raise AssertionError('Parse time per statement grew x%.2f from %d to %d statements' % (growth, smallest, largest))
+    return results, growth
+
+def run_benchmarks(scale=1.0, shader_dir=None):
+    def scaled(count):
+        return max(1, int(count * scale))
+
+    realistic_shaders = [(VERTEX_SHADER, False), (FRAGMENT_SHADER, True)] * scaled(50)
+    if shader_dir:
+        realistic_shaders = load_shaders(shader_dir)
+    large_shaders = [(generate_fragment_shader(scaled(2000)), True)]
+    texture_trace = generate_texture_trace(scaled(20000))
+    program_capture = generate_program_capture(scaled(500))
+    interner = NodeInterner()
+    preprocessed_texts = [text for text, version in PreprocessBatch([source for source, fragment_shader in realistic_shaders + large_shaders])]
+
+    benchmarks = collections.OrderedDict([
+        ('preprocess', lambda : benchmark_preprocess(realistic_shaders)),
+        ('preprocess_batch', lambda : benchmark_preprocess_batch(realistic_shaders)),
+        ('preprocess_large', lambda : benchmark_preprocess(large_shaders)),
+        ('lex', lambda : benchmark_lex(preprocessed_texts, ShaderLexer.ShaderLexer)),
+        ('lex_fast', lambda : benchmark_lex(preprocessed_texts, ShaderLexer.FastShaderLexer)),
+        ('parse', lambda : benchmark_parse(realistic_shaders)),
+        ('parse_large', lambda : benchmark_parse(large_shaders)),
+        ('parse_interned', lambda : benchmark_parse(realistic_shaders + large_shaders, interner)),
+        ('parse_fast_lexer', lambda : benchmark_parse(realistic_shaders, lexer_class=ShaderLexer.FastShaderLexer)),
+        ('parse_lazy', lambda : benchmark_parse(realistic_shaders, lazy=True)),
+        ('parse_lazy_large', lambda : benchmark_parse(large_shaders, lazy=True)),
+        ('parse_cached', lambda : benchmark_parse_cached(realistic_shaders)),
+        ('parse_interface', lambda : benchmark_parse_interface(realistic_shaders)),
+        ('parse_interface_large', lambda : benchmark_parse_interface(large_shaders)),
+        ('visit', lambda : benchmark_visit(realistic_shaders + large_shaders)),
+        ('dispatch_textures', lambda : benchmark_dispatch(texture_trace)),
+        ('dispatch_programs', lambda : benchmark_dispatch(program_capture)),
+        ('collect_textures', lambda : benchmark_collector(TextureCollector(), texture_trace)),
+        ('collect_shaders', lambda : benchmark_shader_collector(program_capture)),
+    ])
+
+    results = collections.OrderedDict()
+    for name, benchmark in benchmarks.items():
+        items, seconds = benchmark()
+        results[name] = {
+            'items' : items,
+            'seconds' : seconds,
+            'per_second' : items / seconds if seconds else float('inf'),
+        }
+        logger.info('%s : %d items in %.3fs' % (name, items, seconds))
+    # share of the realistic corpus preprocessed without cpp
+    statistics = ShaderUtility.preprocess_statistics
+    statistics.reset()
+    benchmark_parse(realistic_shaders, lazy=True)
+    results['parse'].update(statistics.report())
+    logger.info('parse : %d of %d shaders (%.1f%%) bypassed cpp' % (statistics.fast_path,
+        statistics.fast_path + statistics.cpp, statistics.fast_path_ratio * 100))
+    results['parse_interned'].update(interner.report())
+    logger.info('parse_interned : %d shared nodes saved %d bytes' % (interner.hits, interner.saved_bytes))
+    return results
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)), universal_newlines=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(scale=1.0, shader_dir=None):
+    return {
+        'python' : platform.python_implementation() + ' ' + platform.python_version(),
+        'commit' : git_commit(),
+        'time' : time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'scale' : scale,
+        'benchmarks' : run_benchmarks(scale, shader_dir),
+    }
+
+def compare(results):
+    """ Formats the throughputs of several runs relative to the first one
+    """
+    baseline = results[0]['benchmarks']
+    lines = []
+    for result in results:
+        lines.append('%s (%s)' % (result.get('commit'), result['python']))
+        for name, benchmark in result['benchmarks'].items():
+            line = '    %-20s %14.1f/s' % (name, benchmark['per_second'])
+            if name in baseline and baseline[name]['per_second']:
+                line += '  x%.2f' % (benchmark['per_second'] / baseline[name]['per_second'])
+            lines.append(line)
+    return '\n'.join(lines)
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-s', '--scale', type=float, default=1.0,
+            help='Scale the size of the generated corpora')
+    parser.add_argument('-d', '--shader-dir',
+            help='Use the shaders collected in this directory as the realistic corpus')
+    parser.add_argument('-p', '--profile', action='store_true',
+            help='Run with instrumentation and add its report to the results')
+    parser.add_argument('--scaling', action='store_true',
+            help='Check parse time grows linearly with the number of statements')
+    parser.add_argument('-o', '--output',
+            help='Save the results as JSON')
+    parser.add_argument('-c', '--compare', nargs='+', metavar='RESULT',
+            help='Compare saved results, e.g. of different commits or interpreters')
+
+    args = parser.parse_args()
+
+    if args.scaling:
+        results, growth = benchmark_scaling()
+        print('Parse time per statement grew x%.2f' % growth)
+        sys.exit(0)
+
+    if args.compare:
+        results = []
+        for filename in args.compare:
+            with open(filename) as f:
+                results.append(json.load(f))
+        print(compare(results))
+        sys.exit(0)
+
+    if args.profile:
+        Instrumentation.enable()
+    result = run(args.scale, args.shader_dir)
+    if args.profile:
+        profiler = Instrumentation.disable()
+        logger.info('Instrumentation report :\n%s' % profiler.format_report())
+        result['instrumentation'] = profiler.report()
+    print(json.dumps(result, indent=4))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=4)
@@ -0,0 +1,6862 @@
+# Generated by Tools/GenerateGLESEnum.py from Registry/gl.xml, do not edit.
+
+# enum name -> value
+VALUES = {
+    'GL_DEPTH_BUFFER_BIT' : 0x0100,
+    'GL_STENCIL_BUFFER_BIT' : 0x0400,
+    'GL_COLOR_BUFFER_BIT' : 0x4000,
+    'GL_FALSE' : 0x0000,
+    'GL_TRUE' : 0x0001,
+    'GL_POINTS' : 0x0000,
+    'GL_LINES' : 0x0001,
+    'GL_LINE_LOOP' : 0x0002,
+    'GL_LINE_STRIP' : 0x0003,
+    'GL_TRIANGLES' : 0x0004,
+    'GL_TRIANGLE_STRIP' : 0x0005,
+    'GL_TRIANGLE_FAN' : 0x0006,
+    'GL_ZERO' : 0x0000,
+    'GL_ONE' : 0x0001,
+    'GL_SRC_COLOR' : 0x0300,
+    'GL_ONE_MINUS_SRC_COLOR' : 0x0301,
+    'GL_SRC_ALPHA' : 0x0302,
+    'GL_ONE_MINUS_SRC_ALPHA' : 0x0303,
+    'GL_DST_ALPHA' : 0x0304,
+    'GL_ONE_MINUS_DST_ALPHA' : 0x0305,
+    'GL_DST_COLOR' : 0x0306,
+    'GL_ONE_MINUS_DST_COLOR' : 0x0307,
+    'GL_SRC_ALPHA_SATURATE' : 0x0308,
+    'GL_FUNC_ADD' : 0x8006,
+    'GL_BLEND_EQUATION' : 0x8009,
+    'GL_BLEND_EQUATION_RGB' : 0x8009,
+    'GL_BLEND_EQUATION_ALPHA' : 0x883D,
+    'GL_FUNC_SUBTRACT' : 0x800A,
+    'GL_FUNC_REVERSE_SUBTRACT' : 0x800B,
+    'GL_BLEND_DST_RGB' : 0x80C8,
+    'GL_BLEND_SRC_RGB' : 0x80C9,
+    'GL_BLEND_DST_ALPHA' : 0x80CA,
+    'GL_BLEND_SRC_ALPHA' : 0x80CB,
+    'GL_CONSTANT_COLOR' : 0x8001,
+    'GL_ONE_MINUS_CONSTANT_COLOR' : 0x8002,
+    'GL_CONSTANT_ALPHA' : 0x8003,
+    'GL_ONE_MINUS_CONSTANT_ALPHA' : 0x8004,
+    'GL_BLEND_COLOR' : 0x8005,
+    'GL_ARRAY_BUFFER' : 0x8892,
+    'GL_ELEMENT_ARRAY_BUFFER' : 0x8893,
+    'GL_ARRAY_BUFFER_BINDING' : 0x8894,
+    'GL_ELEMENT_ARRAY_BUFFER_BINDING' : 0x8895,
+    'GL_STREAM_DRAW' : 0x88E0,
+    'GL_STATIC_DRAW' : 0x88E4,
+    'GL_DYNAMIC_DRAW' : 0x88E8,
+    'GL_BUFFER_SIZE' : 0x8764,
+    'GL_BUFFER_USAGE' : 0x8765,
+    'GL_CURRENT_VERTEX_ATTRIB' : 0x8626,
+    'GL_FRONT' : 0x0404,
+    'GL_BACK' : 0x0405,
+    'GL_FRONT_AND_BACK' : 0x0408,
+    'GL_TEXTURE_2D' : 0x0DE1,
+    'GL_CULL_FACE' : 0x0B44,
+    'GL_BLEND' : 0x0BE2,
+    'GL_DITHER' : 0x0BD0,
+    'GL_STENCIL_TEST' : 0x0B90,
+    'GL_DEPTH_TEST' : 0x0B71,
+    'GL_SCISSOR_TEST' : 0x0C11,
+    'GL_POLYGON_OFFSET_FILL' : 0x8037,
+    'GL_SAMPLE_ALPHA_TO_COVERAGE' : 0x809E,
+    'GL_SAMPLE_COVERAGE' : 0x80A0,
+    'GL_NO_ERROR' : 0x0000,
+    'GL_INVALID_ENUM' : 0x0500,
+    'GL_INVALID_VALUE' : 0x0501,
+    'GL_INVALID_OPERATION' : 0x0502,
+    'GL_OUT_OF_MEMORY' : 0x0505,
+    'GL_CW' : 0x0900,
+    'GL_CCW' : 0x0901,
+    'GL_LINE_WIDTH' : 0x0B21,
+    'GL_ALIASED_POINT_SIZE_RANGE' : 0x846D,
+    'GL_ALIASED_LINE_WIDTH_RANGE' : 0x846E,
+    'GL_CULL_FACE_MODE' : 0x0B45,
+    'GL_FRONT_FACE' : 0x0B46,
+    'GL_DEPTH_RANGE' : 0x0B70,
+    'GL_DEPTH_WRITEMASK' : 0x0B72,
+    'GL_DEPTH_CLEAR_VALUE' : 0x0B73,
+    'GL_DEPTH_FUNC' : 0x0B74,
+    'GL_STENCIL_CLEAR_VALUE' : 0x0B91,
+    'GL_STENCIL_FUNC' : 0x0B92,
+    'GL_STENCIL_FAIL' : 0x0B94,
+    'GL_STENCIL_PASS_DEPTH_FAIL' : 0x0B95,
+    'GL_STENCIL_PASS_DEPTH_PASS' : 0x0B96,
+    'GL_STENCIL_REF' : 0x0B97,
+    'GL_STENCIL_VALUE_MASK' : 0x0B93,
+    'GL_STENCIL_WRITEMASK' : 0x0B98,
+    'GL_STENCIL_BACK_FUNC' : 0x8800,
+    'GL_STENCIL_BACK_FAIL' : 0x8801,
+    'GL_STENCIL_BACK_PASS_DEPTH_FAIL' : 0x8802,
+    'GL_STENCIL_BACK_PASS_DEPTH_PASS' : 0x8803,
+    'GL_STENCIL_BACK_REF' : 0x8CA3,
+    'GL_STENCIL_BACK_VALUE_MASK' : 0x8CA4,
+    'GL_STENCIL_BACK_WRITEMASK' : 0x8CA5,
+    'GL_VIEWPORT' : 0x0BA2,
+    'GL_SCISSOR_BOX' : 0x0C10,
+    'GL_COLOR_CLEAR_VALUE' : 0x0C22,
+    'GL_COLOR_WRITEMASK' : 0x0C23,
+    'GL_UNPACK_ALIGNMENT' : 0x0CF5,
+    'GL_PACK_ALIGNMENT' : 0x0D05,
+    'GL_MAX_TEXTURE_SIZE' : 0x0D33,
+    'GL_MAX_VIEWPORT_DIMS' : 0x0D3A,
+    'GL_SUBPIXEL_BITS' : 0x0D50,
+    'GL_RED_BITS' : 0x0D52,
+    'GL_GREEN_BITS' : 0x0D53,
+    'GL_BLUE_BITS' : 0x0D54,
+    'GL_ALPHA_BITS' : 0x0D55,
+    'GL_DEPTH_BITS' : 0x0D56,
+    'GL_STENCIL_BITS' : 0x0D57,
+    'GL_POLYGON_OFFSET_UNITS' : 0x2A00,
+    'GL_POLYGON_OFFSET_FACTOR' : 0x8038,
+    'GL_TEXTURE_BINDING_2D' : 0x8069,
+    'GL_SAMPLE_BUFFERS' : 0x80A8,
+    'GL_SAMPLES' : 0x80A9,
+    'GL_SAMPLE_COVERAGE_VALUE' : 0x80AA,
+    'GL_SAMPLE_COVERAGE_INVERT' : 0x80AB,
+    'GL_NUM_COMPRESSED_TEXTURE_FORMATS' : 0x86A2,
+    'GL_COMPRESSED_TEXTURE_FORMATS' : 0x86A3,
+    'GL_DONT_CARE' : 0x1100,
+    'GL_FASTEST' : 0x1101,
+    'GL_NICEST' : 0x1102,
+    'GL_GENERATE_MIPMAP_HINT' : 0x8192,
+    'GL_BYTE' : 0x1400,
+    'GL_UNSIGNED_BYTE' : 0x1401,
+    'GL_SHORT' : 0x1402,
+    'GL_UNSIGNED_SHORT' : 0x1403,
+    'GL_INT' : 0x1404,
+    'GL_UNSIGNED_INT' : 0x1405,
+    'GL_FLOAT' : 0x1406,
+    'GL_FIXED' : 0x140C,
+    'GL_DEPTH_COMPONENT' : 0x1902,
+    'GL_ALPHA' : 0x1906,
+    'GL_RGB' : 0x1907,
+    'GL_RGBA' : 0x1908,
+    'GL_LUMINANCE' : 0x1909,
+    'GL_LUMINANCE_ALPHA' : 0x190A,
+    'GL_UNSIGNED_SHORT_4_4_4_4' : 0x8033,
+    'GL_UNSIGNED_SHORT_5_5_5_1' : 0x8034,
+    'GL_UNSIGNED_SHORT_5_6_5' : 0x8363,
+    'GL_FRAGMENT_SHADER' : 0x8B30,
+    'GL_VERTEX_SHADER' : 0x8B31,
+    'GL_MAX_VERTEX_ATTRIBS' : 0x8869,
+    'GL_MAX_VERTEX_UNIFORM_VECTORS' : 0x8DFB,
+    'GL_MAX_VARYING_VECTORS' : 0x8DFC,
+    'GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS' : 0x8B4D,
+    'GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS' : 0x8B4C,
+    'GL_MAX_TEXTURE_IMAGE_UNITS' : 0x8872,
+    'GL_MAX_FRAGMENT_UNIFORM_VECTORS' : 0x8DFD,
+    'GL_SHADER_TYPE' : 0x8B4F,
+    'GL_DELETE_STATUS' : 0x8B80,
+    'GL_LINK_STATUS' : 0x8B82,
+    'GL_VALIDATE_STATUS' : 0x8B83,
+    'GL_ATTACHED_SHADERS' : 0x8B85,
+    'GL_ACTIVE_UNIFORMS' : 0x8B86,
+    'GL_ACTIVE_UNIFORM_MAX_LENGTH' : 0x8B87,
+    'GL_ACTIVE_ATTRIBUTES' : 0x8B89,
+    'GL_ACTIVE_ATTRIBUTE_MAX_LENGTH' : 0x8B8A,
+    'GL_SHADING_LANGUAGE_VERSION' : 0x8B8C,
+    'GL_CURRENT_PROGRAM' : 0x8B8D,
+    'GL_NEVER' : 0x0200,
+    'GL_LESS' : 0x0201,
+    'GL_EQUAL' : 0x0202,
+    'GL_LEQUAL' : 0x0203,
+    'GL_GREATER' : 0x0204,
+    'GL_NOTEQUAL' : 0x0205,
+    'GL_GEQUAL' : 0x0206,
+    'GL_ALWAYS' : 0x0207,
+    'GL_KEEP' : 0x1E00,
+    'GL_REPLACE' : 0x1E01,
+    'GL_INCR' : 0x1E02,
+    'GL_DECR' : 0x1E03,
+    'GL_INVERT' : 0x150A,
+    'GL_INCR_WRAP' : 0x8507,
+    'GL_DECR_WRAP' : 0x8508,
+    'GL_VENDOR' : 0x1F00,
+    'GL_RENDERER' : 0x1F01,
+    'GL_VERSION' : 0x1F02,
+    'GL_EXTENSIONS' : 0x1F03,
+    'GL_NEAREST' : 0x2600,
+    'GL_LINEAR' : 0x2601,
+    'GL_NEAREST_MIPMAP_NEAREST' : 0x2700,
+    'GL_LINEAR_MIPMAP_NEAREST' : 0x2701,
+    'GL_NEAREST_MIPMAP_LINEAR' : 0x2702,
+    'GL_LINEAR_MIPMAP_LINEAR' : 0x2703,
+    'GL_TEXTURE_MAG_FILTER' : 0x2800,
+    'GL_TEXTURE_MIN_FILTER' : 0x2801,
+    'GL_TEXTURE_WRAP_S' : 0x2802,
+    'GL_TEXTURE_WRAP_T' : 0x2803,
+    'GL_TEXTURE' : 0x1702,
+    'GL_TEXTURE_CUBE_MAP' : 0x8513,
+    'GL_TEXTURE_BINDING_CUBE_MAP' : 0x8514,
+    'GL_TEXTURE_CUBE_MAP_POSITIVE_X' : 0x8515,
+    'GL_TEXTURE_CUBE_MAP_NEGATIVE_X' : 0x8516,
+    'GL_TEXTURE_CUBE_MAP_POSITIVE_Y' : 0x8517,
+    'GL_TEXTURE_CUBE_MAP_NEGATIVE_Y' : 0x8518,
+    'GL_TEXTURE_CUBE_MAP_POSITIVE_Z' : 0x8519,
+    'GL_TEXTURE_CUBE_MAP_NEGATIVE_Z' : 0x851A,
+    'GL_MAX_CUBE_MAP_TEXTURE_SIZE' : 0x851C,
+    'GL_TEXTURE0' : 0x84C0,
+    'GL_TEXTURE1' : 0x84C1,
+    'GL_TEXTURE2' : 0x84C2,
+    'GL_TEXTURE3' : 0x84C3,
+    'GL_TEXTURE4' : 0x84C4,
+    'GL_TEXTURE5' : 0x84C5,
+    'GL_TEXTURE6' : 0x84C6,
+    'GL_TEXTURE7' : 0x84C7,
+    'GL_TEXTURE8' : 0x84C8,
+    'GL_TEXTURE9' : 0x84C9,
+    'GL_TEXTURE10' : 0x84CA,
+    'GL_TEXTURE11' : 0x84CB,
+    'GL_TEXTURE12' : 0x84CC,
+    'GL_TEXTURE13' : 0x84CD,
+    'GL_TEXTURE14' : 0x84CE,
+    'GL_TEXTURE15' : 0x84CF,
+    'GL_TEXTURE16' : 0x84D0,
+    'GL_TEXTURE17' : 0x84D1,
+    'GL_TEXTURE18' : 0x84D2,
+    'GL_TEXTURE19' : 0x84D3,
+    'GL_TEXTURE20' : 0x84D4,
+    'GL_TEXTURE21' : 0x84D5,
+    'GL_TEXTURE22' : 0x84D6,
+    'GL_TEXTURE23' : 0x84D7,
+    'GL_TEXTURE24' : 0x84D8,
+    'GL_TEXTURE25' : 0x84D9,
+    'GL_TEXTURE26' : 0x84DA,
+    'GL_TEXTURE27' : 0x84DB,
+    'GL_TEXTURE28' : 0x84DC,
+    'GL_TEXTURE29' : 0x84DD,
+    'GL_TEXTURE30' : 0x84DE,
+    'GL_TEXTURE31' : 0x84DF,
+    'GL_ACTIVE_TEXTURE' : 0x84E0,
+    'GL_REPEAT' : 0x2901,
+    'GL_CLAMP_TO_EDGE' : 0x812F,
+    'GL_MIRRORED_REPEAT' : 0x8370,
+    'GL_FLOAT_VEC2' : 0x8B50,
+    'GL_FLOAT_VEC3' : 0x8B51,
+    'GL_FLOAT_VEC4' : 0x8B52,
+    'GL_INT_VEC2' : 0x8B53,
+    'GL_INT_VEC3' : 0x8B54,
+    'GL_INT_VEC4' : 0x8B55,
+    'GL_BOOL' : 0x8B56,
+    'GL_BOOL_VEC2' : 0x8B57,
+    'GL_BOOL_VEC3' : 0x8B58,
+    'GL_BOOL_VEC4' : 0x8B59,
+    'GL_FLOAT_MAT2' : 0x8B5A,
+    'GL_FLOAT_MAT3' : 0x8B5B,
+    'GL_FLOAT_MAT4' : 0x8B5C,
+    'GL_SAMPLER_2D' : 0x8B5E,
+    'GL_SAMPLER_CUBE' : 0x8B60,
+    'GL_VERTEX_ATTRIB_ARRAY_ENABLED' : 0x8622,
+    'GL_VERTEX_ATTRIB_ARRAY_SIZE' : 0x8623,
+    'GL_VERTEX_ATTRIB_ARRAY_STRIDE' : 0x8624,
+    'GL_VERTEX_ATTRIB_ARRAY_TYPE' : 0x8625,
+    'GL_VERTEX_ATTRIB_ARRAY_NORMALIZED' : 0x886A,
+    'GL_VERTEX_ATTRIB_ARRAY_POINTER' : 0x8645,
+    'GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING' : 0x889F,
+    'GL_IMPLEMENTATION_COLOR_READ_TYPE' : 0x8B9A,
+    'GL_IMPLEMENTATION_COLOR_READ_FORMAT' : 0x8B9B,
+    'GL_COMPILE_STATUS' : 0x8B81,
+    'GL_INFO_LOG_LENGTH' : 0x8B84,
+    'GL_SHADER_SOURCE_LENGTH' : 0x8B88,
+    'GL_SHADER_COMPILER' : 0x8DFA,
+    'GL_SHADER_BINARY_FORMATS' : 0x8DF8,
+    'GL_NUM_SHADER_BINARY_FORMATS' : 0x8DF9,
+    'GL_LOW_FLOAT' : 0x8DF0,
+    'GL_MEDIUM_FLOAT' : 0x8DF1,
+    'GL_HIGH_FLOAT' : 0x8DF2,
+    'GL_LOW_INT' : 0x8DF3,
+    'GL_MEDIUM_INT' : 0x8DF4,
+    'GL_HIGH_INT' : 0x8DF5,
+    'GL_FRAMEBUFFER' : 0x8D40,
+    'GL_RENDERBUFFER' : 0x8D41,
+    'GL_RGBA4' : 0x8056,
+    'GL_RGB5_A1' : 0x8057,
+    'GL_RGB565' : 0x8D62,
+    'GL_DEPTH_COMPONENT16' : 0x81A5,
+    'GL_STENCIL_INDEX8' : 0x8D48,
+    'GL_RENDERBUFFER_WIDTH' : 0x8D42,
+    'GL_RENDERBUFFER_HEIGHT' : 0x8D43,
+    'GL_RENDERBUFFER_INTERNAL_FORMAT' : 0x8D44,
+    'GL_RENDERBUFFER_RED_SIZE' : 0x8D50,
+    'GL_RENDERBUFFER_GREEN_SIZE' : 0x8D51,
+    'GL_RENDERBUFFER_BLUE_SIZE' : 0x8D52,
+    'GL_RENDERBUFFER_ALPHA_SIZE' : 0x8D53,
+    'GL_RENDERBUFFER_DEPTH_SIZE' : 0x8D54,
+    'GL_RENDERBUFFER_STENCIL_SIZE' : 0x8D55,
+    'GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE' : 0x8CD0,
+    'GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME' : 0x8CD1,
+    'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL' : 0x8CD2,
+    'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE' : 0x8CD3,
+    'GL_COLOR_ATTACHMENT0' : 0x8CE0,
+    'GL_DEPTH_ATTACHMENT' : 0x8D00,
+    'GL_STENCIL_ATTACHMENT' : 0x8D20,
+    'GL_NONE' : 0x0000,
+    'GL_FRAMEBUFFER_COMPLETE' : 0x8CD5,
+    'GL_FRAMEBUFFER_INCOMPLETE_ATTACHMENT' : 0x8CD6,
+    'GL_FRAMEBUFFER_INCOMPLETE_MISSING_ATTACHMENT' : 0x8CD7,
+    'GL_FRAMEBUFFER_INCOMPLETE_DIMENSIONS' : 0x8CD9,
+    'GL_FRAMEBUFFER_UNSUPPORTED' : 0x8CDD,
+    'GL_FRAMEBUFFER_BINDING' : 0x8CA6,
+    'GL_RENDERBUFFER_BINDING' : 0x8CA7,
+    'GL_MAX_RENDERBUFFER_SIZE' : 0x84E8,
+    'GL_INVALID_FRAMEBUFFER_OPERATION' : 0x0506,
+    'GL_READ_BUFFER' : 0x0C02,
+    'GL_UNPACK_ROW_LENGTH' : 0x0CF2,
+    'GL_UNPACK_SKIP_ROWS' : 0x0CF3,
+    'GL_UNPACK_SKIP_PIXELS' : 0x0CF4,
+    'GL_PACK_ROW_LENGTH' : 0x0D02,
+    'GL_PACK_SKIP_ROWS' : 0x0D03,
+    'GL_PACK_SKIP_PIXELS' : 0x0D04,
+    'GL_COLOR' : 0x1800,
+    'GL_DEPTH' : 0x1801,
+    'GL_STENCIL' : 0x1802,
+    'GL_RED' : 0x1903,
+    'GL_RGB8' : 0x8051,
+    'GL_RGBA8' : 0x8058,
+    'GL_RGB10_A2' : 0x8059,
+    'GL_TEXTURE_BINDING_3D' : 0x806A,
+    'GL_UNPACK_SKIP_IMAGES' : 0x806D,
+    'GL_UNPACK_IMAGE_HEIGHT' : 0x806E,
+    'GL_TEXTURE_3D' : 0x806F,
+    'GL_TEXTURE_WRAP_R' : 0x8072,
+    'GL_MAX_3D_TEXTURE_SIZE' : 0x8073,
+    'GL_UNSIGNED_INT_2_10_10_10_REV' : 0x8368,
+    'GL_MAX_ELEMENTS_VERTICES' : 0x80E8,
+    'GL_MAX_ELEMENTS_INDICES' : 0x80E9,
+    'GL_TEXTURE_MIN_LOD' : 0x813A,
+    'GL_TEXTURE_MAX_LOD' : 0x813B,
+    'GL_TEXTURE_BASE_LEVEL' : 0x813C,
+    'GL_TEXTURE_MAX_LEVEL' : 0x813D,
+    'GL_MIN' : 0x8007,
+    'GL_MAX' : 0x8008,
+    'GL_DEPTH_COMPONENT24' : 0x81A6,
+    'GL_MAX_TEXTURE_LOD_BIAS' : 0x84FD,
+    'GL_TEXTURE_COMPARE_MODE' : 0x884C,
+    'GL_TEXTURE_COMPARE_FUNC' : 0x884D,
+    'GL_CURRENT_QUERY' : 0x8865,
+    'GL_QUERY_RESULT' : 0x8866,
+    'GL_QUERY_RESULT_AVAILABLE' : 0x8867,
+    'GL_BUFFER_MAPPED' : 0x88BC,
+    'GL_BUFFER_MAP_POINTER' : 0x88BD,
+    'GL_STREAM_READ' : 0x88E1,
+    'GL_STREAM_COPY' : 0x88E2,
+    'GL_STATIC_READ' : 0x88E5,
+    'GL_STATIC_COPY' : 0x88E6,
+    'GL_DYNAMIC_READ' : 0x88E9,
+    'GL_DYNAMIC_COPY' : 0x88EA,
+    'GL_MAX_DRAW_BUFFERS' : 0x8824,
+    'GL_DRAW_BUFFER0' : 0x8825,
+    'GL_DRAW_BUFFER1' : 0x8826,
+    'GL_DRAW_BUFFER2' : 0x8827,
+    'GL_DRAW_BUFFER3' : 0x8828,
+    'GL_DRAW_BUFFER4' : 0x8829,
+    'GL_DRAW_BUFFER5' : 0x882A,
+    'GL_DRAW_BUFFER6' : 0x882B,
+    'GL_DRAW_BUFFER7' : 0x882C,
+    'GL_DRAW_BUFFER8' : 0x882D,
+    'GL_DRAW_BUFFER9' : 0x882E,
+    'GL_DRAW_BUFFER10' : 0x882F,
+    'GL_DRAW_BUFFER11' : 0x8830,
+    'GL_DRAW_BUFFER12' : 0x8831,
+    'GL_DRAW_BUFFER13' : 0x8832,
+    'GL_DRAW_BUFFER14' : 0x8833,
+    'GL_DRAW_BUFFER15' : 0x8834,
+    'GL_MAX_FRAGMENT_UNIFORM_COMPONENTS' : 0x8B49,
+    'GL_MAX_VERTEX_UNIFORM_COMPONENTS' : 0x8B4A,
+    'GL_SAMPLER_3D' : 0x8B5F,
+    'GL_SAMPLER_2D_SHADOW' : 0x8B62,
+    'GL_FRAGMENT_SHADER_DERIVATIVE_HINT' : 0x8B8B,
+    'GL_PIXEL_PACK_BUFFER' : 0x88EB,
+    'GL_PIXEL_UNPACK_BUFFER' : 0x88EC,
+    'GL_PIXEL_PACK_BUFFER_BINDING' : 0x88ED,
+    'GL_PIXEL_UNPACK_BUFFER_BINDING' : 0x88EF,
+    'GL_FLOAT_MAT2x3' : 0x8B65,
+    'GL_FLOAT_MAT2x4' : 0x8B66,
+    'GL_FLOAT_MAT3x2' : 0x8B67,
+    'GL_FLOAT_MAT3x4' : 0x8B68,
+    'GL_FLOAT_MAT4x2' : 0x8B69,
+    'GL_FLOAT_MAT4x3' : 0x8B6A,
+    'GL_SRGB' : 0x8C40,
+    'GL_SRGB8' : 0x8C41,
+    'GL_SRGB8_ALPHA8' : 0x8C43,
+    'GL_COMPARE_REF_TO_TEXTURE' : 0x884E,
+    'GL_MAJOR_VERSION' : 0x821B,
+    'GL_MINOR_VERSION' : 0x821C,
+    'GL_NUM_EXTENSIONS' : 0x821D,
+    'GL_RGBA32F' : 0x8814,
+    'GL_RGB32F' : 0x8815,
+    'GL_RGBA16F' : 0x881A,
+    'GL_RGB16F' : 0x881B,
+    'GL_VERTEX_ATTRIB_ARRAY_INTEGER' : 0x88FD,
+    'GL_MAX_ARRAY_TEXTURE_LAYERS' : 0x88FF,
+    'GL_MIN_PROGRAM_TEXEL_OFFSET' : 0x8904,
+    'GL_MAX_PROGRAM_TEXEL_OFFSET' : 0x8905,
+    'GL_MAX_VARYING_COMPONENTS' : 0x8B4B,
+    'GL_TEXTURE_2D_ARRAY' : 0x8C1A,
+    'GL_TEXTURE_BINDING_2D_ARRAY' : 0x8C1D,
+    'GL_R11F_G11F_B10F' : 0x8C3A,
+    'GL_UNSIGNED_INT_10F_11F_11F_REV' : 0x8C3B,
+    'GL_RGB9_E5' : 0x8C3D,
+    'GL_UNSIGNED_INT_5_9_9_9_REV' : 0x8C3E,
+    'GL_TRANSFORM_FEEDBACK_VARYING_MAX_LENGTH' : 0x8C76,
+    'GL_TRANSFORM_FEEDBACK_BUFFER_MODE' : 0x8C7F,
+    'GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_COMPONENTS' : 0x8C80,
+    'GL_TRANSFORM_FEEDBACK_VARYINGS' : 0x8C83,
+    'GL_TRANSFORM_FEEDBACK_BUFFER_START' : 0x8C84,
+    'GL_TRANSFORM_FEEDBACK_BUFFER_SIZE' : 0x8C85,
+    'GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN' : 0x8C88,
+    'GL_RASTERIZER_DISCARD' : 0x8C89,
+    'GL_MAX_TRANSFORM_FEEDBACK_INTERLEAVED_COMPONENTS' : 0x8C8A,
+    'GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_ATTRIBS' : 0x8C8B,
+    'GL_INTERLEAVED_ATTRIBS' : 0x8C8C,
+    'GL_SEPARATE_ATTRIBS' : 0x8C8D,
+    'GL_TRANSFORM_FEEDBACK_BUFFER' : 0x8C8E,
+    'GL_TRANSFORM_FEEDBACK_BUFFER_BINDING' : 0x8C8F,
+    'GL_RGBA32UI' : 0x8D70,
+    'GL_RGB32UI' : 0x8D71,
+    'GL_RGBA16UI' : 0x8D76,
+    'GL_RGB16UI' : 0x8D77,
+    'GL_RGBA8UI' : 0x8D7C,
+    'GL_RGB8UI' : 0x8D7D,
+    'GL_RGBA32I' : 0x8D82,
+    'GL_RGB32I' : 0x8D83,
+    'GL_RGBA16I' : 0x8D88,
+    'GL_RGB16I' : 0x8D89,
+    'GL_RGBA8I' : 0x8D8E,
+    'GL_RGB8I' : 0x8D8F,
+    'GL_RED_INTEGER' : 0x8D94,
+    'GL_RGB_INTEGER' : 0x8D98,
+    'GL_RGBA_INTEGER' : 0x8D99,
+    'GL_SAMPLER_2D_ARRAY' : 0x8DC1,
+    'GL_SAMPLER_2D_ARRAY_SHADOW' : 0x8DC4,
+    'GL_SAMPLER_CUBE_SHADOW' : 0x8DC5,
+    'GL_UNSIGNED_INT_VEC2' : 0x8DC6,
+    'GL_UNSIGNED_INT_VEC3' : 0x8DC7,
+    'GL_UNSIGNED_INT_VEC4' : 0x8DC8,
+    'GL_INT_SAMPLER_2D' : 0x8DCA,
+    'GL_INT_SAMPLER_3D' : 0x8DCB,
+    'GL_INT_SAMPLER_CUBE' : 0x8DCC,
+    'GL_INT_SAMPLER_2D_ARRAY' : 0x8DCF,
+    'GL_UNSIGNED_INT_SAMPLER_2D' : 0x8DD2,
+    'GL_UNSIGNED_INT_SAMPLER_3D' : 0x8DD3,
+    'GL_UNSIGNED_INT_SAMPLER_CUBE' : 0x8DD4,
+    'GL_UNSIGNED_INT_SAMPLER_2D_ARRAY' : 0x8DD7,
+    'GL_BUFFER_ACCESS_FLAGS' : 0x911F,
+    'GL_BUFFER_MAP_LENGTH' : 0x9120,
+    'GL_BUFFER_MAP_OFFSET' : 0x9121,
+    'GL_DEPTH_COMPONENT32F' : 0x8CAC,
+    'GL_DEPTH32F_STENCIL8' : 0x8CAD,
+    'GL_FLOAT_32_UNSIGNED_INT_24_8_REV' : 0x8DAD,
+    'GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING' : 0x8210,
+    'GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE' : 0x8211,
+    'GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE' : 0x8212,
+    'GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE' : 0x8213,
+    'GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE' : 0x8214,
+    'GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE' : 0x8215,
+    'GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE' : 0x8216,
+    'GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE' : 0x8217,
+    'GL_FRAMEBUFFER_DEFAULT' : 0x8218,
+    'GL_FRAMEBUFFER_UNDEFINED' : 0x8219,
+    'GL_DEPTH_STENCIL_ATTACHMENT' : 0x821A,
+    'GL_DEPTH_STENCIL' : 0x84F9,
+    'GL_UNSIGNED_INT_24_8' : 0x84FA,
+    'GL_DEPTH24_STENCIL8' : 0x88F0,
+    'GL_UNSIGNED_NORMALIZED' : 0x8C17,
+    'GL_DRAW_FRAMEBUFFER_BINDING' : 0x8CA6,
+    'GL_READ_FRAMEBUFFER' : 0x8CA8,
+    'GL_DRAW_FRAMEBUFFER' : 0x8CA9,
+    'GL_READ_FRAMEBUFFER_BINDING' : 0x8CAA,
+    'GL_RENDERBUFFER_SAMPLES' : 0x8CAB,
+    'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER' : 0x8CD4,
+    'GL_MAX_COLOR_ATTACHMENTS' : 0x8CDF,
+    'GL_COLOR_ATTACHMENT1' : 0x8CE1,
+    'GL_COLOR_ATTACHMENT2' : 0x8CE2,
+    'GL_COLOR_ATTACHMENT3' : 0x8CE3,
+    'GL_COLOR_ATTACHMENT4' : 0x8CE4,
+    'GL_COLOR_ATTACHMENT5' : 0x8CE5,
+    'GL_COLOR_ATTACHMENT6' : 0x8CE6,
+    'GL_COLOR_ATTACHMENT7' : 0x8CE7,
+    'GL_COLOR_ATTACHMENT8' : 0x8CE8,
+    'GL_COLOR_ATTACHMENT9' : 0x8CE9,
+    'GL_COLOR_ATTACHMENT10' : 0x8CEA,
+    'GL_COLOR_ATTACHMENT11' : 0x8CEB,
+    'GL_COLOR_ATTACHMENT12' : 0x8CEC,
+    'GL_COLOR_ATTACHMENT13' : 0x8CED,
+    'GL_COLOR_ATTACHMENT14' : 0x8CEE,
+    'GL_COLOR_ATTACHMENT15' : 0x8CEF,
+    'GL_COLOR_ATTACHMENT16' : 0x8CF0,
+    'GL_COLOR_ATTACHMENT17' : 0x8CF1,
+    'GL_COLOR_ATTACHMENT18' : 0x8CF2,
+    'GL_COLOR_ATTACHMENT19' : 0x8CF3,
+    'GL_COLOR_ATTACHMENT20' : 0x8CF4,
+    'GL_COLOR_ATTACHMENT21' : 0x8CF5,
+    'GL_COLOR_ATTACHMENT22' : 0x8CF6,
+    'GL_COLOR_ATTACHMENT23' : 0x8CF7,
+    'GL_COLOR_ATTACHMENT24' : 0x8CF8,
+    'GL_COLOR_ATTACHMENT25' : 0x8CF9,
+    'GL_COLOR_ATTACHMENT26' : 0x8CFA,
+    'GL_COLOR_ATTACHMENT27' : 0x8CFB,
+    'GL_COLOR_ATTACHMENT28' : 0x8CFC,
+    'GL_COLOR_ATTACHMENT29' : 0x8CFD,
+    'GL_COLOR_ATTACHMENT30' : 0x8CFE,
+    'GL_COLOR_ATTACHMENT31' : 0x8CFF,
+    'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE' : 0x8D56,
+    'GL_MAX_SAMPLES' : 0x8D57,
+    'GL_HALF_FLOAT' : 0x140B,
+    'GL_MAP_READ_BIT' : 0x0001,
+    'GL_MAP_WRITE_BIT' : 0x0002,
+    'GL_MAP_INVALIDATE_RANGE_BIT' : 0x0004,
+    'GL_MAP_INVALIDATE_BUFFER_BIT' : 0x0008,
+    'GL_MAP_FLUSH_EXPLICIT_BIT' : 0x0010,
+    'GL_MAP_UNSYNCHRONIZED_BIT' : 0x0020,
+    'GL_RG' : 0x8227,
+    'GL_RG_INTEGER' : 0x8228,
+    'GL_R8' : 0x8229,
+    'GL_RG8' : 0x822B,
+    'GL_R16F' : 0x822D,
+    'GL_R32F' : 0x822E,
+    'GL_RG16F' : 0x822F,
+    'GL_RG32F' : 0x8230,
+    'GL_R8I' : 0x8231,
+    'GL_R8UI' : 0x8232,
+    'GL_R16I' : 0x8233,
+    'GL_R16UI' : 0x8234,
+    'GL_R32I' : 0x8235,
+    'GL_R32UI' : 0x8236,
+    'GL_RG8I' : 0x8237,
+    'GL_RG8UI' : 0x8238,
+    'GL_RG16I' : 0x8239,
+    'GL_RG16UI' : 0x823A,
+    'GL_RG32I' : 0x823B,
+    'GL_RG32UI' : 0x823C,
+    'GL_VERTEX_ARRAY_BINDING' : 0x85B5,
+    'GL_R8_SNORM' : 0x8F94,
+    'GL_RG8_SNORM' : 0x8F95,
+    'GL_RGB8_SNORM' : 0x8F96,
+    'GL_RGBA8_SNORM' : 0x8F97,
+    'GL_SIGNED_NORMALIZED' : 0x8F9C,
+    'GL_PRIMITIVE_RESTART_FIXED_INDEX' : 0x8D69,
+    'GL_COPY_READ_BUFFER' : 0x8F36,
+    'GL_COPY_WRITE_BUFFER' : 0x8F37,
+    'GL_COPY_READ_BUFFER_BINDING' : 0x8F36,
+    'GL_COPY_WRITE_BUFFER_BINDING' : 0x8F37,
+    'GL_UNIFORM_BUFFER' : 0x8A11,
+    'GL_UNIFORM_BUFFER_BINDING' : 0x8A28,
+    'GL_UNIFORM_BUFFER_START' : 0x8A29,
+    'GL_UNIFORM_BUFFER_SIZE' : 0x8A2A,
+    'GL_MAX_VERTEX_UNIFORM_BLOCKS' : 0x8A2B,
+    'GL_MAX_FRAGMENT_UNIFORM_BLOCKS' : 0x8A2D,
+    'GL_MAX_COMBINED_UNIFORM_BLOCKS' : 0x8A2E,
+    'GL_MAX_UNIFORM_BUFFER_BINDINGS' : 0x8A2F,
+    'GL_MAX_UNIFORM_BLOCK_SIZE' : 0x8A30,
+    'GL_MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS' : 0x8A31,
+    'GL_MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS' : 0x8A33,
+    'GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT' : 0x8A34,
+    'GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH' : 0x8A35,
+    'GL_ACTIVE_UNIFORM_BLOCKS' : 0x8A36,
+    'GL_UNIFORM_TYPE' : 0x8A37,
+    'GL_UNIFORM_SIZE' : 0x8A38,
+    'GL_UNIFORM_NAME_LENGTH' : 0x8A39,
+    'GL_UNIFORM_BLOCK_INDEX' : 0x8A3A,
+    'GL_UNIFORM_OFFSET' : 0x8A3B,
+    'GL_UNIFORM_ARRAY_STRIDE' : 0x8A3C,
+    'GL_UNIFORM_MATRIX_STRIDE' : 0x8A3D,
+    'GL_UNIFORM_IS_ROW_MAJOR' : 0x8A3E,
+    'GL_UNIFORM_BLOCK_BINDING' : 0x8A3F,
+    'GL_UNIFORM_BLOCK_DATA_SIZE' : 0x8A40,
+    'GL_UNIFORM_BLOCK_NAME_LENGTH' : 0x8A41,
+    'GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS' : 0x8A42,
+    'GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES' : 0x8A43,
+    'GL_UNIFORM_BLOCK_REFERENCED_BY_VERTEX_SHADER' : 0x8A44,
+    'GL_UNIFORM_BLOCK_REFERENCED_BY_FRAGMENT_SHADER' : 0x8A46,
+    'GL_INVALID_INDEX' : 0xFFFFFFFF,
+    'GL_MAX_VERTEX_OUTPUT_COMPONENTS' : 0x9122,
+    'GL_MAX_FRAGMENT_INPUT_COMPONENTS' : 0x9125,
+    'GL_MAX_SERVER_WAIT_TIMEOUT' : 0x9111,
+    'GL_OBJECT_TYPE' : 0x9112,
+    'GL_SYNC_CONDITION' : 0x9113,
+    'GL_SYNC_STATUS' : 0x9114,
+    'GL_SYNC_FLAGS' : 0x9115,
+    'GL_SYNC_FENCE' : 0x9116,
+    'GL_SYNC_GPU_COMMANDS_COMPLETE' : 0x9117,
+    'GL_UNSIGNALED' : 0x9118,
+    'GL_SIGNALED' : 0x9119,
+    'GL_ALREADY_SIGNALED' : 0x911A,
+    'GL_TIMEOUT_EXPIRED' : 0x911B,
+    'GL_CONDITION_SATISFIED' : 0x911C,
+    'GL_WAIT_FAILED' : 0x911D,
+    'GL_SYNC_FLUSH_COMMANDS_BIT' : 0x0001,
+    'GL_TIMEOUT_IGNORED' : 0xFFFFFFFFFFFFFFFF,
+    'GL_VERTEX_ATTRIB_ARRAY_DIVISOR' : 0x88FE,
+    'GL_ANY_SAMPLES_PASSED' : 0x8C2F,
+    'GL_ANY_SAMPLES_PASSED_CONSERVATIVE' : 0x8D6A,
+    'GL_SAMPLER_BINDING' : 0x8919,
+    'GL_RGB10_A2UI' : 0x906F,
+    'GL_TEXTURE_SWIZZLE_R' : 0x8E42,
+    'GL_TEXTURE_SWIZZLE_G' : 0x8E43,
+    'GL_TEXTURE_SWIZZLE_B' : 0x8E44,
+    'GL_TEXTURE_SWIZZLE_A' : 0x8E45,
+    'GL_GREEN' : 0x1904,
+    'GL_BLUE' : 0x1905,
+    'GL_INT_2_10_10_10_REV' : 0x8D9F,
+    'GL_TRANSFORM_FEEDBACK' : 0x8E22,
+    'GL_TRANSFORM_FEEDBACK_PAUSED' : 0x8E23,
+    'GL_TRANSFORM_FEEDBACK_ACTIVE' : 0x8E24,
+    'GL_TRANSFORM_FEEDBACK_BINDING' : 0x8E25,
+    'GL_PROGRAM_BINARY_RETRIEVABLE_HINT' : 0x8257,
+    'GL_PROGRAM_BINARY_LENGTH' : 0x8741,
+    'GL_NUM_PROGRAM_BINARY_FORMATS' : 0x87FE,
+    'GL_PROGRAM_BINARY_FORMATS' : 0x87FF,
+    'GL_COMPRESSED_R11_EAC' : 0x9270,
+    'GL_COMPRESSED_SIGNED_R11_EAC' : 0x9271,
+    'GL_COMPRESSED_RG11_EAC' : 0x9272,
+    'GL_COMPRESSED_SIGNED_RG11_EAC' : 0x9273,
+    'GL_COMPRESSED_RGB8_ETC2' : 0x9274,
+    'GL_COMPRESSED_SRGB8_ETC2' : 0x9275,
+    'GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2' : 0x9276,
+    'GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2' : 0x9277,
+    'GL_COMPRESSED_RGBA8_ETC2_EAC' : 0x9278,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC' : 0x9279,
+    'GL_TEXTURE_IMMUTABLE_FORMAT' : 0x912F,
+    'GL_MAX_ELEMENT_INDEX' : 0x8D6B,
+    'GL_NUM_SAMPLE_COUNTS' : 0x9380,
+    'GL_TEXTURE_IMMUTABLE_LEVELS' : 0x82DF,
+    'GL_COMPUTE_SHADER' : 0x91B9,
+    'GL_MAX_COMPUTE_UNIFORM_BLOCKS' : 0x91BB,
+    'GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS' : 0x91BC,
+    'GL_MAX_COMPUTE_IMAGE_UNIFORMS' : 0x91BD,
+    'GL_MAX_COMPUTE_SHARED_MEMORY_SIZE' : 0x8262,
+    'GL_MAX_COMPUTE_UNIFORM_COMPONENTS' : 0x8263,
+    'GL_MAX_COMPUTE_ATOMIC_COUNTER_BUFFERS' : 0x8264,
+    'GL_MAX_COMPUTE_ATOMIC_COUNTERS' : 0x8265,
+    'GL_MAX_COMBINED_COMPUTE_UNIFORM_COMPONENTS' : 0x8266,
+    'GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS' : 0x90EB,
+    'GL_MAX_COMPUTE_WORK_GROUP_COUNT' : 0x91BE,
+    'GL_MAX_COMPUTE_WORK_GROUP_SIZE' : 0x91BF,
+    'GL_COMPUTE_WORK_GROUP_SIZE' : 0x8267,
+    'GL_DISPATCH_INDIRECT_BUFFER' : 0x90EE,
+    'GL_DISPATCH_INDIRECT_BUFFER_BINDING' : 0x90EF,
+    'GL_COMPUTE_SHADER_BIT' : 0x0020,
+    'GL_DRAW_INDIRECT_BUFFER' : 0x8F3F,
+    'GL_DRAW_INDIRECT_BUFFER_BINDING' : 0x8F43,
+    'GL_MAX_UNIFORM_LOCATIONS' : 0x826E,
+    'GL_FRAMEBUFFER_DEFAULT_WIDTH' : 0x9310,
+    'GL_FRAMEBUFFER_DEFAULT_HEIGHT' : 0x9311,
+    'GL_FRAMEBUFFER_DEFAULT_SAMPLES' : 0x9313,
+    'GL_FRAMEBUFFER_DEFAULT_FIXED_SAMPLE_LOCATIONS' : 0x9314,
+    'GL_MAX_FRAMEBUFFER_WIDTH' : 0x9315,
+    'GL_MAX_FRAMEBUFFER_HEIGHT' : 0x9316,
+    'GL_MAX_FRAMEBUFFER_SAMPLES' : 0x9318,
+    'GL_UNIFORM' : 0x92E1,
+    'GL_UNIFORM_BLOCK' : 0x92E2,
+    'GL_PROGRAM_INPUT' : 0x92E3,
+    'GL_PROGRAM_OUTPUT' : 0x92E4,
+    'GL_BUFFER_VARIABLE' : 0x92E5,
+    'GL_SHADER_STORAGE_BLOCK' : 0x92E6,
+    'GL_ATOMIC_COUNTER_BUFFER' : 0x92C0,
+    'GL_TRANSFORM_FEEDBACK_VARYING' : 0x92F4,
+    'GL_ACTIVE_RESOURCES' : 0x92F5,
+    'GL_MAX_NAME_LENGTH' : 0x92F6,
+    'GL_MAX_NUM_ACTIVE_VARIABLES' : 0x92F7,
+    'GL_NAME_LENGTH' : 0x92F9,
+    'GL_TYPE' : 0x92FA,
+    'GL_ARRAY_SIZE' : 0x92FB,
+    'GL_OFFSET' : 0x92FC,
+    'GL_BLOCK_INDEX' : 0x92FD,
+    'GL_ARRAY_STRIDE' : 0x92FE,
+    'GL_MATRIX_STRIDE' : 0x92FF,
+    'GL_IS_ROW_MAJOR' : 0x9300,
+    'GL_ATOMIC_COUNTER_BUFFER_INDEX' : 0x9301,
+    'GL_BUFFER_BINDING' : 0x9302,
+    'GL_BUFFER_DATA_SIZE' : 0x9303,
+    'GL_NUM_ACTIVE_VARIABLES' : 0x9304,
+    'GL_ACTIVE_VARIABLES' : 0x9305,
+    'GL_REFERENCED_BY_VERTEX_SHADER' : 0x9306,
+    'GL_REFERENCED_BY_FRAGMENT_SHADER' : 0x930A,
+    'GL_REFERENCED_BY_COMPUTE_SHADER' : 0x930B,
+    'GL_TOP_LEVEL_ARRAY_SIZE' : 0x930C,
+    'GL_TOP_LEVEL_ARRAY_STRIDE' : 0x930D,
+    'GL_LOCATION' : 0x930E,
+    'GL_VERTEX_SHADER_BIT' : 0x0001,
+    'GL_FRAGMENT_SHADER_BIT' : 0x0002,
+    'GL_ALL_SHADER_BITS' : 0xFFFFFFFF,
+    'GL_PROGRAM_SEPARABLE' : 0x8258,
+    'GL_ACTIVE_PROGRAM' : 0x8259,
+    'GL_PROGRAM_PIPELINE_BINDING' : 0x825A,
+    'GL_ATOMIC_COUNTER_BUFFER_BINDING' : 0x92C1,
+    'GL_ATOMIC_COUNTER_BUFFER_START' : 0x92C2,
+    'GL_ATOMIC_COUNTER_BUFFER_SIZE' : 0x92C3,
+    'GL_MAX_VERTEX_ATOMIC_COUNTER_BUFFERS' : 0x92CC,
+    'GL_MAX_FRAGMENT_ATOMIC_COUNTER_BUFFERS' : 0x92D0,
+    'GL_MAX_COMBINED_ATOMIC_COUNTER_BUFFERS' : 0x92D1,
+    'GL_MAX_VERTEX_ATOMIC_COUNTERS' : 0x92D2,
+    'GL_MAX_FRAGMENT_ATOMIC_COUNTERS' : 0x92D6,
+    'GL_MAX_COMBINED_ATOMIC_COUNTERS' : 0x92D7,
+    'GL_MAX_ATOMIC_COUNTER_BUFFER_SIZE' : 0x92D8,
+    'GL_MAX_ATOMIC_COUNTER_BUFFER_BINDINGS' : 0x92DC,
+    'GL_ACTIVE_ATOMIC_COUNTER_BUFFERS' : 0x92D9,
+    'GL_UNSIGNED_INT_ATOMIC_COUNTER' : 0x92DB,
+    'GL_MAX_IMAGE_UNITS' : 0x8F38,
+    'GL_MAX_VERTEX_IMAGE_UNIFORMS' : 0x90CA,
+    'GL_MAX_FRAGMENT_IMAGE_UNIFORMS' : 0x90CE,
+    'GL_MAX_COMBINED_IMAGE_UNIFORMS' : 0x90CF,
+    'GL_IMAGE_BINDING_NAME' : 0x8F3A,
+    'GL_IMAGE_BINDING_LEVEL' : 0x8F3B,
+    'GL_IMAGE_BINDING_LAYERED' : 0x8F3C,
+    'GL_IMAGE_BINDING_LAYER' : 0x8F3D,
+    'GL_IMAGE_BINDING_ACCESS' : 0x8F3E,
+    'GL_IMAGE_BINDING_FORMAT' : 0x906E,
+    'GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT' : 0x0001,
+    'GL_ELEMENT_ARRAY_BARRIER_BIT' : 0x0002,
+    'GL_UNIFORM_BARRIER_BIT' : 0x0004,
+    'GL_TEXTURE_FETCH_BARRIER_BIT' : 0x0008,
+    'GL_SHADER_IMAGE_ACCESS_BARRIER_BIT' : 0x0020,
+    'GL_COMMAND_BARRIER_BIT' : 0x0040,
+    'GL_PIXEL_BUFFER_BARRIER_BIT' : 0x0080,
+    'GL_TEXTURE_UPDATE_BARRIER_BIT' : 0x0100,
+    'GL_BUFFER_UPDATE_BARRIER_BIT' : 0x0200,
+    'GL_FRAMEBUFFER_BARRIER_BIT' : 0x0400,
+    'GL_TRANSFORM_FEEDBACK_BARRIER_BIT' : 0x0800,
+    'GL_ATOMIC_COUNTER_BARRIER_BIT' : 0x1000,
+    'GL_ALL_BARRIER_BITS' : 0xFFFFFFFF,
+    'GL_IMAGE_2D' : 0x904D,
+    'GL_IMAGE_3D' : 0x904E,
+    'GL_IMAGE_CUBE' : 0x9050,
+    'GL_IMAGE_2D_ARRAY' : 0x9053,
+    'GL_INT_IMAGE_2D' : 0x9058,
+    'GL_INT_IMAGE_3D' : 0x9059,
+    'GL_INT_IMAGE_CUBE' : 0x905B,
+    'GL_INT_IMAGE_2D_ARRAY' : 0x905E,
+    'GL_UNSIGNED_INT_IMAGE_2D' : 0x9063,
+    'GL_UNSIGNED_INT_IMAGE_3D' : 0x9064,
+    'GL_UNSIGNED_INT_IMAGE_CUBE' : 0x9066,
+    'GL_UNSIGNED_INT_IMAGE_2D_ARRAY' : 0x9069,
+    'GL_IMAGE_FORMAT_COMPATIBILITY_TYPE' : 0x90C7,
+    'GL_IMAGE_FORMAT_COMPATIBILITY_BY_SIZE' : 0x90C8,
+    'GL_IMAGE_FORMAT_COMPATIBILITY_BY_CLASS' : 0x90C9,
+    'GL_READ_ONLY' : 0x88B8,
+    'GL_WRITE_ONLY' : 0x88B9,
+    'GL_READ_WRITE' : 0x88BA,
+    'GL_SHADER_STORAGE_BUFFER' : 0x90D2,
+    'GL_SHADER_STORAGE_BUFFER_BINDING' : 0x90D3,
+    'GL_SHADER_STORAGE_BUFFER_START' : 0x90D4,
+    'GL_SHADER_STORAGE_BUFFER_SIZE' : 0x90D5,
+    'GL_MAX_VERTEX_SHADER_STORAGE_BLOCKS' : 0x90D6,
+    'GL_MAX_FRAGMENT_SHADER_STORAGE_BLOCKS' : 0x90DA,
+    'GL_MAX_COMPUTE_SHADER_STORAGE_BLOCKS' : 0x90DB,
+    'GL_MAX_COMBINED_SHADER_STORAGE_BLOCKS' : 0x90DC,
+    'GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS' : 0x90DD,
+    'GL_MAX_SHADER_STORAGE_BLOCK_SIZE' : 0x90DE,
+    'GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT' : 0x90DF,
+    'GL_SHADER_STORAGE_BARRIER_BIT' : 0x2000,
+    'GL_MAX_COMBINED_SHADER_OUTPUT_RESOURCES' : 0x8F39,
+    'GL_DEPTH_STENCIL_TEXTURE_MODE' : 0x90EA,
+    'GL_STENCIL_INDEX' : 0x1901,
+    'GL_MIN_PROGRAM_TEXTURE_GATHER_OFFSET' : 0x8E5E,
+    'GL_MAX_PROGRAM_TEXTURE_GATHER_OFFSET' : 0x8E5F,
+    'GL_SAMPLE_POSITION' : 0x8E50,
+    'GL_SAMPLE_MASK' : 0x8E51,
+    'GL_SAMPLE_MASK_VALUE' : 0x8E52,
+    'GL_TEXTURE_2D_MULTISAMPLE' : 0x9100,
+    'GL_MAX_SAMPLE_MASK_WORDS' : 0x8E59,
+    'GL_MAX_COLOR_TEXTURE_SAMPLES' : 0x910E,
+    'GL_MAX_DEPTH_TEXTURE_SAMPLES' : 0x910F,
+    'GL_MAX_INTEGER_SAMPLES' : 0x9110,
+    'GL_TEXTURE_BINDING_2D_MULTISAMPLE' : 0x9104,
+    'GL_TEXTURE_SAMPLES' : 0x9106,
+    'GL_TEXTURE_FIXED_SAMPLE_LOCATIONS' : 0x9107,
+    'GL_TEXTURE_WIDTH' : 0x1000,
+    'GL_TEXTURE_HEIGHT' : 0x1001,
+    'GL_TEXTURE_DEPTH' : 0x8071,
+    'GL_TEXTURE_INTERNAL_FORMAT' : 0x1003,
+    'GL_TEXTURE_RED_SIZE' : 0x805C,
+    'GL_TEXTURE_GREEN_SIZE' : 0x805D,
+    'GL_TEXTURE_BLUE_SIZE' : 0x805E,
+    'GL_TEXTURE_ALPHA_SIZE' : 0x805F,
+    'GL_TEXTURE_DEPTH_SIZE' : 0x884A,
+    'GL_TEXTURE_STENCIL_SIZE' : 0x88F1,
+    'GL_TEXTURE_SHARED_SIZE' : 0x8C3F,
+    'GL_TEXTURE_RED_TYPE' : 0x8C10,
+    'GL_TEXTURE_GREEN_TYPE' : 0x8C11,
+    'GL_TEXTURE_BLUE_TYPE' : 0x8C12,
+    'GL_TEXTURE_ALPHA_TYPE' : 0x8C13,
+    'GL_TEXTURE_DEPTH_TYPE' : 0x8C16,
+    'GL_TEXTURE_COMPRESSED' : 0x86A1,
+    'GL_SAMPLER_2D_MULTISAMPLE' : 0x9108,
+    'GL_INT_SAMPLER_2D_MULTISAMPLE' : 0x9109,
+    'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE' : 0x910A,
+    'GL_VERTEX_ATTRIB_BINDING' : 0x82D4,
+    'GL_VERTEX_ATTRIB_RELATIVE_OFFSET' : 0x82D5,
+    'GL_VERTEX_BINDING_DIVISOR' : 0x82D6,
+    'GL_VERTEX_BINDING_OFFSET' : 0x82D7,
+    'GL_VERTEX_BINDING_STRIDE' : 0x82D8,
+    'GL_VERTEX_BINDING_BUFFER' : 0x8F4F,
+    'GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET' : 0x82D9,
+    'GL_MAX_VERTEX_ATTRIB_BINDINGS' : 0x82DA,
+    'GL_MAX_VERTEX_ATTRIB_STRIDE' : 0x82E5,
+    'GL_MULTISAMPLE_LINE_WIDTH_RANGE' : 0x9381,
+    'GL_MULTISAMPLE_LINE_WIDTH_GRANULARITY' : 0x9382,
+    'GL_MULTIPLY' : 0x9294,
+    'GL_SCREEN' : 0x9295,
+    'GL_OVERLAY' : 0x9296,
+    'GL_DARKEN' : 0x9297,
+    'GL_LIGHTEN' : 0x9298,
+    'GL_COLORDODGE' : 0x9299,
+    'GL_COLORBURN' : 0x929A,
+    'GL_HARDLIGHT' : 0x929B,
+    'GL_SOFTLIGHT' : 0x929C,
+    'GL_DIFFERENCE' : 0x929E,
+    'GL_EXCLUSION' : 0x92A0,
+    'GL_HSL_HUE' : 0x92AD,
+    'GL_HSL_SATURATION' : 0x92AE,
+    'GL_HSL_COLOR' : 0x92AF,
+    'GL_HSL_LUMINOSITY' : 0x92B0,
+    'GL_DEBUG_OUTPUT_SYNCHRONOUS' : 0x8242,
+    'GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH' : 0x8243,
+    'GL_DEBUG_CALLBACK_FUNCTION' : 0x8244,
+    'GL_DEBUG_CALLBACK_USER_PARAM' : 0x8245,
+    'GL_DEBUG_SOURCE_API' : 0x8246,
+    'GL_DEBUG_SOURCE_WINDOW_SYSTEM' : 0x8247,
+    'GL_DEBUG_SOURCE_SHADER_COMPILER' : 0x8248,
+    'GL_DEBUG_SOURCE_THIRD_PARTY' : 0x8249,
+    'GL_DEBUG_SOURCE_APPLICATION' : 0x824A,
+    'GL_DEBUG_SOURCE_OTHER' : 0x824B,
+    'GL_DEBUG_TYPE_ERROR' : 0x824C,
+    'GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR' : 0x824D,
+    'GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR' : 0x824E,
+    'GL_DEBUG_TYPE_PORTABILITY' : 0x824F,
+    'GL_DEBUG_TYPE_PERFORMANCE' : 0x8250,
+    'GL_DEBUG_TYPE_OTHER' : 0x8251,
+    'GL_DEBUG_TYPE_MARKER' : 0x8268,
+    'GL_DEBUG_TYPE_PUSH_GROUP' : 0x8269,
+    'GL_DEBUG_TYPE_POP_GROUP' : 0x826A,
+    'GL_DEBUG_SEVERITY_NOTIFICATION' : 0x826B,
+    'GL_MAX_DEBUG_GROUP_STACK_DEPTH' : 0x826C,
+    'GL_DEBUG_GROUP_STACK_DEPTH' : 0x826D,
+    'GL_BUFFER' : 0x82E0,
+    'GL_SHADER' : 0x82E1,
+    'GL_PROGRAM' : 0x82E2,
+    'GL_VERTEX_ARRAY' : 0x8074,
+    'GL_QUERY' : 0x82E3,
+    'GL_PROGRAM_PIPELINE' : 0x82E4,
+    'GL_SAMPLER' : 0x82E6,
+    'GL_MAX_LABEL_LENGTH' : 0x82E8,
+    'GL_MAX_DEBUG_MESSAGE_LENGTH' : 0x9143,
+    'GL_MAX_DEBUG_LOGGED_MESSAGES' : 0x9144,
+    'GL_DEBUG_LOGGED_MESSAGES' : 0x9145,
+    'GL_DEBUG_SEVERITY_HIGH' : 0x9146,
+    'GL_DEBUG_SEVERITY_MEDIUM' : 0x9147,
+    'GL_DEBUG_SEVERITY_LOW' : 0x9148,
+    'GL_DEBUG_OUTPUT' : 0x92E0,
+    'GL_CONTEXT_FLAG_DEBUG_BIT' : 0x0002,
+    'GL_STACK_OVERFLOW' : 0x0503,
+    'GL_STACK_UNDERFLOW' : 0x0504,
+    'GL_GEOMETRY_SHADER' : 0x8DD9,
+    'GL_GEOMETRY_SHADER_BIT' : 0x0004,
+    'GL_GEOMETRY_VERTICES_OUT' : 0x8916,
+    'GL_GEOMETRY_INPUT_TYPE' : 0x8917,
+    'GL_GEOMETRY_OUTPUT_TYPE' : 0x8918,
+    'GL_GEOMETRY_SHADER_INVOCATIONS' : 0x887F,
+    'GL_LAYER_PROVOKING_VERTEX' : 0x825E,
+    'GL_LINES_ADJACENCY' : 0x000A,
+    'GL_LINE_STRIP_ADJACENCY' : 0x000B,
+    'GL_TRIANGLES_ADJACENCY' : 0x000C,
+    'GL_TRIANGLE_STRIP_ADJACENCY' : 0x000D,
+    'GL_MAX_GEOMETRY_UNIFORM_COMPONENTS' : 0x8DDF,
+    'GL_MAX_GEOMETRY_UNIFORM_BLOCKS' : 0x8A2C,
+    'GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS' : 0x8A32,
+    'GL_MAX_GEOMETRY_INPUT_COMPONENTS' : 0x9123,
+    'GL_MAX_GEOMETRY_OUTPUT_COMPONENTS' : 0x9124,
+    'GL_MAX_GEOMETRY_OUTPUT_VERTICES' : 0x8DE0,
+    'GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS' : 0x8DE1,
+    'GL_MAX_GEOMETRY_SHADER_INVOCATIONS' : 0x8E5A,
+    'GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS' : 0x8C29,
+    'GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS' : 0x92CF,
+    'GL_MAX_GEOMETRY_ATOMIC_COUNTERS' : 0x92D5,
+    'GL_MAX_GEOMETRY_IMAGE_UNIFORMS' : 0x90CD,
+    'GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS' : 0x90D7,
+    'GL_FIRST_VERTEX_CONVENTION' : 0x8E4D,
+    'GL_LAST_VERTEX_CONVENTION' : 0x8E4E,
+    'GL_UNDEFINED_VERTEX' : 0x8260,
+    'GL_PRIMITIVES_GENERATED' : 0x8C87,
+    'GL_FRAMEBUFFER_DEFAULT_LAYERS' : 0x9312,
+    'GL_MAX_FRAMEBUFFER_LAYERS' : 0x9317,
+    'GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS' : 0x8DA8,
+    'GL_FRAMEBUFFER_ATTACHMENT_LAYERED' : 0x8DA7,
+    'GL_REFERENCED_BY_GEOMETRY_SHADER' : 0x9309,
+    'GL_PRIMITIVE_BOUNDING_BOX' : 0x92BE,
+    'GL_CONTEXT_FLAG_ROBUST_ACCESS_BIT' : 0x0004,
+    'GL_CONTEXT_FLAGS' : 0x821E,
+    'GL_LOSE_CONTEXT_ON_RESET' : 0x8252,
+    'GL_GUILTY_CONTEXT_RESET' : 0x8253,
+    'GL_INNOCENT_CONTEXT_RESET' : 0x8254,
+    'GL_UNKNOWN_CONTEXT_RESET' : 0x8255,
+    'GL_RESET_NOTIFICATION_STRATEGY' : 0x8256,
+    'GL_NO_RESET_NOTIFICATION' : 0x8261,
+    'GL_CONTEXT_LOST' : 0x0507,
+    'GL_SAMPLE_SHADING' : 0x8C36,
+    'GL_MIN_SAMPLE_SHADING_VALUE' : 0x8C37,
+    'GL_MIN_FRAGMENT_INTERPOLATION_OFFSET' : 0x8E5B,
+    'GL_MAX_FRAGMENT_INTERPOLATION_OFFSET' : 0x8E5C,
+    'GL_FRAGMENT_INTERPOLATION_OFFSET_BITS' : 0x8E5D,
+    'GL_PATCHES' : 0x000E,
+    'GL_PATCH_VERTICES' : 0x8E72,
+    'GL_TESS_CONTROL_OUTPUT_VERTICES' : 0x8E75,
+    'GL_TESS_GEN_MODE' : 0x8E76,
+    'GL_TESS_GEN_SPACING' : 0x8E77,
+    'GL_TESS_GEN_VERTEX_ORDER' : 0x8E78,
+    'GL_TESS_GEN_POINT_MODE' : 0x8E79,
+    'GL_ISOLINES' : 0x8E7A,
+    'GL_QUADS' : 0x0007,
+    'GL_FRACTIONAL_ODD' : 0x8E7B,
+    'GL_FRACTIONAL_EVEN' : 0x8E7C,
+    'GL_MAX_PATCH_VERTICES' : 0x8E7D,
+    'GL_MAX_TESS_GEN_LEVEL' : 0x8E7E,
+    'GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS' : 0x8E7F,
+    'GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS' : 0x8E80,
+    'GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS' : 0x8E81,
+    'GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS' : 0x8E82,
+    'GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS' : 0x8E83,
+    'GL_MAX_TESS_PATCH_COMPONENTS' : 0x8E84,
+    'GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS' : 0x8E85,
+    'GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS' : 0x8E86,
+    'GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS' : 0x8E89,
+    'GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS' : 0x8E8A,
+    'GL_MAX_TESS_CONTROL_INPUT_COMPONENTS' : 0x886C,
+    'GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS' : 0x886D,
+    'GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS' : 0x8E1E,
+    'GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS' : 0x8E1F,
+    'GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS' : 0x92CD,
+    'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS' : 0x92CE,
+    'GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS' : 0x92D3,
+    'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS' : 0x92D4,
+    'GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS' : 0x90CB,
+    'GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS' : 0x90CC,
+    'GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS' : 0x90D8,
+    'GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS' : 0x90D9,
+    'GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED' : 0x8221,
+    'GL_IS_PER_PATCH' : 0x92E7,
+    'GL_REFERENCED_BY_TESS_CONTROL_SHADER' : 0x9307,
+    'GL_REFERENCED_BY_TESS_EVALUATION_SHADER' : 0x9308,
+    'GL_TESS_CONTROL_SHADER' : 0x8E88,
+    'GL_TESS_EVALUATION_SHADER' : 0x8E87,
+    'GL_TESS_CONTROL_SHADER_BIT' : 0x0008,
+    'GL_TESS_EVALUATION_SHADER_BIT' : 0x0010,
+    'GL_TEXTURE_BORDER_COLOR' : 0x1004,
+    'GL_CLAMP_TO_BORDER' : 0x812D,
+    'GL_TEXTURE_BUFFER' : 0x8C2A,
+    'GL_TEXTURE_BUFFER_BINDING' : 0x8C2A,
+    'GL_MAX_TEXTURE_BUFFER_SIZE' : 0x8C2B,
+    'GL_TEXTURE_BINDING_BUFFER' : 0x8C2C,
+    'GL_TEXTURE_BUFFER_DATA_STORE_BINDING' : 0x8C2D,
+    'GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT' : 0x919F,
+    'GL_SAMPLER_BUFFER' : 0x8DC2,
+    'GL_INT_SAMPLER_BUFFER' : 0x8DD0,
+    'GL_UNSIGNED_INT_SAMPLER_BUFFER' : 0x8DD8,
+    'GL_IMAGE_BUFFER' : 0x9051,
+    'GL_INT_IMAGE_BUFFER' : 0x905C,
+    'GL_UNSIGNED_INT_IMAGE_BUFFER' : 0x9067,
+    'GL_TEXTURE_BUFFER_OFFSET' : 0x919D,
+    'GL_TEXTURE_BUFFER_SIZE' : 0x919E,
+    'GL_COMPRESSED_RGBA_ASTC_4x4' : 0x93B0,
+    'GL_COMPRESSED_RGBA_ASTC_5x4' : 0x93B1,
+    'GL_COMPRESSED_RGBA_ASTC_5x5' : 0x93B2,
+    'GL_COMPRESSED_RGBA_ASTC_6x5' : 0x93B3,
+    'GL_COMPRESSED_RGBA_ASTC_6x6' : 0x93B4,
+    'GL_COMPRESSED_RGBA_ASTC_8x5' : 0x93B5,
+    'GL_COMPRESSED_RGBA_ASTC_8x6' : 0x93B6,
+    'GL_COMPRESSED_RGBA_ASTC_8x8' : 0x93B7,
+    'GL_COMPRESSED_RGBA_ASTC_10x5' : 0x93B8,
+    'GL_COMPRESSED_RGBA_ASTC_10x6' : 0x93B9,
+    'GL_COMPRESSED_RGBA_ASTC_10x8' : 0x93BA,
+    'GL_COMPRESSED_RGBA_ASTC_10x10' : 0x93BB,
+    'GL_COMPRESSED_RGBA_ASTC_12x10' : 0x93BC,
+    'GL_COMPRESSED_RGBA_ASTC_12x12' : 0x93BD,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4' : 0x93D0,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4' : 0x93D1,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5' : 0x93D2,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5' : 0x93D3,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6' : 0x93D4,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5' : 0x93D5,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6' : 0x93D6,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8' : 0x93D7,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5' : 0x93D8,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6' : 0x93D9,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8' : 0x93DA,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10' : 0x93DB,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10' : 0x93DC,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12' : 0x93DD,
+    'GL_TEXTURE_CUBE_MAP_ARRAY' : 0x9009,
+    'GL_TEXTURE_BINDING_CUBE_MAP_ARRAY' : 0x900A,
+    'GL_SAMPLER_CUBE_MAP_ARRAY' : 0x900C,
+    'GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW' : 0x900D,
+    'GL_INT_SAMPLER_CUBE_MAP_ARRAY' : 0x900E,
+    'GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY' : 0x900F,
+    'GL_IMAGE_CUBE_MAP_ARRAY' : 0x9054,
+    'GL_INT_IMAGE_CUBE_MAP_ARRAY' : 0x905F,
+    'GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY' : 0x906A,
+    'GL_TEXTURE_2D_MULTISAMPLE_ARRAY' : 0x9102,
+    'GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY' : 0x9105,
+    'GL_SAMPLER_2D_MULTISAMPLE_ARRAY' : 0x910B,
+    'GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY' : 0x910C,
+    'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY' : 0x910D,
+    'GL_PACK_IMAGE_HEIGHT' : 0x806C,
+    'GL_PACK_SKIP_IMAGES' : 0x806B,
+    'GL_3DC_X_AMD' : 0x87F9,
+    'GL_3DC_XY_AMD' : 0x87FA,
+    'GL_ATC_RGB_AMD' : 0x8C92,
+    'GL_ATC_RGBA_EXPLICIT_ALPHA_AMD' : 0x8C93,
+    'GL_ATC_RGBA_INTERPOLATED_ALPHA_AMD' : 0x87EE,
+    'GL_RENDERBUFFER_STORAGE_SAMPLES_AMD' : 0x91B2,
+    'GL_MAX_COLOR_FRAMEBUFFER_SAMPLES_AMD' : 0x91B3,
+    'GL_MAX_COLOR_FRAMEBUFFER_STORAGE_SAMPLES_AMD' : 0x91B4,
+    'GL_MAX_DEPTH_STENCIL_FRAMEBUFFER_SAMPLES_AMD' : 0x91B5,
+    'GL_NUM_SUPPORTED_MULTISAMPLE_MODES_AMD' : 0x91B6,
+    'GL_SUPPORTED_MULTISAMPLE_MODES_AMD' : 0x91B7,
+    'GL_COUNTER_TYPE_AMD' : 0x8BC0,
+    'GL_COUNTER_RANGE_AMD' : 0x8BC1,
+    'GL_UNSIGNED_INT64_AMD' : 0x8BC2,
+    'GL_PERCENTAGE_AMD' : 0x8BC3,
+    'GL_PERFMON_RESULT_AVAILABLE_AMD' : 0x8BC4,
+    'GL_PERFMON_RESULT_SIZE_AMD' : 0x8BC5,
+    'GL_PERFMON_RESULT_AMD' : 0x8BC6,
+    'GL_Z400_BINARY_AMD' : 0x8740,
+    'GL_DEPTH_STENCIL_OES' : 0x84F9,
+    'GL_UNSIGNED_INT_24_8_OES' : 0x84FA,
+    'GL_DEPTH_COMPONENT32_OES' : 0x81A7,
+    'GL_DEPTH24_STENCIL8_OES' : 0x88F0,
+    'GL_READ_FRAMEBUFFER_ANGLE' : 0x8CA8,
+    'GL_DRAW_FRAMEBUFFER_ANGLE' : 0x8CA9,
+    'GL_DRAW_FRAMEBUFFER_BINDING_ANGLE' : 0x8CA6,
+    'GL_READ_FRAMEBUFFER_BINDING_ANGLE' : 0x8CAA,
+    'GL_RENDERBUFFER_SAMPLES_ANGLE' : 0x8CAB,
+    'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_ANGLE' : 0x8D56,
+    'GL_MAX_SAMPLES_ANGLE' : 0x8D57,
+    'GL_VERTEX_ATTRIB_ARRAY_DIVISOR_ANGLE' : 0x88FE,
+    'GL_PACK_REVERSE_ROW_ORDER_ANGLE' : 0x93A4,
+    'GL_PROGRAM_BINARY_ANGLE' : 0x93A6,
+    'GL_COMPRESSED_RGBA_S3TC_DXT3_ANGLE' : 0x83F2,
+    'GL_COMPRESSED_RGBA_S3TC_DXT5_ANGLE' : 0x83F3,
+    'GL_TEXTURE_USAGE_ANGLE' : 0x93A2,
+    'GL_FRAMEBUFFER_ATTACHMENT_ANGLE' : 0x93A3,
+    'GL_TRANSLATED_SHADER_SOURCE_LENGTH_ANGLE' : 0x93A0,
+    'GL_MAX_CLIP_DISTANCES_APPLE' : 0x0D32,
+    'GL_CLIP_DISTANCE0_APPLE' : 0x3000,
+    'GL_CLIP_DISTANCE1_APPLE' : 0x3001,
+    'GL_CLIP_DISTANCE2_APPLE' : 0x3002,
+    'GL_CLIP_DISTANCE3_APPLE' : 0x3003,
+    'GL_CLIP_DISTANCE4_APPLE' : 0x3004,
+    'GL_CLIP_DISTANCE5_APPLE' : 0x3005,
+    'GL_CLIP_DISTANCE6_APPLE' : 0x3006,
+    'GL_CLIP_DISTANCE7_APPLE' : 0x3007,
+    'GL_RENDERBUFFER_SAMPLES_APPLE' : 0x8CAB,
+    'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_APPLE' : 0x8D56,
+    'GL_MAX_SAMPLES_APPLE' : 0x8D57,
+    'GL_READ_FRAMEBUFFER_APPLE' : 0x8CA8,
+    'GL_DRAW_FRAMEBUFFER_APPLE' : 0x8CA9,
+    'GL_DRAW_FRAMEBUFFER_BINDING_APPLE' : 0x8CA6,
+    'GL_READ_FRAMEBUFFER_BINDING_APPLE' : 0x8CAA,
+    'GL_RGB_422_APPLE' : 0x8A1F,
+    'GL_UNSIGNED_SHORT_8_8_APPLE' : 0x85BA,
+    'GL_UNSIGNED_SHORT_8_8_REV_APPLE' : 0x85BB,
+    'GL_RGB_RAW_422_APPLE' : 0x8A51,
+    'GL_SYNC_OBJECT_APPLE' : 0x8A53,
+    'GL_MAX_SERVER_WAIT_TIMEOUT_APPLE' : 0x9111,
+    'GL_OBJECT_TYPE_APPLE' : 0x9112,
+    'GL_SYNC_CONDITION_APPLE' : 0x9113,
+    'GL_SYNC_STATUS_APPLE' : 0x9114,
+    'GL_SYNC_FLAGS_APPLE' : 0x9115,
+    'GL_SYNC_FENCE_APPLE' : 0x9116,
+    'GL_SYNC_GPU_COMMANDS_COMPLETE_APPLE' : 0x9117,
+    'GL_UNSIGNALED_APPLE' : 0x9118,
+    'GL_SIGNALED_APPLE' : 0x9119,
+    'GL_ALREADY_SIGNALED_APPLE' : 0x911A,
+    'GL_TIMEOUT_EXPIRED_APPLE' : 0x911B,
+    'GL_CONDITION_SATISFIED_APPLE' : 0x911C,
+    'GL_WAIT_FAILED_APPLE' : 0x911D,
+    'GL_SYNC_FLUSH_COMMANDS_BIT_APPLE' : 0x0001,
+    'GL_TIMEOUT_IGNORED_APPLE' : 0xFFFFFFFFFFFFFFFF,
+    'GL_BGRA_EXT' : 0x80E1,
+    'GL_BGRA8_EXT' : 0x93A1,
+    'GL_TEXTURE_MAX_LEVEL_APPLE' : 0x813D,
+    'GL_UNSIGNED_INT_10F_11F_11F_REV_APPLE' : 0x8C3B,
+    'GL_UNSIGNED_INT_5_9_9_9_REV_APPLE' : 0x8C3E,
+    'GL_R11F_G11F_B10F_APPLE' : 0x8C3A,
+    'GL_RGB9_E5_APPLE' : 0x8C3D,
+    'GL_MALI_PROGRAM_BINARY_ARM' : 0x8F61,
+    'GL_MALI_SHADER_BINARY_ARM' : 0x8F60,
+    'GL_SHADER_CORE_COUNT_ARM' : 0x96F0,
+    'GL_SHADER_CORE_ACTIVE_COUNT_ARM' : 0x96F1,
+    'GL_SHADER_CORE_PRESENT_MASK_ARM' : 0x96F2,
+    'GL_SHADER_CORE_MAX_WARP_COUNT_ARM' : 0x96F3,
+    'GL_SHADER_CORE_PIXEL_RATE_ARM' : 0x96F4,
+    'GL_SHADER_CORE_TEXEL_RATE_ARM' : 0x96F5,
+    'GL_SHADER_CORE_FMA_RATE_ARM' : 0x96F6,
+    'GL_FETCH_PER_SAMPLE_ARM' : 0x8F65,
+    'GL_FRAGMENT_SHADER_FRAMEBUFFER_FETCH_MRT_ARM' : 0x8F66,
+    'GL_TEXTURE_UNNORMALIZED_COORDINATES_ARM' : 0x8F6A,
+    'GL_SMAPHS30_PROGRAM_BINARY_DMP' : 0x9251,
+    'GL_SMAPHS_PROGRAM_BINARY_DMP' : 0x9252,
+    'GL_DMP_PROGRAM_BINARY_DMP' : 0x9253,
+    'GL_SHADER_BINARY_DMP' : 0x9250,
+    'GL_SURFACE_COMPRESSION_EXT' : 0x96C0,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_NONE_EXT' : 0x96C1,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_DEFAULT_EXT' : 0x96C2,
+    'GL_SAMPLER_EXTERNAL_2D_Y2Y_EXT' : 0x8BE7,
+    'GL_TEXTURE_EXTERNAL_OES' : 0x8D65,
+    'GL_TEXTURE_BINDING_EXTERNAL_OES' : 0x8D67,
+    'GL_REQUIRED_TEXTURE_IMAGE_UNITS_OES' : 0x8D68,
+    'GL_SRC1_COLOR_EXT' : 0x88F9,
+    'GL_SRC1_ALPHA_EXT' : 0x8589,
+    'GL_ONE_MINUS_SRC1_COLOR_EXT' : 0x88FA,
+    'GL_ONE_MINUS_SRC1_ALPHA_EXT' : 0x88FB,
+    'GL_SRC_ALPHA_SATURATE_EXT' : 0x0308,
+    'GL_LOCATION_INDEX_EXT' : 0x930F,
+    'GL_MAX_DUAL_SOURCE_DRAW_BUFFERS_EXT' : 0x88FC,
+    'GL_MIN_EXT' : 0x8007,
+    'GL_MAX_EXT' : 0x8008,
+    'GL_MAP_PERSISTENT_BIT_EXT' : 0x0040,
+    'GL_MAP_COHERENT_BIT_EXT' : 0x0080,
+    'GL_DYNAMIC_STORAGE_BIT_EXT' : 0x0100,
+    'GL_CLIENT_STORAGE_BIT_EXT' : 0x0200,
+    'GL_CLIENT_MAPPED_BUFFER_BARRIER_BIT_EXT' : 0x4000,
+    'GL_BUFFER_IMMUTABLE_STORAGE_EXT' : 0x821F,
+    'GL_BUFFER_STORAGE_FLAGS_EXT' : 0x8220,
+    'GL_LOWER_LEFT_EXT' : 0x8CA1,
+    'GL_UPPER_LEFT_EXT' : 0x8CA2,
+    'GL_NEGATIVE_ONE_TO_ONE_EXT' : 0x935E,
+    'GL_ZERO_TO_ONE_EXT' : 0x935F,
+    'GL_CLIP_ORIGIN_EXT' : 0x935C,
+    'GL_CLIP_DEPTH_MODE_EXT' : 0x935D,
+    'GL_MAX_CLIP_DISTANCES_EXT' : 0x0D32,
+    'GL_MAX_CULL_DISTANCES_EXT' : 0x82F9,
+    'GL_MAX_COMBINED_CLIP_AND_CULL_DISTANCES_EXT' : 0x82FA,
+    'GL_CLIP_DISTANCE0_EXT' : 0x3000,
+    'GL_CLIP_DISTANCE1_EXT' : 0x3001,
+    'GL_CLIP_DISTANCE2_EXT' : 0x3002,
+    'GL_CLIP_DISTANCE3_EXT' : 0x3003,
+    'GL_CLIP_DISTANCE4_EXT' : 0x3004,
+    'GL_CLIP_DISTANCE5_EXT' : 0x3005,
+    'GL_CLIP_DISTANCE6_EXT' : 0x3006,
+    'GL_CLIP_DISTANCE7_EXT' : 0x3007,
+    'GL_RGBA16F_EXT' : 0x881A,
+    'GL_RGB16F_EXT' : 0x881B,
+    'GL_RG16F_EXT' : 0x822F,
+    'GL_R16F_EXT' : 0x822D,
+    'GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE_EXT' : 0x8211,
+    'GL_UNSIGNED_NORMALIZED_EXT' : 0x8C17,
+    'GL_PROGRAM_PIPELINE_OBJECT_EXT' : 0x8A4F,
+    'GL_PROGRAM_OBJECT_EXT' : 0x8B40,
+    'GL_SHADER_OBJECT_EXT' : 0x8B48,
+    'GL_BUFFER_OBJECT_EXT' : 0x9151,
+    'GL_QUERY_OBJECT_EXT' : 0x9153,
+    'GL_VERTEX_ARRAY_OBJECT_EXT' : 0x9154,
+    'GL_DEPTH_CLAMP_EXT' : 0x864F,
+    'GL_COLOR_EXT' : 0x1800,
+    'GL_DEPTH_EXT' : 0x1801,
+    'GL_STENCIL_EXT' : 0x1802,
+    'GL_QUERY_COUNTER_BITS_EXT' : 0x8864,
+    'GL_CURRENT_QUERY_EXT' : 0x8865,
+    'GL_QUERY_RESULT_EXT' : 0x8866,
+    'GL_QUERY_RESULT_AVAILABLE_EXT' : 0x8867,
+    'GL_TIME_ELAPSED_EXT' : 0x88BF,
+    'GL_TIMESTAMP_EXT' : 0x8E28,
+    'GL_GPU_DISJOINT_EXT' : 0x8FBB,
+    'GL_MAX_COLOR_ATTACHMENTS_EXT' : 0x8CDF,
+    'GL_MAX_DRAW_BUFFERS_EXT' : 0x8824,
+    'GL_DRAW_BUFFER0_EXT' : 0x8825,
+    'GL_DRAW_BUFFER1_EXT' : 0x8826,
+    'GL_DRAW_BUFFER2_EXT' : 0x8827,
+    'GL_DRAW_BUFFER3_EXT' : 0x8828,
+    'GL_DRAW_BUFFER4_EXT' : 0x8829,
+    'GL_DRAW_BUFFER5_EXT' : 0x882A,
+    'GL_DRAW_BUFFER6_EXT' : 0x882B,
+    'GL_DRAW_BUFFER7_EXT' : 0x882C,
+    'GL_DRAW_BUFFER8_EXT' : 0x882D,
+    'GL_DRAW_BUFFER9_EXT' : 0x882E,
+    'GL_DRAW_BUFFER10_EXT' : 0x882F,
+    'GL_DRAW_BUFFER11_EXT' : 0x8830,
+    'GL_DRAW_BUFFER12_EXT' : 0x8831,
+    'GL_DRAW_BUFFER13_EXT' : 0x8832,
+    'GL_DRAW_BUFFER14_EXT' : 0x8833,
+    'GL_DRAW_BUFFER15_EXT' : 0x8834,
+    'GL_COLOR_ATTACHMENT0_EXT' : 0x8CE0,
+    'GL_COLOR_ATTACHMENT1_EXT' : 0x8CE1,
+    'GL_COLOR_ATTACHMENT2_EXT' : 0x8CE2,
+    'GL_COLOR_ATTACHMENT3_EXT' : 0x8CE3,
+    'GL_COLOR_ATTACHMENT4_EXT' : 0x8CE4,
+    'GL_COLOR_ATTACHMENT5_EXT' : 0x8CE5,
+    'GL_COLOR_ATTACHMENT6_EXT' : 0x8CE6,
+    'GL_COLOR_ATTACHMENT7_EXT' : 0x8CE7,
+    'GL_COLOR_ATTACHMENT8_EXT' : 0x8CE8,
+    'GL_COLOR_ATTACHMENT9_EXT' : 0x8CE9,
+    'GL_COLOR_ATTACHMENT10_EXT' : 0x8CEA,
+    'GL_COLOR_ATTACHMENT11_EXT' : 0x8CEB,
+    'GL_COLOR_ATTACHMENT12_EXT' : 0x8CEC,
+    'GL_COLOR_ATTACHMENT13_EXT' : 0x8CED,
+    'GL_COLOR_ATTACHMENT14_EXT' : 0x8CEE,
+    'GL_COLOR_ATTACHMENT15_EXT' : 0x8CEF,
+    'GL_SHADING_RATE_1X1_PIXELS_EXT' : 0x96A6,
+    'GL_SHADING_RATE_1X2_PIXELS_EXT' : 0x96A7,
+    'GL_SHADING_RATE_2X1_PIXELS_EXT' : 0x96A8,
+    'GL_SHADING_RATE_2X2_PIXELS_EXT' : 0x96A9,
+    'GL_SHADING_RATE_1X4_PIXELS_EXT' : 0x96AA,
+    'GL_SHADING_RATE_4X1_PIXELS_EXT' : 0x96AB,
+    'GL_SHADING_RATE_4X2_PIXELS_EXT' : 0x96AC,
+    'GL_SHADING_RATE_2X4_PIXELS_EXT' : 0x96AD,
+    'GL_SHADING_RATE_4X4_PIXELS_EXT' : 0x96AE,
+    'GL_SHADING_RATE_EXT' : 0x96D0,
+    'GL_SHADING_RATE_ATTACHMENT_EXT' : 0x96D1,
+    'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_KEEP_EXT' : 0x96D2,
+    'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_REPLACE_EXT' : 0x96D3,
+    'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_MIN_EXT' : 0x96D4,
+    'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_MAX_EXT' : 0x96D5,
+    'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_MUL_EXT' : 0x96D6,
+    'GL_MIN_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_WIDTH_EXT' : 0x96D7,
+    'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_WIDTH_EXT' : 0x96D8,
+    'GL_MIN_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_HEIGHT_EXT' : 0x96D9,
+    'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_HEIGHT_EXT' : 0x96DA,
+    'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_ASPECT_RATIO_EXT' : 0x96DB,
+    'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_LAYERS_EXT' : 0x96DC,
+    'GL_FRAGMENT_SHADING_RATE_WITH_SHADER_DEPTH_STENCIL_WRITES_SUPPORTED_EXT' : 0x96DD,
+    'GL_FRAGMENT_SHADING_RATE_WITH_SAMPLE_MASK_SUPPORTED_EXT' : 0x96DE,
+    'GL_FRAGMENT_SHADING_RATE_ATTACHMENT_WITH_DEFAULT_FRAMEBUFFER_SUPPORTED_EXT' : 0x96DF,
+    'GL_FRAGMENT_SHADING_RATE_NON_TRIVIAL_COMBINERS_SUPPORTED_EXT' : 0x8F6F,
+    'GL_GEOMETRY_SHADER_EXT' : 0x8DD9,
+    'GL_GEOMETRY_SHADER_BIT_EXT' : 0x0004,
+    'GL_GEOMETRY_LINKED_VERTICES_OUT_EXT' : 0x8916,
+    'GL_GEOMETRY_LINKED_INPUT_TYPE_EXT' : 0x8917,
+    'GL_GEOMETRY_LINKED_OUTPUT_TYPE_EXT' : 0x8918,
+    'GL_GEOMETRY_SHADER_INVOCATIONS_EXT' : 0x887F,
+    'GL_LAYER_PROVOKING_VERTEX_EXT' : 0x825E,
+    'GL_LINES_ADJACENCY_EXT' : 0x000A,
+    'GL_LINE_STRIP_ADJACENCY_EXT' : 0x000B,
+    'GL_TRIANGLES_ADJACENCY_EXT' : 0x000C,
+    'GL_TRIANGLE_STRIP_ADJACENCY_EXT' : 0x000D,
+    'GL_MAX_GEOMETRY_UNIFORM_COMPONENTS_EXT' : 0x8DDF,
+    'GL_MAX_GEOMETRY_UNIFORM_BLOCKS_EXT' : 0x8A2C,
+    'GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS_EXT' : 0x8A32,
+    'GL_MAX_GEOMETRY_INPUT_COMPONENTS_EXT' : 0x9123,
+    'GL_MAX_GEOMETRY_OUTPUT_COMPONENTS_EXT' : 0x9124,
+    'GL_MAX_GEOMETRY_OUTPUT_VERTICES_EXT' : 0x8DE0,
+    'GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS_EXT' : 0x8DE1,
+    'GL_MAX_GEOMETRY_SHADER_INVOCATIONS_EXT' : 0x8E5A,
+    'GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS_EXT' : 0x8C29,
+    'GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS_EXT' : 0x92CF,
+    'GL_MAX_GEOMETRY_ATOMIC_COUNTERS_EXT' : 0x92D5,
+    'GL_MAX_GEOMETRY_IMAGE_UNIFORMS_EXT' : 0x90CD,
+    'GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS_EXT' : 0x90D7,
+    'GL_FIRST_VERTEX_CONVENTION_EXT' : 0x8E4D,
+    'GL_LAST_VERTEX_CONVENTION_EXT' : 0x8E4E,
+    'GL_UNDEFINED_VERTEX_EXT' : 0x8260,
+    'GL_PRIMITIVES_GENERATED_EXT' : 0x8C87,
+    'GL_FRAMEBUFFER_DEFAULT_LAYERS_EXT' : 0x9312,
+    'GL_MAX_FRAMEBUFFER_LAYERS_EXT' : 0x9317,
+    'GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS_EXT' : 0x8DA8,
+    'GL_FRAMEBUFFER_ATTACHMENT_LAYERED_EXT' : 0x8DA7,
+    'GL_REFERENCED_BY_GEOMETRY_SHADER_EXT' : 0x9309,
+    'GL_VERTEX_ATTRIB_ARRAY_DIVISOR_EXT' : 0x88FE,
+    'GL_MAP_READ_BIT_EXT' : 0x0001,
+    'GL_MAP_WRITE_BIT_EXT' : 0x0002,
+    'GL_MAP_INVALIDATE_RANGE_BIT_EXT' : 0x0004,
+    'GL_MAP_INVALIDATE_BUFFER_BIT_EXT' : 0x0008,
+    'GL_MAP_FLUSH_EXPLICIT_BIT_EXT' : 0x0010,
+    'GL_MAP_UNSYNCHRONIZED_BIT_EXT' : 0x0020,
+    'GL_TEXTURE_TILING_EXT' : 0x9580,
+    'GL_DEDICATED_MEMORY_OBJECT_EXT' : 0x9581,
+    'GL_PROTECTED_MEMORY_OBJECT_EXT' : 0x959B,
+    'GL_NUM_TILING_TYPES_EXT' : 0x9582,
+    'GL_TILING_TYPES_EXT' : 0x9583,
+    'GL_OPTIMAL_TILING_EXT' : 0x9584,
+    'GL_LINEAR_TILING_EXT' : 0x9585,
+    'GL_NUM_DEVICE_UUIDS_EXT' : 0x9596,
+    'GL_DEVICE_UUID_EXT' : 0x9597,
+    'GL_DRIVER_UUID_EXT' : 0x9598,
+    'GL_UUID_SIZE_EXT' : 0x0010,
+    'GL_HANDLE_TYPE_OPAQUE_FD_EXT' : 0x9586,
+    'GL_HANDLE_TYPE_OPAQUE_WIN32_EXT' : 0x9587,
+    'GL_HANDLE_TYPE_OPAQUE_WIN32_KMT_EXT' : 0x9588,
+    'GL_DEVICE_LUID_EXT' : 0x9599,
+    'GL_DEVICE_NODE_MASK_EXT' : 0x959A,
+    'GL_LUID_SIZE_EXT' : 0x0008,
+    'GL_HANDLE_TYPE_D3D12_TILEPOOL_EXT' : 0x9589,
+    'GL_HANDLE_TYPE_D3D12_RESOURCE_EXT' : 0x958A,
+    'GL_HANDLE_TYPE_D3D11_IMAGE_EXT' : 0x958B,
+    'GL_HANDLE_TYPE_D3D11_IMAGE_KMT_EXT' : 0x958C,
+    'GL_MULTISAMPLE_EXT' : 0x809D,
+    'GL_SAMPLE_ALPHA_TO_ONE_EXT' : 0x809F,
+    'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SAMPLES_EXT' : 0x8D6C,
+    'GL_RENDERBUFFER_SAMPLES_EXT' : 0x8CAB,
+    'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_EXT' : 0x8D56,
+    'GL_MAX_SAMPLES_EXT' : 0x8D57,
+    'GL_COLOR_ATTACHMENT_EXT' : 0x90F0,
+    'GL_MULTIVIEW_EXT' : 0x90F1,
+    'GL_DRAW_BUFFER_EXT' : 0x0C01,
+    'GL_READ_BUFFER_EXT' : 0x0C02,
+    'GL_MAX_MULTIVIEW_BUFFERS_EXT' : 0x90F2,
+    'GL_ANY_SAMPLES_PASSED_EXT' : 0x8C2F,
+    'GL_ANY_SAMPLES_PASSED_CONSERVATIVE_EXT' : 0x8D6A,
+    'GL_POLYGON_OFFSET_CLAMP_EXT' : 0x8E1B,
+    'GL_PRIMITIVE_BOUNDING_BOX_EXT' : 0x92BE,
+    'GL_CONTEXT_FLAG_PROTECTED_CONTENT_BIT_EXT' : 0x0010,
+    'GL_TEXTURE_PROTECTED_EXT' : 0x8BFA,
+    'GL_COMPRESSED_SRGB_PVRTC_2BPPV1_EXT' : 0x8A54,
+    'GL_COMPRESSED_SRGB_PVRTC_4BPPV1_EXT' : 0x8A55,
+    'GL_COMPRESSED_SRGB_ALPHA_PVRTC_2BPPV1_EXT' : 0x8A56,
+    'GL_COMPRESSED_SRGB_ALPHA_PVRTC_4BPPV1_EXT' : 0x8A57,
+    'GL_COMPRESSED_SRGB_ALPHA_PVRTC_2BPPV2_IMG' : 0x93F0,
+    'GL_COMPRESSED_SRGB_ALPHA_PVRTC_4BPPV2_IMG' : 0x93F1,
+    'GL_RASTER_MULTISAMPLE_EXT' : 0x9327,
+    'GL_RASTER_SAMPLES_EXT' : 0x9328,
+    'GL_MAX_RASTER_SAMPLES_EXT' : 0x9329,
+    'GL_RASTER_FIXED_SAMPLE_LOCATIONS_EXT' : 0x932A,
+    'GL_MULTISAMPLE_RASTERIZATION_ALLOWED_EXT' : 0x932B,
+    'GL_EFFECTIVE_RASTER_SAMPLES_EXT' : 0x932C,
+    'GL_UNSIGNED_SHORT_4_4_4_4_REV_EXT' : 0x8365,
+    'GL_UNSIGNED_SHORT_1_5_5_5_REV_EXT' : 0x8366,
+    'GL_R16_SNORM_EXT' : 0x8F98,
+    'GL_RG16_SNORM_EXT' : 0x8F99,
+    'GL_RGBA16_SNORM_EXT' : 0x8F9B,
+    'GL_GUILTY_CONTEXT_RESET_EXT' : 0x8253,
+    'GL_INNOCENT_CONTEXT_RESET_EXT' : 0x8254,
+    'GL_UNKNOWN_CONTEXT_RESET_EXT' : 0x8255,
+    'GL_CONTEXT_ROBUST_ACCESS_EXT' : 0x90F3,
+    'GL_RESET_NOTIFICATION_STRATEGY_EXT' : 0x8256,
+    'GL_LOSE_CONTEXT_ON_RESET_EXT' : 0x8252,
+    'GL_NO_RESET_NOTIFICATION_EXT' : 0x8261,
+    'GL_LAYOUT_GENERAL_EXT' : 0x958D,
+    'GL_LAYOUT_COLOR_ATTACHMENT_EXT' : 0x958E,
+    'GL_LAYOUT_DEPTH_STENCIL_ATTACHMENT_EXT' : 0x958F,
+    'GL_LAYOUT_DEPTH_STENCIL_READ_ONLY_EXT' : 0x9590,
+    'GL_LAYOUT_SHADER_READ_ONLY_EXT' : 0x9591,
+    'GL_LAYOUT_TRANSFER_SRC_EXT' : 0x9592,
+    'GL_LAYOUT_TRANSFER_DST_EXT' : 0x9593,
+    'GL_LAYOUT_DEPTH_READ_ONLY_STENCIL_ATTACHMENT_EXT' : 0x9530,
+    'GL_LAYOUT_DEPTH_ATTACHMENT_STENCIL_READ_ONLY_EXT' : 0x9531,
+    'GL_HANDLE_TYPE_D3D12_FENCE_EXT' : 0x9594,
+    'GL_D3D12_FENCE_VALUE_EXT' : 0x9595,
+    'GL_SRGB_EXT' : 0x8C40,
+    'GL_SRGB_ALPHA_EXT' : 0x8C42,
+    'GL_SRGB8_ALPHA8_EXT' : 0x8C43,
+    'GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING_EXT' : 0x8210,
+    'GL_FRAMEBUFFER_SRGB_EXT' : 0x8DB9,
+    'GL_VERTEX_SHADER_BIT_EXT' : 0x0001,
+    'GL_FRAGMENT_SHADER_BIT_EXT' : 0x0002,
+    'GL_ALL_SHADER_BITS_EXT' : 0xFFFFFFFF,
+    'GL_PROGRAM_SEPARABLE_EXT' : 0x8258,
+    'GL_ACTIVE_PROGRAM_EXT' : 0x8259,
+    'GL_PROGRAM_PIPELINE_BINDING_EXT' : 0x825A,
+    'GL_FRAGMENT_SHADER_DISCARDS_SAMPLES_EXT' : 0x8A52,
+    'GL_MAX_SHADER_PIXEL_LOCAL_STORAGE_FAST_SIZE_EXT' : 0x8F63,
+    'GL_MAX_SHADER_PIXEL_LOCAL_STORAGE_SIZE_EXT' : 0x8F67,
+    'GL_SHADER_PIXEL_LOCAL_STORAGE_EXT' : 0x8F64,
+    'GL_MAX_SHADER_COMBINED_LOCAL_STORAGE_FAST_SIZE_EXT' : 0x9650,
+    'GL_MAX_SHADER_COMBINED_LOCAL_STORAGE_SIZE_EXT' : 0x9651,
+    'GL_FRAMEBUFFER_INCOMPLETE_INSUFFICIENT_SHADER_COMBINED_LOCAL_STORAGE_EXT' : 0x9652,
+    'GL_TEXTURE_COMPARE_MODE_EXT' : 0x884C,
+    'GL_TEXTURE_COMPARE_FUNC_EXT' : 0x884D,
+    'GL_COMPARE_REF_TO_TEXTURE_EXT' : 0x884E,
+    'GL_SAMPLER_2D_SHADOW_EXT' : 0x8B62,
+    'GL_TEXTURE_SPARSE_EXT' : 0x91A6,
+    'GL_VIRTUAL_PAGE_SIZE_INDEX_EXT' : 0x91A7,
+    'GL_NUM_SPARSE_LEVELS_EXT' : 0x91AA,
+    'GL_NUM_VIRTUAL_PAGE_SIZES_EXT' : 0x91A8,
+    'GL_VIRTUAL_PAGE_SIZE_X_EXT' : 0x9195,
+    'GL_VIRTUAL_PAGE_SIZE_Y_EXT' : 0x9196,
+    'GL_VIRTUAL_PAGE_SIZE_Z_EXT' : 0x9197,
+    'GL_TEXTURE_CUBE_MAP_ARRAY_OES' : 0x9009,
+    'GL_MAX_SPARSE_TEXTURE_SIZE_EXT' : 0x9198,
+    'GL_MAX_SPARSE_3D_TEXTURE_SIZE_EXT' : 0x9199,
+    'GL_MAX_SPARSE_ARRAY_TEXTURE_LAYERS_EXT' : 0x919A,
+    'GL_SPARSE_TEXTURE_FULL_ARRAY_CUBE_MIPMAPS_EXT' : 0x91A9,
+    'GL_PATCHES_EXT' : 0x000E,
+    'GL_PATCH_VERTICES_EXT' : 0x8E72,
+    'GL_TESS_CONTROL_OUTPUT_VERTICES_EXT' : 0x8E75,
+    'GL_TESS_GEN_MODE_EXT' : 0x8E76,
+    'GL_TESS_GEN_SPACING_EXT' : 0x8E77,
+    'GL_TESS_GEN_VERTEX_ORDER_EXT' : 0x8E78,
+    'GL_TESS_GEN_POINT_MODE_EXT' : 0x8E79,
+    'GL_ISOLINES_EXT' : 0x8E7A,
+    'GL_QUADS_EXT' : 0x0007,
+    'GL_FRACTIONAL_ODD_EXT' : 0x8E7B,
+    'GL_FRACTIONAL_EVEN_EXT' : 0x8E7C,
+    'GL_MAX_PATCH_VERTICES_EXT' : 0x8E7D,
+    'GL_MAX_TESS_GEN_LEVEL_EXT' : 0x8E7E,
+    'GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS_EXT' : 0x8E7F,
+    'GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS_EXT' : 0x8E80,
+    'GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS_EXT' : 0x8E81,
+    'GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS_EXT' : 0x8E82,
+    'GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS_EXT' : 0x8E83,
+    'GL_MAX_TESS_PATCH_COMPONENTS_EXT' : 0x8E84,
+    'GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS_EXT' : 0x8E85,
+    'GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS_EXT' : 0x8E86,
+    'GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS_EXT' : 0x8E89,
+    'GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS_EXT' : 0x8E8A,
+    'GL_MAX_TESS_CONTROL_INPUT_COMPONENTS_EXT' : 0x886C,
+    'GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS_EXT' : 0x886D,
+    'GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS_EXT' : 0x8E1E,
+    'GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS_EXT' : 0x8E1F,
+    'GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS_EXT' : 0x92CD,
+    'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS_EXT' : 0x92CE,
+    'GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS_EXT' : 0x92D3,
+    'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS_EXT' : 0x92D4,
+    'GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS_EXT' : 0x90CB,
+    'GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS_EXT' : 0x90CC,
+    'GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS_EXT' : 0x90D8,
+    'GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS_EXT' : 0x90D9,
+    'GL_IS_PER_PATCH_EXT' : 0x92E7,
+    'GL_REFERENCED_BY_TESS_CONTROL_SHADER_EXT' : 0x9307,
+    'GL_REFERENCED_BY_TESS_EVALUATION_SHADER_EXT' : 0x9308,
+    'GL_TESS_CONTROL_SHADER_EXT' : 0x8E88,
+    'GL_TESS_EVALUATION_SHADER_EXT' : 0x8E87,
+    'GL_TESS_CONTROL_SHADER_BIT_EXT' : 0x0008,
+    'GL_TESS_EVALUATION_SHADER_BIT_EXT' : 0x0010,
+    'GL_TEXTURE_BORDER_COLOR_EXT' : 0x1004,
+    'GL_CLAMP_TO_BORDER_EXT' : 0x812D,
+    'GL_TEXTURE_BUFFER_EXT' : 0x8C2A,
+    'GL_TEXTURE_BUFFER_BINDING_EXT' : 0x8C2A,
+    'GL_MAX_TEXTURE_BUFFER_SIZE_EXT' : 0x8C2B,
+    'GL_TEXTURE_BINDING_BUFFER_EXT' : 0x8C2C,
+    'GL_TEXTURE_BUFFER_DATA_STORE_BINDING_EXT' : 0x8C2D,
+    'GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT_EXT' : 0x919F,
+    'GL_SAMPLER_BUFFER_EXT' : 0x8DC2,
+    'GL_INT_SAMPLER_BUFFER_EXT' : 0x8DD0,
+    'GL_UNSIGNED_INT_SAMPLER_BUFFER_EXT' : 0x8DD8,
+    'GL_IMAGE_BUFFER_EXT' : 0x9051,
+    'GL_INT_IMAGE_BUFFER_EXT' : 0x905C,
+    'GL_UNSIGNED_INT_IMAGE_BUFFER_EXT' : 0x9067,
+    'GL_TEXTURE_BUFFER_OFFSET_EXT' : 0x919D,
+    'GL_TEXTURE_BUFFER_SIZE_EXT' : 0x919E,
+    'GL_TEXTURE_ASTC_DECODE_PRECISION_EXT' : 0x8F69,
+    'GL_COMPRESSED_RGBA_BPTC_UNORM_EXT' : 0x8E8C,
+    'GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM_EXT' : 0x8E8D,
+    'GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT_EXT' : 0x8E8E,
+    'GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT_EXT' : 0x8E8F,
+    'GL_COMPRESSED_RGB_S3TC_DXT1_EXT' : 0x83F0,
+    'GL_COMPRESSED_RGBA_S3TC_DXT1_EXT' : 0x83F1,
+    'GL_COMPRESSED_RED_RGTC1_EXT' : 0x8DBB,
+    'GL_COMPRESSED_SIGNED_RED_RGTC1_EXT' : 0x8DBC,
+    'GL_COMPRESSED_RED_GREEN_RGTC2_EXT' : 0x8DBD,
+    'GL_COMPRESSED_SIGNED_RED_GREEN_RGTC2_EXT' : 0x8DBE,
+    'GL_COMPRESSED_RGBA_S3TC_DXT3_EXT' : 0x83F2,
+    'GL_COMPRESSED_RGBA_S3TC_DXT5_EXT' : 0x83F3,
+    'GL_COMPRESSED_SRGB_S3TC_DXT1_EXT' : 0x8C4C,
+    'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT' : 0x8C4D,
+    'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT' : 0x8C4E,
+    'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT' : 0x8C4F,
+    'GL_TEXTURE_CUBE_MAP_ARRAY_EXT' : 0x9009,
+    'GL_TEXTURE_BINDING_CUBE_MAP_ARRAY_EXT' : 0x900A,
+    'GL_SAMPLER_CUBE_MAP_ARRAY_EXT' : 0x900C,
+    'GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW_EXT' : 0x900D,
+    'GL_INT_SAMPLER_CUBE_MAP_ARRAY_EXT' : 0x900E,
+    'GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY_EXT' : 0x900F,
+    'GL_IMAGE_CUBE_MAP_ARRAY_EXT' : 0x9054,
+    'GL_INT_IMAGE_CUBE_MAP_ARRAY_EXT' : 0x905F,
+    'GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY_EXT' : 0x906A,
+    'GL_TEXTURE_MAX_ANISOTROPY_EXT' : 0x84FE,
+    'GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT' : 0x84FF,
+    'GL_TEXTURE_REDUCTION_MODE_EXT' : 0x9366,
+    'GL_WEIGHTED_AVERAGE_EXT' : 0x9367,
+    'GL_TEXTURE_FORMAT_SRGB_OVERRIDE_EXT' : 0x8FBF,
+    'GL_MIRROR_CLAMP_TO_EDGE_EXT' : 0x8743,
+    'GL_R16_EXT' : 0x822A,
+    'GL_RG16_EXT' : 0x822C,
+    'GL_RGBA16_EXT' : 0x805B,
+    'GL_RGB16_EXT' : 0x8054,
+    'GL_RGB16_SNORM_EXT' : 0x8F9A,
+    'GL_RED_EXT' : 0x1903,
+    'GL_RG_EXT' : 0x8227,
+    'GL_R8_EXT' : 0x8229,
+    'GL_RG8_EXT' : 0x822B,
+    'GL_SR8_EXT' : 0x8FBD,
+    'GL_SRG8_EXT' : 0x8FBE,
+    'GL_TEXTURE_SRGB_DECODE_EXT' : 0x8A48,
+    'GL_DECODE_EXT' : 0x8A49,
+    'GL_SKIP_DECODE_EXT' : 0x8A4A,
+    'GL_TEXTURE_IMMUTABLE_FORMAT_EXT' : 0x912F,
+    'GL_ALPHA8_EXT' : 0x803C,
+    'GL_LUMINANCE8_EXT' : 0x8040,
+    'GL_LUMINANCE8_ALPHA8_EXT' : 0x8045,
+    'GL_RGBA32F_EXT' : 0x8814,
+    'GL_RGB32F_EXT' : 0x8815,
+    'GL_ALPHA32F_EXT' : 0x8816,
+    'GL_LUMINANCE32F_EXT' : 0x8818,
+    'GL_LUMINANCE_ALPHA32F_EXT' : 0x8819,
+    'GL_ALPHA16F_EXT' : 0x881C,
+    'GL_LUMINANCE16F_EXT' : 0x881E,
+    'GL_LUMINANCE_ALPHA16F_EXT' : 0x881F,
+    'GL_RGB10_A2_EXT' : 0x8059,
+    'GL_RGB10_EXT' : 0x8052,
+    'GL_R32F_EXT' : 0x822E,
+    'GL_RG32F_EXT' : 0x8230,
+    'GL_NUM_SURFACE_COMPRESSION_FIXED_RATES_EXT' : 0x8F6E,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_1BPC_EXT' : 0x96C4,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_2BPC_EXT' : 0x96C5,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_3BPC_EXT' : 0x96C6,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_4BPC_EXT' : 0x96C7,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_5BPC_EXT' : 0x96C8,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_6BPC_EXT' : 0x96C9,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_7BPC_EXT' : 0x96CA,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_8BPC_EXT' : 0x96CB,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_9BPC_EXT' : 0x96CC,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_10BPC_EXT' : 0x96CD,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_11BPC_EXT' : 0x96CE,
+    'GL_SURFACE_COMPRESSION_FIXED_RATE_12BPC_EXT' : 0x96CF,
+    'GL_UNSIGNED_INT_2_10_10_10_REV_EXT' : 0x8368,
+    'GL_TEXTURE_VIEW_MIN_LEVEL_EXT' : 0x82DB,
+    'GL_TEXTURE_VIEW_NUM_LEVELS_EXT' : 0x82DC,
+    'GL_TEXTURE_VIEW_MIN_LAYER_EXT' : 0x82DD,
+    'GL_TEXTURE_VIEW_NUM_LAYERS_EXT' : 0x82DE,
+    'GL_TIMELINE_SEMAPHORE_VALUE_NV' : 0x9595,
+    'GL_SEMAPHORE_TYPE_NV' : 0x95B3,
+    'GL_SEMAPHORE_TYPE_BINARY_NV' : 0x95B4,
+    'GL_SEMAPHORE_TYPE_TIMELINE_NV' : 0x95B5,
+    'GL_MAX_TIMELINE_SEMAPHORE_VALUE_DIFFERENCE_NV' : 0x95B6,
+    'GL_UNPACK_ROW_LENGTH_EXT' : 0x0CF2,
+    'GL_UNPACK_SKIP_ROWS_EXT' : 0x0CF3,
+    'GL_UNPACK_SKIP_PIXELS_EXT' : 0x0CF4,
+    'GL_INCLUSIVE_EXT' : 0x8F10,
+    'GL_EXCLUSIVE_EXT' : 0x8F11,
+    'GL_WINDOW_RECTANGLE_EXT' : 0x8F12,
+    'GL_WINDOW_RECTANGLE_MODE_EXT' : 0x8F13,
+    'GL_MAX_WINDOW_RECTANGLES_EXT' : 0x8F14,
+    'GL_NUM_WINDOW_RECTANGLES_EXT' : 0x8F15,
+    'GL_GCCSO_SHADER_BINARY_FJ' : 0x9260,
+    'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_AND_DOWNSAMPLE_IMG' : 0x913C,
+    'GL_NUM_DOWNSAMPLE_SCALES_IMG' : 0x913D,
+    'GL_DOWNSAMPLE_SCALES_IMG' : 0x913E,
+    'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SCALE_IMG' : 0x913F,
+    'GL_RENDERBUFFER_SAMPLES_IMG' : 0x9133,
+    'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_IMG' : 0x9134,
+    'GL_MAX_SAMPLES_IMG' : 0x9135,
+    'GL_TEXTURE_SAMPLES_IMG' : 0x9136,
+    'GL_SGX_PROGRAM_BINARY_IMG' : 0x9130,
+    'GL_BGRA_IMG' : 0x80E1,
+    'GL_UNSIGNED_SHORT_4_4_4_4_REV_IMG' : 0x8365,
+    'GL_SGX_BINARY_IMG' : 0x8C0A,
+    'GL_COMPRESSED_RGB_PVRTC_4BPPV1_IMG' : 0x8C00,
+    'GL_COMPRESSED_RGB_PVRTC_2BPPV1_IMG' : 0x8C01,
+    'GL_COMPRESSED_RGBA_PVRTC_4BPPV1_IMG' : 0x8C02,
+    'GL_COMPRESSED_RGBA_PVRTC_2BPPV1_IMG' : 0x8C03,
+    'GL_COMPRESSED_RGBA_PVRTC_2BPPV2_IMG' : 0x9137,
+    'GL_COMPRESSED_RGBA_PVRTC_4BPPV2_IMG' : 0x9138,
+    'GL_CUBIC_IMG' : 0x9139,
+    'GL_CUBIC_MIPMAP_NEAREST_IMG' : 0x913A,
+    'GL_CUBIC_MIPMAP_LINEAR_IMG' : 0x913B,
+    'GL_CONSERVATIVE_RASTERIZATION_INTEL' : 0x83FE,
+    'GL_BLACKHOLE_RENDER_INTEL' : 0x83FC,
+    'GL_PERFQUERY_SINGLE_CONTEXT_INTEL' : 0x0000,
+    'GL_PERFQUERY_GLOBAL_CONTEXT_INTEL' : 0x0001,
+    'GL_PERFQUERY_WAIT_INTEL' : 0x83FB,
+    'GL_PERFQUERY_FLUSH_INTEL' : 0x83FA,
+    'GL_PERFQUERY_DONOT_FLUSH_INTEL' : 0x83F9,
+    'GL_PERFQUERY_COUNTER_EVENT_INTEL' : 0x94F0,
+    'GL_PERFQUERY_COUNTER_DURATION_NORM_INTEL' : 0x94F1,
+    'GL_PERFQUERY_COUNTER_DURATION_RAW_INTEL' : 0x94F2,
+    'GL_PERFQUERY_COUNTER_THROUGHPUT_INTEL' : 0x94F3,
+    'GL_PERFQUERY_COUNTER_RAW_INTEL' : 0x94F4,
+    'GL_PERFQUERY_COUNTER_TIMESTAMP_INTEL' : 0x94F5,
+    'GL_PERFQUERY_COUNTER_DATA_UINT32_INTEL' : 0x94F8,
+    'GL_PERFQUERY_COUNTER_DATA_UINT64_INTEL' : 0x94F9,
+    'GL_PERFQUERY_COUNTER_DATA_FLOAT_INTEL' : 0x94FA,
+    'GL_PERFQUERY_COUNTER_DATA_DOUBLE_INTEL' : 0x94FB,
+    'GL_PERFQUERY_COUNTER_DATA_BOOL32_INTEL' : 0x94FC,
+    'GL_PERFQUERY_QUERY_NAME_LENGTH_MAX_INTEL' : 0x94FD,
+    'GL_PERFQUERY_COUNTER_NAME_LENGTH_MAX_INTEL' : 0x94FE,
+    'GL_PERFQUERY_COUNTER_DESC_LENGTH_MAX_INTEL' : 0x94FF,
+    'GL_PERFQUERY_GPA_EXTENDED_COUNTERS_INTEL' : 0x9500,
+    'GL_MULTIPLY_KHR' : 0x9294,
+    'GL_SCREEN_KHR' : 0x9295,
+    'GL_OVERLAY_KHR' : 0x9296,
+    'GL_DARKEN_KHR' : 0x9297,
+    'GL_LIGHTEN_KHR' : 0x9298,
+    'GL_COLORDODGE_KHR' : 0x9299,
+    'GL_COLORBURN_KHR' : 0x929A,
+    'GL_HARDLIGHT_KHR' : 0x929B,
+    'GL_SOFTLIGHT_KHR' : 0x929C,
+    'GL_DIFFERENCE_KHR' : 0x929E,
+    'GL_EXCLUSION_KHR' : 0x92A0,
+    'GL_HSL_HUE_KHR' : 0x92AD,
+    'GL_HSL_SATURATION_KHR' : 0x92AE,
+    'GL_HSL_COLOR_KHR' : 0x92AF,
+    'GL_HSL_LUMINOSITY_KHR' : 0x92B0,
+    'GL_BLEND_ADVANCED_COHERENT_KHR' : 0x9285,
+    'GL_CONTEXT_RELEASE_BEHAVIOR_KHR' : 0x82FB,
+    'GL_CONTEXT_RELEASE_BEHAVIOR_FLUSH_KHR' : 0x82FC,
+    'GL_DEBUG_OUTPUT_SYNCHRONOUS_KHR' : 0x8242,
+    'GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH_KHR' : 0x8243,
+    'GL_DEBUG_CALLBACK_FUNCTION_KHR' : 0x8244,
+    'GL_DEBUG_CALLBACK_USER_PARAM_KHR' : 0x8245,
+    'GL_DEBUG_SOURCE_API_KHR' : 0x8246,
+    'GL_DEBUG_SOURCE_WINDOW_SYSTEM_KHR' : 0x8247,
+    'GL_DEBUG_SOURCE_SHADER_COMPILER_KHR' : 0x8248,
+    'GL_DEBUG_SOURCE_THIRD_PARTY_KHR' : 0x8249,
+    'GL_DEBUG_SOURCE_APPLICATION_KHR' : 0x824A,
+    'GL_DEBUG_SOURCE_OTHER_KHR' : 0x824B,
+    'GL_DEBUG_TYPE_ERROR_KHR' : 0x824C,
+    'GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR_KHR' : 0x824D,
+    'GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR_KHR' : 0x824E,
+    'GL_DEBUG_TYPE_PORTABILITY_KHR' : 0x824F,
+    'GL_DEBUG_TYPE_PERFORMANCE_KHR' : 0x8250,
+    'GL_DEBUG_TYPE_OTHER_KHR' : 0x8251,
+    'GL_DEBUG_TYPE_MARKER_KHR' : 0x8268,
+    'GL_DEBUG_TYPE_PUSH_GROUP_KHR' : 0x8269,
+    'GL_DEBUG_TYPE_POP_GROUP_KHR' : 0x826A,
+    'GL_DEBUG_SEVERITY_NOTIFICATION_KHR' : 0x826B,
+    'GL_MAX_DEBUG_GROUP_STACK_DEPTH_KHR' : 0x826C,
+    'GL_DEBUG_GROUP_STACK_DEPTH_KHR' : 0x826D,
+    'GL_BUFFER_KHR' : 0x82E0,
+    'GL_SHADER_KHR' : 0x82E1,
+    'GL_PROGRAM_KHR' : 0x82E2,
+    'GL_VERTEX_ARRAY_KHR' : 0x8074,
+    'GL_QUERY_KHR' : 0x82E3,
+    'GL_PROGRAM_PIPELINE_KHR' : 0x82E4,
+    'GL_SAMPLER_KHR' : 0x82E6,
+    'GL_MAX_LABEL_LENGTH_KHR' : 0x82E8,
+    'GL_MAX_DEBUG_MESSAGE_LENGTH_KHR' : 0x9143,
+    'GL_MAX_DEBUG_LOGGED_MESSAGES_KHR' : 0x9144,
+    'GL_DEBUG_LOGGED_MESSAGES_KHR' : 0x9145,
+    'GL_DEBUG_SEVERITY_HIGH_KHR' : 0x9146,
+    'GL_DEBUG_SEVERITY_MEDIUM_KHR' : 0x9147,
+    'GL_DEBUG_SEVERITY_LOW_KHR' : 0x9148,
+    'GL_DEBUG_OUTPUT_KHR' : 0x92E0,
+    'GL_CONTEXT_FLAG_DEBUG_BIT_KHR' : 0x0002,
+    'GL_STACK_OVERFLOW_KHR' : 0x0503,
+    'GL_STACK_UNDERFLOW_KHR' : 0x0504,
+    'GL_CONTEXT_FLAG_NO_ERROR_BIT_KHR' : 0x0008,
+    'GL_CONTEXT_ROBUST_ACCESS_KHR' : 0x90F3,
+    'GL_LOSE_CONTEXT_ON_RESET_KHR' : 0x8252,
+    'GL_GUILTY_CONTEXT_RESET_KHR' : 0x8253,
+    'GL_INNOCENT_CONTEXT_RESET_KHR' : 0x8254,
+    'GL_UNKNOWN_CONTEXT_RESET_KHR' : 0x8255,
+    'GL_RESET_NOTIFICATION_STRATEGY_KHR' : 0x8256,
+    'GL_NO_RESET_NOTIFICATION_KHR' : 0x8261,
+    'GL_CONTEXT_LOST_KHR' : 0x0507,
+    'GL_SUBGROUP_SIZE_KHR' : 0x9532,
+    'GL_SUBGROUP_SUPPORTED_STAGES_KHR' : 0x9533,
+    'GL_SUBGROUP_SUPPORTED_FEATURES_KHR' : 0x9534,
+    'GL_SUBGROUP_QUAD_ALL_STAGES_KHR' : 0x9535,
+    'GL_SUBGROUP_FEATURE_BASIC_BIT_KHR' : 0x0001,
+    'GL_SUBGROUP_FEATURE_VOTE_BIT_KHR' : 0x0002,
+    'GL_SUBGROUP_FEATURE_ARITHMETIC_BIT_KHR' : 0x0004,
+    'GL_SUBGROUP_FEATURE_BALLOT_BIT_KHR' : 0x0008,
+    'GL_SUBGROUP_FEATURE_SHUFFLE_BIT_KHR' : 0x0010,
+    'GL_SUBGROUP_FEATURE_SHUFFLE_RELATIVE_BIT_KHR' : 0x0020,
+    'GL_SUBGROUP_FEATURE_CLUSTERED_BIT_KHR' : 0x0040,
+    'GL_SUBGROUP_FEATURE_QUAD_BIT_KHR' : 0x0080,
+    'GL_COMPRESSED_RGBA_ASTC_4x4_KHR' : 0x93B0,
+    'GL_COMPRESSED_RGBA_ASTC_5x4_KHR' : 0x93B1,
+    'GL_COMPRESSED_RGBA_ASTC_5x5_KHR' : 0x93B2,
+    'GL_COMPRESSED_RGBA_ASTC_6x5_KHR' : 0x93B3,
+    'GL_COMPRESSED_RGBA_ASTC_6x6_KHR' : 0x93B4,
+    'GL_COMPRESSED_RGBA_ASTC_8x5_KHR' : 0x93B5,
+    'GL_COMPRESSED_RGBA_ASTC_8x6_KHR' : 0x93B6,
+    'GL_COMPRESSED_RGBA_ASTC_8x8_KHR' : 0x93B7,
+    'GL_COMPRESSED_RGBA_ASTC_10x5_KHR' : 0x93B8,
+    'GL_COMPRESSED_RGBA_ASTC_10x6_KHR' : 0x93B9,
+    'GL_COMPRESSED_RGBA_ASTC_10x8_KHR' : 0x93BA,
+    'GL_COMPRESSED_RGBA_ASTC_10x10_KHR' : 0x93BB,
+    'GL_COMPRESSED_RGBA_ASTC_12x10_KHR' : 0x93BC,
+    'GL_COMPRESSED_RGBA_ASTC_12x12_KHR' : 0x93BD,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4_KHR' : 0x93D0,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4_KHR' : 0x93D1,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5_KHR' : 0x93D2,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5_KHR' : 0x93D3,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6_KHR' : 0x93D4,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5_KHR' : 0x93D5,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6_KHR' : 0x93D6,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8_KHR' : 0x93D7,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5_KHR' : 0x93D8,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6_KHR' : 0x93D9,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8_KHR' : 0x93DA,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10_KHR' : 0x93DB,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10_KHR' : 0x93DC,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12_KHR' : 0x93DD,
+    'GL_MAX_SHADER_COMPILER_THREADS_KHR' : 0x91B0,
+    'GL_COMPLETION_STATUS_KHR' : 0x91B1,
+    'GL_BGR_EXT' : 0x80E0,
+    'GL_FRAMEBUFFER_FLIP_X_MESA' : 0x8BBC,
+    'GL_FRAMEBUFFER_FLIP_Y_MESA' : 0x8BBB,
+    'GL_FRAMEBUFFER_SWAP_XY_MESA' : 0x8BBD,
+    'GL_PROGRAM_BINARY_FORMAT_MESA' : 0x875F,
+    'GL_BLEND_OVERLAP_NV' : 0x9281,
+    'GL_BLEND_PREMULTIPLIED_SRC_NV' : 0x9280,
+    'GL_BLUE_NV' : 0x1905,
+    'GL_COLORBURN_NV' : 0x929A,
+    'GL_COLORDODGE_NV' : 0x9299,
+    'GL_CONJOINT_NV' : 0x9284,
+    'GL_CONTRAST_NV' : 0x92A1,
+    'GL_DARKEN_NV' : 0x9297,
+    'GL_DIFFERENCE_NV' : 0x929E,
+    'GL_DISJOINT_NV' : 0x9283,
+    'GL_DST_ATOP_NV' : 0x928F,
+    'GL_DST_IN_NV' : 0x928B,
+    'GL_DST_NV' : 0x9287,
+    'GL_DST_OUT_NV' : 0x928D,
+    'GL_DST_OVER_NV' : 0x9289,
+    'GL_EXCLUSION_NV' : 0x92A0,
+    'GL_GREEN_NV' : 0x1904,
+    'GL_HARDLIGHT_NV' : 0x929B,
+    'GL_HARDMIX_NV' : 0x92A9,
+    'GL_HSL_COLOR_NV' : 0x92AF,
+    'GL_HSL_HUE_NV' : 0x92AD,
+    'GL_HSL_LUMINOSITY_NV' : 0x92B0,
+    'GL_HSL_SATURATION_NV' : 0x92AE,
+    'GL_INVERT_OVG_NV' : 0x92B4,
+    'GL_INVERT_RGB_NV' : 0x92A3,
+    'GL_LIGHTEN_NV' : 0x9298,
+    'GL_LINEARBURN_NV' : 0x92A5,
+    'GL_LINEARDODGE_NV' : 0x92A4,
+    'GL_LINEARLIGHT_NV' : 0x92A7,
+    'GL_MINUS_CLAMPED_NV' : 0x92B3,
+    'GL_MINUS_NV' : 0x929F,
+    'GL_MULTIPLY_NV' : 0x9294,
+    'GL_OVERLAY_NV' : 0x9296,
+    'GL_PINLIGHT_NV' : 0x92A8,
+    'GL_PLUS_CLAMPED_ALPHA_NV' : 0x92B2,
+    'GL_PLUS_CLAMPED_NV' : 0x92B1,
+    'GL_PLUS_DARKER_NV' : 0x9292,
+    'GL_PLUS_NV' : 0x9291,
+    'GL_RED_NV' : 0x1903,
+    'GL_SCREEN_NV' : 0x9295,
+    'GL_SOFTLIGHT_NV' : 0x929C,
+    'GL_SRC_ATOP_NV' : 0x928E,
+    'GL_SRC_IN_NV' : 0x928A,
+    'GL_SRC_NV' : 0x9286,
+    'GL_SRC_OUT_NV' : 0x928C,
+    'GL_SRC_OVER_NV' : 0x9288,
+    'GL_UNCORRELATED_NV' : 0x9282,
+    'GL_VIVIDLIGHT_NV' : 0x92A6,
+    'GL_XOR_NV' : 0x1506,
+    'GL_BLEND_ADVANCED_COHERENT_NV' : 0x9285,
+    'GL_FACTOR_MIN_AMD' : 0x901C,
+    'GL_FACTOR_MAX_AMD' : 0x901D,
+    'GL_VIEWPORT_POSITION_W_SCALE_NV' : 0x937C,
+    'GL_VIEWPORT_POSITION_W_SCALE_X_COEFF_NV' : 0x937D,
+    'GL_VIEWPORT_POSITION_W_SCALE_Y_COEFF_NV' : 0x937E,
+    'GL_QUERY_WAIT_NV' : 0x8E13,
+    'GL_QUERY_NO_WAIT_NV' : 0x8E14,
+    'GL_QUERY_BY_REGION_WAIT_NV' : 0x8E15,
+    'GL_QUERY_BY_REGION_NO_WAIT_NV' : 0x8E16,
+    'GL_CONSERVATIVE_RASTERIZATION_NV' : 0x9346,
+    'GL_SUBPIXEL_PRECISION_BIAS_X_BITS_NV' : 0x9347,
+    'GL_SUBPIXEL_PRECISION_BIAS_Y_BITS_NV' : 0x9348,
+    'GL_MAX_SUBPIXEL_PRECISION_BIAS_BITS_NV' : 0x9349,
+    'GL_CONSERVATIVE_RASTER_MODE_PRE_SNAP_NV' : 0x9550,
+    'GL_CONSERVATIVE_RASTER_MODE_NV' : 0x954D,
+    'GL_CONSERVATIVE_RASTER_MODE_POST_SNAP_NV' : 0x954E,
+    'GL_CONSERVATIVE_RASTER_MODE_PRE_SNAP_TRIANGLES_NV' : 0x954F,
+    'GL_COPY_READ_BUFFER_NV' : 0x8F36,
+    'GL_COPY_WRITE_BUFFER_NV' : 0x8F37,
+    'GL_COVERAGE_COMPONENT_NV' : 0x8ED0,
+    'GL_COVERAGE_COMPONENT4_NV' : 0x8ED1,
+    'GL_COVERAGE_ATTACHMENT_NV' : 0x8ED2,
+    'GL_COVERAGE_BUFFERS_NV' : 0x8ED3,
+    'GL_COVERAGE_SAMPLES_NV' : 0x8ED4,
+    'GL_COVERAGE_ALL_FRAGMENTS_NV' : 0x8ED5,
+    'GL_COVERAGE_EDGE_FRAGMENTS_NV' : 0x8ED6,
+    'GL_COVERAGE_AUTOMATIC_NV' : 0x8ED7,
+    'GL_COVERAGE_BUFFER_BIT_NV' : 0x8000,
+    'GL_DEPTH_COMPONENT16_NONLINEAR_NV' : 0x8E2C,
+    'GL_MAX_DRAW_BUFFERS_NV' : 0x8824,
+    'GL_DRAW_BUFFER0_NV' : 0x8825,
+    'GL_DRAW_BUFFER1_NV' : 0x8826,
+    'GL_DRAW_BUFFER2_NV' : 0x8827,
+    'GL_DRAW_BUFFER3_NV' : 0x8828,
+    'GL_DRAW_BUFFER4_NV' : 0x8829,
+    'GL_DRAW_BUFFER5_NV' : 0x882A,
+    'GL_DRAW_BUFFER6_NV' : 0x882B,
+    'GL_DRAW_BUFFER7_NV' : 0x882C,
+    'GL_DRAW_BUFFER8_NV' : 0x882D,
+    'GL_DRAW_BUFFER9_NV' : 0x882E,
+    'GL_DRAW_BUFFER10_NV' : 0x882F,
+    'GL_DRAW_BUFFER11_NV' : 0x8830,
+    'GL_DRAW_BUFFER12_NV' : 0x8831,
+    'GL_DRAW_BUFFER13_NV' : 0x8832,
+    'GL_DRAW_BUFFER14_NV' : 0x8833,
+    'GL_DRAW_BUFFER15_NV' : 0x8834,
+    'GL_COLOR_ATTACHMENT0_NV' : 0x8CE0,
+    'GL_COLOR_ATTACHMENT1_NV' : 0x8CE1,
+    'GL_COLOR_ATTACHMENT2_NV' : 0x8CE2,
+    'GL_COLOR_ATTACHMENT3_NV' : 0x8CE3,
+    'GL_COLOR_ATTACHMENT4_NV' : 0x8CE4,
+    'GL_COLOR_ATTACHMENT5_NV' : 0x8CE5,
+    'GL_COLOR_ATTACHMENT6_NV' : 0x8CE6,
+    'GL_COLOR_ATTACHMENT7_NV' : 0x8CE7,
+    'GL_COLOR_ATTACHMENT8_NV' : 0x8CE8,
+    'GL_COLOR_ATTACHMENT9_NV' : 0x8CE9,
+    'GL_COLOR_ATTACHMENT10_NV' : 0x8CEA,
+    'GL_COLOR_ATTACHMENT11_NV' : 0x8CEB,
+    'GL_COLOR_ATTACHMENT12_NV' : 0x8CEC,
+    'GL_COLOR_ATTACHMENT13_NV' : 0x8CED,
+    'GL_COLOR_ATTACHMENT14_NV' : 0x8CEE,
+    'GL_COLOR_ATTACHMENT15_NV' : 0x8CEF,
+    'GL_MAX_COLOR_ATTACHMENTS_NV' : 0x8CDF,
+    'GL_ALL_COMPLETED_NV' : 0x84F2,
+    'GL_FENCE_STATUS_NV' : 0x84F3,
+    'GL_FENCE_CONDITION_NV' : 0x84F4,
+    'GL_FILL_RECTANGLE_NV' : 0x933C,
+    'GL_FRAGMENT_COVERAGE_TO_COLOR_NV' : 0x92DD,
+    'GL_FRAGMENT_COVERAGE_COLOR_NV' : 0x92DE,
+    'GL_READ_FRAMEBUFFER_NV' : 0x8CA8,
+    'GL_DRAW_FRAMEBUFFER_NV' : 0x8CA9,
+    'GL_DRAW_FRAMEBUFFER_BINDING_NV' : 0x8CA6,
+    'GL_READ_FRAMEBUFFER_BINDING_NV' : 0x8CAA,
+    'GL_COVERAGE_MODULATION_TABLE_NV' : 0x9331,
+    'GL_COLOR_SAMPLES_NV' : 0x8E20,
+    'GL_DEPTH_SAMPLES_NV' : 0x932D,
+    'GL_STENCIL_SAMPLES_NV' : 0x932E,
+    'GL_MIXED_DEPTH_SAMPLES_SUPPORTED_NV' : 0x932F,
+    'GL_MIXED_STENCIL_SAMPLES_SUPPORTED_NV' : 0x9330,
+    'GL_COVERAGE_MODULATION_NV' : 0x9332,
+    'GL_COVERAGE_MODULATION_TABLE_SIZE_NV' : 0x9333,
+    'GL_RENDERBUFFER_SAMPLES_NV' : 0x8CAB,
+    'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_NV' : 0x8D56,
+    'GL_MAX_SAMPLES_NV' : 0x8D57,
+    'GL_INT64_NV' : 0x140E,
+    'GL_UNSIGNED_INT64_NV' : 0x140F,
+    'GL_INT8_NV' : 0x8FE0,
+    'GL_INT8_VEC2_NV' : 0x8FE1,
+    'GL_INT8_VEC3_NV' : 0x8FE2,
+    'GL_INT8_VEC4_NV' : 0x8FE3,
+    'GL_INT16_NV' : 0x8FE4,
+    'GL_INT16_VEC2_NV' : 0x8FE5,
+    'GL_INT16_VEC3_NV' : 0x8FE6,
+    'GL_INT16_VEC4_NV' : 0x8FE7,
+    'GL_INT64_VEC2_NV' : 0x8FE9,
+    'GL_INT64_VEC3_NV' : 0x8FEA,
+    'GL_INT64_VEC4_NV' : 0x8FEB,
+    'GL_UNSIGNED_INT8_NV' : 0x8FEC,
+    'GL_UNSIGNED_INT8_VEC2_NV' : 0x8FED,
+    'GL_UNSIGNED_INT8_VEC3_NV' : 0x8FEE,
+    'GL_UNSIGNED_INT8_VEC4_NV' : 0x8FEF,
+    'GL_UNSIGNED_INT16_NV' : 0x8FF0,
+    'GL_UNSIGNED_INT16_VEC2_NV' : 0x8FF1,
+    'GL_UNSIGNED_INT16_VEC3_NV' : 0x8FF2,
+    'GL_UNSIGNED_INT16_VEC4_NV' : 0x8FF3,
+    'GL_UNSIGNED_INT64_VEC2_NV' : 0x8FF5,
+    'GL_UNSIGNED_INT64_VEC3_NV' : 0x8FF6,
+    'GL_UNSIGNED_INT64_VEC4_NV' : 0x8FF7,
+    'GL_FLOAT16_NV' : 0x8FF8,
+    'GL_FLOAT16_VEC2_NV' : 0x8FF9,
+    'GL_FLOAT16_VEC3_NV' : 0x8FFA,
+    'GL_FLOAT16_VEC4_NV' : 0x8FFB,
+    'GL_VERTEX_ATTRIB_ARRAY_DIVISOR_NV' : 0x88FE,
+    'GL_MULTISAMPLES_NV' : 0x9371,
+    'GL_SUPERSAMPLE_SCALE_X_NV' : 0x9372,
+    'GL_SUPERSAMPLE_SCALE_Y_NV' : 0x9373,
+    'GL_CONFORMANT_NV' : 0x9374,
+    'GL_ATTACHED_MEMORY_OBJECT_NV' : 0x95A4,
+    'GL_ATTACHED_MEMORY_OFFSET_NV' : 0x95A5,
+    'GL_MEMORY_ATTACHABLE_ALIGNMENT_NV' : 0x95A6,
+    'GL_MEMORY_ATTACHABLE_SIZE_NV' : 0x95A7,
+    'GL_MEMORY_ATTACHABLE_NV' : 0x95A8,
+    'GL_DETACHED_MEMORY_INCARNATION_NV' : 0x95A9,
+    'GL_DETACHED_TEXTURES_NV' : 0x95AA,
+    'GL_DETACHED_BUFFERS_NV' : 0x95AB,
+    'GL_MAX_DETACHED_TEXTURES_NV' : 0x95AC,
+    'GL_MAX_DETACHED_BUFFERS_NV' : 0x95AD,
+    'GL_MESH_SHADER_NV' : 0x9559,
+    'GL_TASK_SHADER_NV' : 0x955A,
+    'GL_MAX_MESH_UNIFORM_BLOCKS_NV' : 0x8E60,
+    'GL_MAX_MESH_TEXTURE_IMAGE_UNITS_NV' : 0x8E61,
+    'GL_MAX_MESH_IMAGE_UNIFORMS_NV' : 0x8E62,
+    'GL_MAX_MESH_UNIFORM_COMPONENTS_NV' : 0x8E63,
+    'GL_MAX_MESH_ATOMIC_COUNTER_BUFFERS_NV' : 0x8E64,
+    'GL_MAX_MESH_ATOMIC_COUNTERS_NV' : 0x8E65,
+    'GL_MAX_MESH_SHADER_STORAGE_BLOCKS_NV' : 0x8E66,
+    'GL_MAX_COMBINED_MESH_UNIFORM_COMPONENTS_NV' : 0x8E67,
+    'GL_MAX_TASK_UNIFORM_BLOCKS_NV' : 0x8E68,
+    'GL_MAX_TASK_TEXTURE_IMAGE_UNITS_NV' : 0x8E69,
+    'GL_MAX_TASK_IMAGE_UNIFORMS_NV' : 0x8E6A,
+    'GL_MAX_TASK_UNIFORM_COMPONENTS_NV' : 0x8E6B,
+    'GL_MAX_TASK_ATOMIC_COUNTER_BUFFERS_NV' : 0x8E6C,
+    'GL_MAX_TASK_ATOMIC_COUNTERS_NV' : 0x8E6D,
+    'GL_MAX_TASK_SHADER_STORAGE_BLOCKS_NV' : 0x8E6E,
+    'GL_MAX_COMBINED_TASK_UNIFORM_COMPONENTS_NV' : 0x8E6F,
+    'GL_MAX_MESH_WORK_GROUP_INVOCATIONS_NV' : 0x95A2,
+    'GL_MAX_TASK_WORK_GROUP_INVOCATIONS_NV' : 0x95A3,
+    'GL_MAX_MESH_TOTAL_MEMORY_SIZE_NV' : 0x9536,
+    'GL_MAX_TASK_TOTAL_MEMORY_SIZE_NV' : 0x9537,
+    'GL_MAX_MESH_OUTPUT_VERTICES_NV' : 0x9538,
+    'GL_MAX_MESH_OUTPUT_PRIMITIVES_NV' : 0x9539,
+    'GL_MAX_TASK_OUTPUT_COUNT_NV' : 0x953A,
+    'GL_MAX_DRAW_MESH_TASKS_COUNT_NV' : 0x953D,
+    'GL_MAX_MESH_VIEWS_NV' : 0x9557,
+    'GL_MESH_OUTPUT_PER_VERTEX_GRANULARITY_NV' : 0x92DF,
+    'GL_MESH_OUTPUT_PER_PRIMITIVE_GRANULARITY_NV' : 0x9543,
+    'GL_MAX_MESH_WORK_GROUP_SIZE_NV' : 0x953B,
+    'GL_MAX_TASK_WORK_GROUP_SIZE_NV' : 0x953C,
+    'GL_MESH_WORK_GROUP_SIZE_NV' : 0x953E,
+    'GL_TASK_WORK_GROUP_SIZE_NV' : 0x953F,
+    'GL_MESH_VERTICES_OUT_NV' : 0x9579,
+    'GL_MESH_PRIMITIVES_OUT_NV' : 0x957A,
+    'GL_MESH_OUTPUT_TYPE_NV' : 0x957B,
+    'GL_UNIFORM_BLOCK_REFERENCED_BY_MESH_SHADER_NV' : 0x959C,
+    'GL_UNIFORM_BLOCK_REFERENCED_BY_TASK_SHADER_NV' : 0x959D,
+    'GL_REFERENCED_BY_MESH_SHADER_NV' : 0x95A0,
+    'GL_REFERENCED_BY_TASK_SHADER_NV' : 0x95A1,
+    'GL_MESH_SHADER_BIT_NV' : 0x0040,
+    'GL_TASK_SHADER_BIT_NV' : 0x0080,
+    'GL_MESH_SUBROUTINE_NV' : 0x957C,
+    'GL_TASK_SUBROUTINE_NV' : 0x957D,
+    'GL_MESH_SUBROUTINE_UNIFORM_NV' : 0x957E,
+    'GL_TASK_SUBROUTINE_UNIFORM_NV' : 0x957F,
+    'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_MESH_SHADER_NV' : 0x959E,
+    'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TASK_SHADER_NV' : 0x959F,
+    'GL_FLOAT_MAT2x3_NV' : 0x8B65,
+    'GL_FLOAT_MAT2x4_NV' : 0x8B66,
+    'GL_FLOAT_MAT3x2_NV' : 0x8B67,
+    'GL_FLOAT_MAT3x4_NV' : 0x8B68,
+    'GL_FLOAT_MAT4x2_NV' : 0x8B69,
+    'GL_FLOAT_MAT4x3_NV' : 0x8B6A,
+    'GL_PATH_FORMAT_SVG_NV' : 0x9070,
+    'GL_PATH_FORMAT_PS_NV' : 0x9071,
+    'GL_STANDARD_FONT_NAME_NV' : 0x9072,
+    'GL_SYSTEM_FONT_NAME_NV' : 0x9073,
+    'GL_FILE_NAME_NV' : 0x9074,
+    'GL_PATH_STROKE_WIDTH_NV' : 0x9075,
+    'GL_PATH_END_CAPS_NV' : 0x9076,
+    'GL_PATH_INITIAL_END_CAP_NV' : 0x9077,
+    'GL_PATH_TERMINAL_END_CAP_NV' : 0x9078,
+    'GL_PATH_JOIN_STYLE_NV' : 0x9079,
+    'GL_PATH_MITER_LIMIT_NV' : 0x907A,
+    'GL_PATH_DASH_CAPS_NV' : 0x907B,
+    'GL_PATH_INITIAL_DASH_CAP_NV' : 0x907C,
+    'GL_PATH_TERMINAL_DASH_CAP_NV' : 0x907D,
+    'GL_PATH_DASH_OFFSET_NV' : 0x907E,
+    'GL_PATH_CLIENT_LENGTH_NV' : 0x907F,
+    'GL_PATH_FILL_MODE_NV' : 0x9080,
+    'GL_PATH_FILL_MASK_NV' : 0x9081,
+    'GL_PATH_FILL_COVER_MODE_NV' : 0x9082,
+    'GL_PATH_STROKE_COVER_MODE_NV' : 0x9083,
+    'GL_PATH_STROKE_MASK_NV' : 0x9084,
+    'GL_COUNT_UP_NV' : 0x9088,
+    'GL_COUNT_DOWN_NV' : 0x9089,
+    'GL_PATH_OBJECT_BOUNDING_BOX_NV' : 0x908A,
+    'GL_CONVEX_HULL_NV' : 0x908B,
+    'GL_BOUNDING_BOX_NV' : 0x908D,
+    'GL_TRANSLATE_X_NV' : 0x908E,
+    'GL_TRANSLATE_Y_NV' : 0x908F,
+    'GL_TRANSLATE_2D_NV' : 0x9090,
+    'GL_TRANSLATE_3D_NV' : 0x9091,
+    'GL_AFFINE_2D_NV' : 0x9092,
+    'GL_AFFINE_3D_NV' : 0x9094,
+    'GL_TRANSPOSE_AFFINE_2D_NV' : 0x9096,
+    'GL_TRANSPOSE_AFFINE_3D_NV' : 0x9098,
+    'GL_UTF8_NV' : 0x909A,
+    'GL_UTF16_NV' : 0x909B,
+    'GL_BOUNDING_BOX_OF_BOUNDING_BOXES_NV' : 0x909C,
+    'GL_PATH_COMMAND_COUNT_NV' : 0x909D,
+    'GL_PATH_COORD_COUNT_NV' : 0x909E,
+    'GL_PATH_DASH_ARRAY_COUNT_NV' : 0x909F,
+    'GL_PATH_COMPUTED_LENGTH_NV' : 0x90A0,
+    'GL_PATH_FILL_BOUNDING_BOX_NV' : 0x90A1,
+    'GL_PATH_STROKE_BOUNDING_BOX_NV' : 0x90A2,
+    'GL_SQUARE_NV' : 0x90A3,
+    'GL_ROUND_NV' : 0x90A4,
+    'GL_TRIANGULAR_NV' : 0x90A5,
+    'GL_BEVEL_NV' : 0x90A6,
+    'GL_MITER_REVERT_NV' : 0x90A7,
+    'GL_MITER_TRUNCATE_NV' : 0x90A8,
+    'GL_SKIP_MISSING_GLYPH_NV' : 0x90A9,
+    'GL_USE_MISSING_GLYPH_NV' : 0x90AA,
+    'GL_PATH_ERROR_POSITION_NV' : 0x90AB,
+    'GL_ACCUM_ADJACENT_PAIRS_NV' : 0x90AD,
+    'GL_ADJACENT_PAIRS_NV' : 0x90AE,
+    'GL_FIRST_TO_REST_NV' : 0x90AF,
+    'GL_PATH_GEN_MODE_NV' : 0x90B0,
+    'GL_PATH_GEN_COEFF_NV' : 0x90B1,
+    'GL_PATH_GEN_COMPONENTS_NV' : 0x90B3,
+    'GL_PATH_STENCIL_FUNC_NV' : 0x90B7,
+    'GL_PATH_STENCIL_REF_NV' : 0x90B8,
+    'GL_PATH_STENCIL_VALUE_MASK_NV' : 0x90B9,
+    'GL_PATH_STENCIL_DEPTH_OFFSET_FACTOR_NV' : 0x90BD,
+    'GL_PATH_STENCIL_DEPTH_OFFSET_UNITS_NV' : 0x90BE,
+    'GL_PATH_COVER_DEPTH_FUNC_NV' : 0x90BF,
+    'GL_PATH_DASH_OFFSET_RESET_NV' : 0x90B4,
+    'GL_MOVE_TO_RESETS_NV' : 0x90B5,
+    'GL_MOVE_TO_CONTINUES_NV' : 0x90B6,
+    'GL_CLOSE_PATH_NV' : 0x0000,
+    'GL_MOVE_TO_NV' : 0x0002,
+    'GL_RELATIVE_MOVE_TO_NV' : 0x0003,
+    'GL_LINE_TO_NV' : 0x0004,
+    'GL_RELATIVE_LINE_TO_NV' : 0x0005,
+    'GL_HORIZONTAL_LINE_TO_NV' : 0x0006,
+    'GL_RELATIVE_HORIZONTAL_LINE_TO_NV' : 0x0007,
+    'GL_VERTICAL_LINE_TO_NV' : 0x0008,
+    'GL_RELATIVE_VERTICAL_LINE_TO_NV' : 0x0009,
+    'GL_QUADRATIC_CURVE_TO_NV' : 0x000A,
+    'GL_RELATIVE_QUADRATIC_CURVE_TO_NV' : 0x000B,
+    'GL_CUBIC_CURVE_TO_NV' : 0x000C,
+    'GL_RELATIVE_CUBIC_CURVE_TO_NV' : 0x000D,
+    'GL_SMOOTH_QUADRATIC_CURVE_TO_NV' : 0x000E,
+    'GL_RELATIVE_SMOOTH_QUADRATIC_CURVE_TO_NV' : 0x000F,
+    'GL_SMOOTH_CUBIC_CURVE_TO_NV' : 0x0010,
+    'GL_RELATIVE_SMOOTH_CUBIC_CURVE_TO_NV' : 0x0011,
+    'GL_SMALL_CCW_ARC_TO_NV' : 0x0012,
+    'GL_RELATIVE_SMALL_CCW_ARC_TO_NV' : 0x0013,
+    'GL_SMALL_CW_ARC_TO_NV' : 0x0014,
+    'GL_RELATIVE_SMALL_CW_ARC_TO_NV' : 0x0015,
+    'GL_LARGE_CCW_ARC_TO_NV' : 0x0016,
+    'GL_RELATIVE_LARGE_CCW_ARC_TO_NV' : 0x0017,
+    'GL_LARGE_CW_ARC_TO_NV' : 0x0018,
+    'GL_RELATIVE_LARGE_CW_ARC_TO_NV' : 0x0019,
+    'GL_RESTART_PATH_NV' : 0x00F0,
+    'GL_DUP_FIRST_CUBIC_CURVE_TO_NV' : 0x00F2,
+    'GL_DUP_LAST_CUBIC_CURVE_TO_NV' : 0x00F4,
+    'GL_RECT_NV' : 0x00F6,
+    'GL_CIRCULAR_CCW_ARC_TO_NV' : 0x00F8,
+    'GL_CIRCULAR_CW_ARC_TO_NV' : 0x00FA,
+    'GL_CIRCULAR_TANGENT_ARC_TO_NV' : 0x00FC,
+    'GL_ARC_TO_NV' : 0x00FE,
+    'GL_RELATIVE_ARC_TO_NV' : 0x00FF,
+    'GL_BOLD_BIT_NV' : 0x0001,
+    'GL_ITALIC_BIT_NV' : 0x0002,
+    'GL_GLYPH_WIDTH_BIT_NV' : 0x0001,
+    'GL_GLYPH_HEIGHT_BIT_NV' : 0x0002,
+    'GL_GLYPH_HORIZONTAL_BEARING_X_BIT_NV' : 0x0004,
+    'GL_GLYPH_HORIZONTAL_BEARING_Y_BIT_NV' : 0x0008,
+    'GL_GLYPH_HORIZONTAL_BEARING_ADVANCE_BIT_NV' : 0x0010,
+    'GL_GLYPH_VERTICAL_BEARING_X_BIT_NV' : 0x0020,
+    'GL_GLYPH_VERTICAL_BEARING_Y_BIT_NV' : 0x0040,
+    'GL_GLYPH_VERTICAL_BEARING_ADVANCE_BIT_NV' : 0x0080,
+    'GL_GLYPH_HAS_KERNING_BIT_NV' : 0x0100,
+    'GL_FONT_X_MIN_BOUNDS_BIT_NV' : 0x10000,
+    'GL_FONT_Y_MIN_BOUNDS_BIT_NV' : 0x20000,
+    'GL_FONT_X_MAX_BOUNDS_BIT_NV' : 0x40000,
+    'GL_FONT_Y_MAX_BOUNDS_BIT_NV' : 0x80000,
+    'GL_FONT_UNITS_PER_EM_BIT_NV' : 0x100000,
+    'GL_FONT_ASCENDER_BIT_NV' : 0x200000,
+    'GL_FONT_DESCENDER_BIT_NV' : 0x400000,
+    'GL_FONT_HEIGHT_BIT_NV' : 0x800000,
+    'GL_FONT_MAX_ADVANCE_WIDTH_BIT_NV' : 0x1000000,
+    'GL_FONT_MAX_ADVANCE_HEIGHT_BIT_NV' : 0x2000000,
+    'GL_FONT_UNDERLINE_POSITION_BIT_NV' : 0x4000000,
+    'GL_FONT_UNDERLINE_THICKNESS_BIT_NV' : 0x8000000,
+    'GL_FONT_HAS_KERNING_BIT_NV' : 0x10000000,
+    'GL_ROUNDED_RECT_NV' : 0x00E8,
+    'GL_RELATIVE_ROUNDED_RECT_NV' : 0x00E9,
+    'GL_ROUNDED_RECT2_NV' : 0x00EA,
+    'GL_RELATIVE_ROUNDED_RECT2_NV' : 0x00EB,
+    'GL_ROUNDED_RECT4_NV' : 0x00EC,
+    'GL_RELATIVE_ROUNDED_RECT4_NV' : 0x00ED,
+    'GL_ROUNDED_RECT8_NV' : 0x00EE,
+    'GL_RELATIVE_ROUNDED_RECT8_NV' : 0x00EF,
+    'GL_RELATIVE_RECT_NV' : 0x00F7,
+    'GL_FONT_GLYPHS_AVAILABLE_NV' : 0x9368,
+    'GL_FONT_TARGET_UNAVAILABLE_NV' : 0x9369,
+    'GL_FONT_UNAVAILABLE_NV' : 0x936A,
+    'GL_FONT_UNINTELLIGIBLE_NV' : 0x936B,
+    'GL_CONIC_CURVE_TO_NV' : 0x001A,
+    'GL_RELATIVE_CONIC_CURVE_TO_NV' : 0x001B,
+    'GL_FONT_NUM_GLYPH_INDICES_BIT_NV' : 0x20000000,
+    'GL_STANDARD_FONT_FORMAT_NV' : 0x936C,
+    'GL_PATH_PROJECTION_NV' : 0x1701,
+    'GL_PATH_MODELVIEW_NV' : 0x1700,
+    'GL_PATH_MODELVIEW_STACK_DEPTH_NV' : 0x0BA3,
+    'GL_PATH_MODELVIEW_MATRIX_NV' : 0x0BA6,
+    'GL_PATH_MAX_MODELVIEW_STACK_DEPTH_NV' : 0x0D36,
+    'GL_PATH_TRANSPOSE_MODELVIEW_MATRIX_NV' : 0x84E3,
+    'GL_PATH_PROJECTION_STACK_DEPTH_NV' : 0x0BA4,
+    'GL_PATH_PROJECTION_MATRIX_NV' : 0x0BA7,
+    'GL_PATH_MAX_PROJECTION_STACK_DEPTH_NV' : 0x0D38,
+    'GL_PATH_TRANSPOSE_PROJECTION_MATRIX_NV' : 0x84E4,
+    'GL_FRAGMENT_INPUT_NV' : 0x936D,
+    'GL_SHARED_EDGE_NV' : 0x00C0,
+    'GL_PIXEL_PACK_BUFFER_NV' : 0x88EB,
+    'GL_PIXEL_UNPACK_BUFFER_NV' : 0x88EC,
+    'GL_PIXEL_PACK_BUFFER_BINDING_NV' : 0x88ED,
+    'GL_PIXEL_UNPACK_BUFFER_BINDING_NV' : 0x88EF,
+    'GL_POLYGON_MODE_NV' : 0x0B40,
+    'GL_POLYGON_OFFSET_POINT_NV' : 0x2A01,
+    'GL_POLYGON_OFFSET_LINE_NV' : 0x2A02,
+    'GL_POINT_NV' : 0x1B00,
+    'GL_LINE_NV' : 0x1B01,
+    'GL_FILL_NV' : 0x1B02,
+    'GL_SHADING_RATE_IMAGE_PER_PRIMITIVE_NV' : 0x95B1,
+    'GL_SHADING_RATE_IMAGE_PALETTE_COUNT_NV' : 0x95B2,
+    'GL_READ_BUFFER_NV' : 0x0C02,
+    'GL_REPRESENTATIVE_FRAGMENT_TEST_NV' : 0x937F,
+    'GL_SLUMINANCE_NV' : 0x8C46,
+    'GL_SLUMINANCE_ALPHA_NV' : 0x8C44,
+    'GL_SRGB8_NV' : 0x8C41,
+    'GL_SLUMINANCE8_NV' : 0x8C47,
+    'GL_SLUMINANCE8_ALPHA8_NV' : 0x8C45,
+    'GL_COMPRESSED_SRGB_S3TC_DXT1_NV' : 0x8C4C,
+    'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_NV' : 0x8C4D,
+    'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_NV' : 0x8C4E,
+    'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_NV' : 0x8C4F,
+    'GL_ETC1_SRGB8_NV' : 0x88EE,
+    'GL_SAMPLE_LOCATION_SUBPIXEL_BITS_NV' : 0x933D,
+    'GL_SAMPLE_LOCATION_PIXEL_GRID_WIDTH_NV' : 0x933E,
+    'GL_SAMPLE_LOCATION_PIXEL_GRID_HEIGHT_NV' : 0x933F,
+    'GL_PROGRAMMABLE_SAMPLE_LOCATION_TABLE_SIZE_NV' : 0x9340,
+    'GL_SAMPLE_LOCATION_NV' : 0x8E50,
+    'GL_PROGRAMMABLE_SAMPLE_LOCATION_NV' : 0x9341,
+    'GL_FRAMEBUFFER_PROGRAMMABLE_SAMPLE_LOCATIONS_NV' : 0x9342,
+    'GL_FRAMEBUFFER_SAMPLE_LOCATION_PIXEL_GRID_NV' : 0x9343,
+    'GL_SCISSOR_TEST_EXCLUSIVE_NV' : 0x9555,
+    'GL_SCISSOR_BOX_EXCLUSIVE_NV' : 0x9556,
+    'GL_SUBGROUP_FEATURE_PARTITIONED_BIT_NV' : 0x0100,
+    'GL_SHADING_RATE_IMAGE_NV' : 0x9563,
+    'GL_SHADING_RATE_NO_INVOCATIONS_NV' : 0x9564,
+    'GL_SHADING_RATE_1_INVOCATION_PER_PIXEL_NV' : 0x9565,
+    'GL_SHADING_RATE_1_INVOCATION_PER_1X2_PIXELS_NV' : 0x9566,
+    'GL_SHADING_RATE_1_INVOCATION_PER_2X1_PIXELS_NV' : 0x9567,
+    'GL_SHADING_RATE_1_INVOCATION_PER_2X2_PIXELS_NV' : 0x9568,
+    'GL_SHADING_RATE_1_INVOCATION_PER_2X4_PIXELS_NV' : 0x9569,
+    'GL_SHADING_RATE_1_INVOCATION_PER_4X2_PIXELS_NV' : 0x956A,
+    'GL_SHADING_RATE_1_INVOCATION_PER_4X4_PIXELS_NV' : 0x956B,
+    'GL_SHADING_RATE_2_INVOCATIONS_PER_PIXEL_NV' : 0x956C,
+    'GL_SHADING_RATE_4_INVOCATIONS_PER_PIXEL_NV' : 0x956D,
+    'GL_SHADING_RATE_8_INVOCATIONS_PER_PIXEL_NV' : 0x956E,
+    'GL_SHADING_RATE_16_INVOCATIONS_PER_PIXEL_NV' : 0x956F,
+    'GL_SHADING_RATE_IMAGE_BINDING_NV' : 0x955B,
+    'GL_SHADING_RATE_IMAGE_TEXEL_WIDTH_NV' : 0x955C,
+    'GL_SHADING_RATE_IMAGE_TEXEL_HEIGHT_NV' : 0x955D,
+    'GL_SHADING_RATE_IMAGE_PALETTE_SIZE_NV' : 0x955E,
+    'GL_MAX_COARSE_FRAGMENT_SAMPLES_NV' : 0x955F,
+    'GL_SHADING_RATE_SAMPLE_ORDER_DEFAULT_NV' : 0x95AE,
+    'GL_SHADING_RATE_SAMPLE_ORDER_PIXEL_MAJOR_NV' : 0x95AF,
+    'GL_SHADING_RATE_SAMPLE_ORDER_SAMPLE_MAJOR_NV' : 0x95B0,
+    'GL_SAMPLER_2D_ARRAY_SHADOW_NV' : 0x8DC4,
+    'GL_SAMPLER_CUBE_SHADOW_NV' : 0x8DC5,
+    'GL_TEXTURE_BORDER_COLOR_NV' : 0x1004,
+    'GL_CLAMP_TO_BORDER_NV' : 0x812D,
+    'GL_MAX_VIEWPORTS_NV' : 0x825B,
+    'GL_VIEWPORT_SUBPIXEL_BITS_NV' : 0x825C,
+    'GL_VIEWPORT_BOUNDS_RANGE_NV' : 0x825D,
+    'GL_VIEWPORT_INDEX_PROVOKING_VERTEX_NV' : 0x825F,
+    'GL_VIEWPORT_SWIZZLE_POSITIVE_X_NV' : 0x9350,
+    'GL_VIEWPORT_SWIZZLE_NEGATIVE_X_NV' : 0x9351,
+    'GL_VIEWPORT_SWIZZLE_POSITIVE_Y_NV' : 0x9352,
+    'GL_VIEWPORT_SWIZZLE_NEGATIVE_Y_NV' : 0x9353,
+    'GL_VIEWPORT_SWIZZLE_POSITIVE_Z_NV' : 0x9354,
+    'GL_VIEWPORT_SWIZZLE_NEGATIVE_Z_NV' : 0x9355,
+    'GL_VIEWPORT_SWIZZLE_POSITIVE_W_NV' : 0x9356,
+    'GL_VIEWPORT_SWIZZLE_NEGATIVE_W_NV' : 0x9357,
+    'GL_VIEWPORT_SWIZZLE_X_NV' : 0x9358,
+    'GL_VIEWPORT_SWIZZLE_Y_NV' : 0x9359,
+    'GL_VIEWPORT_SWIZZLE_Z_NV' : 0x935A,
+    'GL_VIEWPORT_SWIZZLE_W_NV' : 0x935B,
+    'GL_PACK_ROW_LENGTH_NV' : 0x0D02,
+    'GL_PACK_SKIP_ROWS_NV' : 0x0D03,
+    'GL_PACK_SKIP_PIXELS_NV' : 0x0D04,
+    'GL_SAMPLER_EXTERNAL_OES' : 0x8D66,
+    'GL_ETC1_RGB8_OES' : 0x8D64,
+    'GL_PALETTE4_RGB8_OES' : 0x8B90,
+    'GL_PALETTE4_RGBA8_OES' : 0x8B91,
+    'GL_PALETTE4_R5_G6_B5_OES' : 0x8B92,
+    'GL_PALETTE4_RGBA4_OES' : 0x8B93,
+    'GL_PALETTE4_RGB5_A1_OES' : 0x8B94,
+    'GL_PALETTE8_RGB8_OES' : 0x8B95,
+    'GL_PALETTE8_RGBA8_OES' : 0x8B96,
+    'GL_PALETTE8_R5_G6_B5_OES' : 0x8B97,
+    'GL_PALETTE8_RGBA4_OES' : 0x8B98,
+    'GL_PALETTE8_RGB5_A1_OES' : 0x8B99,
+    'GL_DEPTH_COMPONENT24_OES' : 0x81A6,
+    'GL_GEOMETRY_SHADER_OES' : 0x8DD9,
+    'GL_GEOMETRY_SHADER_BIT_OES' : 0x0004,
+    'GL_GEOMETRY_LINKED_VERTICES_OUT_OES' : 0x8916,
+    'GL_GEOMETRY_LINKED_INPUT_TYPE_OES' : 0x8917,
+    'GL_GEOMETRY_LINKED_OUTPUT_TYPE_OES' : 0x8918,
+    'GL_GEOMETRY_SHADER_INVOCATIONS_OES' : 0x887F,
+    'GL_LAYER_PROVOKING_VERTEX_OES' : 0x825E,
+    'GL_LINES_ADJACENCY_OES' : 0x000A,
+    'GL_LINE_STRIP_ADJACENCY_OES' : 0x000B,
+    'GL_TRIANGLES_ADJACENCY_OES' : 0x000C,
+    'GL_TRIANGLE_STRIP_ADJACENCY_OES' : 0x000D,
+    'GL_MAX_GEOMETRY_UNIFORM_COMPONENTS_OES' : 0x8DDF,
+    'GL_MAX_GEOMETRY_UNIFORM_BLOCKS_OES' : 0x8A2C,
+    'GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS_OES' : 0x8A32,
+    'GL_MAX_GEOMETRY_INPUT_COMPONENTS_OES' : 0x9123,
+    'GL_MAX_GEOMETRY_OUTPUT_COMPONENTS_OES' : 0x9124,
+    'GL_MAX_GEOMETRY_OUTPUT_VERTICES_OES' : 0x8DE0,
+    'GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS_OES' : 0x8DE1,
+    'GL_MAX_GEOMETRY_SHADER_INVOCATIONS_OES' : 0x8E5A,
+    'GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS_OES' : 0x8C29,
+    'GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS_OES' : 0x92CF,
+    'GL_MAX_GEOMETRY_ATOMIC_COUNTERS_OES' : 0x92D5,
+    'GL_MAX_GEOMETRY_IMAGE_UNIFORMS_OES' : 0x90CD,
+    'GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS_OES' : 0x90D7,
+    'GL_FIRST_VERTEX_CONVENTION_OES' : 0x8E4D,
+    'GL_LAST_VERTEX_CONVENTION_OES' : 0x8E4E,
+    'GL_UNDEFINED_VERTEX_OES' : 0x8260,
+    'GL_PRIMITIVES_GENERATED_OES' : 0x8C87,
+    'GL_FRAMEBUFFER_DEFAULT_LAYERS_OES' : 0x9312,
+    'GL_MAX_FRAMEBUFFER_LAYERS_OES' : 0x9317,
+    'GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS_OES' : 0x8DA8,
+    'GL_FRAMEBUFFER_ATTACHMENT_LAYERED_OES' : 0x8DA7,
+    'GL_REFERENCED_BY_GEOMETRY_SHADER_OES' : 0x9309,
+    'GL_PROGRAM_BINARY_LENGTH_OES' : 0x8741,
+    'GL_NUM_PROGRAM_BINARY_FORMATS_OES' : 0x87FE,
+    'GL_PROGRAM_BINARY_FORMATS_OES' : 0x87FF,
+    'GL_WRITE_ONLY_OES' : 0x88B9,
+    'GL_BUFFER_ACCESS_OES' : 0x88BB,
+    'GL_BUFFER_MAPPED_OES' : 0x88BC,
+    'GL_BUFFER_MAP_POINTER_OES' : 0x88BD,
+    'GL_PRIMITIVE_BOUNDING_BOX_OES' : 0x92BE,
+    'GL_ALPHA8_OES' : 0x803C,
+    'GL_DEPTH_COMPONENT16_OES' : 0x81A5,
+    'GL_LUMINANCE4_ALPHA4_OES' : 0x8043,
+    'GL_LUMINANCE8_ALPHA8_OES' : 0x8045,
+    'GL_LUMINANCE8_OES' : 0x8040,
+    'GL_RGBA4_OES' : 0x8056,
+    'GL_RGB5_A1_OES' : 0x8057,
+    'GL_RGB565_OES' : 0x8D62,
+    'GL_RGB8_OES' : 0x8051,
+    'GL_RGBA8_OES' : 0x8058,
+    'GL_SAMPLE_SHADING_OES' : 0x8C36,
+    'GL_MIN_SAMPLE_SHADING_VALUE_OES' : 0x8C37,
+    'GL_MIN_FRAGMENT_INTERPOLATION_OFFSET_OES' : 0x8E5B,
+    'GL_MAX_FRAGMENT_INTERPOLATION_OFFSET_OES' : 0x8E5C,
+    'GL_FRAGMENT_INTERPOLATION_OFFSET_BITS_OES' : 0x8E5D,
+    'GL_FRAGMENT_SHADER_DERIVATIVE_HINT_OES' : 0x8B8B,
+    'GL_STENCIL_INDEX1_OES' : 0x8D46,
+    'GL_STENCIL_INDEX4_OES' : 0x8D47,
+    'GL_FRAMEBUFFER_UNDEFINED_OES' : 0x8219,
+    'GL_PATCHES_OES' : 0x000E,
+    'GL_PATCH_VERTICES_OES' : 0x8E72,
+    'GL_TESS_CONTROL_OUTPUT_VERTICES_OES' : 0x8E75,
+    'GL_TESS_GEN_MODE_OES' : 0x8E76,
+    'GL_TESS_GEN_SPACING_OES' : 0x8E77,
+    'GL_TESS_GEN_VERTEX_ORDER_OES' : 0x8E78,
+    'GL_TESS_GEN_POINT_MODE_OES' : 0x8E79,
+    'GL_ISOLINES_OES' : 0x8E7A,
+    'GL_QUADS_OES' : 0x0007,
+    'GL_FRACTIONAL_ODD_OES' : 0x8E7B,
+    'GL_FRACTIONAL_EVEN_OES' : 0x8E7C,
+    'GL_MAX_PATCH_VERTICES_OES' : 0x8E7D,
+    'GL_MAX_TESS_GEN_LEVEL_OES' : 0x8E7E,
+    'GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS_OES' : 0x8E7F,
+    'GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS_OES' : 0x8E80,
+    'GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS_OES' : 0x8E81,
+    'GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS_OES' : 0x8E82,
+    'GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS_OES' : 0x8E83,
+    'GL_MAX_TESS_PATCH_COMPONENTS_OES' : 0x8E84,
+    'GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS_OES' : 0x8E85,
+    'GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS_OES' : 0x8E86,
+    'GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS_OES' : 0x8E89,
+    'GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS_OES' : 0x8E8A,
+    'GL_MAX_TESS_CONTROL_INPUT_COMPONENTS_OES' : 0x886C,
+    'GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS_OES' : 0x886D,
+    'GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS_OES' : 0x8E1E,
+    'GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS_OES' : 0x8E1F,
+    'GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS_OES' : 0x92CD,
+    'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS_OES' : 0x92CE,
+    'GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS_OES' : 0x92D3,
+    'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS_OES' : 0x92D4,
+    'GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS_OES' : 0x90CB,
+    'GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS_OES' : 0x90CC,
+    'GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS_OES' : 0x90D8,
+    'GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS_OES' : 0x90D9,
+    'GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED_OES' : 0x8221,
+    'GL_IS_PER_PATCH_OES' : 0x92E7,
+    'GL_REFERENCED_BY_TESS_CONTROL_SHADER_OES' : 0x9307,
+    'GL_REFERENCED_BY_TESS_EVALUATION_SHADER_OES' : 0x9308,
+    'GL_TESS_CONTROL_SHADER_OES' : 0x8E88,
+    'GL_TESS_EVALUATION_SHADER_OES' : 0x8E87,
+    'GL_TESS_CONTROL_SHADER_BIT_OES' : 0x0008,
+    'GL_TESS_EVALUATION_SHADER_BIT_OES' : 0x0010,
+    'GL_TEXTURE_WRAP_R_OES' : 0x8072,
+    'GL_TEXTURE_3D_OES' : 0x806F,
+    'GL_TEXTURE_BINDING_3D_OES' : 0x806A,
+    'GL_MAX_3D_TEXTURE_SIZE_OES' : 0x8073,
+    'GL_SAMPLER_3D_OES' : 0x8B5F,
+    'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_3D_ZOFFSET_OES' : 0x8CD4,
+    'GL_TEXTURE_BORDER_COLOR_OES' : 0x1004,
+    'GL_CLAMP_TO_BORDER_OES' : 0x812D,
+    'GL_TEXTURE_BUFFER_OES' : 0x8C2A,
+    'GL_TEXTURE_BUFFER_BINDING_OES' : 0x8C2A,
+    'GL_MAX_TEXTURE_BUFFER_SIZE_OES' : 0x8C2B,
+    'GL_TEXTURE_BINDING_BUFFER_OES' : 0x8C2C,
+    'GL_TEXTURE_BUFFER_DATA_STORE_BINDING_OES' : 0x8C2D,
+    'GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT_OES' : 0x919F,
+    'GL_SAMPLER_BUFFER_OES' : 0x8DC2,
+    'GL_INT_SAMPLER_BUFFER_OES' : 0x8DD0,
+    'GL_UNSIGNED_INT_SAMPLER_BUFFER_OES' : 0x8DD8,
+    'GL_IMAGE_BUFFER_OES' : 0x9051,
+    'GL_INT_IMAGE_BUFFER_OES' : 0x905C,
+    'GL_UNSIGNED_INT_IMAGE_BUFFER_OES' : 0x9067,
+    'GL_TEXTURE_BUFFER_OFFSET_OES' : 0x919D,
+    'GL_TEXTURE_BUFFER_SIZE_OES' : 0x919E,
+    'GL_COMPRESSED_RGBA_ASTC_3x3x3_OES' : 0x93C0,
+    'GL_COMPRESSED_RGBA_ASTC_4x3x3_OES' : 0x93C1,
+    'GL_COMPRESSED_RGBA_ASTC_4x4x3_OES' : 0x93C2,
+    'GL_COMPRESSED_RGBA_ASTC_4x4x4_OES' : 0x93C3,
+    'GL_COMPRESSED_RGBA_ASTC_5x4x4_OES' : 0x93C4,
+    'GL_COMPRESSED_RGBA_ASTC_5x5x4_OES' : 0x93C5,
+    'GL_COMPRESSED_RGBA_ASTC_5x5x5_OES' : 0x93C6,
+    'GL_COMPRESSED_RGBA_ASTC_6x5x5_OES' : 0x93C7,
+    'GL_COMPRESSED_RGBA_ASTC_6x6x5_OES' : 0x93C8,
+    'GL_COMPRESSED_RGBA_ASTC_6x6x6_OES' : 0x93C9,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_3x3x3_OES' : 0x93E0,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x3x3_OES' : 0x93E1,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4x3_OES' : 0x93E2,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4x4_OES' : 0x93E3,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4x4_OES' : 0x93E4,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5x4_OES' : 0x93E5,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5x5_OES' : 0x93E6,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5x5_OES' : 0x93E7,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6x5_OES' : 0x93E8,
+    'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6x6_OES' : 0x93E9,
+    'GL_TEXTURE_BINDING_CUBE_MAP_ARRAY_OES' : 0x900A,
+    'GL_SAMPLER_CUBE_MAP_ARRAY_OES' : 0x900C,
+    'GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW_OES' : 0x900D,
+    'GL_INT_SAMPLER_CUBE_MAP_ARRAY_OES' : 0x900E,
+    'GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY_OES' : 0x900F,
+    'GL_IMAGE_CUBE_MAP_ARRAY_OES' : 0x9054,
+    'GL_INT_IMAGE_CUBE_MAP_ARRAY_OES' : 0x905F,
+    'GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY_OES' : 0x906A,
+    'GL_HALF_FLOAT_OES' : 0x8D61,
+    'GL_STENCIL_INDEX_OES' : 0x1901,
+    'GL_STENCIL_INDEX8_OES' : 0x8D48,
+    'GL_TEXTURE_2D_MULTISAMPLE_ARRAY_OES' : 0x9102,
+    'GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY_OES' : 0x9105,
+    'GL_SAMPLER_2D_MULTISAMPLE_ARRAY_OES' : 0x910B,
+    'GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY_OES' : 0x910C,
+    'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY_OES' : 0x910D,
+    'GL_TEXTURE_VIEW_MIN_LEVEL_OES' : 0x82DB,
+    'GL_TEXTURE_VIEW_NUM_LEVELS_OES' : 0x82DC,
+    'GL_TEXTURE_VIEW_MIN_LAYER_OES' : 0x82DD,
+    'GL_TEXTURE_VIEW_NUM_LAYERS_OES' : 0x82DE,
+    'GL_VERTEX_ARRAY_BINDING_OES' : 0x85B5,
+    'GL_UNSIGNED_INT_10_10_10_2_OES' : 0x8DF6,
+    'GL_INT_10_10_10_2_OES' : 0x8DF7,
+    'GL_MAX_VIEWPORTS_OES' : 0x825B,
+    'GL_VIEWPORT_SUBPIXEL_BITS_OES' : 0x825C,
+    'GL_VIEWPORT_BOUNDS_RANGE_OES' : 0x825D,
+    'GL_VIEWPORT_INDEX_PROVOKING_VERTEX_OES' : 0x825F,
+    'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_NUM_VIEWS_OVR' : 0x9630,
+    'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_BASE_VIEW_INDEX_OVR' : 0x9632,
+    'GL_MAX_VIEWS_OVR' : 0x9631,
+    'GL_FRAMEBUFFER_INCOMPLETE_VIEW_TARGETS_OVR' : 0x9633,
+    'GL_ALPHA_TEST_QCOM' : 0x0BC0,
+    'GL_ALPHA_TEST_FUNC_QCOM' : 0x0BC1,
+    'GL_ALPHA_TEST_REF_QCOM' : 0x0BC2,
+    'GL_BINNING_CONTROL_HINT_QCOM' : 0x8FB0,
+    'GL_CPU_OPTIMIZED_QCOM' : 0x8FB1,
+    'GL_GPU_OPTIMIZED_QCOM' : 0x8FB2,
+    'GL_RENDER_DIRECT_TO_FRAMEBUFFER_QCOM' : 0x8FB3,
+    'GL_TEXTURE_WIDTH_QCOM' : 0x8BD2,
+    'GL_TEXTURE_HEIGHT_QCOM' : 0x8BD3,
+    'GL_TEXTURE_DEPTH_QCOM' : 0x8BD4,
+    'GL_TEXTURE_INTERNAL_FORMAT_QCOM' : 0x8BD5,
+    'GL_TEXTURE_FORMAT_QCOM' : 0x8BD6,
+    'GL_TEXTURE_TYPE_QCOM' : 0x8BD7,
+    'GL_TEXTURE_IMAGE_VALID_QCOM' : 0x8BD8,
+    'GL_TEXTURE_NUM_LEVELS_QCOM' : 0x8BD9,
+    'GL_TEXTURE_TARGET_QCOM' : 0x8BDA,
+    'GL_TEXTURE_OBJECT_VALID_QCOM' : 0x8BDB,
+    'GL_STATE_RESTORE' : 0x8BDC,
+    'GL_FOVEATION_ENABLE_BIT_QCOM' : 0x0001,
+    'GL_FOVEATION_SCALED_BIN_METHOD_BIT_QCOM' : 0x0002,
+    'GL_MOTION_ESTIMATION_SEARCH_BLOCK_X_QCOM' : 0x8C90,
+    'GL_MOTION_ESTIMATION_SEARCH_BLOCK_Y_QCOM' : 0x8C91,
+    'GL_TEXTURE_FOVEATED_FEATURE_BITS_QCOM' : 0x8BFB,
+    'GL_TEXTURE_FOVEATED_MIN_PIXEL_DENSITY_QCOM' : 0x8BFC,
+    'GL_TEXTURE_FOVEATED_FEATURE_QUERY_QCOM' : 0x8BFD,
+    'GL_TEXTURE_FOVEATED_NUM_FOCAL_POINTS_QUERY_QCOM' : 0x8BFE,
+    'GL_FRAMEBUFFER_INCOMPLETE_FOVEATION_QCOM' : 0x8BFF,
+    'GL_TEXTURE_FOVEATED_CUTOFF_DENSITY_QCOM' : 0x96A0,
+    'GL_FOVEATION_SUBSAMPLED_LAYOUT_METHOD_BIT_QCOM' : 0x0004,
+    'GL_MAX_SHADER_SUBSAMPLED_IMAGE_UNITS_QCOM' : 0x8FA1,
+    'GL_TEXTURE_Y_DEGAMMA_QCOM' : 0x9710,
+    'GL_TEXTURE_CBCR_DEGAMMA_QCOM' : 0x9711,
+    'GL_TEXTURE_LOD_BIAS_QCOM' : 0x8C96,
+    'GL_PERFMON_GLOBAL_MODE_QCOM' : 0x8FA0,
+    'GL_FRAMEBUFFER_FETCH_NONCOHERENT_QCOM' : 0x96A2,
+    'GL_SHADING_RATE_QCOM' : 0x96A4,
+    'GL_SHADING_RATE_PRESERVE_ASPECT_RATIO_QCOM' : 0x96A5,
+    'GL_SHADING_RATE_1X1_PIXELS_QCOM' : 0x96A6,
+    'GL_SHADING_RATE_1X2_PIXELS_QCOM' : 0x96A7,
+    'GL_SHADING_RATE_2X1_PIXELS_QCOM' : 0x96A8,
+    'GL_SHADING_RATE_2X2_PIXELS_QCOM' : 0x96A9,
+    'GL_SHADING_RATE_4X2_PIXELS_QCOM' : 0x96AC,
+    'GL_SHADING_RATE_4X4_PIXELS_QCOM' : 0x96AE,
+    'GL_COLOR_BUFFER_BIT0_QCOM' : 0x0001,
+    'GL_COLOR_BUFFER_BIT1_QCOM' : 0x0002,
+    'GL_COLOR_BUFFER_BIT2_QCOM' : 0x0004,
+    'GL_COLOR_BUFFER_BIT3_QCOM' : 0x0008,
+    'GL_COLOR_BUFFER_BIT4_QCOM' : 0x0010,
+    'GL_COLOR_BUFFER_BIT5_QCOM' : 0x0020,
+    'GL_COLOR_BUFFER_BIT6_QCOM' : 0x0040,
+    'GL_COLOR_BUFFER_BIT7_QCOM' : 0x0080,
+    'GL_DEPTH_BUFFER_BIT0_QCOM' : 0x0100,
+    'GL_DEPTH_BUFFER_BIT1_QCOM' : 0x0200,
+    'GL_DEPTH_BUFFER_BIT2_QCOM' : 0x0400,
+    'GL_DEPTH_BUFFER_BIT3_QCOM' : 0x0800,
+    'GL_DEPTH_BUFFER_BIT4_QCOM' : 0x1000,
+    'GL_DEPTH_BUFFER_BIT5_QCOM' : 0x2000,
+    'GL_DEPTH_BUFFER_BIT6_QCOM' : 0x4000,
+    'GL_DEPTH_BUFFER_BIT7_QCOM' : 0x8000,
+    'GL_STENCIL_BUFFER_BIT0_QCOM' : 0x10000,
+    'GL_STENCIL_BUFFER_BIT1_QCOM' : 0x20000,
+    'GL_STENCIL_BUFFER_BIT2_QCOM' : 0x40000,
+    'GL_STENCIL_BUFFER_BIT3_QCOM' : 0x80000,
+    'GL_STENCIL_BUFFER_BIT4_QCOM' : 0x100000,
+    'GL_STENCIL_BUFFER_BIT5_QCOM' : 0x200000,
+    'GL_STENCIL_BUFFER_BIT6_QCOM' : 0x400000,
+    'GL_STENCIL_BUFFER_BIT7_QCOM' : 0x800000,
+    'GL_MULTISAMPLE_BUFFER_BIT0_QCOM' : 0x1000000,
+    'GL_MULTISAMPLE_BUFFER_BIT1_QCOM' : 0x2000000,
+    'GL_MULTISAMPLE_BUFFER_BIT2_QCOM' : 0x4000000,
+    'GL_MULTISAMPLE_BUFFER_BIT3_QCOM' : 0x8000000,
+    'GL_MULTISAMPLE_BUFFER_BIT4_QCOM' : 0x10000000,
+    'GL_MULTISAMPLE_BUFFER_BIT5_QCOM' : 0x20000000,
+    'GL_MULTISAMPLE_BUFFER_BIT6_QCOM' : 0x40000000,
+    'GL_MULTISAMPLE_BUFFER_BIT7_QCOM' : 0x80000000,
+    'GL_WRITEONLY_RENDERING_QCOM' : 0x8823,
+    'GL_SHADER_BINARY_VIV' : 0x8FC4,
+}
+
+# value -> canonical enum name
+NAMES = {
+    0x0100 : 'GL_DEPTH_BUFFER_BIT',
+    0x0400 : 'GL_STENCIL_BUFFER_BIT',
+    0x4000 : 'GL_COLOR_BUFFER_BIT',
+    0x0000 : 'GL_FALSE',
+    0x0001 : 'GL_TRUE',
+    0x0002 : 'GL_LINE_LOOP',
+    0x0003 : 'GL_LINE_STRIP',
+    0x0004 : 'GL_TRIANGLES',
+    0x0005 : 'GL_TRIANGLE_STRIP',
+    0x0006 : 'GL_TRIANGLE_FAN',
+    0x0300 : 'GL_SRC_COLOR',
+    0x0301 : 'GL_ONE_MINUS_SRC_COLOR',
+    0x0302 : 'GL_SRC_ALPHA',
+    0x0303 : 'GL_ONE_MINUS_SRC_ALPHA',
+    0x0304 : 'GL_DST_ALPHA',
+    0x0305 : 'GL_ONE_MINUS_DST_ALPHA',
+    0x0306 : 'GL_DST_COLOR',
+    0x0307 : 'GL_ONE_MINUS_DST_COLOR',
+    0x0308 : 'GL_SRC_ALPHA_SATURATE',
+    0x8006 : 'GL_FUNC_ADD',
+    0x8009 : 'GL_BLEND_EQUATION',
+    0x883D : 'GL_BLEND_EQUATION_ALPHA',
+    0x800A : 'GL_FUNC_SUBTRACT',
+    0x800B : 'GL_FUNC_REVERSE_SUBTRACT',
+    0x80C8 : 'GL_BLEND_DST_RGB',
+    0x80C9 : 'GL_BLEND_SRC_RGB',
+    0x80CA : 'GL_BLEND_DST_ALPHA',
+    0x80CB : 'GL_BLEND_SRC_ALPHA',
+    0x8001 : 'GL_CONSTANT_COLOR',
+    0x8002 : 'GL_ONE_MINUS_CONSTANT_COLOR',
+    0x8003 : 'GL_CONSTANT_ALPHA',
+    0x8004 : 'GL_ONE_MINUS_CONSTANT_ALPHA',
+    0x8005 : 'GL_BLEND_COLOR',
+    0x8892 : 'GL_ARRAY_BUFFER',
+    0x8893 : 'GL_ELEMENT_ARRAY_BUFFER',
+    0x8894 : 'GL_ARRAY_BUFFER_BINDING',
+    0x8895 : 'GL_ELEMENT_ARRAY_BUFFER_BINDING',
+    0x88E0 : 'GL_STREAM_DRAW',
+    0x88E4 : 'GL_STATIC_DRAW',
+    0x88E8 : 'GL_DYNAMIC_DRAW',
+    0x8764 : 'GL_BUFFER_SIZE',
+    0x8765 : 'GL_BUFFER_USAGE',
+    0x8626 : 'GL_CURRENT_VERTEX_ATTRIB',
+    0x0404 : 'GL_FRONT',
+    0x0405 : 'GL_BACK',
+    0x0408 : 'GL_FRONT_AND_BACK',
+    0x0DE1 : 'GL_TEXTURE_2D',
+    0x0B44 : 'GL_CULL_FACE',
+    0x0BE2 : 'GL_BLEND',
+    0x0BD0 : 'GL_DITHER',
+    0x0B90 : 'GL_STENCIL_TEST',
+    0x0B71 : 'GL_DEPTH_TEST',
+    0x0C11 : 'GL_SCISSOR_TEST',
+    0x8037 : 'GL_POLYGON_OFFSET_FILL',
+    0x809E : 'GL_SAMPLE_ALPHA_TO_COVERAGE',
+    0x80A0 : 'GL_SAMPLE_COVERAGE',
+    0x0500 : 'GL_INVALID_ENUM',
+    0x0501 : 'GL_INVALID_VALUE',
+    0x0502 : 'GL_INVALID_OPERATION',
+    0x0505 : 'GL_OUT_OF_MEMORY',
+    0x0900 : 'GL_CW',
+    0x0901 : 'GL_CCW',
+    0x0B21 : 'GL_LINE_WIDTH',
+    0x846D : 'GL_ALIASED_POINT_SIZE_RANGE',
+    0x846E : 'GL_ALIASED_LINE_WIDTH_RANGE',
+    0x0B45 : 'GL_CULL_FACE_MODE',
+    0x0B46 : 'GL_FRONT_FACE',
+    0x0B70 : 'GL_DEPTH_RANGE',
+    0x0B72 : 'GL_DEPTH_WRITEMASK',
+    0x0B73 : 'GL_DEPTH_CLEAR_VALUE',
+    0x0B74 : 'GL_DEPTH_FUNC',
+    0x0B91 : 'GL_STENCIL_CLEAR_VALUE',
+    0x0B92 : 'GL_STENCIL_FUNC',
+    0x0B94 : 'GL_STENCIL_FAIL',
+    0x0B95 : 'GL_STENCIL_PASS_DEPTH_FAIL',
+    0x0B96 : 'GL_STENCIL_PASS_DEPTH_PASS',
+    0x0B97 : 'GL_STENCIL_REF',
+    0x0B93 : 'GL_STENCIL_VALUE_MASK',
+    0x0B98 : 'GL_STENCIL_WRITEMASK',
+    0x8800 : 'GL_STENCIL_BACK_FUNC',
+    0x8801 : 'GL_STENCIL_BACK_FAIL',
+    0x8802 : 'GL_STENCIL_BACK_PASS_DEPTH_FAIL',
+    0x8803 : 'GL_STENCIL_BACK_PASS_DEPTH_PASS',
+    0x8CA3 : 'GL_STENCIL_BACK_REF',
+    0x8CA4 : 'GL_STENCIL_BACK_VALUE_MASK',
+    0x8CA5 : 'GL_STENCIL_BACK_WRITEMASK',
+    0x0BA2 : 'GL_VIEWPORT',
+    0x0C10 : 'GL_SCISSOR_BOX',
+    0x0C22 : 'GL_COLOR_CLEAR_VALUE',
+    0x0C23 : 'GL_COLOR_WRITEMASK',
+    0x0CF5 : 'GL_UNPACK_ALIGNMENT',
+    0x0D05 : 'GL_PACK_ALIGNMENT',
+    0x0D33 : 'GL_MAX_TEXTURE_SIZE',
+    0x0D3A : 'GL_MAX_VIEWPORT_DIMS',
+    0x0D50 : 'GL_SUBPIXEL_BITS',
+    0x0D52 : 'GL_RED_BITS',
+    0x0D53 : 'GL_GREEN_BITS',
+    0x0D54 : 'GL_BLUE_BITS',
+    0x0D55 : 'GL_ALPHA_BITS',
+    0x0D56 : 'GL_DEPTH_BITS',
+    0x0D57 : 'GL_STENCIL_BITS',
+    0x2A00 : 'GL_POLYGON_OFFSET_UNITS',
+    0x8038 : 'GL_POLYGON_OFFSET_FACTOR',
+    0x8069 : 'GL_TEXTURE_BINDING_2D',
+    0x80A8 : 'GL_SAMPLE_BUFFERS',
+    0x80A9 : 'GL_SAMPLES',
+    0x80AA : 'GL_SAMPLE_COVERAGE_VALUE',
+    0x80AB : 'GL_SAMPLE_COVERAGE_INVERT',
+    0x86A2 : 'GL_NUM_COMPRESSED_TEXTURE_FORMATS',
+    0x86A3 : 'GL_COMPRESSED_TEXTURE_FORMATS',
+    0x1100 : 'GL_DONT_CARE',
+    0x1101 : 'GL_FASTEST',
+    0x1102 : 'GL_NICEST',
+    0x8192 : 'GL_GENERATE_MIPMAP_HINT',
+    0x1400 : 'GL_BYTE',
+    0x1401 : 'GL_UNSIGNED_BYTE',
+    0x1402 : 'GL_SHORT',
+    0x1403 : 'GL_UNSIGNED_SHORT',
+    0x1404 : 'GL_INT',
+    0x1405 : 'GL_UNSIGNED_INT',
+    0x1406 : 'GL_FLOAT',
+    0x140C : 'GL_FIXED',
+    0x1902 : 'GL_DEPTH_COMPONENT',
+    0x1906 : 'GL_ALPHA',
+    0x1907 : 'GL_RGB',
+    0x1908 : 'GL_RGBA',
+    0x1909 : 'GL_LUMINANCE',
+    0x190A : 'GL_LUMINANCE_ALPHA',
+    0x8033 : 'GL_UNSIGNED_SHORT_4_4_4_4',
+    0x8034 : 'GL_UNSIGNED_SHORT_5_5_5_1',
+    0x8363 : 'GL_UNSIGNED_SHORT_5_6_5',
+    0x8B30 : 'GL_FRAGMENT_SHADER',
+    0x8B31 : 'GL_VERTEX_SHADER',
+    0x8869 : 'GL_MAX_VERTEX_ATTRIBS',
+    0x8DFB : 'GL_MAX_VERTEX_UNIFORM_VECTORS',
+    0x8DFC : 'GL_MAX_VARYING_VECTORS',
+    0x8B4D : 'GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS',
+    0x8B4C : 'GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS',
+    0x8872 : 'GL_MAX_TEXTURE_IMAGE_UNITS',
+    0x8DFD : 'GL_MAX_FRAGMENT_UNIFORM_VECTORS',
+    0x8B4F : 'GL_SHADER_TYPE',
+    0x8B80 : 'GL_DELETE_STATUS',
+    0x8B82 : 'GL_LINK_STATUS',
+    0x8B83 : 'GL_VALIDATE_STATUS',
+    0x8B85 : 'GL_ATTACHED_SHADERS',
+    0x8B86 : 'GL_ACTIVE_UNIFORMS',
+    0x8B87 : 'GL_ACTIVE_UNIFORM_MAX_LENGTH',
+    0x8B89 : 'GL_ACTIVE_ATTRIBUTES',
+    0x8B8A : 'GL_ACTIVE_ATTRIBUTE_MAX_LENGTH',
+    0x8B8C : 'GL_SHADING_LANGUAGE_VERSION',
+    0x8B8D : 'GL_CURRENT_PROGRAM',
+    0x0200 : 'GL_NEVER',
+    0x0201 : 'GL_LESS',
+    0x0202 : 'GL_EQUAL',
+    0x0203 : 'GL_LEQUAL',
+    0x0204 : 'GL_GREATER',
+    0x0205 : 'GL_NOTEQUAL',
+    0x0206 : 'GL_GEQUAL',
+    0x0207 : 'GL_ALWAYS',
+    0x1E00 : 'GL_KEEP',
+    0x1E01 : 'GL_REPLACE',
+    0x1E02 : 'GL_INCR',
+    0x1E03 : 'GL_DECR',
+    0x150A : 'GL_INVERT',
+    0x8507 : 'GL_INCR_WRAP',
+    0x8508 : 'GL_DECR_WRAP',
+    0x1F00 : 'GL_VENDOR',
+    0x1F01 : 'GL_RENDERER',
+    0x1F02 : 'GL_VERSION',
+    0x1F03 : 'GL_EXTENSIONS',
+    0x2600 : 'GL_NEAREST',
+    0x2601 : 'GL_LINEAR',
+    0x2700 : 'GL_NEAREST_MIPMAP_NEAREST',
+    0x2701 : 'GL_LINEAR_MIPMAP_NEAREST',
+    0x2702 : 'GL_NEAREST_MIPMAP_LINEAR',
+    0x2703 : 'GL_LINEAR_MIPMAP_LINEAR',
+    0x2800 : 'GL_TEXTURE_MAG_FILTER',
+    0x2801 : 'GL_TEXTURE_MIN_FILTER',
+    0x2802 : 'GL_TEXTURE_WRAP_S',
+    0x2803 : 'GL_TEXTURE_WRAP_T',
+    0x1702 : 'GL_TEXTURE',
+    0x8513 : 'GL_TEXTURE_CUBE_MAP',
+    0x8514 : 'GL_TEXTURE_BINDING_CUBE_MAP',
+    0x8515 : 'GL_TEXTURE_CUBE_MAP_POSITIVE_X',
+    0x8516 : 'GL_TEXTURE_CUBE_MAP_NEGATIVE_X',
+    0x8517 : 'GL_TEXTURE_CUBE_MAP_POSITIVE_Y',
+    0x8518 : 'GL_TEXTURE_CUBE_MAP_NEGATIVE_Y',
+    0x8519 : 'GL_TEXTURE_CUBE_MAP_POSITIVE_Z',
+    0x851A : 'GL_TEXTURE_CUBE_MAP_NEGATIVE_Z',
+    0x851C : 'GL_MAX_CUBE_MAP_TEXTURE_SIZE',
+    0x84C0 : 'GL_TEXTURE0',
+    0x84C1 : 'GL_TEXTURE1',
+    0x84C2 : 'GL_TEXTURE2',
+    0x84C3 : 'GL_TEXTURE3',
+    0x84C4 : 'GL_TEXTURE4',
+    0x84C5 : 'GL_TEXTURE5',
+    0x84C6 : 'GL_TEXTURE6',
+    0x84C7 : 'GL_TEXTURE7',
+    0x84C8 : 'GL_TEXTURE8',
+    0x84C9 : 'GL_TEXTURE9',
+    0x84CA : 'GL_TEXTURE10',
+    0x84CB : 'GL_TEXTURE11',
+    0x84CC : 'GL_TEXTURE12',
+    0x84CD : 'GL_TEXTURE13',
+    0x84CE : 'GL_TEXTURE14',
+    0x84CF : 'GL_TEXTURE15',
+    0x84D0 : 'GL_TEXTURE16',
+    0x84D1 : 'GL_TEXTURE17',
+    0x84D2 : 'GL_TEXTURE18',
+    0x84D3 : 'GL_TEXTURE19',
+    0x84D4 : 'GL_TEXTURE20',
+    0x84D5 : 'GL_TEXTURE21',
+    0x84D6 : 'GL_TEXTURE22',
+    0x84D7 : 'GL_TEXTURE23',
+    0x84D8 : 'GL_TEXTURE24',
+    0x84D9 : 'GL_TEXTURE25',
+    0x84DA : 'GL_TEXTURE26',
+    0x84DB : 'GL_TEXTURE27',
+    0x84DC : 'GL_TEXTURE28',
+    0x84DD : 'GL_TEXTURE29',
+    0x84DE : 'GL_TEXTURE30',
+    0x84DF : 'GL_TEXTURE31',
+    0x84E0 : 'GL_ACTIVE_TEXTURE',
+    0x2901 : 'GL_REPEAT',
+    0x812F : 'GL_CLAMP_TO_EDGE',
+    0x8370 : 'GL_MIRRORED_REPEAT',
+    0x8B50 : 'GL_FLOAT_VEC2',
+    0x8B51 : 'GL_FLOAT_VEC3',
+    0x8B52 : 'GL_FLOAT_VEC4',
+    0x8B53 : 'GL_INT_VEC2',
+    0x8B54 : 'GL_INT_VEC3',
+    0x8B55 : 'GL_INT_VEC4',
+    0x8B56 : 'GL_BOOL',
+    0x8B57 : 'GL_BOOL_VEC2',
+    0x8B58 : 'GL_BOOL_VEC3',
+    0x8B59 : 'GL_BOOL_VEC4',
+    0x8B5A : 'GL_FLOAT_MAT2',
+    0x8B5B : 'GL_FLOAT_MAT3',
+    0x8B5C : 'GL_FLOAT_MAT4',
+    0x8B5E : 'GL_SAMPLER_2D',
+    0x8B60 : 'GL_SAMPLER_CUBE',
+    0x8622 : 'GL_VERTEX_ATTRIB_ARRAY_ENABLED',
+    0x8623 : 'GL_VERTEX_ATTRIB_ARRAY_SIZE',
+    0x8624 : 'GL_VERTEX_ATTRIB_ARRAY_STRIDE',
+    0x8625 : 'GL_VERTEX_ATTRIB_ARRAY_TYPE',
+    0x886A : 'GL_VERTEX_ATTRIB_ARRAY_NORMALIZED',
+    0x8645 : 'GL_VERTEX_ATTRIB_ARRAY_POINTER',
+    0x889F : 'GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING',
+    0x8B9A : 'GL_IMPLEMENTATION_COLOR_READ_TYPE',
+    0x8B9B : 'GL_IMPLEMENTATION_COLOR_READ_FORMAT',
+    0x8B81 : 'GL_COMPILE_STATUS',
+    0x8B84 : 'GL_INFO_LOG_LENGTH',
+    0x8B88 : 'GL_SHADER_SOURCE_LENGTH',
+    0x8DFA : 'GL_SHADER_COMPILER',
+    0x8DF8 : 'GL_SHADER_BINARY_FORMATS',
+    0x8DF9 : 'GL_NUM_SHADER_BINARY_FORMATS',
+    0x8DF0 : 'GL_LOW_FLOAT',
+    0x8DF1 : 'GL_MEDIUM_FLOAT',
+    0x8DF2 : 'GL_HIGH_FLOAT',
+    0x8DF3 : 'GL_LOW_INT',
+    0x8DF4 : 'GL_MEDIUM_INT',
+    0x8DF5 : 'GL_HIGH_INT',
+    0x8D40 : 'GL_FRAMEBUFFER',
+    0x8D41 : 'GL_RENDERBUFFER',
+    0x8056 : 'GL_RGBA4',
+    0x8057 : 'GL_RGB5_A1',
+    0x8D62 : 'GL_RGB565',
+    0x81A5 : 'GL_DEPTH_COMPONENT16',
+    0x8D48 : 'GL_STENCIL_INDEX8',
+    0x8D42 : 'GL_RENDERBUFFER_WIDTH',
+    0x8D43 : 'GL_RENDERBUFFER_HEIGHT',
+    0x8D44 : 'GL_RENDERBUFFER_INTERNAL_FORMAT',
+    0x8D50 : 'GL_RENDERBUFFER_RED_SIZE',
+    0x8D51 : 'GL_RENDERBUFFER_GREEN_SIZE',
+    0x8D52 : 'GL_RENDERBUFFER_BLUE_SIZE',
+    0x8D53 : 'GL_RENDERBUFFER_ALPHA_SIZE',
+    0x8D54 : 'GL_RENDERBUFFER_DEPTH_SIZE',
+    0x8D55 : 'GL_RENDERBUFFER_STENCIL_SIZE',
+    0x8CD0 : 'GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE',
+    0x8CD1 : 'GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME',
+    0x8CD2 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL',
+    0x8CD3 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE',
+    0x8CE0 : 'GL_COLOR_ATTACHMENT0',
+    0x8D00 : 'GL_DEPTH_ATTACHMENT',
+    0x8D20 : 'GL_STENCIL_ATTACHMENT',
+    0x8CD5 : 'GL_FRAMEBUFFER_COMPLETE',
+    0x8CD6 : 'GL_FRAMEBUFFER_INCOMPLETE_ATTACHMENT',
+    0x8CD7 : 'GL_FRAMEBUFFER_INCOMPLETE_MISSING_ATTACHMENT',
+    0x8CD9 : 'GL_FRAMEBUFFER_INCOMPLETE_DIMENSIONS',
+    0x8CDD : 'GL_FRAMEBUFFER_UNSUPPORTED',
+    0x8CA6 : 'GL_FRAMEBUFFER_BINDING',
+    0x8CA7 : 'GL_RENDERBUFFER_BINDING',
+    0x84E8 : 'GL_MAX_RENDERBUFFER_SIZE',
+    0x0506 : 'GL_INVALID_FRAMEBUFFER_OPERATION',
+    0x0C02 : 'GL_READ_BUFFER',
+    0x0CF2 : 'GL_UNPACK_ROW_LENGTH',
+    0x0CF3 : 'GL_UNPACK_SKIP_ROWS',
+    0x0CF4 : 'GL_UNPACK_SKIP_PIXELS',
+    0x0D02 : 'GL_PACK_ROW_LENGTH',
+    0x0D03 : 'GL_PACK_SKIP_ROWS',
+    0x0D04 : 'GL_PACK_SKIP_PIXELS',
+    0x1800 : 'GL_COLOR',
+    0x1801 : 'GL_DEPTH',
+    0x1802 : 'GL_STENCIL',
+    0x1903 : 'GL_RED',
+    0x8051 : 'GL_RGB8',
+    0x8058 : 'GL_RGBA8',
+    0x8059 : 'GL_RGB10_A2',
+    0x806A : 'GL_TEXTURE_BINDING_3D',
+    0x806D : 'GL_UNPACK_SKIP_IMAGES',
+    0x806E : 'GL_UNPACK_IMAGE_HEIGHT',
+    0x806F : 'GL_TEXTURE_3D',
+    0x8072 : 'GL_TEXTURE_WRAP_R',
+    0x8073 : 'GL_MAX_3D_TEXTURE_SIZE',
+    0x8368 : 'GL_UNSIGNED_INT_2_10_10_10_REV',
+    0x80E8 : 'GL_MAX_ELEMENTS_VERTICES',
+    0x80E9 : 'GL_MAX_ELEMENTS_INDICES',
+    0x813A : 'GL_TEXTURE_MIN_LOD',
+    0x813B : 'GL_TEXTURE_MAX_LOD',
+    0x813C : 'GL_TEXTURE_BASE_LEVEL',
+    0x813D : 'GL_TEXTURE_MAX_LEVEL',
+    0x8007 : 'GL_MIN',
+    0x8008 : 'GL_MAX',
+    0x81A6 : 'GL_DEPTH_COMPONENT24',
+    0x84FD : 'GL_MAX_TEXTURE_LOD_BIAS',
+    0x884C : 'GL_TEXTURE_COMPARE_MODE',
+    0x884D : 'GL_TEXTURE_COMPARE_FUNC',
+    0x8865 : 'GL_CURRENT_QUERY',
+    0x8866 : 'GL_QUERY_RESULT',
+    0x8867 : 'GL_QUERY_RESULT_AVAILABLE',
+    0x88BC : 'GL_BUFFER_MAPPED',
+    0x88BD : 'GL_BUFFER_MAP_POINTER',
+    0x88E1 : 'GL_STREAM_READ',
+    0x88E2 : 'GL_STREAM_COPY',
+    0x88E5 : 'GL_STATIC_READ',
+    0x88E6 : 'GL_STATIC_COPY',
+    0x88E9 : 'GL_DYNAMIC_READ',
+    0x88EA : 'GL_DYNAMIC_COPY',
+    0x8824 : 'GL_MAX_DRAW_BUFFERS',
+    0x8825 : 'GL_DRAW_BUFFER0',
+    0x8826 : 'GL_DRAW_BUFFER1',
+    0x8827 : 'GL_DRAW_BUFFER2',
+    0x8828 : 'GL_DRAW_BUFFER3',
+    0x8829 : 'GL_DRAW_BUFFER4',
+    0x882A : 'GL_DRAW_BUFFER5',
+    0x882B : 'GL_DRAW_BUFFER6',
+    0x882C : 'GL_DRAW_BUFFER7',
+    0x882D : 'GL_DRAW_BUFFER8',
+    0x882E : 'GL_DRAW_BUFFER9',
+    0x882F : 'GL_DRAW_BUFFER10',
+    0x8830 : 'GL_DRAW_BUFFER11',
+    0x8831 : 'GL_DRAW_BUFFER12',
+    0x8832 : 'GL_DRAW_BUFFER13',
+    0x8833 : 'GL_DRAW_BUFFER14',
+    0x8834 : 'GL_DRAW_BUFFER15',
+    0x8B49 : 'GL_MAX_FRAGMENT_UNIFORM_COMPONENTS',
+    0x8B4A : 'GL_MAX_VERTEX_UNIFORM_COMPONENTS',
+    0x8B5F : 'GL_SAMPLER_3D',
+    0x8B62 : 'GL_SAMPLER_2D_SHADOW',
+    0x8B8B : 'GL_FRAGMENT_SHADER_DERIVATIVE_HINT',
+    0x88EB : 'GL_PIXEL_PACK_BUFFER',
+    0x88EC : 'GL_PIXEL_UNPACK_BUFFER',
+    0x88ED : 'GL_PIXEL_PACK_BUFFER_BINDING',
+    0x88EF : 'GL_PIXEL_UNPACK_BUFFER_BINDING',
+    0x8B65 : 'GL_FLOAT_MAT2x3',
+    0x8B66 : 'GL_FLOAT_MAT2x4',
+    0x8B67 : 'GL_FLOAT_MAT3x2',
+    0x8B68 : 'GL_FLOAT_MAT3x4',
+    0x8B69 : 'GL_FLOAT_MAT4x2',
+    0x8B6A : 'GL_FLOAT_MAT4x3',
+    0x8C40 : 'GL_SRGB',
+    0x8C41 : 'GL_SRGB8',
+    0x8C43 : 'GL_SRGB8_ALPHA8',
+    0x884E : 'GL_COMPARE_REF_TO_TEXTURE',
+    0x821B : 'GL_MAJOR_VERSION',
+    0x821C : 'GL_MINOR_VERSION',
+    0x821D : 'GL_NUM_EXTENSIONS',
+    0x8814 : 'GL_RGBA32F',
+    0x8815 : 'GL_RGB32F',
+    0x881A : 'GL_RGBA16F',
+    0x881B : 'GL_RGB16F',
+    0x88FD : 'GL_VERTEX_ATTRIB_ARRAY_INTEGER',
+    0x88FF : 'GL_MAX_ARRAY_TEXTURE_LAYERS',
+    0x8904 : 'GL_MIN_PROGRAM_TEXEL_OFFSET',
+    0x8905 : 'GL_MAX_PROGRAM_TEXEL_OFFSET',
+    0x8B4B : 'GL_MAX_VARYING_COMPONENTS',
+    0x8C1A : 'GL_TEXTURE_2D_ARRAY',
+    0x8C1D : 'GL_TEXTURE_BINDING_2D_ARRAY',
+    0x8C3A : 'GL_R11F_G11F_B10F',
+    0x8C3B : 'GL_UNSIGNED_INT_10F_11F_11F_REV',
+    0x8C3D : 'GL_RGB9_E5',
+    0x8C3E : 'GL_UNSIGNED_INT_5_9_9_9_REV',
+    0x8C76 : 'GL_TRANSFORM_FEEDBACK_VARYING_MAX_LENGTH',
+    0x8C7F : 'GL_TRANSFORM_FEEDBACK_BUFFER_MODE',
+    0x8C80 : 'GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_COMPONENTS',
+    0x8C83 : 'GL_TRANSFORM_FEEDBACK_VARYINGS',
+    0x8C84 : 'GL_TRANSFORM_FEEDBACK_BUFFER_START',
+    0x8C85 : 'GL_TRANSFORM_FEEDBACK_BUFFER_SIZE',
+    0x8C88 : 'GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN',
+    0x8C89 : 'GL_RASTERIZER_DISCARD',
+    0x8C8A : 'GL_MAX_TRANSFORM_FEEDBACK_INTERLEAVED_COMPONENTS',
+    0x8C8B : 'GL_MAX_TRANSFORM_FEEDBACK_SEPARATE_ATTRIBS',
+    0x8C8C : 'GL_INTERLEAVED_ATTRIBS',
+    0x8C8D : 'GL_SEPARATE_ATTRIBS',
+    0x8C8E : 'GL_TRANSFORM_FEEDBACK_BUFFER',
+    0x8C8F : 'GL_TRANSFORM_FEEDBACK_BUFFER_BINDING',
+    0x8D70 : 'GL_RGBA32UI',
+    0x8D71 : 'GL_RGB32UI',
+    0x8D76 : 'GL_RGBA16UI',
+    0x8D77 : 'GL_RGB16UI',
+    0x8D7C : 'GL_RGBA8UI',
+    0x8D7D : 'GL_RGB8UI',
+    0x8D82 : 'GL_RGBA32I',
+    0x8D83 : 'GL_RGB32I',
+    0x8D88 : 'GL_RGBA16I',
+    0x8D89 : 'GL_RGB16I',
+    0x8D8E : 'GL_RGBA8I',
+    0x8D8F : 'GL_RGB8I',
+    0x8D94 : 'GL_RED_INTEGER',
+    0x8D98 : 'GL_RGB_INTEGER',
+    0x8D99 : 'GL_RGBA_INTEGER',
+    0x8DC1 : 'GL_SAMPLER_2D_ARRAY',
+    0x8DC4 : 'GL_SAMPLER_2D_ARRAY_SHADOW',
+    0x8DC5 : 'GL_SAMPLER_CUBE_SHADOW',
+    0x8DC6 : 'GL_UNSIGNED_INT_VEC2',
+    0x8DC7 : 'GL_UNSIGNED_INT_VEC3',
+    0x8DC8 : 'GL_UNSIGNED_INT_VEC4',
+    0x8DCA : 'GL_INT_SAMPLER_2D',
+    0x8DCB : 'GL_INT_SAMPLER_3D',
+    0x8DCC : 'GL_INT_SAMPLER_CUBE',
+    0x8DCF : 'GL_INT_SAMPLER_2D_ARRAY',
+    0x8DD2 : 'GL_UNSIGNED_INT_SAMPLER_2D',
+    0x8DD3 : 'GL_UNSIGNED_INT_SAMPLER_3D',
+    0x8DD4 : 'GL_UNSIGNED_INT_SAMPLER_CUBE',
+    0x8DD7 : 'GL_UNSIGNED_INT_SAMPLER_2D_ARRAY',
+    0x911F : 'GL_BUFFER_ACCESS_FLAGS',
+    0x9120 : 'GL_BUFFER_MAP_LENGTH',
+    0x9121 : 'GL_BUFFER_MAP_OFFSET',
+    0x8CAC : 'GL_DEPTH_COMPONENT32F',
+    0x8CAD : 'GL_DEPTH32F_STENCIL8',
+    0x8DAD : 'GL_FLOAT_32_UNSIGNED_INT_24_8_REV',
+    0x8210 : 'GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING',
+    0x8211 : 'GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE',
+    0x8212 : 'GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE',
+    0x8213 : 'GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE',
+    0x8214 : 'GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE',
+    0x8215 : 'GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE',
+    0x8216 : 'GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE',
+    0x8217 : 'GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE',
+    0x8218 : 'GL_FRAMEBUFFER_DEFAULT',
+    0x8219 : 'GL_FRAMEBUFFER_UNDEFINED',
+    0x821A : 'GL_DEPTH_STENCIL_ATTACHMENT',
+    0x84F9 : 'GL_DEPTH_STENCIL',
+    0x84FA : 'GL_UNSIGNED_INT_24_8',
+    0x88F0 : 'GL_DEPTH24_STENCIL8',
+    0x8C17 : 'GL_UNSIGNED_NORMALIZED',
+    0x8CA8 : 'GL_READ_FRAMEBUFFER',
+    0x8CA9 : 'GL_DRAW_FRAMEBUFFER',
+    0x8CAA : 'GL_READ_FRAMEBUFFER_BINDING',
+    0x8CAB : 'GL_RENDERBUFFER_SAMPLES',
+    0x8CD4 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER',
+    0x8CDF : 'GL_MAX_COLOR_ATTACHMENTS',
+    0x8CE1 : 'GL_COLOR_ATTACHMENT1',
+    0x8CE2 : 'GL_COLOR_ATTACHMENT2',
+    0x8CE3 : 'GL_COLOR_ATTACHMENT3',
+    0x8CE4 : 'GL_COLOR_ATTACHMENT4',
+    0x8CE5 : 'GL_COLOR_ATTACHMENT5',
+    0x8CE6 : 'GL_COLOR_ATTACHMENT6',
+    0x8CE7 : 'GL_COLOR_ATTACHMENT7',
+    0x8CE8 : 'GL_COLOR_ATTACHMENT8',
+    0x8CE9 : 'GL_COLOR_ATTACHMENT9',
+    0x8CEA : 'GL_COLOR_ATTACHMENT10',
+    0x8CEB : 'GL_COLOR_ATTACHMENT11',
+    0x8CEC : 'GL_COLOR_ATTACHMENT12',
+    0x8CED : 'GL_COLOR_ATTACHMENT13',
+    0x8CEE : 'GL_COLOR_ATTACHMENT14',
+    0x8CEF : 'GL_COLOR_ATTACHMENT15',
+    0x8CF0 : 'GL_COLOR_ATTACHMENT16',
+    0x8CF1 : 'GL_COLOR_ATTACHMENT17',
+    0x8CF2 : 'GL_COLOR_ATTACHMENT18',
+    0x8CF3 : 'GL_COLOR_ATTACHMENT19',
+    0x8CF4 : 'GL_COLOR_ATTACHMENT20',
+    0x8CF5 : 'GL_COLOR_ATTACHMENT21',
+    0x8CF6 : 'GL_COLOR_ATTACHMENT22',
+    0x8CF7 : 'GL_COLOR_ATTACHMENT23',
+    0x8CF8 : 'GL_COLOR_ATTACHMENT24',
+    0x8CF9 : 'GL_COLOR_ATTACHMENT25',
+    0x8CFA : 'GL_COLOR_ATTACHMENT26',
+    0x8CFB : 'GL_COLOR_ATTACHMENT27',
+    0x8CFC : 'GL_COLOR_ATTACHMENT28',
+    0x8CFD : 'GL_COLOR_ATTACHMENT29',
+    0x8CFE : 'GL_COLOR_ATTACHMENT30',
+    0x8CFF : 'GL_COLOR_ATTACHMENT31',
+    0x8D56 : 'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE',
+    0x8D57 : 'GL_MAX_SAMPLES',
+    0x140B : 'GL_HALF_FLOAT',
+    0x0008 : 'GL_MAP_INVALIDATE_BUFFER_BIT',
+    0x0010 : 'GL_MAP_FLUSH_EXPLICIT_BIT',
+    0x0020 : 'GL_MAP_UNSYNCHRONIZED_BIT',
+    0x8227 : 'GL_RG',
+    0x8228 : 'GL_RG_INTEGER',
+    0x8229 : 'GL_R8',
+    0x822B : 'GL_RG8',
+    0x822D : 'GL_R16F',
+    0x822E : 'GL_R32F',
+    0x822F : 'GL_RG16F',
+    0x8230 : 'GL_RG32F',
+    0x8231 : 'GL_R8I',
+    0x8232 : 'GL_R8UI',
+    0x8233 : 'GL_R16I',
+    0x8234 : 'GL_R16UI',
+    0x8235 : 'GL_R32I',
+    0x8236 : 'GL_R32UI',
+    0x8237 : 'GL_RG8I',
+    0x8238 : 'GL_RG8UI',
+    0x8239 : 'GL_RG16I',
+    0x823A : 'GL_RG16UI',
+    0x823B : 'GL_RG32I',
+    0x823C : 'GL_RG32UI',
+    0x85B5 : 'GL_VERTEX_ARRAY_BINDING',
+    0x8F94 : 'GL_R8_SNORM',
+    0x8F95 : 'GL_RG8_SNORM',
+    0x8F96 : 'GL_RGB8_SNORM',
+    0x8F97 : 'GL_RGBA8_SNORM',
+    0x8F9C : 'GL_SIGNED_NORMALIZED',
+    0x8D69 : 'GL_PRIMITIVE_RESTART_FIXED_INDEX',
+    0x8F36 : 'GL_COPY_READ_BUFFER',
+    0x8F37 : 'GL_COPY_WRITE_BUFFER',
+    0x8A11 : 'GL_UNIFORM_BUFFER',
+    0x8A28 : 'GL_UNIFORM_BUFFER_BINDING',
+    0x8A29 : 'GL_UNIFORM_BUFFER_START',
+    0x8A2A : 'GL_UNIFORM_BUFFER_SIZE',
+    0x8A2B : 'GL_MAX_VERTEX_UNIFORM_BLOCKS',
+    0x8A2D : 'GL_MAX_FRAGMENT_UNIFORM_BLOCKS',
+    0x8A2E : 'GL_MAX_COMBINED_UNIFORM_BLOCKS',
+    0x8A2F : 'GL_MAX_UNIFORM_BUFFER_BINDINGS',
+    0x8A30 : 'GL_MAX_UNIFORM_BLOCK_SIZE',
+    0x8A31 : 'GL_MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS',
+    0x8A33 : 'GL_MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS',
+    0x8A34 : 'GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT',
+    0x8A35 : 'GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH',
+    0x8A36 : 'GL_ACTIVE_UNIFORM_BLOCKS',
+    0x8A37 : 'GL_UNIFORM_TYPE',
+    0x8A38 : 'GL_UNIFORM_SIZE',
+    0x8A39 : 'GL_UNIFORM_NAME_LENGTH',
+    0x8A3A : 'GL_UNIFORM_BLOCK_INDEX',
+    0x8A3B : 'GL_UNIFORM_OFFSET',
+    0x8A3C : 'GL_UNIFORM_ARRAY_STRIDE',
+    0x8A3D : 'GL_UNIFORM_MATRIX_STRIDE',
+    0x8A3E : 'GL_UNIFORM_IS_ROW_MAJOR',
+    0x8A3F : 'GL_UNIFORM_BLOCK_BINDING',
+    0x8A40 : 'GL_UNIFORM_BLOCK_DATA_SIZE',
+    0x8A41 : 'GL_UNIFORM_BLOCK_NAME_LENGTH',
+    0x8A42 : 'GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS',
+    0x8A43 : 'GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES',
+    0x8A44 : 'GL_UNIFORM_BLOCK_REFERENCED_BY_VERTEX_SHADER',
+    0x8A46 : 'GL_UNIFORM_BLOCK_REFERENCED_BY_FRAGMENT_SHADER',
+    0xFFFFFFFF : 'GL_INVALID_INDEX',
+    0x9122 : 'GL_MAX_VERTEX_OUTPUT_COMPONENTS',
+    0x9125 : 'GL_MAX_FRAGMENT_INPUT_COMPONENTS',
+    0x9111 : 'GL_MAX_SERVER_WAIT_TIMEOUT',
+    0x9112 : 'GL_OBJECT_TYPE',
+    0x9113 : 'GL_SYNC_CONDITION',
+    0x9114 : 'GL_SYNC_STATUS',
+    0x9115 : 'GL_SYNC_FLAGS',
+    0x9116 : 'GL_SYNC_FENCE',
+    0x9117 : 'GL_SYNC_GPU_COMMANDS_COMPLETE',
+    0x9118 : 'GL_UNSIGNALED',
+    0x9119 : 'GL_SIGNALED',
+    0x911A : 'GL_ALREADY_SIGNALED',
+    0x911B : 'GL_TIMEOUT_EXPIRED',
+    0x911C : 'GL_CONDITION_SATISFIED',
+    0x911D : 'GL_WAIT_FAILED',
+    0xFFFFFFFFFFFFFFFF : 'GL_TIMEOUT_IGNORED',
+    0x88FE : 'GL_VERTEX_ATTRIB_ARRAY_DIVISOR',
+    0x8C2F : 'GL_ANY_SAMPLES_PASSED',
+    0x8D6A : 'GL_ANY_SAMPLES_PASSED_CONSERVATIVE',
+    0x8919 : 'GL_SAMPLER_BINDING',
+    0x906F : 'GL_RGB10_A2UI',
+    0x8E42 : 'GL_TEXTURE_SWIZZLE_R',
+    0x8E43 : 'GL_TEXTURE_SWIZZLE_G',
+    0x8E44 : 'GL_TEXTURE_SWIZZLE_B',
+    0x8E45 : 'GL_TEXTURE_SWIZZLE_A',
+    0x1904 : 'GL_GREEN',
+    0x1905 : 'GL_BLUE',
+    0x8D9F : 'GL_INT_2_10_10_10_REV',
+    0x8E22 : 'GL_TRANSFORM_FEEDBACK',
+    0x8E23 : 'GL_TRANSFORM_FEEDBACK_PAUSED',
+    0x8E24 : 'GL_TRANSFORM_FEEDBACK_ACTIVE',
+    0x8E25 : 'GL_TRANSFORM_FEEDBACK_BINDING',
+    0x8257 : 'GL_PROGRAM_BINARY_RETRIEVABLE_HINT',
+    0x8741 : 'GL_PROGRAM_BINARY_LENGTH',
+    0x87FE : 'GL_NUM_PROGRAM_BINARY_FORMATS',
+    0x87FF : 'GL_PROGRAM_BINARY_FORMATS',
+    0x9270 : 'GL_COMPRESSED_R11_EAC',
+    0x9271 : 'GL_COMPRESSED_SIGNED_R11_EAC',
+    0x9272 : 'GL_COMPRESSED_RG11_EAC',
+    0x9273 : 'GL_COMPRESSED_SIGNED_RG11_EAC',
+    0x9274 : 'GL_COMPRESSED_RGB8_ETC2',
+    0x9275 : 'GL_COMPRESSED_SRGB8_ETC2',
+    0x9276 : 'GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2',
+    0x9277 : 'GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2',
+    0x9278 : 'GL_COMPRESSED_RGBA8_ETC2_EAC',
+    0x9279 : 'GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC',
+    0x912F : 'GL_TEXTURE_IMMUTABLE_FORMAT',
+    0x8D6B : 'GL_MAX_ELEMENT_INDEX',
+    0x9380 : 'GL_NUM_SAMPLE_COUNTS',
+    0x82DF : 'GL_TEXTURE_IMMUTABLE_LEVELS',
+    0x91B9 : 'GL_COMPUTE_SHADER',
+    0x91BB : 'GL_MAX_COMPUTE_UNIFORM_BLOCKS',
+    0x91BC : 'GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS',
+    0x91BD : 'GL_MAX_COMPUTE_IMAGE_UNIFORMS',
+    0x8262 : 'GL_MAX_COMPUTE_SHARED_MEMORY_SIZE',
+    0x8263 : 'GL_MAX_COMPUTE_UNIFORM_COMPONENTS',
+    0x8264 : 'GL_MAX_COMPUTE_ATOMIC_COUNTER_BUFFERS',
+    0x8265 : 'GL_MAX_COMPUTE_ATOMIC_COUNTERS',
+    0x8266 : 'GL_MAX_COMBINED_COMPUTE_UNIFORM_COMPONENTS',
+    0x90EB : 'GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS',
+    0x91BE : 'GL_MAX_COMPUTE_WORK_GROUP_COUNT',
+    0x91BF : 'GL_MAX_COMPUTE_WORK_GROUP_SIZE',
+    0x8267 : 'GL_COMPUTE_WORK_GROUP_SIZE',
+    0x90EE : 'GL_DISPATCH_INDIRECT_BUFFER',
+    0x90EF : 'GL_DISPATCH_INDIRECT_BUFFER_BINDING',
+    0x8F3F : 'GL_DRAW_INDIRECT_BUFFER',
+    0x8F43 : 'GL_DRAW_INDIRECT_BUFFER_BINDING',
+    0x826E : 'GL_MAX_UNIFORM_LOCATIONS',
+    0x9310 : 'GL_FRAMEBUFFER_DEFAULT_WIDTH',
+    0x9311 : 'GL_FRAMEBUFFER_DEFAULT_HEIGHT',
+    0x9313 : 'GL_FRAMEBUFFER_DEFAULT_SAMPLES',
+    0x9314 : 'GL_FRAMEBUFFER_DEFAULT_FIXED_SAMPLE_LOCATIONS',
+    0x9315 : 'GL_MAX_FRAMEBUFFER_WIDTH',
+    0x9316 : 'GL_MAX_FRAMEBUFFER_HEIGHT',
+    0x9318 : 'GL_MAX_FRAMEBUFFER_SAMPLES',
+    0x92E1 : 'GL_UNIFORM',
+    0x92E2 : 'GL_UNIFORM_BLOCK',
+    0x92E3 : 'GL_PROGRAM_INPUT',
+    0x92E4 : 'GL_PROGRAM_OUTPUT',
+    0x92E5 : 'GL_BUFFER_VARIABLE',
+    0x92E6 : 'GL_SHADER_STORAGE_BLOCK',
+    0x92C0 : 'GL_ATOMIC_COUNTER_BUFFER',
+    0x92F4 : 'GL_TRANSFORM_FEEDBACK_VARYING',
+    0x92F5 : 'GL_ACTIVE_RESOURCES',
+    0x92F6 : 'GL_MAX_NAME_LENGTH',
+    0x92F7 : 'GL_MAX_NUM_ACTIVE_VARIABLES',
+    0x92F9 : 'GL_NAME_LENGTH',
+    0x92FA : 'GL_TYPE',
+    0x92FB : 'GL_ARRAY_SIZE',
+    0x92FC : 'GL_OFFSET',
+    0x92FD : 'GL_BLOCK_INDEX',
+    0x92FE : 'GL_ARRAY_STRIDE',
+    0x92FF : 'GL_MATRIX_STRIDE',
+    0x9300 : 'GL_IS_ROW_MAJOR',
+    0x9301 : 'GL_ATOMIC_COUNTER_BUFFER_INDEX',
+    0x9302 : 'GL_BUFFER_BINDING',
+    0x9303 : 'GL_BUFFER_DATA_SIZE',
+    0x9304 : 'GL_NUM_ACTIVE_VARIABLES',
+    0x9305 : 'GL_ACTIVE_VARIABLES',
+    0x9306 : 'GL_REFERENCED_BY_VERTEX_SHADER',
+    0x930A : 'GL_REFERENCED_BY_FRAGMENT_SHADER',
+    0x930B : 'GL_REFERENCED_BY_COMPUTE_SHADER',
+    0x930C : 'GL_TOP_LEVEL_ARRAY_SIZE',
+    0x930D : 'GL_TOP_LEVEL_ARRAY_STRIDE',
+    0x930E : 'GL_LOCATION',
+    0x8258 : 'GL_PROGRAM_SEPARABLE',
+    0x8259 : 'GL_ACTIVE_PROGRAM',
+    0x825A : 'GL_PROGRAM_PIPELINE_BINDING',
+    0x92C1 : 'GL_ATOMIC_COUNTER_BUFFER_BINDING',
+    0x92C2 : 'GL_ATOMIC_COUNTER_BUFFER_START',
+    0x92C3 : 'GL_ATOMIC_COUNTER_BUFFER_SIZE',
+    0x92CC : 'GL_MAX_VERTEX_ATOMIC_COUNTER_BUFFERS',
+    0x92D0 : 'GL_MAX_FRAGMENT_ATOMIC_COUNTER_BUFFERS',
+    0x92D1 : 'GL_MAX_COMBINED_ATOMIC_COUNTER_BUFFERS',
+    0x92D2 : 'GL_MAX_VERTEX_ATOMIC_COUNTERS',
+    0x92D6 : 'GL_MAX_FRAGMENT_ATOMIC_COUNTERS',
+    0x92D7 : 'GL_MAX_COMBINED_ATOMIC_COUNTERS',
+    0x92D8 : 'GL_MAX_ATOMIC_COUNTER_BUFFER_SIZE',
+    0x92DC : 'GL_MAX_ATOMIC_COUNTER_BUFFER_BINDINGS',
+    0x92D9 : 'GL_ACTIVE_ATOMIC_COUNTER_BUFFERS',
+    0x92DB : 'GL_UNSIGNED_INT_ATOMIC_COUNTER',
+    0x8F38 : 'GL_MAX_IMAGE_UNITS',
+    0x90CA : 'GL_MAX_VERTEX_IMAGE_UNIFORMS',
+    0x90CE : 'GL_MAX_FRAGMENT_IMAGE_UNIFORMS',
+    0x90CF : 'GL_MAX_COMBINED_IMAGE_UNIFORMS',
+    0x8F3A : 'GL_IMAGE_BINDING_NAME',
+    0x8F3B : 'GL_IMAGE_BINDING_LEVEL',
+    0x8F3C : 'GL_IMAGE_BINDING_LAYERED',
+    0x8F3D : 'GL_IMAGE_BINDING_LAYER',
+    0x8F3E : 'GL_IMAGE_BINDING_ACCESS',
+    0x906E : 'GL_IMAGE_BINDING_FORMAT',
+    0x0040 : 'GL_COMMAND_BARRIER_BIT',
+    0x0080 : 'GL_PIXEL_BUFFER_BARRIER_BIT',
+    0x0800 : 'GL_TRANSFORM_FEEDBACK_BARRIER_BIT',
+    0x1000 : 'GL_ATOMIC_COUNTER_BARRIER_BIT',
+    0x904D : 'GL_IMAGE_2D',
+    0x904E : 'GL_IMAGE_3D',
+    0x9050 : 'GL_IMAGE_CUBE',
+    0x9053 : 'GL_IMAGE_2D_ARRAY',
+    0x9058 : 'GL_INT_IMAGE_2D',
+    0x9059 : 'GL_INT_IMAGE_3D',
+    0x905B : 'GL_INT_IMAGE_CUBE',
+    0x905E : 'GL_INT_IMAGE_2D_ARRAY',
+    0x9063 : 'GL_UNSIGNED_INT_IMAGE_2D',
+    0x9064 : 'GL_UNSIGNED_INT_IMAGE_3D',
+    0x9066 : 'GL_UNSIGNED_INT_IMAGE_CUBE',
+    0x9069 : 'GL_UNSIGNED_INT_IMAGE_2D_ARRAY',
+    0x90C7 : 'GL_IMAGE_FORMAT_COMPATIBILITY_TYPE',
+    0x90C8 : 'GL_IMAGE_FORMAT_COMPATIBILITY_BY_SIZE',
+    0x90C9 : 'GL_IMAGE_FORMAT_COMPATIBILITY_BY_CLASS',
+    0x88B8 : 'GL_READ_ONLY',
+    0x88B9 : 'GL_WRITE_ONLY',
+    0x88BA : 'GL_READ_WRITE',
+    0x90D2 : 'GL_SHADER_STORAGE_BUFFER',
+    0x90D3 : 'GL_SHADER_STORAGE_BUFFER_BINDING',
+    0x90D4 : 'GL_SHADER_STORAGE_BUFFER_START',
+    0x90D5 : 'GL_SHADER_STORAGE_BUFFER_SIZE',
+    0x90D6 : 'GL_MAX_VERTEX_SHADER_STORAGE_BLOCKS',
+    0x90DA : 'GL_MAX_FRAGMENT_SHADER_STORAGE_BLOCKS',
+    0x90DB : 'GL_MAX_COMPUTE_SHADER_STORAGE_BLOCKS',
+    0x90DC : 'GL_MAX_COMBINED_SHADER_STORAGE_BLOCKS',
+    0x90DD : 'GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS',
+    0x90DE : 'GL_MAX_SHADER_STORAGE_BLOCK_SIZE',
+    0x90DF : 'GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT',
+    0x2000 : 'GL_SHADER_STORAGE_BARRIER_BIT',
+    0x8F39 : 'GL_MAX_COMBINED_SHADER_OUTPUT_RESOURCES',
+    0x90EA : 'GL_DEPTH_STENCIL_TEXTURE_MODE',
+    0x1901 : 'GL_STENCIL_INDEX',
+    0x8E5E : 'GL_MIN_PROGRAM_TEXTURE_GATHER_OFFSET',
+    0x8E5F : 'GL_MAX_PROGRAM_TEXTURE_GATHER_OFFSET',
+    0x8E50 : 'GL_SAMPLE_POSITION',
+    0x8E51 : 'GL_SAMPLE_MASK',
+    0x8E52 : 'GL_SAMPLE_MASK_VALUE',
+    0x9100 : 'GL_TEXTURE_2D_MULTISAMPLE',
+    0x8E59 : 'GL_MAX_SAMPLE_MASK_WORDS',
+    0x910E : 'GL_MAX_COLOR_TEXTURE_SAMPLES',
+    0x910F : 'GL_MAX_DEPTH_TEXTURE_SAMPLES',
+    0x9110 : 'GL_MAX_INTEGER_SAMPLES',
+    0x9104 : 'GL_TEXTURE_BINDING_2D_MULTISAMPLE',
+    0x9106 : 'GL_TEXTURE_SAMPLES',
+    0x9107 : 'GL_TEXTURE_FIXED_SAMPLE_LOCATIONS',
+    0x1001 : 'GL_TEXTURE_HEIGHT',
+    0x8071 : 'GL_TEXTURE_DEPTH',
+    0x1003 : 'GL_TEXTURE_INTERNAL_FORMAT',
+    0x805C : 'GL_TEXTURE_RED_SIZE',
+    0x805D : 'GL_TEXTURE_GREEN_SIZE',
+    0x805E : 'GL_TEXTURE_BLUE_SIZE',
+    0x805F : 'GL_TEXTURE_ALPHA_SIZE',
+    0x884A : 'GL_TEXTURE_DEPTH_SIZE',
+    0x88F1 : 'GL_TEXTURE_STENCIL_SIZE',
+    0x8C3F : 'GL_TEXTURE_SHARED_SIZE',
+    0x8C10 : 'GL_TEXTURE_RED_TYPE',
+    0x8C11 : 'GL_TEXTURE_GREEN_TYPE',
+    0x8C12 : 'GL_TEXTURE_BLUE_TYPE',
+    0x8C13 : 'GL_TEXTURE_ALPHA_TYPE',
+    0x8C16 : 'GL_TEXTURE_DEPTH_TYPE',
+    0x86A1 : 'GL_TEXTURE_COMPRESSED',
+    0x9108 : 'GL_SAMPLER_2D_MULTISAMPLE',
+    0x9109 : 'GL_INT_SAMPLER_2D_MULTISAMPLE',
+    0x910A : 'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE',
+    0x82D4 : 'GL_VERTEX_ATTRIB_BINDING',
+    0x82D5 : 'GL_VERTEX_ATTRIB_RELATIVE_OFFSET',
+    0x82D6 : 'GL_VERTEX_BINDING_DIVISOR',
+    0x82D7 : 'GL_VERTEX_BINDING_OFFSET',
+    0x82D8 : 'GL_VERTEX_BINDING_STRIDE',
+    0x8F4F : 'GL_VERTEX_BINDING_BUFFER',
+    0x82D9 : 'GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET',
+    0x82DA : 'GL_MAX_VERTEX_ATTRIB_BINDINGS',
+    0x82E5 : 'GL_MAX_VERTEX_ATTRIB_STRIDE',
+    0x9381 : 'GL_MULTISAMPLE_LINE_WIDTH_RANGE',
+    0x9382 : 'GL_MULTISAMPLE_LINE_WIDTH_GRANULARITY',
+    0x9294 : 'GL_MULTIPLY',
+    0x9295 : 'GL_SCREEN',
+    0x9296 : 'GL_OVERLAY',
+    0x9297 : 'GL_DARKEN',
+    0x9298 : 'GL_LIGHTEN',
+    0x9299 : 'GL_COLORDODGE',
+    0x929A : 'GL_COLORBURN',
+    0x929B : 'GL_HARDLIGHT',
+    0x929C : 'GL_SOFTLIGHT',
+    0x929E : 'GL_DIFFERENCE',
+    0x92A0 : 'GL_EXCLUSION',
+    0x92AD : 'GL_HSL_HUE',
+    0x92AE : 'GL_HSL_SATURATION',
+    0x92AF : 'GL_HSL_COLOR',
+    0x92B0 : 'GL_HSL_LUMINOSITY',
+    0x8242 : 'GL_DEBUG_OUTPUT_SYNCHRONOUS',
+    0x8243 : 'GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH',
+    0x8244 : 'GL_DEBUG_CALLBACK_FUNCTION',
+    0x8245 : 'GL_DEBUG_CALLBACK_USER_PARAM',
+    0x8246 : 'GL_DEBUG_SOURCE_API',
+    0x8247 : 'GL_DEBUG_SOURCE_WINDOW_SYSTEM',
+    0x8248 : 'GL_DEBUG_SOURCE_SHADER_COMPILER',
+    0x8249 : 'GL_DEBUG_SOURCE_THIRD_PARTY',
+    0x824A : 'GL_DEBUG_SOURCE_APPLICATION',
+    0x824B : 'GL_DEBUG_SOURCE_OTHER',
+    0x824C : 'GL_DEBUG_TYPE_ERROR',
+    0x824D : 'GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR',
+    0x824E : 'GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR',
+    0x824F : 'GL_DEBUG_TYPE_PORTABILITY',
+    0x8250 : 'GL_DEBUG_TYPE_PERFORMANCE',
+    0x8251 : 'GL_DEBUG_TYPE_OTHER',
+    0x8268 : 'GL_DEBUG_TYPE_MARKER',
+    0x8269 : 'GL_DEBUG_TYPE_PUSH_GROUP',
+    0x826A : 'GL_DEBUG_TYPE_POP_GROUP',
+    0x826B : 'GL_DEBUG_SEVERITY_NOTIFICATION',
+    0x826C : 'GL_MAX_DEBUG_GROUP_STACK_DEPTH',
+    0x826D : 'GL_DEBUG_GROUP_STACK_DEPTH',
+    0x82E0 : 'GL_BUFFER',
+    0x82E1 : 'GL_SHADER',
+    0x82E2 : 'GL_PROGRAM',
+    0x8074 : 'GL_VERTEX_ARRAY',
+    0x82E3 : 'GL_QUERY',
+    0x82E4 : 'GL_PROGRAM_PIPELINE',
+    0x82E6 : 'GL_SAMPLER',
+    0x82E8 : 'GL_MAX_LABEL_LENGTH',
+    0x9143 : 'GL_MAX_DEBUG_MESSAGE_LENGTH',
+    0x9144 : 'GL_MAX_DEBUG_LOGGED_MESSAGES',
+    0x9145 : 'GL_DEBUG_LOGGED_MESSAGES',
+    0x9146 : 'GL_DEBUG_SEVERITY_HIGH',
+    0x9147 : 'GL_DEBUG_SEVERITY_MEDIUM',
+    0x9148 : 'GL_DEBUG_SEVERITY_LOW',
+    0x92E0 : 'GL_DEBUG_OUTPUT',
+    0x0503 : 'GL_STACK_OVERFLOW',
+    0x0504 : 'GL_STACK_UNDERFLOW',
+    0x8DD9 : 'GL_GEOMETRY_SHADER',
+    0x8916 : 'GL_GEOMETRY_VERTICES_OUT',
+    0x8917 : 'GL_GEOMETRY_INPUT_TYPE',
+    0x8918 : 'GL_GEOMETRY_OUTPUT_TYPE',
+    0x887F : 'GL_GEOMETRY_SHADER_INVOCATIONS',
+    0x825E : 'GL_LAYER_PROVOKING_VERTEX',
+    0x000A : 'GL_LINES_ADJACENCY',
+    0x000B : 'GL_LINE_STRIP_ADJACENCY',
+    0x000C : 'GL_TRIANGLES_ADJACENCY',
+    0x000D : 'GL_TRIANGLE_STRIP_ADJACENCY',
+    0x8DDF : 'GL_MAX_GEOMETRY_UNIFORM_COMPONENTS',
+    0x8A2C : 'GL_MAX_GEOMETRY_UNIFORM_BLOCKS',
+    0x8A32 : 'GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS',
+    0x9123 : 'GL_MAX_GEOMETRY_INPUT_COMPONENTS',
+    0x9124 : 'GL_MAX_GEOMETRY_OUTPUT_COMPONENTS',
+    0x8DE0 : 'GL_MAX_GEOMETRY_OUTPUT_VERTICES',
+    0x8DE1 : 'GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS',
+    0x8E5A : 'GL_MAX_GEOMETRY_SHADER_INVOCATIONS',
+    0x8C29 : 'GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS',
+    0x92CF : 'GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS',
+    0x92D5 : 'GL_MAX_GEOMETRY_ATOMIC_COUNTERS',
+    0x90CD : 'GL_MAX_GEOMETRY_IMAGE_UNIFORMS',
+    0x90D7 : 'GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS',
+    0x8E4D : 'GL_FIRST_VERTEX_CONVENTION',
+    0x8E4E : 'GL_LAST_VERTEX_CONVENTION',
+    0x8260 : 'GL_UNDEFINED_VERTEX',
+    0x8C87 : 'GL_PRIMITIVES_GENERATED',
+    0x9312 : 'GL_FRAMEBUFFER_DEFAULT_LAYERS',
+    0x9317 : 'GL_MAX_FRAMEBUFFER_LAYERS',
+    0x8DA8 : 'GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS',
+    0x8DA7 : 'GL_FRAMEBUFFER_ATTACHMENT_LAYERED',
+    0x9309 : 'GL_REFERENCED_BY_GEOMETRY_SHADER',
+    0x92BE : 'GL_PRIMITIVE_BOUNDING_BOX',
+    0x821E : 'GL_CONTEXT_FLAGS',
+    0x8252 : 'GL_LOSE_CONTEXT_ON_RESET',
+    0x8253 : 'GL_GUILTY_CONTEXT_RESET',
+    0x8254 : 'GL_INNOCENT_CONTEXT_RESET',
+    0x8255 : 'GL_UNKNOWN_CONTEXT_RESET',
+    0x8256 : 'GL_RESET_NOTIFICATION_STRATEGY',
+    0x8261 : 'GL_NO_RESET_NOTIFICATION',
+    0x0507 : 'GL_CONTEXT_LOST',
+    0x8C36 : 'GL_SAMPLE_SHADING',
+    0x8C37 : 'GL_MIN_SAMPLE_SHADING_VALUE',
+    0x8E5B : 'GL_MIN_FRAGMENT_INTERPOLATION_OFFSET',
+    0x8E5C : 'GL_MAX_FRAGMENT_INTERPOLATION_OFFSET',
+    0x8E5D : 'GL_FRAGMENT_INTERPOLATION_OFFSET_BITS',
+    0x000E : 'GL_PATCHES',
+    0x8E72 : 'GL_PATCH_VERTICES',
+    0x8E75 : 'GL_TESS_CONTROL_OUTPUT_VERTICES',
+    0x8E76 : 'GL_TESS_GEN_MODE',
+    0x8E77 : 'GL_TESS_GEN_SPACING',
+    0x8E78 : 'GL_TESS_GEN_VERTEX_ORDER',
+    0x8E79 : 'GL_TESS_GEN_POINT_MODE',
+    0x8E7A : 'GL_ISOLINES',
+    0x0007 : 'GL_QUADS',
+    0x8E7B : 'GL_FRACTIONAL_ODD',
+    0x8E7C : 'GL_FRACTIONAL_EVEN',
+    0x8E7D : 'GL_MAX_PATCH_VERTICES',
+    0x8E7E : 'GL_MAX_TESS_GEN_LEVEL',
+    0x8E7F : 'GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS',
+    0x8E80 : 'GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS',
+    0x8E81 : 'GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS',
+    0x8E82 : 'GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS',
+    0x8E83 : 'GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS',
+    0x8E84 : 'GL_MAX_TESS_PATCH_COMPONENTS',
+    0x8E85 : 'GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS',
+    0x8E86 : 'GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS',
+    0x8E89 : 'GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS',
+    0x8E8A : 'GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS',
+    0x886C : 'GL_MAX_TESS_CONTROL_INPUT_COMPONENTS',
+    0x886D : 'GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS',
+    0x8E1E : 'GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS',
+    0x8E1F : 'GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS',
+    0x92CD : 'GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS',
+    0x92CE : 'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS',
+    0x92D3 : 'GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS',
+    0x92D4 : 'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS',
+    0x90CB : 'GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS',
+    0x90CC : 'GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS',
+    0x90D8 : 'GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS',
+    0x90D9 : 'GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS',
+    0x8221 : 'GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED',
+    0x92E7 : 'GL_IS_PER_PATCH',
+    0x9307 : 'GL_REFERENCED_BY_TESS_CONTROL_SHADER',
+    0x9308 : 'GL_REFERENCED_BY_TESS_EVALUATION_SHADER',
+    0x8E88 : 'GL_TESS_CONTROL_SHADER',
+    0x8E87 : 'GL_TESS_EVALUATION_SHADER',
+    0x1004 : 'GL_TEXTURE_BORDER_COLOR',
+    0x812D : 'GL_CLAMP_TO_BORDER',
+    0x8C2A : 'GL_TEXTURE_BUFFER',
+    0x8C2B : 'GL_MAX_TEXTURE_BUFFER_SIZE',
+    0x8C2C : 'GL_TEXTURE_BINDING_BUFFER',
+    0x8C2D : 'GL_TEXTURE_BUFFER_DATA_STORE_BINDING',
+    0x919F : 'GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT',
+    0x8DC2 : 'GL_SAMPLER_BUFFER',
+    0x8DD0 : 'GL_INT_SAMPLER_BUFFER',
+    0x8DD8 : 'GL_UNSIGNED_INT_SAMPLER_BUFFER',
+    0x9051 : 'GL_IMAGE_BUFFER',
+    0x905C : 'GL_INT_IMAGE_BUFFER',
+    0x9067 : 'GL_UNSIGNED_INT_IMAGE_BUFFER',
+    0x919D : 'GL_TEXTURE_BUFFER_OFFSET',
+    0x919E : 'GL_TEXTURE_BUFFER_SIZE',
+    0x93B0 : 'GL_COMPRESSED_RGBA_ASTC_4x4',
+    0x93B1 : 'GL_COMPRESSED_RGBA_ASTC_5x4',
+    0x93B2 : 'GL_COMPRESSED_RGBA_ASTC_5x5',
+    0x93B3 : 'GL_COMPRESSED_RGBA_ASTC_6x5',
+    0x93B4 : 'GL_COMPRESSED_RGBA_ASTC_6x6',
+    0x93B5 : 'GL_COMPRESSED_RGBA_ASTC_8x5',
+    0x93B6 : 'GL_COMPRESSED_RGBA_ASTC_8x6',
+    0x93B7 : 'GL_COMPRESSED_RGBA_ASTC_8x8',
+    0x93B8 : 'GL_COMPRESSED_RGBA_ASTC_10x5',
+    0x93B9 : 'GL_COMPRESSED_RGBA_ASTC_10x6',
+    0x93BA : 'GL_COMPRESSED_RGBA_ASTC_10x8',
+    0x93BB : 'GL_COMPRESSED_RGBA_ASTC_10x10',
+    0x93BC : 'GL_COMPRESSED_RGBA_ASTC_12x10',
+    0x93BD : 'GL_COMPRESSED_RGBA_ASTC_12x12',
+    0x93D0 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4',
+    0x93D1 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4',
+    0x93D2 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5',
+    0x93D3 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5',
+    0x93D4 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6',
+    0x93D5 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5',
+    0x93D6 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6',
+    0x93D7 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8',
+    0x93D8 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5',
+    0x93D9 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6',
+    0x93DA : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8',
+    0x93DB : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10',
+    0x93DC : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10',
+    0x93DD : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12',
+    0x9009 : 'GL_TEXTURE_CUBE_MAP_ARRAY',
+    0x900A : 'GL_TEXTURE_BINDING_CUBE_MAP_ARRAY',
+    0x900C : 'GL_SAMPLER_CUBE_MAP_ARRAY',
+    0x900D : 'GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW',
+    0x900E : 'GL_INT_SAMPLER_CUBE_MAP_ARRAY',
+    0x900F : 'GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY',
+    0x9054 : 'GL_IMAGE_CUBE_MAP_ARRAY',
+    0x905F : 'GL_INT_IMAGE_CUBE_MAP_ARRAY',
+    0x906A : 'GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY',
+    0x9102 : 'GL_TEXTURE_2D_MULTISAMPLE_ARRAY',
+    0x9105 : 'GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY',
+    0x910B : 'GL_SAMPLER_2D_MULTISAMPLE_ARRAY',
+    0x910C : 'GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY',
+    0x910D : 'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY',
+    0x806C : 'GL_PACK_IMAGE_HEIGHT',
+    0x806B : 'GL_PACK_SKIP_IMAGES',
+    0x87F9 : 'GL_3DC_X_AMD',
+    0x87FA : 'GL_3DC_XY_AMD',
+    0x8C92 : 'GL_ATC_RGB_AMD',
+    0x8C93 : 'GL_ATC_RGBA_EXPLICIT_ALPHA_AMD',
+    0x87EE : 'GL_ATC_RGBA_INTERPOLATED_ALPHA_AMD',
+    0x91B2 : 'GL_RENDERBUFFER_STORAGE_SAMPLES_AMD',
+    0x91B3 : 'GL_MAX_COLOR_FRAMEBUFFER_SAMPLES_AMD',
+    0x91B4 : 'GL_MAX_COLOR_FRAMEBUFFER_STORAGE_SAMPLES_AMD',
+    0x91B5 : 'GL_MAX_DEPTH_STENCIL_FRAMEBUFFER_SAMPLES_AMD',
+    0x91B6 : 'GL_NUM_SUPPORTED_MULTISAMPLE_MODES_AMD',
+    0x91B7 : 'GL_SUPPORTED_MULTISAMPLE_MODES_AMD',
+    0x8BC0 : 'GL_COUNTER_TYPE_AMD',
+    0x8BC1 : 'GL_COUNTER_RANGE_AMD',
+    0x8BC2 : 'GL_UNSIGNED_INT64_AMD',
+    0x8BC3 : 'GL_PERCENTAGE_AMD',
+    0x8BC4 : 'GL_PERFMON_RESULT_AVAILABLE_AMD',
+    0x8BC5 : 'GL_PERFMON_RESULT_SIZE_AMD',
+    0x8BC6 : 'GL_PERFMON_RESULT_AMD',
+    0x8740 : 'GL_Z400_BINARY_AMD',
+    0x81A7 : 'GL_DEPTH_COMPONENT32_OES',
+    0x93A4 : 'GL_PACK_REVERSE_ROW_ORDER_ANGLE',
+    0x93A6 : 'GL_PROGRAM_BINARY_ANGLE',
+    0x83F2 : 'GL_COMPRESSED_RGBA_S3TC_DXT3_ANGLE',
+    0x83F3 : 'GL_COMPRESSED_RGBA_S3TC_DXT5_ANGLE',
+    0x93A2 : 'GL_TEXTURE_USAGE_ANGLE',
+    0x93A3 : 'GL_FRAMEBUFFER_ATTACHMENT_ANGLE',
+    0x93A0 : 'GL_TRANSLATED_SHADER_SOURCE_LENGTH_ANGLE',
+    0x0D32 : 'GL_MAX_CLIP_DISTANCES_APPLE',
+    0x3000 : 'GL_CLIP_DISTANCE0_APPLE',
+    0x3001 : 'GL_CLIP_DISTANCE1_APPLE',
+    0x3002 : 'GL_CLIP_DISTANCE2_APPLE',
+    0x3003 : 'GL_CLIP_DISTANCE3_APPLE',
+    0x3004 : 'GL_CLIP_DISTANCE4_APPLE',
+    0x3005 : 'GL_CLIP_DISTANCE5_APPLE',
+    0x3006 : 'GL_CLIP_DISTANCE6_APPLE',
+    0x3007 : 'GL_CLIP_DISTANCE7_APPLE',
+    0x8A1F : 'GL_RGB_422_APPLE',
+    0x85BA : 'GL_UNSIGNED_SHORT_8_8_APPLE',
+    0x85BB : 'GL_UNSIGNED_SHORT_8_8_REV_APPLE',
+    0x8A51 : 'GL_RGB_RAW_422_APPLE',
+    0x8A53 : 'GL_SYNC_OBJECT_APPLE',
+    0x80E1 : 'GL_BGRA_EXT',
+    0x93A1 : 'GL_BGRA8_EXT',
+    0x8F61 : 'GL_MALI_PROGRAM_BINARY_ARM',
+    0x8F60 : 'GL_MALI_SHADER_BINARY_ARM',
+    0x96F0 : 'GL_SHADER_CORE_COUNT_ARM',
+    0x96F1 : 'GL_SHADER_CORE_ACTIVE_COUNT_ARM',
+    0x96F2 : 'GL_SHADER_CORE_PRESENT_MASK_ARM',
+    0x96F3 : 'GL_SHADER_CORE_MAX_WARP_COUNT_ARM',
+    0x96F4 : 'GL_SHADER_CORE_PIXEL_RATE_ARM',
+    0x96F5 : 'GL_SHADER_CORE_TEXEL_RATE_ARM',
+    0x96F6 : 'GL_SHADER_CORE_FMA_RATE_ARM',
+    0x8F65 : 'GL_FETCH_PER_SAMPLE_ARM',
+    0x8F66 : 'GL_FRAGMENT_SHADER_FRAMEBUFFER_FETCH_MRT_ARM',
+    0x8F6A : 'GL_TEXTURE_UNNORMALIZED_COORDINATES_ARM',
+    0x9251 : 'GL_SMAPHS30_PROGRAM_BINARY_DMP',
+    0x9252 : 'GL_SMAPHS_PROGRAM_BINARY_DMP',
+    0x9253 : 'GL_DMP_PROGRAM_BINARY_DMP',
+    0x9250 : 'GL_SHADER_BINARY_DMP',
+    0x96C0 : 'GL_SURFACE_COMPRESSION_EXT',
+    0x96C1 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_NONE_EXT',
+    0x96C2 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_DEFAULT_EXT',
+    0x8BE7 : 'GL_SAMPLER_EXTERNAL_2D_Y2Y_EXT',
+    0x8D65 : 'GL_TEXTURE_EXTERNAL_OES',
+    0x8D67 : 'GL_TEXTURE_BINDING_EXTERNAL_OES',
+    0x8D68 : 'GL_REQUIRED_TEXTURE_IMAGE_UNITS_OES',
+    0x88F9 : 'GL_SRC1_COLOR_EXT',
+    0x8589 : 'GL_SRC1_ALPHA_EXT',
+    0x88FA : 'GL_ONE_MINUS_SRC1_COLOR_EXT',
+    0x88FB : 'GL_ONE_MINUS_SRC1_ALPHA_EXT',
+    0x930F : 'GL_LOCATION_INDEX_EXT',
+    0x88FC : 'GL_MAX_DUAL_SOURCE_DRAW_BUFFERS_EXT',
+    0x821F : 'GL_BUFFER_IMMUTABLE_STORAGE_EXT',
+    0x8220 : 'GL_BUFFER_STORAGE_FLAGS_EXT',
+    0x8CA1 : 'GL_LOWER_LEFT_EXT',
+    0x8CA2 : 'GL_UPPER_LEFT_EXT',
+    0x935E : 'GL_NEGATIVE_ONE_TO_ONE_EXT',
+    0x935F : 'GL_ZERO_TO_ONE_EXT',
+    0x935C : 'GL_CLIP_ORIGIN_EXT',
+    0x935D : 'GL_CLIP_DEPTH_MODE_EXT',
+    0x82F9 : 'GL_MAX_CULL_DISTANCES_EXT',
+    0x82FA : 'GL_MAX_COMBINED_CLIP_AND_CULL_DISTANCES_EXT',
+    0x8A4F : 'GL_PROGRAM_PIPELINE_OBJECT_EXT',
+    0x8B40 : 'GL_PROGRAM_OBJECT_EXT',
+    0x8B48 : 'GL_SHADER_OBJECT_EXT',
+    0x9151 : 'GL_BUFFER_OBJECT_EXT',
+    0x9153 : 'GL_QUERY_OBJECT_EXT',
+    0x9154 : 'GL_VERTEX_ARRAY_OBJECT_EXT',
+    0x864F : 'GL_DEPTH_CLAMP_EXT',
+    0x8864 : 'GL_QUERY_COUNTER_BITS_EXT',
+    0x88BF : 'GL_TIME_ELAPSED_EXT',
+    0x8E28 : 'GL_TIMESTAMP_EXT',
+    0x8FBB : 'GL_GPU_DISJOINT_EXT',
+    0x96A6 : 'GL_SHADING_RATE_1X1_PIXELS_EXT',
+    0x96A7 : 'GL_SHADING_RATE_1X2_PIXELS_EXT',
+    0x96A8 : 'GL_SHADING_RATE_2X1_PIXELS_EXT',
+    0x96A9 : 'GL_SHADING_RATE_2X2_PIXELS_EXT',
+    0x96AA : 'GL_SHADING_RATE_1X4_PIXELS_EXT',
+    0x96AB : 'GL_SHADING_RATE_4X1_PIXELS_EXT',
+    0x96AC : 'GL_SHADING_RATE_4X2_PIXELS_EXT',
+    0x96AD : 'GL_SHADING_RATE_2X4_PIXELS_EXT',
+    0x96AE : 'GL_SHADING_RATE_4X4_PIXELS_EXT',
+    0x96D0 : 'GL_SHADING_RATE_EXT',
+    0x96D1 : 'GL_SHADING_RATE_ATTACHMENT_EXT',
+    0x96D2 : 'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_KEEP_EXT',
+    0x96D3 : 'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_REPLACE_EXT',
+    0x96D4 : 'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_MIN_EXT',
+    0x96D5 : 'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_MAX_EXT',
+    0x96D6 : 'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_MUL_EXT',
+    0x96D7 : 'GL_MIN_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_WIDTH_EXT',
+    0x96D8 : 'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_WIDTH_EXT',
+    0x96D9 : 'GL_MIN_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_HEIGHT_EXT',
+    0x96DA : 'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_HEIGHT_EXT',
+    0x96DB : 'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_ASPECT_RATIO_EXT',
+    0x96DC : 'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_LAYERS_EXT',
+    0x96DD : 'GL_FRAGMENT_SHADING_RATE_WITH_SHADER_DEPTH_STENCIL_WRITES_SUPPORTED_EXT',
+    0x96DE : 'GL_FRAGMENT_SHADING_RATE_WITH_SAMPLE_MASK_SUPPORTED_EXT',
+    0x96DF : 'GL_FRAGMENT_SHADING_RATE_ATTACHMENT_WITH_DEFAULT_FRAMEBUFFER_SUPPORTED_EXT',
+    0x8F6F : 'GL_FRAGMENT_SHADING_RATE_NON_TRIVIAL_COMBINERS_SUPPORTED_EXT',
+    0x9580 : 'GL_TEXTURE_TILING_EXT',
+    0x9581 : 'GL_DEDICATED_MEMORY_OBJECT_EXT',
+    0x959B : 'GL_PROTECTED_MEMORY_OBJECT_EXT',
+    0x9582 : 'GL_NUM_TILING_TYPES_EXT',
+    0x9583 : 'GL_TILING_TYPES_EXT',
+    0x9584 : 'GL_OPTIMAL_TILING_EXT',
+    0x9585 : 'GL_LINEAR_TILING_EXT',
+    0x9596 : 'GL_NUM_DEVICE_UUIDS_EXT',
+    0x9597 : 'GL_DEVICE_UUID_EXT',
+    0x9598 : 'GL_DRIVER_UUID_EXT',
+    0x9586 : 'GL_HANDLE_TYPE_OPAQUE_FD_EXT',
+    0x9587 : 'GL_HANDLE_TYPE_OPAQUE_WIN32_EXT',
+    0x9588 : 'GL_HANDLE_TYPE_OPAQUE_WIN32_KMT_EXT',
+    0x9599 : 'GL_DEVICE_LUID_EXT',
+    0x959A : 'GL_DEVICE_NODE_MASK_EXT',
+    0x9589 : 'GL_HANDLE_TYPE_D3D12_TILEPOOL_EXT',
+    0x958A : 'GL_HANDLE_TYPE_D3D12_RESOURCE_EXT',
+    0x958B : 'GL_HANDLE_TYPE_D3D11_IMAGE_EXT',
+    0x958C : 'GL_HANDLE_TYPE_D3D11_IMAGE_KMT_EXT',
+    0x809D : 'GL_MULTISAMPLE_EXT',
+    0x809F : 'GL_SAMPLE_ALPHA_TO_ONE_EXT',
+    0x8D6C : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SAMPLES_EXT',
+    0x90F0 : 'GL_COLOR_ATTACHMENT_EXT',
+    0x90F1 : 'GL_MULTIVIEW_EXT',
+    0x0C01 : 'GL_DRAW_BUFFER_EXT',
+    0x90F2 : 'GL_MAX_MULTIVIEW_BUFFERS_EXT',
+    0x8E1B : 'GL_POLYGON_OFFSET_CLAMP_EXT',
+    0x8BFA : 'GL_TEXTURE_PROTECTED_EXT',
+    0x8A54 : 'GL_COMPRESSED_SRGB_PVRTC_2BPPV1_EXT',
+    0x8A55 : 'GL_COMPRESSED_SRGB_PVRTC_4BPPV1_EXT',
+    0x8A56 : 'GL_COMPRESSED_SRGB_ALPHA_PVRTC_2BPPV1_EXT',
+    0x8A57 : 'GL_COMPRESSED_SRGB_ALPHA_PVRTC_4BPPV1_EXT',
+    0x93F0 : 'GL_COMPRESSED_SRGB_ALPHA_PVRTC_2BPPV2_IMG',
+    0x93F1 : 'GL_COMPRESSED_SRGB_ALPHA_PVRTC_4BPPV2_IMG',
+    0x9327 : 'GL_RASTER_MULTISAMPLE_EXT',
+    0x9328 : 'GL_RASTER_SAMPLES_EXT',
+    0x9329 : 'GL_MAX_RASTER_SAMPLES_EXT',
+    0x932A : 'GL_RASTER_FIXED_SAMPLE_LOCATIONS_EXT',
+    0x932B : 'GL_MULTISAMPLE_RASTERIZATION_ALLOWED_EXT',
+    0x932C : 'GL_EFFECTIVE_RASTER_SAMPLES_EXT',
+    0x8365 : 'GL_UNSIGNED_SHORT_4_4_4_4_REV_EXT',
+    0x8366 : 'GL_UNSIGNED_SHORT_1_5_5_5_REV_EXT',
+    0x8F98 : 'GL_R16_SNORM_EXT',
+    0x8F99 : 'GL_RG16_SNORM_EXT',
+    0x8F9B : 'GL_RGBA16_SNORM_EXT',
+    0x90F3 : 'GL_CONTEXT_ROBUST_ACCESS_EXT',
+    0x958D : 'GL_LAYOUT_GENERAL_EXT',
+    0x958E : 'GL_LAYOUT_COLOR_ATTACHMENT_EXT',
+    0x958F : 'GL_LAYOUT_DEPTH_STENCIL_ATTACHMENT_EXT',
+    0x9590 : 'GL_LAYOUT_DEPTH_STENCIL_READ_ONLY_EXT',
+    0x9591 : 'GL_LAYOUT_SHADER_READ_ONLY_EXT',
+    0x9592 : 'GL_LAYOUT_TRANSFER_SRC_EXT',
+    0x9593 : 'GL_LAYOUT_TRANSFER_DST_EXT',
+    0x9530 : 'GL_LAYOUT_DEPTH_READ_ONLY_STENCIL_ATTACHMENT_EXT',
+    0x9531 : 'GL_LAYOUT_DEPTH_ATTACHMENT_STENCIL_READ_ONLY_EXT',
+    0x9594 : 'GL_HANDLE_TYPE_D3D12_FENCE_EXT',
+    0x9595 : 'GL_D3D12_FENCE_VALUE_EXT',
+    0x8C42 : 'GL_SRGB_ALPHA_EXT',
+    0x8DB9 : 'GL_FRAMEBUFFER_SRGB_EXT',
+    0x8A52 : 'GL_FRAGMENT_SHADER_DISCARDS_SAMPLES_EXT',
+    0x8F63 : 'GL_MAX_SHADER_PIXEL_LOCAL_STORAGE_FAST_SIZE_EXT',
+    0x8F67 : 'GL_MAX_SHADER_PIXEL_LOCAL_STORAGE_SIZE_EXT',
+    0x8F64 : 'GL_SHADER_PIXEL_LOCAL_STORAGE_EXT',
+    0x9650 : 'GL_MAX_SHADER_COMBINED_LOCAL_STORAGE_FAST_SIZE_EXT',
+    0x9651 : 'GL_MAX_SHADER_COMBINED_LOCAL_STORAGE_SIZE_EXT',
+    0x9652 : 'GL_FRAMEBUFFER_INCOMPLETE_INSUFFICIENT_SHADER_COMBINED_LOCAL_STORAGE_EXT',
+    0x91A6 : 'GL_TEXTURE_SPARSE_EXT',
+    0x91A7 : 'GL_VIRTUAL_PAGE_SIZE_INDEX_EXT',
+    0x91AA : 'GL_NUM_SPARSE_LEVELS_EXT',
+    0x91A8 : 'GL_NUM_VIRTUAL_PAGE_SIZES_EXT',
+    0x9195 : 'GL_VIRTUAL_PAGE_SIZE_X_EXT',
+    0x9196 : 'GL_VIRTUAL_PAGE_SIZE_Y_EXT',
+    0x9197 : 'GL_VIRTUAL_PAGE_SIZE_Z_EXT',
+    0x9198 : 'GL_MAX_SPARSE_TEXTURE_SIZE_EXT',
+    0x9199 : 'GL_MAX_SPARSE_3D_TEXTURE_SIZE_EXT',
+    0x919A : 'GL_MAX_SPARSE_ARRAY_TEXTURE_LAYERS_EXT',
+    0x91A9 : 'GL_SPARSE_TEXTURE_FULL_ARRAY_CUBE_MIPMAPS_EXT',
+    0x8F69 : 'GL_TEXTURE_ASTC_DECODE_PRECISION_EXT',
+    0x8E8C : 'GL_COMPRESSED_RGBA_BPTC_UNORM_EXT',
+    0x8E8D : 'GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM_EXT',
+    0x8E8E : 'GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT_EXT',
+    0x8E8F : 'GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT_EXT',
+    0x83F0 : 'GL_COMPRESSED_RGB_S3TC_DXT1_EXT',
+    0x83F1 : 'GL_COMPRESSED_RGBA_S3TC_DXT1_EXT',
+    0x8DBB : 'GL_COMPRESSED_RED_RGTC1_EXT',
+    0x8DBC : 'GL_COMPRESSED_SIGNED_RED_RGTC1_EXT',
+    0x8DBD : 'GL_COMPRESSED_RED_GREEN_RGTC2_EXT',
+    0x8DBE : 'GL_COMPRESSED_SIGNED_RED_GREEN_RGTC2_EXT',
+    0x8C4C : 'GL_COMPRESSED_SRGB_S3TC_DXT1_EXT',
+    0x8C4D : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT',
+    0x8C4E : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT',
+    0x8C4F : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT',
+    0x84FE : 'GL_TEXTURE_MAX_ANISOTROPY_EXT',
+    0x84FF : 'GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT',
+    0x9366 : 'GL_TEXTURE_REDUCTION_MODE_EXT',
+    0x9367 : 'GL_WEIGHTED_AVERAGE_EXT',
+    0x8FBF : 'GL_TEXTURE_FORMAT_SRGB_OVERRIDE_EXT',
+    0x8743 : 'GL_MIRROR_CLAMP_TO_EDGE_EXT',
+    0x822A : 'GL_R16_EXT',
+    0x822C : 'GL_RG16_EXT',
+    0x805B : 'GL_RGBA16_EXT',
+    0x8054 : 'GL_RGB16_EXT',
+    0x8F9A : 'GL_RGB16_SNORM_EXT',
+    0x8FBD : 'GL_SR8_EXT',
+    0x8FBE : 'GL_SRG8_EXT',
+    0x8A48 : 'GL_TEXTURE_SRGB_DECODE_EXT',
+    0x8A49 : 'GL_DECODE_EXT',
+    0x8A4A : 'GL_SKIP_DECODE_EXT',
+    0x803C : 'GL_ALPHA8_EXT',
+    0x8040 : 'GL_LUMINANCE8_EXT',
+    0x8045 : 'GL_LUMINANCE8_ALPHA8_EXT',
+    0x8816 : 'GL_ALPHA32F_EXT',
+    0x8818 : 'GL_LUMINANCE32F_EXT',
+    0x8819 : 'GL_LUMINANCE_ALPHA32F_EXT',
+    0x881C : 'GL_ALPHA16F_EXT',
+    0x881E : 'GL_LUMINANCE16F_EXT',
+    0x881F : 'GL_LUMINANCE_ALPHA16F_EXT',
+    0x8052 : 'GL_RGB10_EXT',
+    0x8F6E : 'GL_NUM_SURFACE_COMPRESSION_FIXED_RATES_EXT',
+    0x96C4 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_1BPC_EXT',
+    0x96C5 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_2BPC_EXT',
+    0x96C6 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_3BPC_EXT',
+    0x96C7 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_4BPC_EXT',
+    0x96C8 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_5BPC_EXT',
+    0x96C9 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_6BPC_EXT',
+    0x96CA : 'GL_SURFACE_COMPRESSION_FIXED_RATE_7BPC_EXT',
+    0x96CB : 'GL_SURFACE_COMPRESSION_FIXED_RATE_8BPC_EXT',
+    0x96CC : 'GL_SURFACE_COMPRESSION_FIXED_RATE_9BPC_EXT',
+    0x96CD : 'GL_SURFACE_COMPRESSION_FIXED_RATE_10BPC_EXT',
+    0x96CE : 'GL_SURFACE_COMPRESSION_FIXED_RATE_11BPC_EXT',
+    0x96CF : 'GL_SURFACE_COMPRESSION_FIXED_RATE_12BPC_EXT',
+    0x82DB : 'GL_TEXTURE_VIEW_MIN_LEVEL_EXT',
+    0x82DC : 'GL_TEXTURE_VIEW_NUM_LEVELS_EXT',
+    0x82DD : 'GL_TEXTURE_VIEW_MIN_LAYER_EXT',
+    0x82DE : 'GL_TEXTURE_VIEW_NUM_LAYERS_EXT',
+    0x95B3 : 'GL_SEMAPHORE_TYPE_NV',
+    0x95B4 : 'GL_SEMAPHORE_TYPE_BINARY_NV',
+    0x95B5 : 'GL_SEMAPHORE_TYPE_TIMELINE_NV',
+    0x95B6 : 'GL_MAX_TIMELINE_SEMAPHORE_VALUE_DIFFERENCE_NV',
+    0x8F10 : 'GL_INCLUSIVE_EXT',
+    0x8F11 : 'GL_EXCLUSIVE_EXT',
+    0x8F12 : 'GL_WINDOW_RECTANGLE_EXT',
+    0x8F13 : 'GL_WINDOW_RECTANGLE_MODE_EXT',
+    0x8F14 : 'GL_MAX_WINDOW_RECTANGLES_EXT',
+    0x8F15 : 'GL_NUM_WINDOW_RECTANGLES_EXT',
+    0x9260 : 'GL_GCCSO_SHADER_BINARY_FJ',
+    0x913C : 'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_AND_DOWNSAMPLE_IMG',
+    0x913D : 'GL_NUM_DOWNSAMPLE_SCALES_IMG',
+    0x913E : 'GL_DOWNSAMPLE_SCALES_IMG',
+    0x913F : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SCALE_IMG',
+    0x9133 : 'GL_RENDERBUFFER_SAMPLES_IMG',
+    0x9134 : 'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_IMG',
+    0x9135 : 'GL_MAX_SAMPLES_IMG',
+    0x9136 : 'GL_TEXTURE_SAMPLES_IMG',
+    0x9130 : 'GL_SGX_PROGRAM_BINARY_IMG',
+    0x8C0A : 'GL_SGX_BINARY_IMG',
+    0x8C00 : 'GL_COMPRESSED_RGB_PVRTC_4BPPV1_IMG',
+    0x8C01 : 'GL_COMPRESSED_RGB_PVRTC_2BPPV1_IMG',
+    0x8C02 : 'GL_COMPRESSED_RGBA_PVRTC_4BPPV1_IMG',
+    0x8C03 : 'GL_COMPRESSED_RGBA_PVRTC_2BPPV1_IMG',
+    0x9137 : 'GL_COMPRESSED_RGBA_PVRTC_2BPPV2_IMG',
+    0x9138 : 'GL_COMPRESSED_RGBA_PVRTC_4BPPV2_IMG',
+    0x9139 : 'GL_CUBIC_IMG',
+    0x913A : 'GL_CUBIC_MIPMAP_NEAREST_IMG',
+    0x913B : 'GL_CUBIC_MIPMAP_LINEAR_IMG',
+    0x83FE : 'GL_CONSERVATIVE_RASTERIZATION_INTEL',
+    0x83FC : 'GL_BLACKHOLE_RENDER_INTEL',
+    0x83FB : 'GL_PERFQUERY_WAIT_INTEL',
+    0x83FA : 'GL_PERFQUERY_FLUSH_INTEL',
+    0x83F9 : 'GL_PERFQUERY_DONOT_FLUSH_INTEL',
+    0x94F0 : 'GL_PERFQUERY_COUNTER_EVENT_INTEL',
+    0x94F1 : 'GL_PERFQUERY_COUNTER_DURATION_NORM_INTEL',
+    0x94F2 : 'GL_PERFQUERY_COUNTER_DURATION_RAW_INTEL',
+    0x94F3 : 'GL_PERFQUERY_COUNTER_THROUGHPUT_INTEL',
+    0x94F4 : 'GL_PERFQUERY_COUNTER_RAW_INTEL',
+    0x94F5 : 'GL_PERFQUERY_COUNTER_TIMESTAMP_INTEL',
+    0x94F8 : 'GL_PERFQUERY_COUNTER_DATA_UINT32_INTEL',
+    0x94F9 : 'GL_PERFQUERY_COUNTER_DATA_UINT64_INTEL',
+    0x94FA : 'GL_PERFQUERY_COUNTER_DATA_FLOAT_INTEL',
+    0x94FB : 'GL_PERFQUERY_COUNTER_DATA_DOUBLE_INTEL',
+    0x94FC : 'GL_PERFQUERY_COUNTER_DATA_BOOL32_INTEL',
+    0x94FD : 'GL_PERFQUERY_QUERY_NAME_LENGTH_MAX_INTEL',
+    0x94FE : 'GL_PERFQUERY_COUNTER_NAME_LENGTH_MAX_INTEL',
+    0x94FF : 'GL_PERFQUERY_COUNTER_DESC_LENGTH_MAX_INTEL',
+    0x9500 : 'GL_PERFQUERY_GPA_EXTENDED_COUNTERS_INTEL',
+    0x9285 : 'GL_BLEND_ADVANCED_COHERENT_KHR',
+    0x82FB : 'GL_CONTEXT_RELEASE_BEHAVIOR_KHR',
+    0x82FC : 'GL_CONTEXT_RELEASE_BEHAVIOR_FLUSH_KHR',
+    0x9532 : 'GL_SUBGROUP_SIZE_KHR',
+    0x9533 : 'GL_SUBGROUP_SUPPORTED_STAGES_KHR',
+    0x9534 : 'GL_SUBGROUP_SUPPORTED_FEATURES_KHR',
+    0x9535 : 'GL_SUBGROUP_QUAD_ALL_STAGES_KHR',
+    0x91B0 : 'GL_MAX_SHADER_COMPILER_THREADS_KHR',
+    0x91B1 : 'GL_COMPLETION_STATUS_KHR',
+    0x80E0 : 'GL_BGR_EXT',
+    0x8BBC : 'GL_FRAMEBUFFER_FLIP_X_MESA',
+    0x8BBB : 'GL_FRAMEBUFFER_FLIP_Y_MESA',
+    0x8BBD : 'GL_FRAMEBUFFER_SWAP_XY_MESA',
+    0x875F : 'GL_PROGRAM_BINARY_FORMAT_MESA',
+    0x9281 : 'GL_BLEND_OVERLAP_NV',
+    0x9280 : 'GL_BLEND_PREMULTIPLIED_SRC_NV',
+    0x9284 : 'GL_CONJOINT_NV',
+    0x92A1 : 'GL_CONTRAST_NV',
+    0x9283 : 'GL_DISJOINT_NV',
+    0x928F : 'GL_DST_ATOP_NV',
+    0x928B : 'GL_DST_IN_NV',
+    0x9287 : 'GL_DST_NV',
+    0x928D : 'GL_DST_OUT_NV',
+    0x9289 : 'GL_DST_OVER_NV',
+    0x92A9 : 'GL_HARDMIX_NV',
+    0x92B4 : 'GL_INVERT_OVG_NV',
+    0x92A3 : 'GL_INVERT_RGB_NV',
+    0x92A5 : 'GL_LINEARBURN_NV',
+    0x92A4 : 'GL_LINEARDODGE_NV',
+    0x92A7 : 'GL_LINEARLIGHT_NV',
+    0x92B3 : 'GL_MINUS_CLAMPED_NV',
+    0x929F : 'GL_MINUS_NV',
+    0x92A8 : 'GL_PINLIGHT_NV',
+    0x92B2 : 'GL_PLUS_CLAMPED_ALPHA_NV',
+    0x92B1 : 'GL_PLUS_CLAMPED_NV',
+    0x9292 : 'GL_PLUS_DARKER_NV',
+    0x9291 : 'GL_PLUS_NV',
+    0x928E : 'GL_SRC_ATOP_NV',
+    0x928A : 'GL_SRC_IN_NV',
+    0x9286 : 'GL_SRC_NV',
+    0x928C : 'GL_SRC_OUT_NV',
+    0x9288 : 'GL_SRC_OVER_NV',
+    0x9282 : 'GL_UNCORRELATED_NV',
+    0x92A6 : 'GL_VIVIDLIGHT_NV',
+    0x1506 : 'GL_XOR_NV',
+    0x901C : 'GL_FACTOR_MIN_AMD',
+    0x901D : 'GL_FACTOR_MAX_AMD',
+    0x937C : 'GL_VIEWPORT_POSITION_W_SCALE_NV',
+    0x937D : 'GL_VIEWPORT_POSITION_W_SCALE_X_COEFF_NV',
+    0x937E : 'GL_VIEWPORT_POSITION_W_SCALE_Y_COEFF_NV',
+    0x8E13 : 'GL_QUERY_WAIT_NV',
+    0x8E14 : 'GL_QUERY_NO_WAIT_NV',
+    0x8E15 : 'GL_QUERY_BY_REGION_WAIT_NV',
+    0x8E16 : 'GL_QUERY_BY_REGION_NO_WAIT_NV',
+    0x9346 : 'GL_CONSERVATIVE_RASTERIZATION_NV',
+    0x9347 : 'GL_SUBPIXEL_PRECISION_BIAS_X_BITS_NV',
+    0x9348 : 'GL_SUBPIXEL_PRECISION_BIAS_Y_BITS_NV',
+    0x9349 : 'GL_MAX_SUBPIXEL_PRECISION_BIAS_BITS_NV',
+    0x9550 : 'GL_CONSERVATIVE_RASTER_MODE_PRE_SNAP_NV',
+    0x954D : 'GL_CONSERVATIVE_RASTER_MODE_NV',
+    0x954E : 'GL_CONSERVATIVE_RASTER_MODE_POST_SNAP_NV',
+    0x954F : 'GL_CONSERVATIVE_RASTER_MODE_PRE_SNAP_TRIANGLES_NV',
+    0x8ED0 : 'GL_COVERAGE_COMPONENT_NV',
+    0x8ED1 : 'GL_COVERAGE_COMPONENT4_NV',
+    0x8ED2 : 'GL_COVERAGE_ATTACHMENT_NV',
+    0x8ED3 : 'GL_COVERAGE_BUFFERS_NV',
+    0x8ED4 : 'GL_COVERAGE_SAMPLES_NV',
+    0x8ED5 : 'GL_COVERAGE_ALL_FRAGMENTS_NV',
+    0x8ED6 : 'GL_COVERAGE_EDGE_FRAGMENTS_NV',
+    0x8ED7 : 'GL_COVERAGE_AUTOMATIC_NV',
+    0x8000 : 'GL_COVERAGE_BUFFER_BIT_NV',
+    0x8E2C : 'GL_DEPTH_COMPONENT16_NONLINEAR_NV',
+    0x84F2 : 'GL_ALL_COMPLETED_NV',
+    0x84F3 : 'GL_FENCE_STATUS_NV',
+    0x84F4 : 'GL_FENCE_CONDITION_NV',
+    0x933C : 'GL_FILL_RECTANGLE_NV',
+    0x92DD : 'GL_FRAGMENT_COVERAGE_TO_COLOR_NV',
+    0x92DE : 'GL_FRAGMENT_COVERAGE_COLOR_NV',
+    0x9331 : 'GL_COVERAGE_MODULATION_TABLE_NV',
+    0x8E20 : 'GL_COLOR_SAMPLES_NV',
+    0x932D : 'GL_DEPTH_SAMPLES_NV',
+    0x932E : 'GL_STENCIL_SAMPLES_NV',
+    0x932F : 'GL_MIXED_DEPTH_SAMPLES_SUPPORTED_NV',
+    0x9330 : 'GL_MIXED_STENCIL_SAMPLES_SUPPORTED_NV',
+    0x9332 : 'GL_COVERAGE_MODULATION_NV',
+    0x9333 : 'GL_COVERAGE_MODULATION_TABLE_SIZE_NV',
+    0x140E : 'GL_INT64_NV',
+    0x140F : 'GL_UNSIGNED_INT64_NV',
+    0x8FE0 : 'GL_INT8_NV',
+    0x8FE1 : 'GL_INT8_VEC2_NV',
+    0x8FE2 : 'GL_INT8_VEC3_NV',
+    0x8FE3 : 'GL_INT8_VEC4_NV',
+    0x8FE4 : 'GL_INT16_NV',
+    0x8FE5 : 'GL_INT16_VEC2_NV',
+    0x8FE6 : 'GL_INT16_VEC3_NV',
+    0x8FE7 : 'GL_INT16_VEC4_NV',
+    0x8FE9 : 'GL_INT64_VEC2_NV',
+    0x8FEA : 'GL_INT64_VEC3_NV',
+    0x8FEB : 'GL_INT64_VEC4_NV',
+    0x8FEC : 'GL_UNSIGNED_INT8_NV',
+    0x8FED : 'GL_UNSIGNED_INT8_VEC2_NV',
+    0x8FEE : 'GL_UNSIGNED_INT8_VEC3_NV',
+    0x8FEF : 'GL_UNSIGNED_INT8_VEC4_NV',
+    0x8FF0 : 'GL_UNSIGNED_INT16_NV',
+    0x8FF1 : 'GL_UNSIGNED_INT16_VEC2_NV',
+    0x8FF2 : 'GL_UNSIGNED_INT16_VEC3_NV',
+    0x8FF3 : 'GL_UNSIGNED_INT16_VEC4_NV',
+    0x8FF5 : 'GL_UNSIGNED_INT64_VEC2_NV',
+    0x8FF6 : 'GL_UNSIGNED_INT64_VEC3_NV',
+    0x8FF7 : 'GL_UNSIGNED_INT64_VEC4_NV',
+    0x8FF8 : 'GL_FLOAT16_NV',
+    0x8FF9 : 'GL_FLOAT16_VEC2_NV',
+    0x8FFA : 'GL_FLOAT16_VEC3_NV',
+    0x8FFB : 'GL_FLOAT16_VEC4_NV',
+    0x9371 : 'GL_MULTISAMPLES_NV',
+    0x9372 : 'GL_SUPERSAMPLE_SCALE_X_NV',
+    0x9373 : 'GL_SUPERSAMPLE_SCALE_Y_NV',
+    0x9374 : 'GL_CONFORMANT_NV',
+    0x95A4 : 'GL_ATTACHED_MEMORY_OBJECT_NV',
+    0x95A5 : 'GL_ATTACHED_MEMORY_OFFSET_NV',
+    0x95A6 : 'GL_MEMORY_ATTACHABLE_ALIGNMENT_NV',
+    0x95A7 : 'GL_MEMORY_ATTACHABLE_SIZE_NV',
+    0x95A8 : 'GL_MEMORY_ATTACHABLE_NV',
+    0x95A9 : 'GL_DETACHED_MEMORY_INCARNATION_NV',
+    0x95AA : 'GL_DETACHED_TEXTURES_NV',
+    0x95AB : 'GL_DETACHED_BUFFERS_NV',
+    0x95AC : 'GL_MAX_DETACHED_TEXTURES_NV',
+    0x95AD : 'GL_MAX_DETACHED_BUFFERS_NV',
+    0x9559 : 'GL_MESH_SHADER_NV',
+    0x955A : 'GL_TASK_SHADER_NV',
+    0x8E60 : 'GL_MAX_MESH_UNIFORM_BLOCKS_NV',
+    0x8E61 : 'GL_MAX_MESH_TEXTURE_IMAGE_UNITS_NV',
+    0x8E62 : 'GL_MAX_MESH_IMAGE_UNIFORMS_NV',
+    0x8E63 : 'GL_MAX_MESH_UNIFORM_COMPONENTS_NV',
+    0x8E64 : 'GL_MAX_MESH_ATOMIC_COUNTER_BUFFERS_NV',
+    0x8E65 : 'GL_MAX_MESH_ATOMIC_COUNTERS_NV',
+    0x8E66 : 'GL_MAX_MESH_SHADER_STORAGE_BLOCKS_NV',
+    0x8E67 : 'GL_MAX_COMBINED_MESH_UNIFORM_COMPONENTS_NV',
+    0x8E68 : 'GL_MAX_TASK_UNIFORM_BLOCKS_NV',
+    0x8E69 : 'GL_MAX_TASK_TEXTURE_IMAGE_UNITS_NV',
+    0x8E6A : 'GL_MAX_TASK_IMAGE_UNIFORMS_NV',
+    0x8E6B : 'GL_MAX_TASK_UNIFORM_COMPONENTS_NV',
+    0x8E6C : 'GL_MAX_TASK_ATOMIC_COUNTER_BUFFERS_NV',
+    0x8E6D : 'GL_MAX_TASK_ATOMIC_COUNTERS_NV',
+    0x8E6E : 'GL_MAX_TASK_SHADER_STORAGE_BLOCKS_NV',
+    0x8E6F : 'GL_MAX_COMBINED_TASK_UNIFORM_COMPONENTS_NV',
+    0x95A2 : 'GL_MAX_MESH_WORK_GROUP_INVOCATIONS_NV',
+    0x95A3 : 'GL_MAX_TASK_WORK_GROUP_INVOCATIONS_NV',
+    0x9536 : 'GL_MAX_MESH_TOTAL_MEMORY_SIZE_NV',
+    0x9537 : 'GL_MAX_TASK_TOTAL_MEMORY_SIZE_NV',
+    0x9538 : 'GL_MAX_MESH_OUTPUT_VERTICES_NV',
+    0x9539 : 'GL_MAX_MESH_OUTPUT_PRIMITIVES_NV',
+    0x953A : 'GL_MAX_TASK_OUTPUT_COUNT_NV',
+    0x953D : 'GL_MAX_DRAW_MESH_TASKS_COUNT_NV',
+    0x9557 : 'GL_MAX_MESH_VIEWS_NV',
+    0x92DF : 'GL_MESH_OUTPUT_PER_VERTEX_GRANULARITY_NV',
+    0x9543 : 'GL_MESH_OUTPUT_PER_PRIMITIVE_GRANULARITY_NV',
+    0x953B : 'GL_MAX_MESH_WORK_GROUP_SIZE_NV',
+    0x953C : 'GL_MAX_TASK_WORK_GROUP_SIZE_NV',
+    0x953E : 'GL_MESH_WORK_GROUP_SIZE_NV',
+    0x953F : 'GL_TASK_WORK_GROUP_SIZE_NV',
+    0x9579 : 'GL_MESH_VERTICES_OUT_NV',
+    0x957A : 'GL_MESH_PRIMITIVES_OUT_NV',
+    0x957B : 'GL_MESH_OUTPUT_TYPE_NV',
+    0x959C : 'GL_UNIFORM_BLOCK_REFERENCED_BY_MESH_SHADER_NV',
+    0x959D : 'GL_UNIFORM_BLOCK_REFERENCED_BY_TASK_SHADER_NV',
+    0x95A0 : 'GL_REFERENCED_BY_MESH_SHADER_NV',
+    0x95A1 : 'GL_REFERENCED_BY_TASK_SHADER_NV',
+    0x957C : 'GL_MESH_SUBROUTINE_NV',
+    0x957D : 'GL_TASK_SUBROUTINE_NV',
+    0x957E : 'GL_MESH_SUBROUTINE_UNIFORM_NV',
+    0x957F : 'GL_TASK_SUBROUTINE_UNIFORM_NV',
+    0x959E : 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_MESH_SHADER_NV',
+    0x959F : 'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TASK_SHADER_NV',
+    0x9070 : 'GL_PATH_FORMAT_SVG_NV',
+    0x9071 : 'GL_PATH_FORMAT_PS_NV',
+    0x9072 : 'GL_STANDARD_FONT_NAME_NV',
+    0x9073 : 'GL_SYSTEM_FONT_NAME_NV',
+    0x9074 : 'GL_FILE_NAME_NV',
+    0x9075 : 'GL_PATH_STROKE_WIDTH_NV',
+    0x9076 : 'GL_PATH_END_CAPS_NV',
+    0x9077 : 'GL_PATH_INITIAL_END_CAP_NV',
+    0x9078 : 'GL_PATH_TERMINAL_END_CAP_NV',
+    0x9079 : 'GL_PATH_JOIN_STYLE_NV',
+    0x907A : 'GL_PATH_MITER_LIMIT_NV',
+    0x907B : 'GL_PATH_DASH_CAPS_NV',
+    0x907C : 'GL_PATH_INITIAL_DASH_CAP_NV',
+    0x907D : 'GL_PATH_TERMINAL_DASH_CAP_NV',
+    0x907E : 'GL_PATH_DASH_OFFSET_NV',
+    0x907F : 'GL_PATH_CLIENT_LENGTH_NV',
+    0x9080 : 'GL_PATH_FILL_MODE_NV',
+    0x9081 : 'GL_PATH_FILL_MASK_NV',
+    0x9082 : 'GL_PATH_FILL_COVER_MODE_NV',
+    0x9083 : 'GL_PATH_STROKE_COVER_MODE_NV',
+    0x9084 : 'GL_PATH_STROKE_MASK_NV',
+    0x9088 : 'GL_COUNT_UP_NV',
+    0x9089 : 'GL_COUNT_DOWN_NV',
+    0x908A : 'GL_PATH_OBJECT_BOUNDING_BOX_NV',
+    0x908B : 'GL_CONVEX_HULL_NV',
+    0x908D : 'GL_BOUNDING_BOX_NV',
+    0x908E : 'GL_TRANSLATE_X_NV',
+    0x908F : 'GL_TRANSLATE_Y_NV',
+    0x9090 : 'GL_TRANSLATE_2D_NV',
+    0x9091 : 'GL_TRANSLATE_3D_NV',
+    0x9092 : 'GL_AFFINE_2D_NV',
+    0x9094 : 'GL_AFFINE_3D_NV',
+    0x9096 : 'GL_TRANSPOSE_AFFINE_2D_NV',
+    0x9098 : 'GL_TRANSPOSE_AFFINE_3D_NV',
+    0x909A : 'GL_UTF8_NV',
+    0x909B : 'GL_UTF16_NV',
+    0x909C : 'GL_BOUNDING_BOX_OF_BOUNDING_BOXES_NV',
+    0x909D : 'GL_PATH_COMMAND_COUNT_NV',
+    0x909E : 'GL_PATH_COORD_COUNT_NV',
+    0x909F : 'GL_PATH_DASH_ARRAY_COUNT_NV',
+    0x90A0 : 'GL_PATH_COMPUTED_LENGTH_NV',
+    0x90A1 : 'GL_PATH_FILL_BOUNDING_BOX_NV',
+    0x90A2 : 'GL_PATH_STROKE_BOUNDING_BOX_NV',
+    0x90A3 : 'GL_SQUARE_NV',
+    0x90A4 : 'GL_ROUND_NV',
+    0x90A5 : 'GL_TRIANGULAR_NV',
+    0x90A6 : 'GL_BEVEL_NV',
+    0x90A7 : 'GL_MITER_REVERT_NV',
+    0x90A8 : 'GL_MITER_TRUNCATE_NV',
+    0x90A9 : 'GL_SKIP_MISSING_GLYPH_NV',
+    0x90AA : 'GL_USE_MISSING_GLYPH_NV',
+    0x90AB : 'GL_PATH_ERROR_POSITION_NV',
+    0x90AD : 'GL_ACCUM_ADJACENT_PAIRS_NV',
+    0x90AE : 'GL_ADJACENT_PAIRS_NV',
+    0x90AF : 'GL_FIRST_TO_REST_NV',
+    0x90B0 : 'GL_PATH_GEN_MODE_NV',
+    0x90B1 : 'GL_PATH_GEN_COEFF_NV',
+    0x90B3 : 'GL_PATH_GEN_COMPONENTS_NV',
+    0x90B7 : 'GL_PATH_STENCIL_FUNC_NV',
+    0x90B8 : 'GL_PATH_STENCIL_REF_NV',
+    0x90B9 : 'GL_PATH_STENCIL_VALUE_MASK_NV',
+    0x90BD : 'GL_PATH_STENCIL_DEPTH_OFFSET_FACTOR_NV',
+    0x90BE : 'GL_PATH_STENCIL_DEPTH_OFFSET_UNITS_NV',
+    0x90BF : 'GL_PATH_COVER_DEPTH_FUNC_NV',
+    0x90B4 : 'GL_PATH_DASH_OFFSET_RESET_NV',
+    0x90B5 : 'GL_MOVE_TO_RESETS_NV',
+    0x90B6 : 'GL_MOVE_TO_CONTINUES_NV',
+    0x0009 : 'GL_RELATIVE_VERTICAL_LINE_TO_NV',
+    0x000F : 'GL_RELATIVE_SMOOTH_QUADRATIC_CURVE_TO_NV',
+    0x0011 : 'GL_RELATIVE_SMOOTH_CUBIC_CURVE_TO_NV',
+    0x0012 : 'GL_SMALL_CCW_ARC_TO_NV',
+    0x0013 : 'GL_RELATIVE_SMALL_CCW_ARC_TO_NV',
+    0x0014 : 'GL_SMALL_CW_ARC_TO_NV',
+    0x0015 : 'GL_RELATIVE_SMALL_CW_ARC_TO_NV',
+    0x0016 : 'GL_LARGE_CCW_ARC_TO_NV',
+    0x0017 : 'GL_RELATIVE_LARGE_CCW_ARC_TO_NV',
+    0x0018 : 'GL_LARGE_CW_ARC_TO_NV',
+    0x0019 : 'GL_RELATIVE_LARGE_CW_ARC_TO_NV',
+    0x00F0 : 'GL_RESTART_PATH_NV',
+    0x00F2 : 'GL_DUP_FIRST_CUBIC_CURVE_TO_NV',
+    0x00F4 : 'GL_DUP_LAST_CUBIC_CURVE_TO_NV',
+    0x00F6 : 'GL_RECT_NV',
+    0x00F8 : 'GL_CIRCULAR_CCW_ARC_TO_NV',
+    0x00FA : 'GL_CIRCULAR_CW_ARC_TO_NV',
+    0x00FC : 'GL_CIRCULAR_TANGENT_ARC_TO_NV',
+    0x00FE : 'GL_ARC_TO_NV',
+    0x00FF : 'GL_RELATIVE_ARC_TO_NV',
+    0x10000 : 'GL_FONT_X_MIN_BOUNDS_BIT_NV',
+    0x20000 : 'GL_FONT_Y_MIN_BOUNDS_BIT_NV',
+    0x40000 : 'GL_FONT_X_MAX_BOUNDS_BIT_NV',
+    0x80000 : 'GL_FONT_Y_MAX_BOUNDS_BIT_NV',
+    0x100000 : 'GL_FONT_UNITS_PER_EM_BIT_NV',
+    0x200000 : 'GL_FONT_ASCENDER_BIT_NV',
+    0x400000 : 'GL_FONT_DESCENDER_BIT_NV',
+    0x800000 : 'GL_FONT_HEIGHT_BIT_NV',
+    0x1000000 : 'GL_FONT_MAX_ADVANCE_WIDTH_BIT_NV',
+    0x2000000 : 'GL_FONT_MAX_ADVANCE_HEIGHT_BIT_NV',
+    0x4000000 : 'GL_FONT_UNDERLINE_POSITION_BIT_NV',
+    0x8000000 : 'GL_FONT_UNDERLINE_THICKNESS_BIT_NV',
+    0x10000000 : 'GL_FONT_HAS_KERNING_BIT_NV',
+    0x00E8 : 'GL_ROUNDED_RECT_NV',
+    0x00E9 : 'GL_RELATIVE_ROUNDED_RECT_NV',
+    0x00EA : 'GL_ROUNDED_RECT2_NV',
+    0x00EB : 'GL_RELATIVE_ROUNDED_RECT2_NV',
+    0x00EC : 'GL_ROUNDED_RECT4_NV',
+    0x00ED : 'GL_RELATIVE_ROUNDED_RECT4_NV',
+    0x00EE : 'GL_ROUNDED_RECT8_NV',
+    0x00EF : 'GL_RELATIVE_ROUNDED_RECT8_NV',
+    0x00F7 : 'GL_RELATIVE_RECT_NV',
+    0x9368 : 'GL_FONT_GLYPHS_AVAILABLE_NV',
+    0x9369 : 'GL_FONT_TARGET_UNAVAILABLE_NV',
+    0x936A : 'GL_FONT_UNAVAILABLE_NV',
+    0x936B : 'GL_FONT_UNINTELLIGIBLE_NV',
+    0x001A : 'GL_CONIC_CURVE_TO_NV',
+    0x001B : 'GL_RELATIVE_CONIC_CURVE_TO_NV',
+    0x20000000 : 'GL_FONT_NUM_GLYPH_INDICES_BIT_NV',
+    0x936C : 'GL_STANDARD_FONT_FORMAT_NV',
+    0x1701 : 'GL_PATH_PROJECTION_NV',
+    0x1700 : 'GL_PATH_MODELVIEW_NV',
+    0x0BA3 : 'GL_PATH_MODELVIEW_STACK_DEPTH_NV',
+    0x0BA6 : 'GL_PATH_MODELVIEW_MATRIX_NV',
+    0x0D36 : 'GL_PATH_MAX_MODELVIEW_STACK_DEPTH_NV',
+    0x84E3 : 'GL_PATH_TRANSPOSE_MODELVIEW_MATRIX_NV',
+    0x0BA4 : 'GL_PATH_PROJECTION_STACK_DEPTH_NV',
+    0x0BA7 : 'GL_PATH_PROJECTION_MATRIX_NV',
+    0x0D38 : 'GL_PATH_MAX_PROJECTION_STACK_DEPTH_NV',
+    0x84E4 : 'GL_PATH_TRANSPOSE_PROJECTION_MATRIX_NV',
+    0x936D : 'GL_FRAGMENT_INPUT_NV',
+    0x00C0 : 'GL_SHARED_EDGE_NV',
+    0x0B40 : 'GL_POLYGON_MODE_NV',
+    0x2A01 : 'GL_POLYGON_OFFSET_POINT_NV',
+    0x2A02 : 'GL_POLYGON_OFFSET_LINE_NV',
+    0x1B00 : 'GL_POINT_NV',
+    0x1B01 : 'GL_LINE_NV',
+    0x1B02 : 'GL_FILL_NV',
+    0x95B1 : 'GL_SHADING_RATE_IMAGE_PER_PRIMITIVE_NV',
+    0x95B2 : 'GL_SHADING_RATE_IMAGE_PALETTE_COUNT_NV',
+    0x937F : 'GL_REPRESENTATIVE_FRAGMENT_TEST_NV',
+    0x8C46 : 'GL_SLUMINANCE_NV',
+    0x8C44 : 'GL_SLUMINANCE_ALPHA_NV',
+    0x8C47 : 'GL_SLUMINANCE8_NV',
+    0x8C45 : 'GL_SLUMINANCE8_ALPHA8_NV',
+    0x88EE : 'GL_ETC1_SRGB8_NV',
+    0x933D : 'GL_SAMPLE_LOCATION_SUBPIXEL_BITS_NV',
+    0x933E : 'GL_SAMPLE_LOCATION_PIXEL_GRID_WIDTH_NV',
+    0x933F : 'GL_SAMPLE_LOCATION_PIXEL_GRID_HEIGHT_NV',
+    0x9340 : 'GL_PROGRAMMABLE_SAMPLE_LOCATION_TABLE_SIZE_NV',
+    0x9341 : 'GL_PROGRAMMABLE_SAMPLE_LOCATION_NV',
+    0x9342 : 'GL_FRAMEBUFFER_PROGRAMMABLE_SAMPLE_LOCATIONS_NV',
+    0x9343 : 'GL_FRAMEBUFFER_SAMPLE_LOCATION_PIXEL_GRID_NV',
+    0x9555 : 'GL_SCISSOR_TEST_EXCLUSIVE_NV',
+    0x9556 : 'GL_SCISSOR_BOX_EXCLUSIVE_NV',
+    0x9563 : 'GL_SHADING_RATE_IMAGE_NV',
+    0x9564 : 'GL_SHADING_RATE_NO_INVOCATIONS_NV',
+    0x9565 : 'GL_SHADING_RATE_1_INVOCATION_PER_PIXEL_NV',
+    0x9566 : 'GL_SHADING_RATE_1_INVOCATION_PER_1X2_PIXELS_NV',
+    0x9567 : 'GL_SHADING_RATE_1_INVOCATION_PER_2X1_PIXELS_NV',
+    0x9568 : 'GL_SHADING_RATE_1_INVOCATION_PER_2X2_PIXELS_NV',
+    0x9569 : 'GL_SHADING_RATE_1_INVOCATION_PER_2X4_PIXELS_NV',
+    0x956A : 'GL_SHADING_RATE_1_INVOCATION_PER_4X2_PIXELS_NV',
+    0x956B : 'GL_SHADING_RATE_1_INVOCATION_PER_4X4_PIXELS_NV',
+    0x956C : 'GL_SHADING_RATE_2_INVOCATIONS_PER_PIXEL_NV',
+    0x956D : 'GL_SHADING_RATE_4_INVOCATIONS_PER_PIXEL_NV',
+    0x956E : 'GL_SHADING_RATE_8_INVOCATIONS_PER_PIXEL_NV',
+    0x956F : 'GL_SHADING_RATE_16_INVOCATIONS_PER_PIXEL_NV',
+    0x955B : 'GL_SHADING_RATE_IMAGE_BINDING_NV',
+    0x955C : 'GL_SHADING_RATE_IMAGE_TEXEL_WIDTH_NV',
+    0x955D : 'GL_SHADING_RATE_IMAGE_TEXEL_HEIGHT_NV',
+    0x955E : 'GL_SHADING_RATE_IMAGE_PALETTE_SIZE_NV',
+    0x955F : 'GL_MAX_COARSE_FRAGMENT_SAMPLES_NV',
+    0x95AE : 'GL_SHADING_RATE_SAMPLE_ORDER_DEFAULT_NV',
+    0x95AF : 'GL_SHADING_RATE_SAMPLE_ORDER_PIXEL_MAJOR_NV',
+    0x95B0 : 'GL_SHADING_RATE_SAMPLE_ORDER_SAMPLE_MAJOR_NV',
+    0x825B : 'GL_MAX_VIEWPORTS_NV',
+    0x825C : 'GL_VIEWPORT_SUBPIXEL_BITS_NV',
+    0x825D : 'GL_VIEWPORT_BOUNDS_RANGE_NV',
+    0x825F : 'GL_VIEWPORT_INDEX_PROVOKING_VERTEX_NV',
+    0x9350 : 'GL_VIEWPORT_SWIZZLE_POSITIVE_X_NV',
+    0x9351 : 'GL_VIEWPORT_SWIZZLE_NEGATIVE_X_NV',
+    0x9352 : 'GL_VIEWPORT_SWIZZLE_POSITIVE_Y_NV',
+    0x9353 : 'GL_VIEWPORT_SWIZZLE_NEGATIVE_Y_NV',
+    0x9354 : 'GL_VIEWPORT_SWIZZLE_POSITIVE_Z_NV',
+    0x9355 : 'GL_VIEWPORT_SWIZZLE_NEGATIVE_Z_NV',
+    0x9356 : 'GL_VIEWPORT_SWIZZLE_POSITIVE_W_NV',
+    0x9357 : 'GL_VIEWPORT_SWIZZLE_NEGATIVE_W_NV',
+    0x9358 : 'GL_VIEWPORT_SWIZZLE_X_NV',
+    0x9359 : 'GL_VIEWPORT_SWIZZLE_Y_NV',
+    0x935A : 'GL_VIEWPORT_SWIZZLE_Z_NV',
+    0x935B : 'GL_VIEWPORT_SWIZZLE_W_NV',
+    0x8D66 : 'GL_SAMPLER_EXTERNAL_OES',
+    0x8D64 : 'GL_ETC1_RGB8_OES',
+    0x8B90 : 'GL_PALETTE4_RGB8_OES',
+    0x8B91 : 'GL_PALETTE4_RGBA8_OES',
+    0x8B92 : 'GL_PALETTE4_R5_G6_B5_OES',
+    0x8B93 : 'GL_PALETTE4_RGBA4_OES',
+    0x8B94 : 'GL_PALETTE4_RGB5_A1_OES',
+    0x8B95 : 'GL_PALETTE8_RGB8_OES',
+    0x8B96 : 'GL_PALETTE8_RGBA8_OES',
+    0x8B97 : 'GL_PALETTE8_R5_G6_B5_OES',
+    0x8B98 : 'GL_PALETTE8_RGBA4_OES',
+    0x8B99 : 'GL_PALETTE8_RGB5_A1_OES',
+    0x88BB : 'GL_BUFFER_ACCESS_OES',
+    0x8043 : 'GL_LUMINANCE4_ALPHA4_OES',
+    0x8D46 : 'GL_STENCIL_INDEX1_OES',
+    0x8D47 : 'GL_STENCIL_INDEX4_OES',
+    0x93C0 : 'GL_COMPRESSED_RGBA_ASTC_3x3x3_OES',
+    0x93C1 : 'GL_COMPRESSED_RGBA_ASTC_4x3x3_OES',
+    0x93C2 : 'GL_COMPRESSED_RGBA_ASTC_4x4x3_OES',
+    0x93C3 : 'GL_COMPRESSED_RGBA_ASTC_4x4x4_OES',
+    0x93C4 : 'GL_COMPRESSED_RGBA_ASTC_5x4x4_OES',
+    0x93C5 : 'GL_COMPRESSED_RGBA_ASTC_5x5x4_OES',
+    0x93C6 : 'GL_COMPRESSED_RGBA_ASTC_5x5x5_OES',
+    0x93C7 : 'GL_COMPRESSED_RGBA_ASTC_6x5x5_OES',
+    0x93C8 : 'GL_COMPRESSED_RGBA_ASTC_6x6x5_OES',
+    0x93C9 : 'GL_COMPRESSED_RGBA_ASTC_6x6x6_OES',
+    0x93E0 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_3x3x3_OES',
+    0x93E1 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x3x3_OES',
+    0x93E2 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4x3_OES',
+    0x93E3 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4x4_OES',
+    0x93E4 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4x4_OES',
+    0x93E5 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5x4_OES',
+    0x93E6 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5x5_OES',
+    0x93E7 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5x5_OES',
+    0x93E8 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6x5_OES',
+    0x93E9 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6x6_OES',
+    0x8D61 : 'GL_HALF_FLOAT_OES',
+    0x8DF6 : 'GL_UNSIGNED_INT_10_10_10_2_OES',
+    0x8DF7 : 'GL_INT_10_10_10_2_OES',
+    0x9630 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_NUM_VIEWS_OVR',
+    0x9632 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_BASE_VIEW_INDEX_OVR',
+    0x9631 : 'GL_MAX_VIEWS_OVR',
+    0x9633 : 'GL_FRAMEBUFFER_INCOMPLETE_VIEW_TARGETS_OVR',
+    0x0BC0 : 'GL_ALPHA_TEST_QCOM',
+    0x0BC1 : 'GL_ALPHA_TEST_FUNC_QCOM',
+    0x0BC2 : 'GL_ALPHA_TEST_REF_QCOM',
+    0x8FB0 : 'GL_BINNING_CONTROL_HINT_QCOM',
+    0x8FB1 : 'GL_CPU_OPTIMIZED_QCOM',
+    0x8FB2 : 'GL_GPU_OPTIMIZED_QCOM',
+    0x8FB3 : 'GL_RENDER_DIRECT_TO_FRAMEBUFFER_QCOM',
+    0x8BD2 : 'GL_TEXTURE_WIDTH_QCOM',
+    0x8BD3 : 'GL_TEXTURE_HEIGHT_QCOM',
+    0x8BD4 : 'GL_TEXTURE_DEPTH_QCOM',
+    0x8BD5 : 'GL_TEXTURE_INTERNAL_FORMAT_QCOM',
+    0x8BD6 : 'GL_TEXTURE_FORMAT_QCOM',
+    0x8BD7 : 'GL_TEXTURE_TYPE_QCOM',
+    0x8BD8 : 'GL_TEXTURE_IMAGE_VALID_QCOM',
+    0x8BD9 : 'GL_TEXTURE_NUM_LEVELS_QCOM',
+    0x8BDA : 'GL_TEXTURE_TARGET_QCOM',
+    0x8BDB : 'GL_TEXTURE_OBJECT_VALID_QCOM',
+    0x8BDC : 'GL_STATE_RESTORE',
+    0x8C90 : 'GL_MOTION_ESTIMATION_SEARCH_BLOCK_X_QCOM',
+    0x8C91 : 'GL_MOTION_ESTIMATION_SEARCH_BLOCK_Y_QCOM',
+    0x8BFB : 'GL_TEXTURE_FOVEATED_FEATURE_BITS_QCOM',
+    0x8BFC : 'GL_TEXTURE_FOVEATED_MIN_PIXEL_DENSITY_QCOM',
+    0x8BFD : 'GL_TEXTURE_FOVEATED_FEATURE_QUERY_QCOM',
+    0x8BFE : 'GL_TEXTURE_FOVEATED_NUM_FOCAL_POINTS_QUERY_QCOM',
+    0x8BFF : 'GL_FRAMEBUFFER_INCOMPLETE_FOVEATION_QCOM',
+    0x96A0 : 'GL_TEXTURE_FOVEATED_CUTOFF_DENSITY_QCOM',
+    0x8FA1 : 'GL_MAX_SHADER_SUBSAMPLED_IMAGE_UNITS_QCOM',
+    0x9710 : 'GL_TEXTURE_Y_DEGAMMA_QCOM',
+    0x9711 : 'GL_TEXTURE_CBCR_DEGAMMA_QCOM',
+    0x8C96 : 'GL_TEXTURE_LOD_BIAS_QCOM',
+    0x8FA0 : 'GL_PERFMON_GLOBAL_MODE_QCOM',
+    0x96A2 : 'GL_FRAMEBUFFER_FETCH_NONCOHERENT_QCOM',
+    0x96A4 : 'GL_SHADING_RATE_QCOM',
+    0x96A5 : 'GL_SHADING_RATE_PRESERVE_ASPECT_RATIO_QCOM',
+    0x40000000 : 'GL_MULTISAMPLE_BUFFER_BIT6_QCOM',
+    0x80000000 : 'GL_MULTISAMPLE_BUFFER_BIT7_QCOM',
+    0x8823 : 'GL_WRITEONLY_RENDERING_QCOM',
+    0x8FC4 : 'GL_SHADER_BINARY_VIV',
+}
+
+# value -> all enum names of the value, for values shared by several enums
+ALIASES = {
+    0x0100 : ('GL_DEPTH_BUFFER_BIT', 'GL_TEXTURE_UPDATE_BARRIER_BIT', 'GL_DYNAMIC_STORAGE_BIT_EXT', 'GL_GLYPH_HAS_KERNING_BIT_NV', 'GL_SUBGROUP_FEATURE_PARTITIONED_BIT_NV', 'GL_DEPTH_BUFFER_BIT0_QCOM'),
+    0x0400 : ('GL_STENCIL_BUFFER_BIT', 'GL_FRAMEBUFFER_BARRIER_BIT', 'GL_DEPTH_BUFFER_BIT2_QCOM'),
+    0x4000 : ('GL_COLOR_BUFFER_BIT', 'GL_CLIENT_MAPPED_BUFFER_BARRIER_BIT_EXT', 'GL_DEPTH_BUFFER_BIT6_QCOM'),
+    0x0000 : ('GL_FALSE', 'GL_POINTS', 'GL_ZERO', 'GL_NO_ERROR', 'GL_NONE', 'GL_PERFQUERY_SINGLE_CONTEXT_INTEL', 'GL_CLOSE_PATH_NV'),
+    0x0001 : ('GL_TRUE', 'GL_LINES', 'GL_ONE', 'GL_MAP_READ_BIT', 'GL_SYNC_FLUSH_COMMANDS_BIT', 'GL_VERTEX_SHADER_BIT', 'GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT', 'GL_SYNC_FLUSH_COMMANDS_BIT_APPLE', 'GL_MAP_READ_BIT_EXT', 'GL_VERTEX_SHADER_BIT_EXT', 'GL_PERFQUERY_GLOBAL_CONTEXT_INTEL', 'GL_SUBGROUP_FEATURE_BASIC_BIT_KHR', 'GL_BOLD_BIT_NV', 'GL_GLYPH_WIDTH_BIT_NV', 'GL_FOVEATION_ENABLE_BIT_QCOM', 'GL_COLOR_BUFFER_BIT0_QCOM'),
+    0x0002 : ('GL_LINE_LOOP', 'GL_MAP_WRITE_BIT', 'GL_FRAGMENT_SHADER_BIT', 'GL_ELEMENT_ARRAY_BARRIER_BIT', 'GL_CONTEXT_FLAG_DEBUG_BIT', 'GL_MAP_WRITE_BIT_EXT', 'GL_FRAGMENT_SHADER_BIT_EXT', 'GL_CONTEXT_FLAG_DEBUG_BIT_KHR', 'GL_SUBGROUP_FEATURE_VOTE_BIT_KHR', 'GL_MOVE_TO_NV', 'GL_ITALIC_BIT_NV', 'GL_GLYPH_HEIGHT_BIT_NV', 'GL_FOVEATION_SCALED_BIN_METHOD_BIT_QCOM', 'GL_COLOR_BUFFER_BIT1_QCOM'),
+    0x0003 : ('GL_LINE_STRIP', 'GL_RELATIVE_MOVE_TO_NV'),
+    0x0004 : ('GL_TRIANGLES', 'GL_MAP_INVALIDATE_RANGE_BIT', 'GL_UNIFORM_BARRIER_BIT', 'GL_GEOMETRY_SHADER_BIT', 'GL_CONTEXT_FLAG_ROBUST_ACCESS_BIT', 'GL_GEOMETRY_SHADER_BIT_EXT', 'GL_MAP_INVALIDATE_RANGE_BIT_EXT', 'GL_SUBGROUP_FEATURE_ARITHMETIC_BIT_KHR', 'GL_LINE_TO_NV', 'GL_GLYPH_HORIZONTAL_BEARING_X_BIT_NV', 'GL_GEOMETRY_SHADER_BIT_OES', 'GL_FOVEATION_SUBSAMPLED_LAYOUT_METHOD_BIT_QCOM', 'GL_COLOR_BUFFER_BIT2_QCOM'),
+    0x0005 : ('GL_TRIANGLE_STRIP', 'GL_RELATIVE_LINE_TO_NV'),
+    0x0006 : ('GL_TRIANGLE_FAN', 'GL_HORIZONTAL_LINE_TO_NV'),
+    0x0308 : ('GL_SRC_ALPHA_SATURATE', 'GL_SRC_ALPHA_SATURATE_EXT'),
+    0x8009 : ('GL_BLEND_EQUATION', 'GL_BLEND_EQUATION_RGB'),
+    0x0200 : ('GL_NEVER', 'GL_BUFFER_UPDATE_BARRIER_BIT', 'GL_CLIENT_STORAGE_BIT_EXT', 'GL_DEPTH_BUFFER_BIT1_QCOM'),
+    0x8056 : ('GL_RGBA4', 'GL_RGBA4_OES'),
+    0x8057 : ('GL_RGB5_A1', 'GL_RGB5_A1_OES'),
+    0x8D62 : ('GL_RGB565', 'GL_RGB565_OES'),
+    0x81A5 : ('GL_DEPTH_COMPONENT16', 'GL_DEPTH_COMPONENT16_OES'),
+    0x8D48 : ('GL_STENCIL_INDEX8', 'GL_STENCIL_INDEX8_OES'),
+    0x8CE0 : ('GL_COLOR_ATTACHMENT0', 'GL_COLOR_ATTACHMENT0_EXT', 'GL_COLOR_ATTACHMENT0_NV'),
+    0x8CA6 : ('GL_FRAMEBUFFER_BINDING', 'GL_DRAW_FRAMEBUFFER_BINDING', 'GL_DRAW_FRAMEBUFFER_BINDING_ANGLE', 'GL_DRAW_FRAMEBUFFER_BINDING_APPLE', 'GL_DRAW_FRAMEBUFFER_BINDING_NV'),
+    0x0C02 : ('GL_READ_BUFFER', 'GL_READ_BUFFER_EXT', 'GL_READ_BUFFER_NV'),
+    0x0CF2 : ('GL_UNPACK_ROW_LENGTH', 'GL_UNPACK_ROW_LENGTH_EXT'),
+    0x0CF3 : ('GL_UNPACK_SKIP_ROWS', 'GL_UNPACK_SKIP_ROWS_EXT'),
+    0x0CF4 : ('GL_UNPACK_SKIP_PIXELS', 'GL_UNPACK_SKIP_PIXELS_EXT'),
+    0x0D02 : ('GL_PACK_ROW_LENGTH', 'GL_PACK_ROW_LENGTH_NV'),
+    0x0D03 : ('GL_PACK_SKIP_ROWS', 'GL_PACK_SKIP_ROWS_NV'),
+    0x0D04 : ('GL_PACK_SKIP_PIXELS', 'GL_PACK_SKIP_PIXELS_NV'),
+    0x1800 : ('GL_COLOR', 'GL_COLOR_EXT'),
+    0x1801 : ('GL_DEPTH', 'GL_DEPTH_EXT'),
+    0x1802 : ('GL_STENCIL', 'GL_STENCIL_EXT'),
+    0x1903 : ('GL_RED', 'GL_RED_EXT', 'GL_RED_NV'),
+    0x8051 : ('GL_RGB8', 'GL_RGB8_OES'),
+    0x8058 : ('GL_RGBA8', 'GL_RGBA8_OES'),
+    0x8059 : ('GL_RGB10_A2', 'GL_RGB10_A2_EXT'),
+    0x806A : ('GL_TEXTURE_BINDING_3D', 'GL_TEXTURE_BINDING_3D_OES'),
+    0x806F : ('GL_TEXTURE_3D', 'GL_TEXTURE_3D_OES'),
+    0x8072 : ('GL_TEXTURE_WRAP_R', 'GL_TEXTURE_WRAP_R_OES'),
+    0x8073 : ('GL_MAX_3D_TEXTURE_SIZE', 'GL_MAX_3D_TEXTURE_SIZE_OES'),
+    0x8368 : ('GL_UNSIGNED_INT_2_10_10_10_REV', 'GL_UNSIGNED_INT_2_10_10_10_REV_EXT'),
+    0x813D : ('GL_TEXTURE_MAX_LEVEL', 'GL_TEXTURE_MAX_LEVEL_APPLE'),
+    0x8007 : ('GL_MIN', 'GL_MIN_EXT'),
+    0x8008 : ('GL_MAX', 'GL_MAX_EXT'),
+    0x81A6 : ('GL_DEPTH_COMPONENT24', 'GL_DEPTH_COMPONENT24_OES'),
+    0x884C : ('GL_TEXTURE_COMPARE_MODE', 'GL_TEXTURE_COMPARE_MODE_EXT'),
+    0x884D : ('GL_TEXTURE_COMPARE_FUNC', 'GL_TEXTURE_COMPARE_FUNC_EXT'),
+    0x8865 : ('GL_CURRENT_QUERY', 'GL_CURRENT_QUERY_EXT'),
+    0x8866 : ('GL_QUERY_RESULT', 'GL_QUERY_RESULT_EXT'),
+    0x8867 : ('GL_QUERY_RESULT_AVAILABLE', 'GL_QUERY_RESULT_AVAILABLE_EXT'),
+    0x88BC : ('GL_BUFFER_MAPPED', 'GL_BUFFER_MAPPED_OES'),
+    0x88BD : ('GL_BUFFER_MAP_POINTER', 'GL_BUFFER_MAP_POINTER_OES'),
+    0x8824 : ('GL_MAX_DRAW_BUFFERS', 'GL_MAX_DRAW_BUFFERS_EXT', 'GL_MAX_DRAW_BUFFERS_NV'),
+    0x8825 : ('GL_DRAW_BUFFER0', 'GL_DRAW_BUFFER0_EXT', 'GL_DRAW_BUFFER0_NV'),
+    0x8826 : ('GL_DRAW_BUFFER1', 'GL_DRAW_BUFFER1_EXT', 'GL_DRAW_BUFFER1_NV'),
+    0x8827 : ('GL_DRAW_BUFFER2', 'GL_DRAW_BUFFER2_EXT', 'GL_DRAW_BUFFER2_NV'),
+    0x8828 : ('GL_DRAW_BUFFER3', 'GL_DRAW_BUFFER3_EXT', 'GL_DRAW_BUFFER3_NV'),
+    0x8829 : ('GL_DRAW_BUFFER4', 'GL_DRAW_BUFFER4_EXT', 'GL_DRAW_BUFFER4_NV'),
+    0x882A : ('GL_DRAW_BUFFER5', 'GL_DRAW_BUFFER5_EXT', 'GL_DRAW_BUFFER5_NV'),
+    0x882B : ('GL_DRAW_BUFFER6', 'GL_DRAW_BUFFER6_EXT', 'GL_DRAW_BUFFER6_NV'),
+    0x882C : ('GL_DRAW_BUFFER7', 'GL_DRAW_BUFFER7_EXT', 'GL_DRAW_BUFFER7_NV'),
+    0x882D : ('GL_DRAW_BUFFER8', 'GL_DRAW_BUFFER8_EXT', 'GL_DRAW_BUFFER8_NV'),
+    0x882E : ('GL_DRAW_BUFFER9', 'GL_DRAW_BUFFER9_EXT', 'GL_DRAW_BUFFER9_NV'),
+    0x882F : ('GL_DRAW_BUFFER10', 'GL_DRAW_BUFFER10_EXT', 'GL_DRAW_BUFFER10_NV'),
+    0x8830 : ('GL_DRAW_BUFFER11', 'GL_DRAW_BUFFER11_EXT', 'GL_DRAW_BUFFER11_NV'),
+    0x8831 : ('GL_DRAW_BUFFER12', 'GL_DRAW_BUFFER12_EXT', 'GL_DRAW_BUFFER12_NV'),
+    0x8832 : ('GL_DRAW_BUFFER13', 'GL_DRAW_BUFFER13_EXT', 'GL_DRAW_BUFFER13_NV'),
+    0x8833 : ('GL_DRAW_BUFFER14', 'GL_DRAW_BUFFER14_EXT', 'GL_DRAW_BUFFER14_NV'),
+    0x8834 : ('GL_DRAW_BUFFER15', 'GL_DRAW_BUFFER15_EXT', 'GL_DRAW_BUFFER15_NV'),
+    0x8B5F : ('GL_SAMPLER_3D', 'GL_SAMPLER_3D_OES'),
+    0x8B62 : ('GL_SAMPLER_2D_SHADOW', 'GL_SAMPLER_2D_SHADOW_EXT'),
+    0x8B8B : ('GL_FRAGMENT_SHADER_DERIVATIVE_HINT', 'GL_FRAGMENT_SHADER_DERIVATIVE_HINT_OES'),
+    0x88EB : ('GL_PIXEL_PACK_BUFFER', 'GL_PIXEL_PACK_BUFFER_NV'),
+    0x88EC : ('GL_PIXEL_UNPACK_BUFFER', 'GL_PIXEL_UNPACK_BUFFER_NV'),
+    0x88ED : ('GL_PIXEL_PACK_BUFFER_BINDING', 'GL_PIXEL_PACK_BUFFER_BINDING_NV'),
+    0x88EF : ('GL_PIXEL_UNPACK_BUFFER_BINDING', 'GL_PIXEL_UNPACK_BUFFER_BINDING_NV'),
+    0x8B65 : ('GL_FLOAT_MAT2x3', 'GL_FLOAT_MAT2x3_NV'),
+    0x8B66 : ('GL_FLOAT_MAT2x4', 'GL_FLOAT_MAT2x4_NV'),
+    0x8B67 : ('GL_FLOAT_MAT3x2', 'GL_FLOAT_MAT3x2_NV'),
+    0x8B68 : ('GL_FLOAT_MAT3x4', 'GL_FLOAT_MAT3x4_NV'),
+    0x8B69 : ('GL_FLOAT_MAT4x2', 'GL_FLOAT_MAT4x2_NV'),
+    0x8B6A : ('GL_FLOAT_MAT4x3', 'GL_FLOAT_MAT4x3_NV'),
+    0x8C40 : ('GL_SRGB', 'GL_SRGB_EXT'),
+    0x8C41 : ('GL_SRGB8', 'GL_SRGB8_NV'),
+    0x8C43 : ('GL_SRGB8_ALPHA8', 'GL_SRGB8_ALPHA8_EXT'),
+    0x884E : ('GL_COMPARE_REF_TO_TEXTURE', 'GL_COMPARE_REF_TO_TEXTURE_EXT'),
+    0x8814 : ('GL_RGBA32F', 'GL_RGBA32F_EXT'),
+    0x8815 : ('GL_RGB32F', 'GL_RGB32F_EXT'),
+    0x881A : ('GL_RGBA16F', 'GL_RGBA16F_EXT'),
+    0x881B : ('GL_RGB16F', 'GL_RGB16F_EXT'),
+    0x8C3A : ('GL_R11F_G11F_B10F', 'GL_R11F_G11F_B10F_APPLE'),
+    0x8C3B : ('GL_UNSIGNED_INT_10F_11F_11F_REV', 'GL_UNSIGNED_INT_10F_11F_11F_REV_APPLE'),
+    0x8C3D : ('GL_RGB9_E5', 'GL_RGB9_E5_APPLE'),
+    0x8C3E : ('GL_UNSIGNED_INT_5_9_9_9_REV', 'GL_UNSIGNED_INT_5_9_9_9_REV_APPLE'),
+    0x8DC4 : ('GL_SAMPLER_2D_ARRAY_SHADOW', 'GL_SAMPLER_2D_ARRAY_SHADOW_NV'),
+    0x8DC5 : ('GL_SAMPLER_CUBE_SHADOW', 'GL_SAMPLER_CUBE_SHADOW_NV'),
+    0x8210 : ('GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING', 'GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING_EXT'),
+    0x8211 : ('GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE', 'GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE_EXT'),
+    0x8219 : ('GL_FRAMEBUFFER_UNDEFINED', 'GL_FRAMEBUFFER_UNDEFINED_OES'),
+    0x84F9 : ('GL_DEPTH_STENCIL', 'GL_DEPTH_STENCIL_OES'),
+    0x84FA : ('GL_UNSIGNED_INT_24_8', 'GL_UNSIGNED_INT_24_8_OES'),
+    0x88F0 : ('GL_DEPTH24_STENCIL8', 'GL_DEPTH24_STENCIL8_OES'),
+    0x8C17 : ('GL_UNSIGNED_NORMALIZED', 'GL_UNSIGNED_NORMALIZED_EXT'),
+    0x8CA8 : ('GL_READ_FRAMEBUFFER', 'GL_READ_FRAMEBUFFER_ANGLE', 'GL_READ_FRAMEBUFFER_APPLE', 'GL_READ_FRAMEBUFFER_NV'),
+    0x8CA9 : ('GL_DRAW_FRAMEBUFFER', 'GL_DRAW_FRAMEBUFFER_ANGLE', 'GL_DRAW_FRAMEBUFFER_APPLE', 'GL_DRAW_FRAMEBUFFER_NV'),
+    0x8CAA : ('GL_READ_FRAMEBUFFER_BINDING', 'GL_READ_FRAMEBUFFER_BINDING_ANGLE', 'GL_READ_FRAMEBUFFER_BINDING_APPLE', 'GL_READ_FRAMEBUFFER_BINDING_NV'),
+    0x8CAB : ('GL_RENDERBUFFER_SAMPLES', 'GL_RENDERBUFFER_SAMPLES_ANGLE', 'GL_RENDERBUFFER_SAMPLES_APPLE', 'GL_RENDERBUFFER_SAMPLES_EXT', 'GL_RENDERBUFFER_SAMPLES_NV'),
+    0x8CD4 : ('GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER', 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_3D_ZOFFSET_OES'),
+    0x8CDF : ('GL_MAX_COLOR_ATTACHMENTS', 'GL_MAX_COLOR_ATTACHMENTS_EXT', 'GL_MAX_COLOR_ATTACHMENTS_NV'),
+    0x8CE1 : ('GL_COLOR_ATTACHMENT1', 'GL_COLOR_ATTACHMENT1_EXT', 'GL_COLOR_ATTACHMENT1_NV'),
+    0x8CE2 : ('GL_COLOR_ATTACHMENT2', 'GL_COLOR_ATTACHMENT2_EXT', 'GL_COLOR_ATTACHMENT2_NV'),
+    0x8CE3 : ('GL_COLOR_ATTACHMENT3', 'GL_COLOR_ATTACHMENT3_EXT', 'GL_COLOR_ATTACHMENT3_NV'),
+    0x8CE4 : ('GL_COLOR_ATTACHMENT4', 'GL_COLOR_ATTACHMENT4_EXT', 'GL_COLOR_ATTACHMENT4_NV'),
+    0x8CE5 : ('GL_COLOR_ATTACHMENT5', 'GL_COLOR_ATTACHMENT5_EXT', 'GL_COLOR_ATTACHMENT5_NV'),
+    0x8CE6 : ('GL_COLOR_ATTACHMENT6', 'GL_COLOR_ATTACHMENT6_EXT', 'GL_COLOR_ATTACHMENT6_NV'),
+    0x8CE7 : ('GL_COLOR_ATTACHMENT7', 'GL_COLOR_ATTACHMENT7_EXT', 'GL_COLOR_ATTACHMENT7_NV'),
+    0x8CE8 : ('GL_COLOR_ATTACHMENT8', 'GL_COLOR_ATTACHMENT8_EXT', 'GL_COLOR_ATTACHMENT8_NV'),
+    0x8CE9 : ('GL_COLOR_ATTACHMENT9', 'GL_COLOR_ATTACHMENT9_EXT', 'GL_COLOR_ATTACHMENT9_NV'),
+    0x8CEA : ('GL_COLOR_ATTACHMENT10', 'GL_COLOR_ATTACHMENT10_EXT', 'GL_COLOR_ATTACHMENT10_NV'),
+    0x8CEB : ('GL_COLOR_ATTACHMENT11', 'GL_COLOR_ATTACHMENT11_EXT', 'GL_COLOR_ATTACHMENT11_NV'),
+    0x8CEC : ('GL_COLOR_ATTACHMENT12', 'GL_COLOR_ATTACHMENT12_EXT', 'GL_COLOR_ATTACHMENT12_NV'),
+    0x8CED : ('GL_COLOR_ATTACHMENT13', 'GL_COLOR_ATTACHMENT13_EXT', 'GL_COLOR_ATTACHMENT13_NV'),
+    0x8CEE : ('GL_COLOR_ATTACHMENT14', 'GL_COLOR_ATTACHMENT14_EXT', 'GL_COLOR_ATTACHMENT14_NV'),
+    0x8CEF : ('GL_COLOR_ATTACHMENT15', 'GL_COLOR_ATTACHMENT15_EXT', 'GL_COLOR_ATTACHMENT15_NV'),
+    0x8D56 : ('GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE', 'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_ANGLE', 'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_APPLE', 'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_EXT', 'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE_NV'),
+    0x8D57 : ('GL_MAX_SAMPLES', 'GL_MAX_SAMPLES_ANGLE', 'GL_MAX_SAMPLES_APPLE', 'GL_MAX_SAMPLES_EXT', 'GL_MAX_SAMPLES_NV'),
+    0x0008 : ('GL_MAP_INVALIDATE_BUFFER_BIT', 'GL_TEXTURE_FETCH_BARRIER_BIT', 'GL_TESS_CONTROL_SHADER_BIT', 'GL_MAP_INVALIDATE_BUFFER_BIT_EXT', 'GL_LUID_SIZE_EXT', 'GL_TESS_CONTROL_SHADER_BIT_EXT', 'GL_CONTEXT_FLAG_NO_ERROR_BIT_KHR', 'GL_SUBGROUP_FEATURE_BALLOT_BIT_KHR', 'GL_VERTICAL_LINE_TO_NV', 'GL_GLYPH_HORIZONTAL_BEARING_Y_BIT_NV', 'GL_TESS_CONTROL_SHADER_BIT_OES', 'GL_COLOR_BUFFER_BIT3_QCOM'),
+    0x0010 : ('GL_MAP_FLUSH_EXPLICIT_BIT', 'GL_TESS_EVALUATION_SHADER_BIT', 'GL_MAP_FLUSH_EXPLICIT_BIT_EXT', 'GL_UUID_SIZE_EXT', 'GL_CONTEXT_FLAG_PROTECTED_CONTENT_BIT_EXT', 'GL_TESS_EVALUATION_SHADER_BIT_EXT', 'GL_SUBGROUP_FEATURE_SHUFFLE_BIT_KHR', 'GL_SMOOTH_CUBIC_CURVE_TO_NV', 'GL_GLYPH_HORIZONTAL_BEARING_ADVANCE_BIT_NV', 'GL_TESS_EVALUATION_SHADER_BIT_OES', 'GL_COLOR_BUFFER_BIT4_QCOM'),
+    0x0020 : ('GL_MAP_UNSYNCHRONIZED_BIT', 'GL_COMPUTE_SHADER_BIT', 'GL_SHADER_IMAGE_ACCESS_BARRIER_BIT', 'GL_MAP_UNSYNCHRONIZED_BIT_EXT', 'GL_SUBGROUP_FEATURE_SHUFFLE_RELATIVE_BIT_KHR', 'GL_GLYPH_VERTICAL_BEARING_X_BIT_NV', 'GL_COLOR_BUFFER_BIT5_QCOM'),
+    0x8227 : ('GL_RG', 'GL_RG_EXT'),
+    0x8229 : ('GL_R8', 'GL_R8_EXT'),
+    0x822B : ('GL_RG8', 'GL_RG8_EXT'),
+    0x822D : ('GL_R16F', 'GL_R16F_EXT'),
+    0x822E : ('GL_R32F', 'GL_R32F_EXT'),
+    0x822F : ('GL_RG16F', 'GL_RG16F_EXT'),
+    0x8230 : ('GL_RG32F', 'GL_RG32F_EXT'),
+    0x85B5 : ('GL_VERTEX_ARRAY_BINDING', 'GL_VERTEX_ARRAY_BINDING_OES'),
+    0x8F36 : ('GL_COPY_READ_BUFFER', 'GL_COPY_READ_BUFFER_BINDING', 'GL_COPY_READ_BUFFER_NV'),
+    0x8F37 : ('GL_COPY_WRITE_BUFFER', 'GL_COPY_WRITE_BUFFER_BINDING', 'GL_COPY_WRITE_BUFFER_NV'),
+    0xFFFFFFFF : ('GL_INVALID_INDEX', 'GL_ALL_SHADER_BITS', 'GL_ALL_BARRIER_BITS', 'GL_ALL_SHADER_BITS_EXT'),
+    0x9111 : ('GL_MAX_SERVER_WAIT_TIMEOUT', 'GL_MAX_SERVER_WAIT_TIMEOUT_APPLE'),
+    0x9112 : ('GL_OBJECT_TYPE', 'GL_OBJECT_TYPE_APPLE'),
+    0x9113 : ('GL_SYNC_CONDITION', 'GL_SYNC_CONDITION_APPLE'),
+    0x9114 : ('GL_SYNC_STATUS', 'GL_SYNC_STATUS_APPLE'),
+    0x9115 : ('GL_SYNC_FLAGS', 'GL_SYNC_FLAGS_APPLE'),
+    0x9116 : ('GL_SYNC_FENCE', 'GL_SYNC_FENCE_APPLE'),
+    0x9117 : ('GL_SYNC_GPU_COMMANDS_COMPLETE', 'GL_SYNC_GPU_COMMANDS_COMPLETE_APPLE'),
+    0x9118 : ('GL_UNSIGNALED', 'GL_UNSIGNALED_APPLE'),
+    0x9119 : ('GL_SIGNALED', 'GL_SIGNALED_APPLE'),
+    0x911A : ('GL_ALREADY_SIGNALED', 'GL_ALREADY_SIGNALED_APPLE'),
+    0x911B : ('GL_TIMEOUT_EXPIRED', 'GL_TIMEOUT_EXPIRED_APPLE'),
+    0x911C : ('GL_CONDITION_SATISFIED', 'GL_CONDITION_SATISFIED_APPLE'),
+    0x911D : ('GL_WAIT_FAILED', 'GL_WAIT_FAILED_APPLE'),
+    0xFFFFFFFFFFFFFFFF : ('GL_TIMEOUT_IGNORED', 'GL_TIMEOUT_IGNORED_APPLE'),
+    0x88FE : ('GL_VERTEX_ATTRIB_ARRAY_DIVISOR', 'GL_VERTEX_ATTRIB_ARRAY_DIVISOR_ANGLE', 'GL_VERTEX_ATTRIB_ARRAY_DIVISOR_EXT', 'GL_VERTEX_ATTRIB_ARRAY_DIVISOR_NV'),
+    0x8C2F : ('GL_ANY_SAMPLES_PASSED', 'GL_ANY_SAMPLES_PASSED_EXT'),
+    0x8D6A : ('GL_ANY_SAMPLES_PASSED_CONSERVATIVE', 'GL_ANY_SAMPLES_PASSED_CONSERVATIVE_EXT'),
+    0x1904 : ('GL_GREEN', 'GL_GREEN_NV'),
+    0x1905 : ('GL_BLUE', 'GL_BLUE_NV'),
+    0x8741 : ('GL_PROGRAM_BINARY_LENGTH', 'GL_PROGRAM_BINARY_LENGTH_OES'),
+    0x87FE : ('GL_NUM_PROGRAM_BINARY_FORMATS', 'GL_NUM_PROGRAM_BINARY_FORMATS_OES'),
+    0x87FF : ('GL_PROGRAM_BINARY_FORMATS', 'GL_PROGRAM_BINARY_FORMATS_OES'),
+    0x912F : ('GL_TEXTURE_IMMUTABLE_FORMAT', 'GL_TEXTURE_IMMUTABLE_FORMAT_EXT'),
+    0x8258 : ('GL_PROGRAM_SEPARABLE', 'GL_PROGRAM_SEPARABLE_EXT'),
+    0x8259 : ('GL_ACTIVE_PROGRAM', 'GL_ACTIVE_PROGRAM_EXT'),
+    0x825A : ('GL_PROGRAM_PIPELINE_BINDING', 'GL_PROGRAM_PIPELINE_BINDING_EXT'),
+    0x0040 : ('GL_COMMAND_BARRIER_BIT', 'GL_MAP_PERSISTENT_BIT_EXT', 'GL_SUBGROUP_FEATURE_CLUSTERED_BIT_KHR', 'GL_MESH_SHADER_BIT_NV', 'GL_GLYPH_VERTICAL_BEARING_Y_BIT_NV', 'GL_COLOR_BUFFER_BIT6_QCOM'),
+    0x0080 : ('GL_PIXEL_BUFFER_BARRIER_BIT', 'GL_MAP_COHERENT_BIT_EXT', 'GL_SUBGROUP_FEATURE_QUAD_BIT_KHR', 'GL_TASK_SHADER_BIT_NV', 'GL_GLYPH_VERTICAL_BEARING_ADVANCE_BIT_NV', 'GL_COLOR_BUFFER_BIT7_QCOM'),
+    0x0800 : ('GL_TRANSFORM_FEEDBACK_BARRIER_BIT', 'GL_DEPTH_BUFFER_BIT3_QCOM'),
+    0x1000 : ('GL_ATOMIC_COUNTER_BARRIER_BIT', 'GL_TEXTURE_WIDTH', 'GL_DEPTH_BUFFER_BIT4_QCOM'),
+    0x88B9 : ('GL_WRITE_ONLY', 'GL_WRITE_ONLY_OES'),
+    0x2000 : ('GL_SHADER_STORAGE_BARRIER_BIT', 'GL_DEPTH_BUFFER_BIT5_QCOM'),
+    0x1901 : ('GL_STENCIL_INDEX', 'GL_STENCIL_INDEX_OES'),
+    0x8E50 : ('GL_SAMPLE_POSITION', 'GL_SAMPLE_LOCATION_NV'),
+    0x9294 : ('GL_MULTIPLY', 'GL_MULTIPLY_KHR', 'GL_MULTIPLY_NV'),
+    0x9295 : ('GL_SCREEN', 'GL_SCREEN_KHR', 'GL_SCREEN_NV'),
+    0x9296 : ('GL_OVERLAY', 'GL_OVERLAY_KHR', 'GL_OVERLAY_NV'),
+    0x9297 : ('GL_DARKEN', 'GL_DARKEN_KHR', 'GL_DARKEN_NV'),
+    0x9298 : ('GL_LIGHTEN', 'GL_LIGHTEN_KHR', 'GL_LIGHTEN_NV'),
+    0x9299 : ('GL_COLORDODGE', 'GL_COLORDODGE_KHR', 'GL_COLORDODGE_NV'),
+    0x929A : ('GL_COLORBURN', 'GL_COLORBURN_KHR', 'GL_COLORBURN_NV'),
+    0x929B : ('GL_HARDLIGHT', 'GL_HARDLIGHT_KHR', 'GL_HARDLIGHT_NV'),
+    0x929C : ('GL_SOFTLIGHT', 'GL_SOFTLIGHT_KHR', 'GL_SOFTLIGHT_NV'),
+    0x929E : ('GL_DIFFERENCE', 'GL_DIFFERENCE_KHR', 'GL_DIFFERENCE_NV'),
+    0x92A0 : ('GL_EXCLUSION', 'GL_EXCLUSION_KHR', 'GL_EXCLUSION_NV'),
+    0x92AD : ('GL_HSL_HUE', 'GL_HSL_HUE_KHR', 'GL_HSL_HUE_NV'),
+    0x92AE : ('GL_HSL_SATURATION', 'GL_HSL_SATURATION_KHR', 'GL_HSL_SATURATION_NV'),
+    0x92AF : ('GL_HSL_COLOR', 'GL_HSL_COLOR_KHR', 'GL_HSL_COLOR_NV'),
+    0x92B0 : ('GL_HSL_LUMINOSITY', 'GL_HSL_LUMINOSITY_KHR', 'GL_HSL_LUMINOSITY_NV'),
+    0x8242 : ('GL_DEBUG_OUTPUT_SYNCHRONOUS', 'GL_DEBUG_OUTPUT_SYNCHRONOUS_KHR'),
+    0x8243 : ('GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH', 'GL_DEBUG_NEXT_LOGGED_MESSAGE_LENGTH_KHR'),
+    0x8244 : ('GL_DEBUG_CALLBACK_FUNCTION', 'GL_DEBUG_CALLBACK_FUNCTION_KHR'),
+    0x8245 : ('GL_DEBUG_CALLBACK_USER_PARAM', 'GL_DEBUG_CALLBACK_USER_PARAM_KHR'),
+    0x8246 : ('GL_DEBUG_SOURCE_API', 'GL_DEBUG_SOURCE_API_KHR'),
+    0x8247 : ('GL_DEBUG_SOURCE_WINDOW_SYSTEM', 'GL_DEBUG_SOURCE_WINDOW_SYSTEM_KHR'),
+    0x8248 : ('GL_DEBUG_SOURCE_SHADER_COMPILER', 'GL_DEBUG_SOURCE_SHADER_COMPILER_KHR'),
+    0x8249 : ('GL_DEBUG_SOURCE_THIRD_PARTY', 'GL_DEBUG_SOURCE_THIRD_PARTY_KHR'),
+    0x824A : ('GL_DEBUG_SOURCE_APPLICATION', 'GL_DEBUG_SOURCE_APPLICATION_KHR'),
+    0x824B : ('GL_DEBUG_SOURCE_OTHER', 'GL_DEBUG_SOURCE_OTHER_KHR'),
+    0x824C : ('GL_DEBUG_TYPE_ERROR', 'GL_DEBUG_TYPE_ERROR_KHR'),
+    0x824D : ('GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR', 'GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR_KHR'),
+    0x824E : ('GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR', 'GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR_KHR'),
+    0x824F : ('GL_DEBUG_TYPE_PORTABILITY', 'GL_DEBUG_TYPE_PORTABILITY_KHR'),
+    0x8250 : ('GL_DEBUG_TYPE_PERFORMANCE', 'GL_DEBUG_TYPE_PERFORMANCE_KHR'),
+    0x8251 : ('GL_DEBUG_TYPE_OTHER', 'GL_DEBUG_TYPE_OTHER_KHR'),
+    0x8268 : ('GL_DEBUG_TYPE_MARKER', 'GL_DEBUG_TYPE_MARKER_KHR'),
+    0x8269 : ('GL_DEBUG_TYPE_PUSH_GROUP', 'GL_DEBUG_TYPE_PUSH_GROUP_KHR'),
+    0x826A : ('GL_DEBUG_TYPE_POP_GROUP', 'GL_DEBUG_TYPE_POP_GROUP_KHR'),
+    0x826B : ('GL_DEBUG_SEVERITY_NOTIFICATION', 'GL_DEBUG_SEVERITY_NOTIFICATION_KHR'),
+    0x826C : ('GL_MAX_DEBUG_GROUP_STACK_DEPTH', 'GL_MAX_DEBUG_GROUP_STACK_DEPTH_KHR'),
+    0x826D : ('GL_DEBUG_GROUP_STACK_DEPTH', 'GL_DEBUG_GROUP_STACK_DEPTH_KHR'),
+    0x82E0 : ('GL_BUFFER', 'GL_BUFFER_KHR'),
+    0x82E1 : ('GL_SHADER', 'GL_SHADER_KHR'),
+    0x82E2 : ('GL_PROGRAM', 'GL_PROGRAM_KHR'),
+    0x8074 : ('GL_VERTEX_ARRAY', 'GL_VERTEX_ARRAY_KHR'),
+    0x82E3 : ('GL_QUERY', 'GL_QUERY_KHR'),
+    0x82E4 : ('GL_PROGRAM_PIPELINE', 'GL_PROGRAM_PIPELINE_KHR'),
+    0x82E6 : ('GL_SAMPLER', 'GL_SAMPLER_KHR'),
+    0x82E8 : ('GL_MAX_LABEL_LENGTH', 'GL_MAX_LABEL_LENGTH_KHR'),
+    0x9143 : ('GL_MAX_DEBUG_MESSAGE_LENGTH', 'GL_MAX_DEBUG_MESSAGE_LENGTH_KHR'),
+    0x9144 : ('GL_MAX_DEBUG_LOGGED_MESSAGES', 'GL_MAX_DEBUG_LOGGED_MESSAGES_KHR'),
+    0x9145 : ('GL_DEBUG_LOGGED_MESSAGES', 'GL_DEBUG_LOGGED_MESSAGES_KHR'),
+    0x9146 : ('GL_DEBUG_SEVERITY_HIGH', 'GL_DEBUG_SEVERITY_HIGH_KHR'),
+    0x9147 : ('GL_DEBUG_SEVERITY_MEDIUM', 'GL_DEBUG_SEVERITY_MEDIUM_KHR'),
+    0x9148 : ('GL_DEBUG_SEVERITY_LOW', 'GL_DEBUG_SEVERITY_LOW_KHR'),
+    0x92E0 : ('GL_DEBUG_OUTPUT', 'GL_DEBUG_OUTPUT_KHR'),
+    0x0503 : ('GL_STACK_OVERFLOW', 'GL_STACK_OVERFLOW_KHR'),
+    0x0504 : ('GL_STACK_UNDERFLOW', 'GL_STACK_UNDERFLOW_KHR'),
+    0x8DD9 : ('GL_GEOMETRY_SHADER', 'GL_GEOMETRY_SHADER_EXT', 'GL_GEOMETRY_SHADER_OES'),
+    0x8916 : ('GL_GEOMETRY_VERTICES_OUT', 'GL_GEOMETRY_LINKED_VERTICES_OUT_EXT', 'GL_GEOMETRY_LINKED_VERTICES_OUT_OES'),
+    0x8917 : ('GL_GEOMETRY_INPUT_TYPE', 'GL_GEOMETRY_LINKED_INPUT_TYPE_EXT', 'GL_GEOMETRY_LINKED_INPUT_TYPE_OES'),
+    0x8918 : ('GL_GEOMETRY_OUTPUT_TYPE', 'GL_GEOMETRY_LINKED_OUTPUT_TYPE_EXT', 'GL_GEOMETRY_LINKED_OUTPUT_TYPE_OES'),
+    0x887F : ('GL_GEOMETRY_SHADER_INVOCATIONS', 'GL_GEOMETRY_SHADER_INVOCATIONS_EXT', 'GL_GEOMETRY_SHADER_INVOCATIONS_OES'),
+    0x825E : ('GL_LAYER_PROVOKING_VERTEX', 'GL_LAYER_PROVOKING_VERTEX_EXT', 'GL_LAYER_PROVOKING_VERTEX_OES'),
+    0x000A : ('GL_LINES_ADJACENCY', 'GL_LINES_ADJACENCY_EXT', 'GL_QUADRATIC_CURVE_TO_NV', 'GL_LINES_ADJACENCY_OES'),
+    0x000B : ('GL_LINE_STRIP_ADJACENCY', 'GL_LINE_STRIP_ADJACENCY_EXT', 'GL_RELATIVE_QUADRATIC_CURVE_TO_NV', 'GL_LINE_STRIP_ADJACENCY_OES'),
+    0x000C : ('GL_TRIANGLES_ADJACENCY', 'GL_TRIANGLES_ADJACENCY_EXT', 'GL_CUBIC_CURVE_TO_NV', 'GL_TRIANGLES_ADJACENCY_OES'),
+    0x000D : ('GL_TRIANGLE_STRIP_ADJACENCY', 'GL_TRIANGLE_STRIP_ADJACENCY_EXT', 'GL_RELATIVE_CUBIC_CURVE_TO_NV', 'GL_TRIANGLE_STRIP_ADJACENCY_OES'),
+    0x8DDF : ('GL_MAX_GEOMETRY_UNIFORM_COMPONENTS', 'GL_MAX_GEOMETRY_UNIFORM_COMPONENTS_EXT', 'GL_MAX_GEOMETRY_UNIFORM_COMPONENTS_OES'),
+    0x8A2C : ('GL_MAX_GEOMETRY_UNIFORM_BLOCKS', 'GL_MAX_GEOMETRY_UNIFORM_BLOCKS_EXT', 'GL_MAX_GEOMETRY_UNIFORM_BLOCKS_OES'),
+    0x8A32 : ('GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS', 'GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS_EXT', 'GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS_OES'),
+    0x9123 : ('GL_MAX_GEOMETRY_INPUT_COMPONENTS', 'GL_MAX_GEOMETRY_INPUT_COMPONENTS_EXT', 'GL_MAX_GEOMETRY_INPUT_COMPONENTS_OES'),
+    0x9124 : ('GL_MAX_GEOMETRY_OUTPUT_COMPONENTS', 'GL_MAX_GEOMETRY_OUTPUT_COMPONENTS_EXT', 'GL_MAX_GEOMETRY_OUTPUT_COMPONENTS_OES'),
+    0x8DE0 : ('GL_MAX_GEOMETRY_OUTPUT_VERTICES', 'GL_MAX_GEOMETRY_OUTPUT_VERTICES_EXT', 'GL_MAX_GEOMETRY_OUTPUT_VERTICES_OES'),
+    0x8DE1 : ('GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS', 'GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS_EXT', 'GL_MAX_GEOMETRY_TOTAL_OUTPUT_COMPONENTS_OES'),
+    0x8E5A : ('GL_MAX_GEOMETRY_SHADER_INVOCATIONS', 'GL_MAX_GEOMETRY_SHADER_INVOCATIONS_EXT', 'GL_MAX_GEOMETRY_SHADER_INVOCATIONS_OES'),
+    0x8C29 : ('GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS', 'GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS_EXT', 'GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS_OES'),
+    0x92CF : ('GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS', 'GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS_EXT', 'GL_MAX_GEOMETRY_ATOMIC_COUNTER_BUFFERS_OES'),
+    0x92D5 : ('GL_MAX_GEOMETRY_ATOMIC_COUNTERS', 'GL_MAX_GEOMETRY_ATOMIC_COUNTERS_EXT', 'GL_MAX_GEOMETRY_ATOMIC_COUNTERS_OES'),
+    0x90CD : ('GL_MAX_GEOMETRY_IMAGE_UNIFORMS', 'GL_MAX_GEOMETRY_IMAGE_UNIFORMS_EXT', 'GL_MAX_GEOMETRY_IMAGE_UNIFORMS_OES'),
+    0x90D7 : ('GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS', 'GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS_EXT', 'GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS_OES'),
+    0x8E4D : ('GL_FIRST_VERTEX_CONVENTION', 'GL_FIRST_VERTEX_CONVENTION_EXT', 'GL_FIRST_VERTEX_CONVENTION_OES'),
+    0x8E4E : ('GL_LAST_VERTEX_CONVENTION', 'GL_LAST_VERTEX_CONVENTION_EXT', 'GL_LAST_VERTEX_CONVENTION_OES'),
+    0x8260 : ('GL_UNDEFINED_VERTEX', 'GL_UNDEFINED_VERTEX_EXT', 'GL_UNDEFINED_VERTEX_OES'),
+    0x8C87 : ('GL_PRIMITIVES_GENERATED', 'GL_PRIMITIVES_GENERATED_EXT', 'GL_PRIMITIVES_GENERATED_OES'),
+    0x9312 : ('GL_FRAMEBUFFER_DEFAULT_LAYERS', 'GL_FRAMEBUFFER_DEFAULT_LAYERS_EXT', 'GL_FRAMEBUFFER_DEFAULT_LAYERS_OES'),
+    0x9317 : ('GL_MAX_FRAMEBUFFER_LAYERS', 'GL_MAX_FRAMEBUFFER_LAYERS_EXT', 'GL_MAX_FRAMEBUFFER_LAYERS_OES'),
+    0x8DA8 : ('GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS', 'GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS_EXT', 'GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS_OES'),
+    0x8DA7 : ('GL_FRAMEBUFFER_ATTACHMENT_LAYERED', 'GL_FRAMEBUFFER_ATTACHMENT_LAYERED_EXT', 'GL_FRAMEBUFFER_ATTACHMENT_LAYERED_OES'),
+    0x9309 : ('GL_REFERENCED_BY_GEOMETRY_SHADER', 'GL_REFERENCED_BY_GEOMETRY_SHADER_EXT', 'GL_REFERENCED_BY_GEOMETRY_SHADER_OES'),
+    0x92BE : ('GL_PRIMITIVE_BOUNDING_BOX', 'GL_PRIMITIVE_BOUNDING_BOX_EXT', 'GL_PRIMITIVE_BOUNDING_BOX_OES'),
+    0x8252 : ('GL_LOSE_CONTEXT_ON_RESET', 'GL_LOSE_CONTEXT_ON_RESET_EXT', 'GL_LOSE_CONTEXT_ON_RESET_KHR'),
+    0x8253 : ('GL_GUILTY_CONTEXT_RESET', 'GL_GUILTY_CONTEXT_RESET_EXT', 'GL_GUILTY_CONTEXT_RESET_KHR'),
+    0x8254 : ('GL_INNOCENT_CONTEXT_RESET', 'GL_INNOCENT_CONTEXT_RESET_EXT', 'GL_INNOCENT_CONTEXT_RESET_KHR'),
+    0x8255 : ('GL_UNKNOWN_CONTEXT_RESET', 'GL_UNKNOWN_CONTEXT_RESET_EXT', 'GL_UNKNOWN_CONTEXT_RESET_KHR'),
+    0x8256 : ('GL_RESET_NOTIFICATION_STRATEGY', 'GL_RESET_NOTIFICATION_STRATEGY_EXT', 'GL_RESET_NOTIFICATION_STRATEGY_KHR'),
+    0x8261 : ('GL_NO_RESET_NOTIFICATION', 'GL_NO_RESET_NOTIFICATION_EXT', 'GL_NO_RESET_NOTIFICATION_KHR'),
+    0x0507 : ('GL_CONTEXT_LOST', 'GL_CONTEXT_LOST_KHR'),
+    0x8C36 : ('GL_SAMPLE_SHADING', 'GL_SAMPLE_SHADING_OES'),
+    0x8C37 : ('GL_MIN_SAMPLE_SHADING_VALUE', 'GL_MIN_SAMPLE_SHADING_VALUE_OES'),
+    0x8E5B : ('GL_MIN_FRAGMENT_INTERPOLATION_OFFSET', 'GL_MIN_FRAGMENT_INTERPOLATION_OFFSET_OES'),
+    0x8E5C : ('GL_MAX_FRAGMENT_INTERPOLATION_OFFSET', 'GL_MAX_FRAGMENT_INTERPOLATION_OFFSET_OES'),
+    0x8E5D : ('GL_FRAGMENT_INTERPOLATION_OFFSET_BITS', 'GL_FRAGMENT_INTERPOLATION_OFFSET_BITS_OES'),
+    0x000E : ('GL_PATCHES', 'GL_PATCHES_EXT', 'GL_SMOOTH_QUADRATIC_CURVE_TO_NV', 'GL_PATCHES_OES'),
+    0x8E72 : ('GL_PATCH_VERTICES', 'GL_PATCH_VERTICES_EXT', 'GL_PATCH_VERTICES_OES'),
+    0x8E75 : ('GL_TESS_CONTROL_OUTPUT_VERTICES', 'GL_TESS_CONTROL_OUTPUT_VERTICES_EXT', 'GL_TESS_CONTROL_OUTPUT_VERTICES_OES'),
+    0x8E76 : ('GL_TESS_GEN_MODE', 'GL_TESS_GEN_MODE_EXT', 'GL_TESS_GEN_MODE_OES'),
+    0x8E77 : ('GL_TESS_GEN_SPACING', 'GL_TESS_GEN_SPACING_EXT', 'GL_TESS_GEN_SPACING_OES'),
+    0x8E78 : ('GL_TESS_GEN_VERTEX_ORDER', 'GL_TESS_GEN_VERTEX_ORDER_EXT', 'GL_TESS_GEN_VERTEX_ORDER_OES'),
+    0x8E79 : ('GL_TESS_GEN_POINT_MODE', 'GL_TESS_GEN_POINT_MODE_EXT', 'GL_TESS_GEN_POINT_MODE_OES'),
+    0x8E7A : ('GL_ISOLINES', 'GL_ISOLINES_EXT', 'GL_ISOLINES_OES'),
+    0x0007 : ('GL_QUADS', 'GL_QUADS_EXT', 'GL_RELATIVE_HORIZONTAL_LINE_TO_NV', 'GL_QUADS_OES'),
+    0x8E7B : ('GL_FRACTIONAL_ODD', 'GL_FRACTIONAL_ODD_EXT', 'GL_FRACTIONAL_ODD_OES'),
+    0x8E7C : ('GL_FRACTIONAL_EVEN', 'GL_FRACTIONAL_EVEN_EXT', 'GL_FRACTIONAL_EVEN_OES'),
+    0x8E7D : ('GL_MAX_PATCH_VERTICES', 'GL_MAX_PATCH_VERTICES_EXT', 'GL_MAX_PATCH_VERTICES_OES'),
+    0x8E7E : ('GL_MAX_TESS_GEN_LEVEL', 'GL_MAX_TESS_GEN_LEVEL_EXT', 'GL_MAX_TESS_GEN_LEVEL_OES'),
+    0x8E7F : ('GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS', 'GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS_EXT', 'GL_MAX_TESS_CONTROL_UNIFORM_COMPONENTS_OES'),
+    0x8E80 : ('GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS', 'GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS_EXT', 'GL_MAX_TESS_EVALUATION_UNIFORM_COMPONENTS_OES'),
+    0x8E81 : ('GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS', 'GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS_EXT', 'GL_MAX_TESS_CONTROL_TEXTURE_IMAGE_UNITS_OES'),
+    0x8E82 : ('GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS', 'GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS_EXT', 'GL_MAX_TESS_EVALUATION_TEXTURE_IMAGE_UNITS_OES'),
+    0x8E83 : ('GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS', 'GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS_EXT', 'GL_MAX_TESS_CONTROL_OUTPUT_COMPONENTS_OES'),
+    0x8E84 : ('GL_MAX_TESS_PATCH_COMPONENTS', 'GL_MAX_TESS_PATCH_COMPONENTS_EXT', 'GL_MAX_TESS_PATCH_COMPONENTS_OES'),
+    0x8E85 : ('GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS', 'GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS_EXT', 'GL_MAX_TESS_CONTROL_TOTAL_OUTPUT_COMPONENTS_OES'),
+    0x8E86 : ('GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS', 'GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS_EXT', 'GL_MAX_TESS_EVALUATION_OUTPUT_COMPONENTS_OES'),
+    0x8E89 : ('GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS', 'GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS_EXT', 'GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS_OES'),
+    0x8E8A : ('GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS', 'GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS_EXT', 'GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS_OES'),
+    0x886C : ('GL_MAX_TESS_CONTROL_INPUT_COMPONENTS', 'GL_MAX_TESS_CONTROL_INPUT_COMPONENTS_EXT', 'GL_MAX_TESS_CONTROL_INPUT_COMPONENTS_OES'),
+    0x886D : ('GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS', 'GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS_EXT', 'GL_MAX_TESS_EVALUATION_INPUT_COMPONENTS_OES'),
+    0x8E1E : ('GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS', 'GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS_EXT', 'GL_MAX_COMBINED_TESS_CONTROL_UNIFORM_COMPONENTS_OES'),
+    0x8E1F : ('GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS', 'GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS_EXT', 'GL_MAX_COMBINED_TESS_EVALUATION_UNIFORM_COMPONENTS_OES'),
+    0x92CD : ('GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS', 'GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS_EXT', 'GL_MAX_TESS_CONTROL_ATOMIC_COUNTER_BUFFERS_OES'),
+    0x92CE : ('GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS', 'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS_EXT', 'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTER_BUFFERS_OES'),
+    0x92D3 : ('GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS', 'GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS_EXT', 'GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS_OES'),
+    0x92D4 : ('GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS', 'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS_EXT', 'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS_OES'),
+    0x90CB : ('GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS', 'GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS_EXT', 'GL_MAX_TESS_CONTROL_IMAGE_UNIFORMS_OES'),
+    0x90CC : ('GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS', 'GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS_EXT', 'GL_MAX_TESS_EVALUATION_IMAGE_UNIFORMS_OES'),
+    0x90D8 : ('GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS', 'GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS_EXT', 'GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS_OES'),
+    0x90D9 : ('GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS', 'GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS_EXT', 'GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS_OES'),
+    0x8221 : ('GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED', 'GL_PRIMITIVE_RESTART_FOR_PATCHES_SUPPORTED_OES'),
+    0x92E7 : ('GL_IS_PER_PATCH', 'GL_IS_PER_PATCH_EXT', 'GL_IS_PER_PATCH_OES'),
+    0x9307 : ('GL_REFERENCED_BY_TESS_CONTROL_SHADER', 'GL_REFERENCED_BY_TESS_CONTROL_SHADER_EXT', 'GL_REFERENCED_BY_TESS_CONTROL_SHADER_OES'),
+    0x9308 : ('GL_REFERENCED_BY_TESS_EVALUATION_SHADER', 'GL_REFERENCED_BY_TESS_EVALUATION_SHADER_EXT', 'GL_REFERENCED_BY_TESS_EVALUATION_SHADER_OES'),
+    0x8E88 : ('GL_TESS_CONTROL_SHADER', 'GL_TESS_CONTROL_SHADER_EXT', 'GL_TESS_CONTROL_SHADER_OES'),
+    0x8E87 : ('GL_TESS_EVALUATION_SHADER', 'GL_TESS_EVALUATION_SHADER_EXT', 'GL_TESS_EVALUATION_SHADER_OES'),
+    0x1004 : ('GL_TEXTURE_BORDER_COLOR', 'GL_TEXTURE_BORDER_COLOR_EXT', 'GL_TEXTURE_BORDER_COLOR_NV', 'GL_TEXTURE_BORDER_COLOR_OES'),
+    0x812D : ('GL_CLAMP_TO_BORDER', 'GL_CLAMP_TO_BORDER_EXT', 'GL_CLAMP_TO_BORDER_NV', 'GL_CLAMP_TO_BORDER_OES'),
+    0x8C2A : ('GL_TEXTURE_BUFFER', 'GL_TEXTURE_BUFFER_BINDING', 'GL_TEXTURE_BUFFER_EXT', 'GL_TEXTURE_BUFFER_BINDING_EXT', 'GL_TEXTURE_BUFFER_OES', 'GL_TEXTURE_BUFFER_BINDING_OES'),
+    0x8C2B : ('GL_MAX_TEXTURE_BUFFER_SIZE', 'GL_MAX_TEXTURE_BUFFER_SIZE_EXT', 'GL_MAX_TEXTURE_BUFFER_SIZE_OES'),
+    0x8C2C : ('GL_TEXTURE_BINDING_BUFFER', 'GL_TEXTURE_BINDING_BUFFER_EXT', 'GL_TEXTURE_BINDING_BUFFER_OES'),
+    0x8C2D : ('GL_TEXTURE_BUFFER_DATA_STORE_BINDING', 'GL_TEXTURE_BUFFER_DATA_STORE_BINDING_EXT', 'GL_TEXTURE_BUFFER_DATA_STORE_BINDING_OES'),
+    0x919F : ('GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT', 'GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT_EXT', 'GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT_OES'),
+    0x8DC2 : ('GL_SAMPLER_BUFFER', 'GL_SAMPLER_BUFFER_EXT', 'GL_SAMPLER_BUFFER_OES'),
+    0x8DD0 : ('GL_INT_SAMPLER_BUFFER', 'GL_INT_SAMPLER_BUFFER_EXT', 'GL_INT_SAMPLER_BUFFER_OES'),
+    0x8DD8 : ('GL_UNSIGNED_INT_SAMPLER_BUFFER', 'GL_UNSIGNED_INT_SAMPLER_BUFFER_EXT', 'GL_UNSIGNED_INT_SAMPLER_BUFFER_OES'),
+    0x9051 : ('GL_IMAGE_BUFFER', 'GL_IMAGE_BUFFER_EXT', 'GL_IMAGE_BUFFER_OES'),
+    0x905C : ('GL_INT_IMAGE_BUFFER', 'GL_INT_IMAGE_BUFFER_EXT', 'GL_INT_IMAGE_BUFFER_OES'),
+    0x9067 : ('GL_UNSIGNED_INT_IMAGE_BUFFER', 'GL_UNSIGNED_INT_IMAGE_BUFFER_EXT', 'GL_UNSIGNED_INT_IMAGE_BUFFER_OES'),
+    0x919D : ('GL_TEXTURE_BUFFER_OFFSET', 'GL_TEXTURE_BUFFER_OFFSET_EXT', 'GL_TEXTURE_BUFFER_OFFSET_OES'),
+    0x919E : ('GL_TEXTURE_BUFFER_SIZE', 'GL_TEXTURE_BUFFER_SIZE_EXT', 'GL_TEXTURE_BUFFER_SIZE_OES'),
+    0x93B0 : ('GL_COMPRESSED_RGBA_ASTC_4x4', 'GL_COMPRESSED_RGBA_ASTC_4x4_KHR'),
+    0x93B1 : ('GL_COMPRESSED_RGBA_ASTC_5x4', 'GL_COMPRESSED_RGBA_ASTC_5x4_KHR'),
+    0x93B2 : ('GL_COMPRESSED_RGBA_ASTC_5x5', 'GL_COMPRESSED_RGBA_ASTC_5x5_KHR'),
+    0x93B3 : ('GL_COMPRESSED_RGBA_ASTC_6x5', 'GL_COMPRESSED_RGBA_ASTC_6x5_KHR'),
+    0x93B4 : ('GL_COMPRESSED_RGBA_ASTC_6x6', 'GL_COMPRESSED_RGBA_ASTC_6x6_KHR'),
+    0x93B5 : ('GL_COMPRESSED_RGBA_ASTC_8x5', 'GL_COMPRESSED_RGBA_ASTC_8x5_KHR'),
+    0x93B6 : ('GL_COMPRESSED_RGBA_ASTC_8x6', 'GL_COMPRESSED_RGBA_ASTC_8x6_KHR'),
+    0x93B7 : ('GL_COMPRESSED_RGBA_ASTC_8x8', 'GL_COMPRESSED_RGBA_ASTC_8x8_KHR'),
+    0x93B8 : ('GL_COMPRESSED_RGBA_ASTC_10x5', 'GL_COMPRESSED_RGBA_ASTC_10x5_KHR'),
+    0x93B9 : ('GL_COMPRESSED_RGBA_ASTC_10x6', 'GL_COMPRESSED_RGBA_ASTC_10x6_KHR'),
+    0x93BA : ('GL_COMPRESSED_RGBA_ASTC_10x8', 'GL_COMPRESSED_RGBA_ASTC_10x8_KHR'),
+    0x93BB : ('GL_COMPRESSED_RGBA_ASTC_10x10', 'GL_COMPRESSED_RGBA_ASTC_10x10_KHR'),
+    0x93BC : ('GL_COMPRESSED_RGBA_ASTC_12x10', 'GL_COMPRESSED_RGBA_ASTC_12x10_KHR'),
+    0x93BD : ('GL_COMPRESSED_RGBA_ASTC_12x12', 'GL_COMPRESSED_RGBA_ASTC_12x12_KHR'),
+    0x93D0 : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4_KHR'),
+    0x93D1 : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4_KHR'),
+    0x93D2 : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5_KHR'),
+    0x93D3 : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5_KHR'),
+    0x93D4 : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6_KHR'),
+    0x93D5 : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5_KHR'),
+    0x93D6 : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6_KHR'),
+    0x93D7 : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8_KHR'),
+    0x93D8 : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5_KHR'),
+    0x93D9 : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6_KHR'),
+    0x93DA : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8_KHR'),
+    0x93DB : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10_KHR'),
+    0x93DC : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10_KHR'),
+    0x93DD : ('GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12', 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12_KHR'),
+    0x9009 : ('GL_TEXTURE_CUBE_MAP_ARRAY', 'GL_TEXTURE_CUBE_MAP_ARRAY_OES', 'GL_TEXTURE_CUBE_MAP_ARRAY_EXT'),
+    0x900A : ('GL_TEXTURE_BINDING_CUBE_MAP_ARRAY', 'GL_TEXTURE_BINDING_CUBE_MAP_ARRAY_EXT', 'GL_TEXTURE_BINDING_CUBE_MAP_ARRAY_OES'),
+    0x900C : ('GL_SAMPLER_CUBE_MAP_ARRAY', 'GL_SAMPLER_CUBE_MAP_ARRAY_EXT', 'GL_SAMPLER_CUBE_MAP_ARRAY_OES'),
+    0x900D : ('GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW', 'GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW_EXT', 'GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW_OES'),
+    0x900E : ('GL_INT_SAMPLER_CUBE_MAP_ARRAY', 'GL_INT_SAMPLER_CUBE_MAP_ARRAY_EXT', 'GL_INT_SAMPLER_CUBE_MAP_ARRAY_OES'),
+    0x900F : ('GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY', 'GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY_EXT', 'GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY_OES'),
+    0x9054 : ('GL_IMAGE_CUBE_MAP_ARRAY', 'GL_IMAGE_CUBE_MAP_ARRAY_EXT', 'GL_IMAGE_CUBE_MAP_ARRAY_OES'),
+    0x905F : ('GL_INT_IMAGE_CUBE_MAP_ARRAY', 'GL_INT_IMAGE_CUBE_MAP_ARRAY_EXT', 'GL_INT_IMAGE_CUBE_MAP_ARRAY_OES'),
+    0x906A : ('GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY', 'GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY_EXT', 'GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY_OES'),
+    0x9102 : ('GL_TEXTURE_2D_MULTISAMPLE_ARRAY', 'GL_TEXTURE_2D_MULTISAMPLE_ARRAY_OES'),
+    0x9105 : ('GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY', 'GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY_OES'),
+    0x910B : ('GL_SAMPLER_2D_MULTISAMPLE_ARRAY', 'GL_SAMPLER_2D_MULTISAMPLE_ARRAY_OES'),
+    0x910C : ('GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY', 'GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY_OES'),
+    0x910D : ('GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY', 'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY_OES'),
+    0x83F2 : ('GL_COMPRESSED_RGBA_S3TC_DXT3_ANGLE', 'GL_COMPRESSED_RGBA_S3TC_DXT3_EXT'),
+    0x83F3 : ('GL_COMPRESSED_RGBA_S3TC_DXT5_ANGLE', 'GL_COMPRESSED_RGBA_S3TC_DXT5_EXT'),
+    0x0D32 : ('GL_MAX_CLIP_DISTANCES_APPLE', 'GL_MAX_CLIP_DISTANCES_EXT'),
+    0x3000 : ('GL_CLIP_DISTANCE0_APPLE', 'GL_CLIP_DISTANCE0_EXT'),
+    0x3001 : ('GL_CLIP_DISTANCE1_APPLE', 'GL_CLIP_DISTANCE1_EXT'),
+    0x3002 : ('GL_CLIP_DISTANCE2_APPLE', 'GL_CLIP_DISTANCE2_EXT'),
+    0x3003 : ('GL_CLIP_DISTANCE3_APPLE', 'GL_CLIP_DISTANCE3_EXT'),
+    0x3004 : ('GL_CLIP_DISTANCE4_APPLE', 'GL_CLIP_DISTANCE4_EXT'),
+    0x3005 : ('GL_CLIP_DISTANCE5_APPLE', 'GL_CLIP_DISTANCE5_EXT'),
+    0x3006 : ('GL_CLIP_DISTANCE6_APPLE', 'GL_CLIP_DISTANCE6_EXT'),
+    0x3007 : ('GL_CLIP_DISTANCE7_APPLE', 'GL_CLIP_DISTANCE7_EXT'),
+    0x80E1 : ('GL_BGRA_EXT', 'GL_BGRA_IMG'),
+    0x96A6 : ('GL_SHADING_RATE_1X1_PIXELS_EXT', 'GL_SHADING_RATE_1X1_PIXELS_QCOM'),
+    0x96A7 : ('GL_SHADING_RATE_1X2_PIXELS_EXT', 'GL_SHADING_RATE_1X2_PIXELS_QCOM'),
+    0x96A8 : ('GL_SHADING_RATE_2X1_PIXELS_EXT', 'GL_SHADING_RATE_2X1_PIXELS_QCOM'),
+    0x96A9 : ('GL_SHADING_RATE_2X2_PIXELS_EXT', 'GL_SHADING_RATE_2X2_PIXELS_QCOM'),
+    0x96AC : ('GL_SHADING_RATE_4X2_PIXELS_EXT', 'GL_SHADING_RATE_4X2_PIXELS_QCOM'),
+    0x96AE : ('GL_SHADING_RATE_4X4_PIXELS_EXT', 'GL_SHADING_RATE_4X4_PIXELS_QCOM'),
+    0x8365 : ('GL_UNSIGNED_SHORT_4_4_4_4_REV_EXT', 'GL_UNSIGNED_SHORT_4_4_4_4_REV_IMG'),
+    0x90F3 : ('GL_CONTEXT_ROBUST_ACCESS_EXT', 'GL_CONTEXT_ROBUST_ACCESS_KHR'),
+    0x9595 : ('GL_D3D12_FENCE_VALUE_EXT', 'GL_TIMELINE_SEMAPHORE_VALUE_NV'),
+    0x8C4C : ('GL_COMPRESSED_SRGB_S3TC_DXT1_EXT', 'GL_COMPRESSED_SRGB_S3TC_DXT1_NV'),
+    0x8C4D : ('GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT', 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_NV'),
+    0x8C4E : ('GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT', 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_NV'),
+    0x8C4F : ('GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT', 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_NV'),
+    0x803C : ('GL_ALPHA8_EXT', 'GL_ALPHA8_OES'),
+    0x8040 : ('GL_LUMINANCE8_EXT', 'GL_LUMINANCE8_OES'),
+    0x8045 : ('GL_LUMINANCE8_ALPHA8_EXT', 'GL_LUMINANCE8_ALPHA8_OES'),
+    0x82DB : ('GL_TEXTURE_VIEW_MIN_LEVEL_EXT', 'GL_TEXTURE_VIEW_MIN_LEVEL_OES'),
+    0x82DC : ('GL_TEXTURE_VIEW_NUM_LEVELS_EXT', 'GL_TEXTURE_VIEW_NUM_LEVELS_OES'),
+    0x82DD : ('GL_TEXTURE_VIEW_MIN_LAYER_EXT', 'GL_TEXTURE_VIEW_MIN_LAYER_OES'),
+    0x82DE : ('GL_TEXTURE_VIEW_NUM_LAYERS_EXT', 'GL_TEXTURE_VIEW_NUM_LAYERS_OES'),
+    0x9285 : ('GL_BLEND_ADVANCED_COHERENT_KHR', 'GL_BLEND_ADVANCED_COHERENT_NV'),
+    0x8000 : ('GL_COVERAGE_BUFFER_BIT_NV', 'GL_DEPTH_BUFFER_BIT7_QCOM'),
+    0x10000 : ('GL_FONT_X_MIN_BOUNDS_BIT_NV', 'GL_STENCIL_BUFFER_BIT0_QCOM'),
+    0x20000 : ('GL_FONT_Y_MIN_BOUNDS_BIT_NV', 'GL_STENCIL_BUFFER_BIT1_QCOM'),
+    0x40000 : ('GL_FONT_X_MAX_BOUNDS_BIT_NV', 'GL_STENCIL_BUFFER_BIT2_QCOM'),
+    0x80000 : ('GL_FONT_Y_MAX_BOUNDS_BIT_NV', 'GL_STENCIL_BUFFER_BIT3_QCOM'),
+    0x100000 : ('GL_FONT_UNITS_PER_EM_BIT_NV', 'GL_STENCIL_BUFFER_BIT4_QCOM'),
+    0x200000 : ('GL_FONT_ASCENDER_BIT_NV', 'GL_STENCIL_BUFFER_BIT5_QCOM'),
+    0x400000 : ('GL_FONT_DESCENDER_BIT_NV', 'GL_STENCIL_BUFFER_BIT6_QCOM'),
+    0x800000 : ('GL_FONT_HEIGHT_BIT_NV', 'GL_STENCIL_BUFFER_BIT7_QCOM'),
+    0x1000000 : ('GL_FONT_MAX_ADVANCE_WIDTH_BIT_NV', 'GL_MULTISAMPLE_BUFFER_BIT0_QCOM'),
+    0x2000000 : ('GL_FONT_MAX_ADVANCE_HEIGHT_BIT_NV', 'GL_MULTISAMPLE_BUFFER_BIT1_QCOM'),
+    0x4000000 : ('GL_FONT_UNDERLINE_POSITION_BIT_NV', 'GL_MULTISAMPLE_BUFFER_BIT2_QCOM'),
+    0x8000000 : ('GL_FONT_UNDERLINE_THICKNESS_BIT_NV', 'GL_MULTISAMPLE_BUFFER_BIT3_QCOM'),
+    0x10000000 : ('GL_FONT_HAS_KERNING_BIT_NV', 'GL_MULTISAMPLE_BUFFER_BIT4_QCOM'),
+    0x20000000 : ('GL_FONT_NUM_GLYPH_INDICES_BIT_NV', 'GL_MULTISAMPLE_BUFFER_BIT5_QCOM'),
+    0x825B : ('GL_MAX_VIEWPORTS_NV', 'GL_MAX_VIEWPORTS_OES'),
+    0x825C : ('GL_VIEWPORT_SUBPIXEL_BITS_NV', 'GL_VIEWPORT_SUBPIXEL_BITS_OES'),
+    0x825D : ('GL_VIEWPORT_BOUNDS_RANGE_NV', 'GL_VIEWPORT_BOUNDS_RANGE_OES'),
+    0x825F : ('GL_VIEWPORT_INDEX_PROVOKING_VERTEX_NV', 'GL_VIEWPORT_INDEX_PROVOKING_VERTEX_OES'),
+}
+
+# group -> value -> enum name in the group
+GROUPS = {
+    'AlphaFunction' : {
+        0x0200 : 'GL_NEVER',
+        0x0201 : 'GL_LESS',
+        0x0202 : 'GL_EQUAL',
+        0x0203 : 'GL_LEQUAL',
+        0x0204 : 'GL_GREATER',
+        0x0205 : 'GL_NOTEQUAL',
+        0x0206 : 'GL_GEQUAL',
+        0x0207 : 'GL_ALWAYS',
+    },
+    'AtomicCounterBufferPName' : {
+        0x92C1 : 'GL_ATOMIC_COUNTER_BUFFER_BINDING',
+    },
+    'AttribMask' : {
+        0x0100 : 'GL_DEPTH_BUFFER_BIT',
+        0x0400 : 'GL_STENCIL_BUFFER_BIT',
+        0x4000 : 'GL_COLOR_BUFFER_BIT',
+    },
+    'AttributeType' : {
+        0x1404 : 'GL_INT',
+        0x1405 : 'GL_UNSIGNED_INT',
+        0x1406 : 'GL_FLOAT',
+        0x8B50 : 'GL_FLOAT_VEC2',
+        0x8B51 : 'GL_FLOAT_VEC3',
+        0x8B52 : 'GL_FLOAT_VEC4',
+        0x8B53 : 'GL_INT_VEC2',
+        0x8B54 : 'GL_INT_VEC3',
+        0x8B55 : 'GL_INT_VEC4',
+        0x8B56 : 'GL_BOOL',
+        0x8B57 : 'GL_BOOL_VEC2',
+        0x8B58 : 'GL_BOOL_VEC3',
+        0x8B59 : 'GL_BOOL_VEC4',
+        0x8B5A : 'GL_FLOAT_MAT2',
+        0x8B5B : 'GL_FLOAT_MAT3',
+        0x8B5C : 'GL_FLOAT_MAT4',
+        0x8B5E : 'GL_SAMPLER_2D',
+        0x8B60 : 'GL_SAMPLER_CUBE',
+        0x8B5F : 'GL_SAMPLER_3D',
+        0x8B62 : 'GL_SAMPLER_2D_SHADOW',
+        0x8B65 : 'GL_FLOAT_MAT2x3',
+        0x8B66 : 'GL_FLOAT_MAT2x4',
+        0x8B67 : 'GL_FLOAT_MAT3x2',
+        0x8B68 : 'GL_FLOAT_MAT3x4',
+        0x8B69 : 'GL_FLOAT_MAT4x2',
+        0x8B6A : 'GL_FLOAT_MAT4x3',
+        0x8DC4 : 'GL_SAMPLER_2D_ARRAY_SHADOW',
+        0x8DC5 : 'GL_SAMPLER_CUBE_SHADOW',
+        0x8DC6 : 'GL_UNSIGNED_INT_VEC2',
+        0x8DC7 : 'GL_UNSIGNED_INT_VEC3',
+        0x8DC8 : 'GL_UNSIGNED_INT_VEC4',
+        0x8DCA : 'GL_INT_SAMPLER_2D',
+        0x8DCB : 'GL_INT_SAMPLER_3D',
+        0x8DCC : 'GL_INT_SAMPLER_CUBE',
+        0x8DCF : 'GL_INT_SAMPLER_2D_ARRAY',
+        0x8DD2 : 'GL_UNSIGNED_INT_SAMPLER_2D',
+        0x8DD3 : 'GL_UNSIGNED_INT_SAMPLER_3D',
+        0x8DD4 : 'GL_UNSIGNED_INT_SAMPLER_CUBE',
+        0x8DD7 : 'GL_UNSIGNED_INT_SAMPLER_2D_ARRAY',
+        0x904D : 'GL_IMAGE_2D',
+        0x904E : 'GL_IMAGE_3D',
+        0x9050 : 'GL_IMAGE_CUBE',
+        0x9053 : 'GL_IMAGE_2D_ARRAY',
+        0x9058 : 'GL_INT_IMAGE_2D',
+        0x9059 : 'GL_INT_IMAGE_3D',
+        0x905B : 'GL_INT_IMAGE_CUBE',
+        0x905E : 'GL_INT_IMAGE_2D_ARRAY',
+        0x9063 : 'GL_UNSIGNED_INT_IMAGE_2D',
+        0x9064 : 'GL_UNSIGNED_INT_IMAGE_3D',
+        0x9066 : 'GL_UNSIGNED_INT_IMAGE_CUBE',
+        0x9069 : 'GL_UNSIGNED_INT_IMAGE_2D_ARRAY',
+        0x9108 : 'GL_SAMPLER_2D_MULTISAMPLE',
+        0x9109 : 'GL_INT_SAMPLER_2D_MULTISAMPLE',
+        0x910A : 'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE',
+        0x8DC2 : 'GL_SAMPLER_BUFFER',
+        0x8DD0 : 'GL_INT_SAMPLER_BUFFER',
+        0x8DD8 : 'GL_UNSIGNED_INT_SAMPLER_BUFFER',
+        0x9051 : 'GL_IMAGE_BUFFER',
+        0x905C : 'GL_INT_IMAGE_BUFFER',
+        0x9067 : 'GL_UNSIGNED_INT_IMAGE_BUFFER',
+        0x900C : 'GL_SAMPLER_CUBE_MAP_ARRAY',
+        0x900D : 'GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW',
+        0x900E : 'GL_INT_SAMPLER_CUBE_MAP_ARRAY',
+        0x900F : 'GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY',
+        0x9054 : 'GL_IMAGE_CUBE_MAP_ARRAY',
+        0x905F : 'GL_INT_IMAGE_CUBE_MAP_ARRAY',
+        0x906A : 'GL_UNSIGNED_INT_IMAGE_CUBE_MAP_ARRAY',
+        0x910B : 'GL_SAMPLER_2D_MULTISAMPLE_ARRAY',
+        0x910C : 'GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY',
+        0x910D : 'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY',
+        0x140E : 'GL_INT64_NV',
+        0x140F : 'GL_UNSIGNED_INT64_NV',
+    },
+    'BindTransformFeedbackTarget' : {
+        0x8E22 : 'GL_TRANSFORM_FEEDBACK',
+    },
+    'BinormalPointerTypeEXT' : {
+        0x1400 : 'GL_BYTE',
+        0x1402 : 'GL_SHORT',
+        0x1404 : 'GL_INT',
+        0x1406 : 'GL_FLOAT',
+    },
+    'BlendEquationModeEXT' : {
+        0x8006 : 'GL_FUNC_ADD',
+        0x800A : 'GL_FUNC_SUBTRACT',
+        0x800B : 'GL_FUNC_REVERSE_SUBTRACT',
+        0x8007 : 'GL_MIN',
+        0x8008 : 'GL_MAX',
+    },
+    'BlendingFactor' : {
+        0x0000 : 'GL_ZERO',
+        0x0001 : 'GL_ONE',
+        0x0300 : 'GL_SRC_COLOR',
+        0x0301 : 'GL_ONE_MINUS_SRC_COLOR',
+        0x0302 : 'GL_SRC_ALPHA',
+        0x0303 : 'GL_ONE_MINUS_SRC_ALPHA',
+        0x0304 : 'GL_DST_ALPHA',
+        0x0305 : 'GL_ONE_MINUS_DST_ALPHA',
+        0x0306 : 'GL_DST_COLOR',
+        0x0307 : 'GL_ONE_MINUS_DST_COLOR',
+        0x0308 : 'GL_SRC_ALPHA_SATURATE',
+        0x8001 : 'GL_CONSTANT_COLOR',
+        0x8002 : 'GL_ONE_MINUS_CONSTANT_COLOR',
+        0x8003 : 'GL_CONSTANT_ALPHA',
+        0x8004 : 'GL_ONE_MINUS_CONSTANT_ALPHA',
+    },
+    'BlitFramebufferFilter' : {
+        0x2600 : 'GL_NEAREST',
+        0x2601 : 'GL_LINEAR',
+    },
+    'Boolean' : {
+        0x0000 : 'GL_FALSE',
+        0x0001 : 'GL_TRUE',
+    },
+    'Buffer' : {
+        0x1800 : 'GL_COLOR',
+        0x1801 : 'GL_DEPTH',
+        0x1802 : 'GL_STENCIL',
+    },
+    'BufferAccessARB' : {
+        0x88B8 : 'GL_READ_ONLY',
+        0x88B9 : 'GL_WRITE_ONLY',
+        0x88BA : 'GL_READ_WRITE',
+    },
+    'BufferBitQCOM' : {
+        0x0001 : 'GL_COLOR_BUFFER_BIT0_QCOM',
+        0x0002 : 'GL_COLOR_BUFFER_BIT1_QCOM',
+        0x0004 : 'GL_COLOR_BUFFER_BIT2_QCOM',
+        0x0008 : 'GL_COLOR_BUFFER_BIT3_QCOM',
+        0x0010 : 'GL_COLOR_BUFFER_BIT4_QCOM',
+        0x0020 : 'GL_COLOR_BUFFER_BIT5_QCOM',
+        0x0040 : 'GL_COLOR_BUFFER_BIT6_QCOM',
+        0x0080 : 'GL_COLOR_BUFFER_BIT7_QCOM',
+        0x0100 : 'GL_DEPTH_BUFFER_BIT0_QCOM',
+        0x0200 : 'GL_DEPTH_BUFFER_BIT1_QCOM',
+        0x0400 : 'GL_DEPTH_BUFFER_BIT2_QCOM',
+        0x0800 : 'GL_DEPTH_BUFFER_BIT3_QCOM',
+        0x1000 : 'GL_DEPTH_BUFFER_BIT4_QCOM',
+        0x2000 : 'GL_DEPTH_BUFFER_BIT5_QCOM',
+        0x4000 : 'GL_DEPTH_BUFFER_BIT6_QCOM',
+        0x8000 : 'GL_DEPTH_BUFFER_BIT7_QCOM',
+        0x10000 : 'GL_STENCIL_BUFFER_BIT0_QCOM',
+        0x20000 : 'GL_STENCIL_BUFFER_BIT1_QCOM',
+        0x40000 : 'GL_STENCIL_BUFFER_BIT2_QCOM',
+        0x80000 : 'GL_STENCIL_BUFFER_BIT3_QCOM',
+        0x100000 : 'GL_STENCIL_BUFFER_BIT4_QCOM',
+        0x200000 : 'GL_STENCIL_BUFFER_BIT5_QCOM',
+        0x400000 : 'GL_STENCIL_BUFFER_BIT6_QCOM',
+        0x800000 : 'GL_STENCIL_BUFFER_BIT7_QCOM',
+        0x1000000 : 'GL_MULTISAMPLE_BUFFER_BIT0_QCOM',
+        0x2000000 : 'GL_MULTISAMPLE_BUFFER_BIT1_QCOM',
+        0x4000000 : 'GL_MULTISAMPLE_BUFFER_BIT2_QCOM',
+        0x8000000 : 'GL_MULTISAMPLE_BUFFER_BIT3_QCOM',
+        0x10000000 : 'GL_MULTISAMPLE_BUFFER_BIT4_QCOM',
+        0x20000000 : 'GL_MULTISAMPLE_BUFFER_BIT5_QCOM',
+        0x40000000 : 'GL_MULTISAMPLE_BUFFER_BIT6_QCOM',
+        0x80000000 : 'GL_MULTISAMPLE_BUFFER_BIT7_QCOM',
+    },
+    'BufferPNameARB' : {
+        0x8764 : 'GL_BUFFER_SIZE',
+        0x8765 : 'GL_BUFFER_USAGE',
+        0x88BC : 'GL_BUFFER_MAPPED',
+        0x911F : 'GL_BUFFER_ACCESS_FLAGS',
+        0x9120 : 'GL_BUFFER_MAP_LENGTH',
+        0x9121 : 'GL_BUFFER_MAP_OFFSET',
+    },
+    'BufferPointerNameARB' : {
+        0x88BD : 'GL_BUFFER_MAP_POINTER',
+    },
+    'BufferStorageMask' : {
+        0x0001 : 'GL_MAP_READ_BIT',
+        0x0002 : 'GL_MAP_WRITE_BIT',
+        0x0040 : 'GL_MAP_PERSISTENT_BIT_EXT',
+        0x0080 : 'GL_MAP_COHERENT_BIT_EXT',
+        0x0100 : 'GL_DYNAMIC_STORAGE_BIT_EXT',
+        0x0200 : 'GL_CLIENT_STORAGE_BIT_EXT',
+    },
+    'BufferStorageTarget' : {
+        0x8892 : 'GL_ARRAY_BUFFER',
+        0x8893 : 'GL_ELEMENT_ARRAY_BUFFER',
+        0x88EB : 'GL_PIXEL_PACK_BUFFER',
+        0x88EC : 'GL_PIXEL_UNPACK_BUFFER',
+        0x8C8E : 'GL_TRANSFORM_FEEDBACK_BUFFER',
+        0x8F36 : 'GL_COPY_READ_BUFFER',
+        0x8F37 : 'GL_COPY_WRITE_BUFFER',
+        0x8A11 : 'GL_UNIFORM_BUFFER',
+        0x90EE : 'GL_DISPATCH_INDIRECT_BUFFER',
+        0x8F3F : 'GL_DRAW_INDIRECT_BUFFER',
+        0x92C0 : 'GL_ATOMIC_COUNTER_BUFFER',
+        0x90D2 : 'GL_SHADER_STORAGE_BUFFER',
+        0x8C2A : 'GL_TEXTURE_BUFFER',
+    },
+    'BufferTargetARB' : {
+        0x8892 : 'GL_ARRAY_BUFFER',
+        0x8893 : 'GL_ELEMENT_ARRAY_BUFFER',
+        0x88EB : 'GL_PIXEL_PACK_BUFFER',
+        0x88EC : 'GL_PIXEL_UNPACK_BUFFER',
+        0x8C8E : 'GL_TRANSFORM_FEEDBACK_BUFFER',
+        0x8F36 : 'GL_COPY_READ_BUFFER',
+        0x8F37 : 'GL_COPY_WRITE_BUFFER',
+        0x8A11 : 'GL_UNIFORM_BUFFER',
+        0x90EE : 'GL_DISPATCH_INDIRECT_BUFFER',
+        0x8F3F : 'GL_DRAW_INDIRECT_BUFFER',
+        0x92C0 : 'GL_ATOMIC_COUNTER_BUFFER',
+        0x90D2 : 'GL_SHADER_STORAGE_BUFFER',
+        0x8C2A : 'GL_TEXTURE_BUFFER',
+    },
+    'BufferUsageARB' : {
+        0x88E0 : 'GL_STREAM_DRAW',
+        0x88E4 : 'GL_STATIC_DRAW',
+        0x88E8 : 'GL_DYNAMIC_DRAW',
+        0x88E1 : 'GL_STREAM_READ',
+        0x88E2 : 'GL_STREAM_COPY',
+        0x88E5 : 'GL_STATIC_READ',
+        0x88E6 : 'GL_STATIC_COPY',
+        0x88E9 : 'GL_DYNAMIC_READ',
+        0x88EA : 'GL_DYNAMIC_COPY',
+    },
+    'ClampColorModeARB' : {
+        0x0000 : 'GL_FALSE',
+        0x0001 : 'GL_TRUE',
+    },
+    'ClearBufferMask' : {
+        0x0100 : 'GL_DEPTH_BUFFER_BIT',
+        0x0400 : 'GL_STENCIL_BUFFER_BIT',
+        0x4000 : 'GL_COLOR_BUFFER_BIT',
+        0x8000 : 'GL_COVERAGE_BUFFER_BIT_NV',
+    },
+    'ColorBuffer' : {
+        0x0404 : 'GL_FRONT',
+        0x0405 : 'GL_BACK',
+        0x0408 : 'GL_FRONT_AND_BACK',
+        0x8CE0 : 'GL_COLOR_ATTACHMENT0',
+        0x0000 : 'GL_NONE',
+        0x8CE1 : 'GL_COLOR_ATTACHMENT1',
+        0x8CE2 : 'GL_COLOR_ATTACHMENT2',
+        0x8CE3 : 'GL_COLOR_ATTACHMENT3',
+        0x8CE4 : 'GL_COLOR_ATTACHMENT4',
+        0x8CE5 : 'GL_COLOR_ATTACHMENT5',
+        0x8CE6 : 'GL_COLOR_ATTACHMENT6',
+        0x8CE7 : 'GL_COLOR_ATTACHMENT7',
+        0x8CE8 : 'GL_COLOR_ATTACHMENT8',
+        0x8CE9 : 'GL_COLOR_ATTACHMENT9',
+        0x8CEA : 'GL_COLOR_ATTACHMENT10',
+        0x8CEB : 'GL_COLOR_ATTACHMENT11',
+        0x8CEC : 'GL_COLOR_ATTACHMENT12',
+        0x8CED : 'GL_COLOR_ATTACHMENT13',
+        0x8CEE : 'GL_COLOR_ATTACHMENT14',
+        0x8CEF : 'GL_COLOR_ATTACHMENT15',
+        0x8CF0 : 'GL_COLOR_ATTACHMENT16',
+        0x8CF1 : 'GL_COLOR_ATTACHMENT17',
+        0x8CF2 : 'GL_COLOR_ATTACHMENT18',
+        0x8CF3 : 'GL_COLOR_ATTACHMENT19',
+        0x8CF4 : 'GL_COLOR_ATTACHMENT20',
+        0x8CF5 : 'GL_COLOR_ATTACHMENT21',
+        0x8CF6 : 'GL_COLOR_ATTACHMENT22',
+        0x8CF7 : 'GL_COLOR_ATTACHMENT23',
+        0x8CF8 : 'GL_COLOR_ATTACHMENT24',
+        0x8CF9 : 'GL_COLOR_ATTACHMENT25',
+        0x8CFA : 'GL_COLOR_ATTACHMENT26',
+        0x8CFB : 'GL_COLOR_ATTACHMENT27',
+        0x8CFC : 'GL_COLOR_ATTACHMENT28',
+        0x8CFD : 'GL_COLOR_ATTACHMENT29',
+        0x8CFE : 'GL_COLOR_ATTACHMENT30',
+        0x8CFF : 'GL_COLOR_ATTACHMENT31',
+    },
+    'ColorPointerType' : {
+        0x1400 : 'GL_BYTE',
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1402 : 'GL_SHORT',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1404 : 'GL_INT',
+        0x1405 : 'GL_UNSIGNED_INT',
+        0x1406 : 'GL_FLOAT',
+    },
+    'CombinerBiasNV' : {
+        0x0000 : 'GL_NONE',
+    },
+    'CombinerComponentUsageNV' : {
+        0x1906 : 'GL_ALPHA',
+        0x1907 : 'GL_RGB',
+        0x1905 : 'GL_BLUE',
+    },
+    'CombinerPortionNV' : {
+        0x1906 : 'GL_ALPHA',
+        0x1907 : 'GL_RGB',
+    },
+    'CombinerScaleNV' : {
+        0x0000 : 'GL_NONE',
+    },
+    'ContainerType' : {
+        0x8B40 : 'GL_PROGRAM_OBJECT_EXT',
+    },
+    'ContextFlagMask' : {
+        0x0002 : 'GL_CONTEXT_FLAG_DEBUG_BIT',
+        0x0004 : 'GL_CONTEXT_FLAG_ROBUST_ACCESS_BIT',
+        0x0010 : 'GL_CONTEXT_FLAG_PROTECTED_CONTENT_BIT_EXT',
+        0x0008 : 'GL_CONTEXT_FLAG_NO_ERROR_BIT_KHR',
+    },
+    'CopyBufferSubDataTarget' : {
+        0x8892 : 'GL_ARRAY_BUFFER',
+        0x8893 : 'GL_ELEMENT_ARRAY_BUFFER',
+        0x88EB : 'GL_PIXEL_PACK_BUFFER',
+        0x88EC : 'GL_PIXEL_UNPACK_BUFFER',
+        0x8C8E : 'GL_TRANSFORM_FEEDBACK_BUFFER',
+        0x8F36 : 'GL_COPY_READ_BUFFER',
+        0x8F37 : 'GL_COPY_WRITE_BUFFER',
+        0x8A11 : 'GL_UNIFORM_BUFFER',
+        0x90EE : 'GL_DISPATCH_INDIRECT_BUFFER',
+        0x8F3F : 'GL_DRAW_INDIRECT_BUFFER',
+        0x92C0 : 'GL_ATOMIC_COUNTER_BUFFER',
+        0x90D2 : 'GL_SHADER_STORAGE_BUFFER',
+        0x8C2A : 'GL_TEXTURE_BUFFER',
+    },
+    'CopyImageSubDataTarget' : {
+        0x0DE1 : 'GL_TEXTURE_2D',
+        0x8513 : 'GL_TEXTURE_CUBE_MAP',
+        0x8D41 : 'GL_RENDERBUFFER',
+        0x806F : 'GL_TEXTURE_3D',
+        0x8C1A : 'GL_TEXTURE_2D_ARRAY',
+        0x9100 : 'GL_TEXTURE_2D_MULTISAMPLE',
+        0x9009 : 'GL_TEXTURE_CUBE_MAP_ARRAY',
+        0x9102 : 'GL_TEXTURE_2D_MULTISAMPLE_ARRAY',
+    },
+    'DebugSeverity' : {
+        0x1100 : 'GL_DONT_CARE',
+        0x826B : 'GL_DEBUG_SEVERITY_NOTIFICATION',
+        0x9146 : 'GL_DEBUG_SEVERITY_HIGH',
+        0x9147 : 'GL_DEBUG_SEVERITY_MEDIUM',
+        0x9148 : 'GL_DEBUG_SEVERITY_LOW',
+    },
+    'DebugSource' : {
+        0x1100 : 'GL_DONT_CARE',
+        0x8246 : 'GL_DEBUG_SOURCE_API',
+        0x8247 : 'GL_DEBUG_SOURCE_WINDOW_SYSTEM',
+        0x8248 : 'GL_DEBUG_SOURCE_SHADER_COMPILER',
+        0x8249 : 'GL_DEBUG_SOURCE_THIRD_PARTY',
+        0x824A : 'GL_DEBUG_SOURCE_APPLICATION',
+        0x824B : 'GL_DEBUG_SOURCE_OTHER',
+    },
+    'DebugType' : {
+        0x1100 : 'GL_DONT_CARE',
+        0x824C : 'GL_DEBUG_TYPE_ERROR',
+        0x824D : 'GL_DEBUG_TYPE_DEPRECATED_BEHAVIOR',
+        0x824E : 'GL_DEBUG_TYPE_UNDEFINED_BEHAVIOR',
+        0x824F : 'GL_DEBUG_TYPE_PORTABILITY',
+        0x8250 : 'GL_DEBUG_TYPE_PERFORMANCE',
+        0x8251 : 'GL_DEBUG_TYPE_OTHER',
+        0x8268 : 'GL_DEBUG_TYPE_MARKER',
+        0x8269 : 'GL_DEBUG_TYPE_PUSH_GROUP',
+        0x826A : 'GL_DEBUG_TYPE_POP_GROUP',
+    },
+    'DepthFunction' : {
+        0x0200 : 'GL_NEVER',
+        0x0201 : 'GL_LESS',
+        0x0202 : 'GL_EQUAL',
+        0x0203 : 'GL_LEQUAL',
+        0x0204 : 'GL_GREATER',
+        0x0205 : 'GL_NOTEQUAL',
+        0x0206 : 'GL_GEQUAL',
+        0x0207 : 'GL_ALWAYS',
+    },
+    'DepthStencilTextureMode' : {
+        0x1902 : 'GL_DEPTH_COMPONENT',
+        0x1901 : 'GL_STENCIL_INDEX',
+    },
+    'DrawBufferMode' : {
+        0x0404 : 'GL_FRONT',
+        0x0405 : 'GL_BACK',
+        0x0408 : 'GL_FRONT_AND_BACK',
+        0x8CE0 : 'GL_COLOR_ATTACHMENT0',
+        0x0000 : 'GL_NONE',
+        0x8CE1 : 'GL_COLOR_ATTACHMENT1',
+        0x8CE2 : 'GL_COLOR_ATTACHMENT2',
+        0x8CE3 : 'GL_COLOR_ATTACHMENT3',
+        0x8CE4 : 'GL_COLOR_ATTACHMENT4',
+        0x8CE5 : 'GL_COLOR_ATTACHMENT5',
+        0x8CE6 : 'GL_COLOR_ATTACHMENT6',
+        0x8CE7 : 'GL_COLOR_ATTACHMENT7',
+        0x8CE8 : 'GL_COLOR_ATTACHMENT8',
+        0x8CE9 : 'GL_COLOR_ATTACHMENT9',
+        0x8CEA : 'GL_COLOR_ATTACHMENT10',
+        0x8CEB : 'GL_COLOR_ATTACHMENT11',
+        0x8CEC : 'GL_COLOR_ATTACHMENT12',
+        0x8CED : 'GL_COLOR_ATTACHMENT13',
+        0x8CEE : 'GL_COLOR_ATTACHMENT14',
+        0x8CEF : 'GL_COLOR_ATTACHMENT15',
+        0x8CF0 : 'GL_COLOR_ATTACHMENT16',
+        0x8CF1 : 'GL_COLOR_ATTACHMENT17',
+        0x8CF2 : 'GL_COLOR_ATTACHMENT18',
+        0x8CF3 : 'GL_COLOR_ATTACHMENT19',
+        0x8CF4 : 'GL_COLOR_ATTACHMENT20',
+        0x8CF5 : 'GL_COLOR_ATTACHMENT21',
+        0x8CF6 : 'GL_COLOR_ATTACHMENT22',
+        0x8CF7 : 'GL_COLOR_ATTACHMENT23',
+        0x8CF8 : 'GL_COLOR_ATTACHMENT24',
+        0x8CF9 : 'GL_COLOR_ATTACHMENT25',
+        0x8CFA : 'GL_COLOR_ATTACHMENT26',
+        0x8CFB : 'GL_COLOR_ATTACHMENT27',
+        0x8CFC : 'GL_COLOR_ATTACHMENT28',
+        0x8CFD : 'GL_COLOR_ATTACHMENT29',
+        0x8CFE : 'GL_COLOR_ATTACHMENT30',
+        0x8CFF : 'GL_COLOR_ATTACHMENT31',
+    },
+    'DrawElementsType' : {
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1405 : 'GL_UNSIGNED_INT',
+    },
+    'ElementPointerTypeATI' : {
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1405 : 'GL_UNSIGNED_INT',
+    },
+    'EnableCap' : {
+        0x0DE1 : 'GL_TEXTURE_2D',
+        0x0B44 : 'GL_CULL_FACE',
+        0x0BE2 : 'GL_BLEND',
+        0x0BD0 : 'GL_DITHER',
+        0x0B90 : 'GL_STENCIL_TEST',
+        0x0B71 : 'GL_DEPTH_TEST',
+        0x0C11 : 'GL_SCISSOR_TEST',
+        0x8037 : 'GL_POLYGON_OFFSET_FILL',
+        0x809E : 'GL_SAMPLE_ALPHA_TO_COVERAGE',
+        0x80A0 : 'GL_SAMPLE_COVERAGE',
+        0x8513 : 'GL_TEXTURE_CUBE_MAP',
+        0x8C89 : 'GL_RASTERIZER_DISCARD',
+        0x8D69 : 'GL_PRIMITIVE_RESTART_FIXED_INDEX',
+        0x8E51 : 'GL_SAMPLE_MASK',
+        0x8242 : 'GL_DEBUG_OUTPUT_SYNCHRONOUS',
+        0x8074 : 'GL_VERTEX_ARRAY',
+        0x92E0 : 'GL_DEBUG_OUTPUT',
+        0x8C36 : 'GL_SAMPLE_SHADING',
+        0x8F65 : 'GL_FETCH_PER_SAMPLE_ARM',
+        0x95B1 : 'GL_SHADING_RATE_IMAGE_PER_PRIMITIVE_NV',
+        0x96A2 : 'GL_FRAMEBUFFER_FETCH_NONCOHERENT_QCOM',
+        0x96A5 : 'GL_SHADING_RATE_PRESERVE_ASPECT_RATIO_QCOM',
+    },
+    'ErrorCode' : {
+        0x0000 : 'GL_NO_ERROR',
+        0x0500 : 'GL_INVALID_ENUM',
+        0x0501 : 'GL_INVALID_VALUE',
+        0x0502 : 'GL_INVALID_OPERATION',
+        0x0505 : 'GL_OUT_OF_MEMORY',
+        0x0506 : 'GL_INVALID_FRAMEBUFFER_OPERATION',
+        0x0503 : 'GL_STACK_OVERFLOW',
+        0x0504 : 'GL_STACK_UNDERFLOW',
+    },
+    'EvalMapsModeNV' : {
+        0x1B02 : 'GL_FILL_NV',
+    },
+    'ExternalHandleType' : {
+        0x9586 : 'GL_HANDLE_TYPE_OPAQUE_FD_EXT',
+        0x9587 : 'GL_HANDLE_TYPE_OPAQUE_WIN32_EXT',
+        0x9588 : 'GL_HANDLE_TYPE_OPAQUE_WIN32_KMT_EXT',
+        0x9589 : 'GL_HANDLE_TYPE_D3D12_TILEPOOL_EXT',
+        0x958A : 'GL_HANDLE_TYPE_D3D12_RESOURCE_EXT',
+        0x958B : 'GL_HANDLE_TYPE_D3D11_IMAGE_EXT',
+        0x958C : 'GL_HANDLE_TYPE_D3D11_IMAGE_KMT_EXT',
+        0x9594 : 'GL_HANDLE_TYPE_D3D12_FENCE_EXT',
+    },
+    'FenceConditionNV' : {
+        0x84F2 : 'GL_ALL_COMPLETED_NV',
+    },
+    'FenceParameterNameNV' : {
+        0x84F3 : 'GL_FENCE_STATUS_NV',
+        0x84F4 : 'GL_FENCE_CONDITION_NV',
+    },
+    'FogCoordinatePointerType' : {
+        0x1406 : 'GL_FLOAT',
+    },
+    'FogMode' : {
+        0x2601 : 'GL_LINEAR',
+    },
+    'FogPointerTypeEXT' : {
+        0x1406 : 'GL_FLOAT',
+    },
+    'FogPointerTypeIBM' : {
+        0x1406 : 'GL_FLOAT',
+    },
+    'FoveationConfigBitQCOM' : {
+        0x0001 : 'GL_FOVEATION_ENABLE_BIT_QCOM',
+        0x0002 : 'GL_FOVEATION_SCALED_BIN_METHOD_BIT_QCOM',
+        0x0004 : 'GL_FOVEATION_SUBSAMPLED_LAYOUT_METHOD_BIT_QCOM',
+    },
+    'FragmentShaderDestMaskATI' : {
+        0x0000 : 'GL_NONE',
+    },
+    'FragmentShaderDestModMaskATI' : {
+        0x0000 : 'GL_NONE',
+    },
+    'FragmentShaderGenericSourceATI' : {
+        0x0000 : 'GL_ZERO',
+        0x0001 : 'GL_ONE',
+    },
+    'FragmentShaderTextureSourceATI' : {
+        0x84C0 : 'GL_TEXTURE0',
+        0x84C1 : 'GL_TEXTURE1',
+        0x84C2 : 'GL_TEXTURE2',
+        0x84C3 : 'GL_TEXTURE3',
+        0x84C4 : 'GL_TEXTURE4',
+        0x84C5 : 'GL_TEXTURE5',
+        0x84C6 : 'GL_TEXTURE6',
+        0x84C7 : 'GL_TEXTURE7',
+        0x84C8 : 'GL_TEXTURE8',
+        0x84C9 : 'GL_TEXTURE9',
+        0x84CA : 'GL_TEXTURE10',
+        0x84CB : 'GL_TEXTURE11',
+        0x84CC : 'GL_TEXTURE12',
+        0x84CD : 'GL_TEXTURE13',
+        0x84CE : 'GL_TEXTURE14',
+        0x84CF : 'GL_TEXTURE15',
+        0x84D0 : 'GL_TEXTURE16',
+        0x84D1 : 'GL_TEXTURE17',
+        0x84D2 : 'GL_TEXTURE18',
+        0x84D3 : 'GL_TEXTURE19',
+        0x84D4 : 'GL_TEXTURE20',
+        0x84D5 : 'GL_TEXTURE21',
+        0x84D6 : 'GL_TEXTURE22',
+        0x84D7 : 'GL_TEXTURE23',
+        0x84D8 : 'GL_TEXTURE24',
+        0x84D9 : 'GL_TEXTURE25',
+        0x84DA : 'GL_TEXTURE26',
+        0x84DB : 'GL_TEXTURE27',
+        0x84DC : 'GL_TEXTURE28',
+        0x84DD : 'GL_TEXTURE29',
+        0x84DE : 'GL_TEXTURE30',
+        0x84DF : 'GL_TEXTURE31',
+    },
+    'FragmentShaderValueRepATI' : {
+        0x1906 : 'GL_ALPHA',
+        0x0000 : 'GL_NONE',
+        0x1903 : 'GL_RED',
+        0x1904 : 'GL_GREEN',
+        0x1905 : 'GL_BLUE',
+    },
+    'FramebufferAttachment' : {
+        0x8CE0 : 'GL_COLOR_ATTACHMENT0',
+        0x8D00 : 'GL_DEPTH_ATTACHMENT',
+        0x8D20 : 'GL_STENCIL_ATTACHMENT',
+        0x821A : 'GL_DEPTH_STENCIL_ATTACHMENT',
+        0x8CE1 : 'GL_COLOR_ATTACHMENT1',
+        0x8CE2 : 'GL_COLOR_ATTACHMENT2',
+        0x8CE3 : 'GL_COLOR_ATTACHMENT3',
+        0x8CE4 : 'GL_COLOR_ATTACHMENT4',
+        0x8CE5 : 'GL_COLOR_ATTACHMENT5',
+        0x8CE6 : 'GL_COLOR_ATTACHMENT6',
+        0x8CE7 : 'GL_COLOR_ATTACHMENT7',
+        0x8CE8 : 'GL_COLOR_ATTACHMENT8',
+        0x8CE9 : 'GL_COLOR_ATTACHMENT9',
+        0x8CEA : 'GL_COLOR_ATTACHMENT10',
+        0x8CEB : 'GL_COLOR_ATTACHMENT11',
+        0x8CEC : 'GL_COLOR_ATTACHMENT12',
+        0x8CED : 'GL_COLOR_ATTACHMENT13',
+        0x8CEE : 'GL_COLOR_ATTACHMENT14',
+        0x8CEF : 'GL_COLOR_ATTACHMENT15',
+        0x8CF0 : 'GL_COLOR_ATTACHMENT16',
+        0x8CF1 : 'GL_COLOR_ATTACHMENT17',
+        0x8CF2 : 'GL_COLOR_ATTACHMENT18',
+        0x8CF3 : 'GL_COLOR_ATTACHMENT19',
+        0x8CF4 : 'GL_COLOR_ATTACHMENT20',
+        0x8CF5 : 'GL_COLOR_ATTACHMENT21',
+        0x8CF6 : 'GL_COLOR_ATTACHMENT22',
+        0x8CF7 : 'GL_COLOR_ATTACHMENT23',
+        0x8CF8 : 'GL_COLOR_ATTACHMENT24',
+        0x8CF9 : 'GL_COLOR_ATTACHMENT25',
+        0x8CFA : 'GL_COLOR_ATTACHMENT26',
+        0x8CFB : 'GL_COLOR_ATTACHMENT27',
+        0x8CFC : 'GL_COLOR_ATTACHMENT28',
+        0x8CFD : 'GL_COLOR_ATTACHMENT29',
+        0x8CFE : 'GL_COLOR_ATTACHMENT30',
+        0x8CFF : 'GL_COLOR_ATTACHMENT31',
+        0x96D1 : 'GL_SHADING_RATE_ATTACHMENT_EXT',
+    },
+    'FramebufferAttachmentParameterName' : {
+        0x8CD0 : 'GL_FRAMEBUFFER_ATTACHMENT_OBJECT_TYPE',
+        0x8CD1 : 'GL_FRAMEBUFFER_ATTACHMENT_OBJECT_NAME',
+        0x8CD2 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LEVEL',
+        0x8CD3 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_CUBE_MAP_FACE',
+        0x8210 : 'GL_FRAMEBUFFER_ATTACHMENT_COLOR_ENCODING',
+        0x8211 : 'GL_FRAMEBUFFER_ATTACHMENT_COMPONENT_TYPE',
+        0x8212 : 'GL_FRAMEBUFFER_ATTACHMENT_RED_SIZE',
+        0x8213 : 'GL_FRAMEBUFFER_ATTACHMENT_GREEN_SIZE',
+        0x8214 : 'GL_FRAMEBUFFER_ATTACHMENT_BLUE_SIZE',
+        0x8215 : 'GL_FRAMEBUFFER_ATTACHMENT_ALPHA_SIZE',
+        0x8216 : 'GL_FRAMEBUFFER_ATTACHMENT_DEPTH_SIZE',
+        0x8217 : 'GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE',
+        0x8CD4 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_LAYER',
+        0x8DA7 : 'GL_FRAMEBUFFER_ATTACHMENT_LAYERED',
+        0x8D6C : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SAMPLES_EXT',
+        0x913F : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_SCALE_IMG',
+        0x9630 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_NUM_VIEWS_OVR',
+        0x9632 : 'GL_FRAMEBUFFER_ATTACHMENT_TEXTURE_BASE_VIEW_INDEX_OVR',
+    },
+    'FramebufferParameterName' : {
+        0x9310 : 'GL_FRAMEBUFFER_DEFAULT_WIDTH',
+        0x9311 : 'GL_FRAMEBUFFER_DEFAULT_HEIGHT',
+        0x9313 : 'GL_FRAMEBUFFER_DEFAULT_SAMPLES',
+        0x9314 : 'GL_FRAMEBUFFER_DEFAULT_FIXED_SAMPLE_LOCATIONS',
+        0x9312 : 'GL_FRAMEBUFFER_DEFAULT_LAYERS',
+    },
+    'FramebufferStatus' : {
+        0x8CD5 : 'GL_FRAMEBUFFER_COMPLETE',
+        0x8CD6 : 'GL_FRAMEBUFFER_INCOMPLETE_ATTACHMENT',
+        0x8CD7 : 'GL_FRAMEBUFFER_INCOMPLETE_MISSING_ATTACHMENT',
+        0x8CDD : 'GL_FRAMEBUFFER_UNSUPPORTED',
+        0x8219 : 'GL_FRAMEBUFFER_UNDEFINED',
+        0x8D56 : 'GL_FRAMEBUFFER_INCOMPLETE_MULTISAMPLE',
+        0x8DA8 : 'GL_FRAMEBUFFER_INCOMPLETE_LAYER_TARGETS',
+    },
+    'FramebufferTarget' : {
+        0x8D40 : 'GL_FRAMEBUFFER',
+        0x8CA8 : 'GL_READ_FRAMEBUFFER',
+        0x8CA9 : 'GL_DRAW_FRAMEBUFFER',
+    },
+    'FrontFaceDirection' : {
+        0x0900 : 'GL_CW',
+        0x0901 : 'GL_CCW',
+    },
+    'GetFramebufferParameter' : {
+        0x80A8 : 'GL_SAMPLE_BUFFERS',
+        0x80A9 : 'GL_SAMPLES',
+        0x8B9A : 'GL_IMPLEMENTATION_COLOR_READ_TYPE',
+        0x8B9B : 'GL_IMPLEMENTATION_COLOR_READ_FORMAT',
+        0x9310 : 'GL_FRAMEBUFFER_DEFAULT_WIDTH',
+        0x9311 : 'GL_FRAMEBUFFER_DEFAULT_HEIGHT',
+        0x9313 : 'GL_FRAMEBUFFER_DEFAULT_SAMPLES',
+        0x9314 : 'GL_FRAMEBUFFER_DEFAULT_FIXED_SAMPLE_LOCATIONS',
+        0x9312 : 'GL_FRAMEBUFFER_DEFAULT_LAYERS',
+    },
+    'GetMultisamplePNameNV' : {
+        0x8E50 : 'GL_SAMPLE_POSITION',
+    },
+    'GetPName' : {
+        0x8009 : 'GL_BLEND_EQUATION',
+        0x883D : 'GL_BLEND_EQUATION_ALPHA',
+        0x80C8 : 'GL_BLEND_DST_RGB',
+        0x80C9 : 'GL_BLEND_SRC_RGB',
+        0x80CA : 'GL_BLEND_DST_ALPHA',
+        0x80CB : 'GL_BLEND_SRC_ALPHA',
+        0x8005 : 'GL_BLEND_COLOR',
+        0x8894 : 'GL_ARRAY_BUFFER_BINDING',
+        0x8895 : 'GL_ELEMENT_ARRAY_BUFFER_BINDING',
+        0x0DE1 : 'GL_TEXTURE_2D',
+        0x0B44 : 'GL_CULL_FACE',
+        0x0BE2 : 'GL_BLEND',
+        0x0BD0 : 'GL_DITHER',
+        0x0B90 : 'GL_STENCIL_TEST',
+        0x0B71 : 'GL_DEPTH_TEST',
+        0x0C11 : 'GL_SCISSOR_TEST',
+        0x8037 : 'GL_POLYGON_OFFSET_FILL',
+        0x0B21 : 'GL_LINE_WIDTH',
+        0x846D : 'GL_ALIASED_POINT_SIZE_RANGE',
+        0x846E : 'GL_ALIASED_LINE_WIDTH_RANGE',
+        0x0B45 : 'GL_CULL_FACE_MODE',
+        0x0B46 : 'GL_FRONT_FACE',
+        0x0B70 : 'GL_DEPTH_RANGE',
+        0x0B72 : 'GL_DEPTH_WRITEMASK',
+        0x0B73 : 'GL_DEPTH_CLEAR_VALUE',
+        0x0B74 : 'GL_DEPTH_FUNC',
+        0x0B91 : 'GL_STENCIL_CLEAR_VALUE',
+        0x0B92 : 'GL_STENCIL_FUNC',
+        0x0B94 : 'GL_STENCIL_FAIL',
+        0x0B95 : 'GL_STENCIL_PASS_DEPTH_FAIL',
+        0x0B96 : 'GL_STENCIL_PASS_DEPTH_PASS',
+        0x0B97 : 'GL_STENCIL_REF',
+        0x0B93 : 'GL_STENCIL_VALUE_MASK',
+        0x0B98 : 'GL_STENCIL_WRITEMASK',
+        0x8800 : 'GL_STENCIL_BACK_FUNC',
+        0x8801 : 'GL_STENCIL_BACK_FAIL',
+        0x8802 : 'GL_STENCIL_BACK_PASS_DEPTH_FAIL',
+        0x8803 : 'GL_STENCIL_BACK_PASS_DEPTH_PASS',
+        0x8CA3 : 'GL_STENCIL_BACK_REF',
+        0x8CA4 : 'GL_STENCIL_BACK_VALUE_MASK',
+        0x8CA5 : 'GL_STENCIL_BACK_WRITEMASK',
+        0x0BA2 : 'GL_VIEWPORT',
+        0x0C10 : 'GL_SCISSOR_BOX',
+        0x0C22 : 'GL_COLOR_CLEAR_VALUE',
+        0x0C23 : 'GL_COLOR_WRITEMASK',
+        0x0CF5 : 'GL_UNPACK_ALIGNMENT',
+        0x0D05 : 'GL_PACK_ALIGNMENT',
+        0x0D33 : 'GL_MAX_TEXTURE_SIZE',
+        0x0D3A : 'GL_MAX_VIEWPORT_DIMS',
+        0x0D50 : 'GL_SUBPIXEL_BITS',
+        0x0D52 : 'GL_RED_BITS',
+        0x0D53 : 'GL_GREEN_BITS',
+        0x0D54 : 'GL_BLUE_BITS',
+        0x0D55 : 'GL_ALPHA_BITS',
+        0x0D56 : 'GL_DEPTH_BITS',
+        0x0D57 : 'GL_STENCIL_BITS',
+        0x2A00 : 'GL_POLYGON_OFFSET_UNITS',
+        0x8038 : 'GL_POLYGON_OFFSET_FACTOR',
+        0x8069 : 'GL_TEXTURE_BINDING_2D',
+        0x80A8 : 'GL_SAMPLE_BUFFERS',
+        0x80A9 : 'GL_SAMPLES',
+        0x80AA : 'GL_SAMPLE_COVERAGE_VALUE',
+        0x80AB : 'GL_SAMPLE_COVERAGE_INVERT',
+        0x86A2 : 'GL_NUM_COMPRESSED_TEXTURE_FORMATS',
+        0x86A3 : 'GL_COMPRESSED_TEXTURE_FORMATS',
+        0x8869 : 'GL_MAX_VERTEX_ATTRIBS',
+        0x8DFB : 'GL_MAX_VERTEX_UNIFORM_VECTORS',
+        0x8DFC : 'GL_MAX_VARYING_VECTORS',
+        0x8B4D : 'GL_MAX_COMBINED_TEXTURE_IMAGE_UNITS',
+        0x8B4C : 'GL_MAX_VERTEX_TEXTURE_IMAGE_UNITS',
+        0x8872 : 'GL_MAX_TEXTURE_IMAGE_UNITS',
+        0x8DFD : 'GL_MAX_FRAGMENT_UNIFORM_VECTORS',
+        0x8B8D : 'GL_CURRENT_PROGRAM',
+        0x8514 : 'GL_TEXTURE_BINDING_CUBE_MAP',
+        0x851C : 'GL_MAX_CUBE_MAP_TEXTURE_SIZE',
+        0x84E0 : 'GL_ACTIVE_TEXTURE',
+        0x8B9A : 'GL_IMPLEMENTATION_COLOR_READ_TYPE',
+        0x8B9B : 'GL_IMPLEMENTATION_COLOR_READ_FORMAT',
+        0x8DFA : 'GL_SHADER_COMPILER',
+        0x8DF8 : 'GL_SHADER_BINARY_FORMATS',
+        0x8DF9 : 'GL_NUM_SHADER_BINARY_FORMATS',
+        0x8CA7 : 'GL_RENDERBUFFER_BINDING',
+        0x84E8 : 'GL_MAX_RENDERBUFFER_SIZE',
+        0x0C02 : 'GL_READ_BUFFER',
+        0x0CF2 : 'GL_UNPACK_ROW_LENGTH',
+        0x0CF3 : 'GL_UNPACK_SKIP_ROWS',
+        0x0CF4 : 'GL_UNPACK_SKIP_PIXELS',
+        0x0D02 : 'GL_PACK_ROW_LENGTH',
+        0x0D03 : 'GL_PACK_SKIP_ROWS',
+        0x0D04 : 'GL_PACK_SKIP_PIXELS',
+        0x806A : 'GL_TEXTURE_BINDING_3D',
+        0x806D : 'GL_UNPACK_SKIP_IMAGES',
+        0x806E : 'GL_UNPACK_IMAGE_HEIGHT',
+        0x8073 : 'GL_MAX_3D_TEXTURE_SIZE',
+        0x80E8 : 'GL_MAX_ELEMENTS_VERTICES',
+        0x80E9 : 'GL_MAX_ELEMENTS_INDICES',
+        0x84FD : 'GL_MAX_TEXTURE_LOD_BIAS',
+        0x8824 : 'GL_MAX_DRAW_BUFFERS',
+        0x8B49 : 'GL_MAX_FRAGMENT_UNIFORM_COMPONENTS',
+        0x8B4A : 'GL_MAX_VERTEX_UNIFORM_COMPONENTS',
+        0x8B8B : 'GL_FRAGMENT_SHADER_DERIVATIVE_HINT',
+        0x88ED : 'GL_PIXEL_PACK_BUFFER_BINDING',
+        0x88EF : 'GL_PIXEL_UNPACK_BUFFER_BINDING',
+        0x821B : 'GL_MAJOR_VERSION',
+        0x821C : 'GL_MINOR_VERSION',
+        0x821D : 'GL_NUM_EXTENSIONS',
+        0x88FF : 'GL_MAX_ARRAY_TEXTURE_LAYERS',
+        0x8904 : 'GL_MIN_PROGRAM_TEXEL_OFFSET',
+        0x8905 : 'GL_MAX_PROGRAM_TEXEL_OFFSET',
+        0x8B4B : 'GL_MAX_VARYING_COMPONENTS',
+        0x8C1D : 'GL_TEXTURE_BINDING_2D_ARRAY',
+        0x8C84 : 'GL_TRANSFORM_FEEDBACK_BUFFER_START',
+        0x8C85 : 'GL_TRANSFORM_FEEDBACK_BUFFER_SIZE',
+        0x8C8F : 'GL_TRANSFORM_FEEDBACK_BUFFER_BINDING',
+        0x8CA6 : 'GL_DRAW_FRAMEBUFFER_BINDING',
+        0x8CAA : 'GL_READ_FRAMEBUFFER_BINDING',
+        0x8CDF : 'GL_MAX_COLOR_ATTACHMENTS',
+        0x85B5 : 'GL_VERTEX_ARRAY_BINDING',
+        0x8A28 : 'GL_UNIFORM_BUFFER_BINDING',
+        0x8A29 : 'GL_UNIFORM_BUFFER_START',
+        0x8A2A : 'GL_UNIFORM_BUFFER_SIZE',
+        0x8A2B : 'GL_MAX_VERTEX_UNIFORM_BLOCKS',
+        0x8A2D : 'GL_MAX_FRAGMENT_UNIFORM_BLOCKS',
+        0x8A2E : 'GL_MAX_COMBINED_UNIFORM_BLOCKS',
+        0x8A2F : 'GL_MAX_UNIFORM_BUFFER_BINDINGS',
+        0x8A30 : 'GL_MAX_UNIFORM_BLOCK_SIZE',
+        0x8A31 : 'GL_MAX_COMBINED_VERTEX_UNIFORM_COMPONENTS',
+        0x8A33 : 'GL_MAX_COMBINED_FRAGMENT_UNIFORM_COMPONENTS',
+        0x8A34 : 'GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT',
+        0x9122 : 'GL_MAX_VERTEX_OUTPUT_COMPONENTS',
+        0x9125 : 'GL_MAX_FRAGMENT_INPUT_COMPONENTS',
+        0x9111 : 'GL_MAX_SERVER_WAIT_TIMEOUT',
+        0x8919 : 'GL_SAMPLER_BINDING',
+        0x87FE : 'GL_NUM_PROGRAM_BINARY_FORMATS',
+        0x87FF : 'GL_PROGRAM_BINARY_FORMATS',
+        0x8D6B : 'GL_MAX_ELEMENT_INDEX',
+        0x91BB : 'GL_MAX_COMPUTE_UNIFORM_BLOCKS',
+        0x91BC : 'GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS',
+        0x8263 : 'GL_MAX_COMPUTE_UNIFORM_COMPONENTS',
+        0x8264 : 'GL_MAX_COMPUTE_ATOMIC_COUNTER_BUFFERS',
+        0x8265 : 'GL_MAX_COMPUTE_ATOMIC_COUNTERS',
+        0x8266 : 'GL_MAX_COMBINED_COMPUTE_UNIFORM_COMPONENTS',
+        0x90EB : 'GL_MAX_COMPUTE_WORK_GROUP_INVOCATIONS',
+        0x91BE : 'GL_MAX_COMPUTE_WORK_GROUP_COUNT',
+        0x91BF : 'GL_MAX_COMPUTE_WORK_GROUP_SIZE',
+        0x90EF : 'GL_DISPATCH_INDIRECT_BUFFER_BINDING',
+        0x826E : 'GL_MAX_UNIFORM_LOCATIONS',
+        0x9315 : 'GL_MAX_FRAMEBUFFER_WIDTH',
+        0x9316 : 'GL_MAX_FRAMEBUFFER_HEIGHT',
+        0x9318 : 'GL_MAX_FRAMEBUFFER_SAMPLES',
+        0x825A : 'GL_PROGRAM_PIPELINE_BINDING',
+        0x92D2 : 'GL_MAX_VERTEX_ATOMIC_COUNTERS',
+        0x92D6 : 'GL_MAX_FRAGMENT_ATOMIC_COUNTERS',
+        0x92D7 : 'GL_MAX_COMBINED_ATOMIC_COUNTERS',
+        0x90D3 : 'GL_SHADER_STORAGE_BUFFER_BINDING',
+        0x90D4 : 'GL_SHADER_STORAGE_BUFFER_START',
+        0x90D5 : 'GL_SHADER_STORAGE_BUFFER_SIZE',
+        0x90D6 : 'GL_MAX_VERTEX_SHADER_STORAGE_BLOCKS',
+        0x90DA : 'GL_MAX_FRAGMENT_SHADER_STORAGE_BLOCKS',
+        0x90DB : 'GL_MAX_COMPUTE_SHADER_STORAGE_BLOCKS',
+        0x90DC : 'GL_MAX_COMBINED_SHADER_STORAGE_BLOCKS',
+        0x90DD : 'GL_MAX_SHADER_STORAGE_BUFFER_BINDINGS',
+        0x90DF : 'GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT',
+        0x8E59 : 'GL_MAX_SAMPLE_MASK_WORDS',
+        0x910E : 'GL_MAX_COLOR_TEXTURE_SAMPLES',
+        0x910F : 'GL_MAX_DEPTH_TEXTURE_SAMPLES',
+        0x9110 : 'GL_MAX_INTEGER_SAMPLES',
+        0x9104 : 'GL_TEXTURE_BINDING_2D_MULTISAMPLE',
+        0x82D6 : 'GL_VERTEX_BINDING_DIVISOR',
+        0x82D7 : 'GL_VERTEX_BINDING_OFFSET',
+        0x82D8 : 'GL_VERTEX_BINDING_STRIDE',
+        0x82D9 : 'GL_MAX_VERTEX_ATTRIB_RELATIVE_OFFSET',
+        0x82DA : 'GL_MAX_VERTEX_ATTRIB_BINDINGS',
+        0x826C : 'GL_MAX_DEBUG_GROUP_STACK_DEPTH',
+        0x826D : 'GL_DEBUG_GROUP_STACK_DEPTH',
+        0x8074 : 'GL_VERTEX_ARRAY',
+        0x82E8 : 'GL_MAX_LABEL_LENGTH',
+        0x825E : 'GL_LAYER_PROVOKING_VERTEX',
+        0x8DDF : 'GL_MAX_GEOMETRY_UNIFORM_COMPONENTS',
+        0x8A2C : 'GL_MAX_GEOMETRY_UNIFORM_BLOCKS',
+        0x8A32 : 'GL_MAX_COMBINED_GEOMETRY_UNIFORM_COMPONENTS',
+        0x9123 : 'GL_MAX_GEOMETRY_INPUT_COMPONENTS',
+        0x9124 : 'GL_MAX_GEOMETRY_OUTPUT_COMPONENTS',
+        0x8C29 : 'GL_MAX_GEOMETRY_TEXTURE_IMAGE_UNITS',
+        0x92D5 : 'GL_MAX_GEOMETRY_ATOMIC_COUNTERS',
+        0x90D7 : 'GL_MAX_GEOMETRY_SHADER_STORAGE_BLOCKS',
+        0x9317 : 'GL_MAX_FRAMEBUFFER_LAYERS',
+        0x821E : 'GL_CONTEXT_FLAGS',
+        0x8E89 : 'GL_MAX_TESS_CONTROL_UNIFORM_BLOCKS',
+        0x8E8A : 'GL_MAX_TESS_EVALUATION_UNIFORM_BLOCKS',
+        0x92D3 : 'GL_MAX_TESS_CONTROL_ATOMIC_COUNTERS',
+        0x92D4 : 'GL_MAX_TESS_EVALUATION_ATOMIC_COUNTERS',
+        0x90D8 : 'GL_MAX_TESS_CONTROL_SHADER_STORAGE_BLOCKS',
+        0x90D9 : 'GL_MAX_TESS_EVALUATION_SHADER_STORAGE_BLOCKS',
+        0x8C2B : 'GL_MAX_TEXTURE_BUFFER_SIZE',
+        0x8C2C : 'GL_TEXTURE_BINDING_BUFFER',
+        0x919F : 'GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT',
+        0x9105 : 'GL_TEXTURE_BINDING_2D_MULTISAMPLE_ARRAY',
+        0x806C : 'GL_PACK_IMAGE_HEIGHT',
+        0x806B : 'GL_PACK_SKIP_IMAGES',
+        0x96F0 : 'GL_SHADER_CORE_COUNT_ARM',
+        0x96F1 : 'GL_SHADER_CORE_ACTIVE_COUNT_ARM',
+        0x96F2 : 'GL_SHADER_CORE_PRESENT_MASK_ARM',
+        0x96F3 : 'GL_SHADER_CORE_MAX_WARP_COUNT_ARM',
+        0x96F4 : 'GL_SHADER_CORE_PIXEL_RATE_ARM',
+        0x96F5 : 'GL_SHADER_CORE_TEXEL_RATE_ARM',
+        0x96F6 : 'GL_SHADER_CORE_FMA_RATE_ARM',
+        0x8F65 : 'GL_FETCH_PER_SAMPLE_ARM',
+        0x8F66 : 'GL_FRAGMENT_SHADER_FRAMEBUFFER_FETCH_MRT_ARM',
+        0x8E28 : 'GL_TIMESTAMP_EXT',
+        0x96D0 : 'GL_SHADING_RATE_EXT',
+        0x96D7 : 'GL_MIN_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_WIDTH_EXT',
+        0x96D8 : 'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_WIDTH_EXT',
+        0x96D9 : 'GL_MIN_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_HEIGHT_EXT',
+        0x96DA : 'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_HEIGHT_EXT',
+        0x96DB : 'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_TEXEL_ASPECT_RATIO_EXT',
+        0x96DC : 'GL_MAX_FRAGMENT_SHADING_RATE_ATTACHMENT_LAYERS_EXT',
+        0x96DD : 'GL_FRAGMENT_SHADING_RATE_WITH_SHADER_DEPTH_STENCIL_WRITES_SUPPORTED_EXT',
+        0x96DE : 'GL_FRAGMENT_SHADING_RATE_WITH_SAMPLE_MASK_SUPPORTED_EXT',
+        0x96DF : 'GL_FRAGMENT_SHADING_RATE_ATTACHMENT_WITH_DEFAULT_FRAMEBUFFER_SUPPORTED_EXT',
+        0x8F6F : 'GL_FRAGMENT_SHADING_RATE_NON_TRIVIAL_COMBINERS_SUPPORTED_EXT',
+        0x9596 : 'GL_NUM_DEVICE_UUIDS_EXT',
+        0x9597 : 'GL_DEVICE_UUID_EXT',
+        0x9598 : 'GL_DRIVER_UUID_EXT',
+        0x9599 : 'GL_DEVICE_LUID_EXT',
+        0x959A : 'GL_DEVICE_NODE_MASK_EXT',
+        0x0C01 : 'GL_DRAW_BUFFER_EXT',
+        0x95B6 : 'GL_MAX_TIMELINE_SEMAPHORE_VALUE_DIFFERENCE_NV',
+        0x95B1 : 'GL_SHADING_RATE_IMAGE_PER_PRIMITIVE_NV',
+        0x95B2 : 'GL_SHADING_RATE_IMAGE_PALETTE_COUNT_NV',
+        0x0BC0 : 'GL_ALPHA_TEST_QCOM',
+        0x0BC1 : 'GL_ALPHA_TEST_FUNC_QCOM',
+        0x0BC2 : 'GL_ALPHA_TEST_REF_QCOM',
+        0x8C90 : 'GL_MOTION_ESTIMATION_SEARCH_BLOCK_X_QCOM',
+        0x8C91 : 'GL_MOTION_ESTIMATION_SEARCH_BLOCK_Y_QCOM',
+        0x96A2 : 'GL_FRAMEBUFFER_FETCH_NONCOHERENT_QCOM',
+        0x96A4 : 'GL_SHADING_RATE_QCOM',
+    },
+    'GetPointervPName' : {
+        0x8244 : 'GL_DEBUG_CALLBACK_FUNCTION',
+        0x8245 : 'GL_DEBUG_CALLBACK_USER_PARAM',
+    },
+    'GetTextureParameter' : {
+        0x2800 : 'GL_TEXTURE_MAG_FILTER',
+        0x2801 : 'GL_TEXTURE_MIN_FILTER',
+        0x2802 : 'GL_TEXTURE_WRAP_S',
+        0x2803 : 'GL_TEXTURE_WRAP_T',
+        0x1000 : 'GL_TEXTURE_WIDTH',
+        0x1001 : 'GL_TEXTURE_HEIGHT',
+        0x1003 : 'GL_TEXTURE_INTERNAL_FORMAT',
+        0x805C : 'GL_TEXTURE_RED_SIZE',
+        0x805D : 'GL_TEXTURE_GREEN_SIZE',
+        0x805E : 'GL_TEXTURE_BLUE_SIZE',
+        0x805F : 'GL_TEXTURE_ALPHA_SIZE',
+        0x1004 : 'GL_TEXTURE_BORDER_COLOR',
+        0x8F6A : 'GL_TEXTURE_UNNORMALIZED_COORDINATES_ARM',
+        0x96C0 : 'GL_SURFACE_COMPRESSION_EXT',
+        0x9710 : 'GL_TEXTURE_Y_DEGAMMA_QCOM',
+        0x9711 : 'GL_TEXTURE_CBCR_DEGAMMA_QCOM',
+    },
+    'GraphicsResetStatus' : {
+        0x0000 : 'GL_NO_ERROR',
+        0x8253 : 'GL_GUILTY_CONTEXT_RESET',
+        0x8254 : 'GL_INNOCENT_CONTEXT_RESET',
+        0x8255 : 'GL_UNKNOWN_CONTEXT_RESET',
+    },
+    'HintMode' : {
+        0x1100 : 'GL_DONT_CARE',
+        0x1101 : 'GL_FASTEST',
+        0x1102 : 'GL_NICEST',
+    },
+    'HintTarget' : {
+        0x8192 : 'GL_GENERATE_MIPMAP_HINT',
+        0x8B8B : 'GL_FRAGMENT_SHADER_DERIVATIVE_HINT',
+        0x8257 : 'GL_PROGRAM_BINARY_RETRIEVABLE_HINT',
+        0x8FB0 : 'GL_BINNING_CONTROL_HINT_QCOM',
+    },
+    'IndexFunctionEXT' : {
+        0x0200 : 'GL_NEVER',
+        0x0201 : 'GL_LESS',
+        0x0202 : 'GL_EQUAL',
+        0x0203 : 'GL_LEQUAL',
+        0x0204 : 'GL_GREATER',
+        0x0205 : 'GL_NOTEQUAL',
+        0x0206 : 'GL_GEQUAL',
+        0x0207 : 'GL_ALWAYS',
+    },
+    'IndexPointerType' : {
+        0x1402 : 'GL_SHORT',
+        0x1404 : 'GL_INT',
+        0x1406 : 'GL_FLOAT',
+    },
+    'InstancedPathCoverMode' : {
+        0x9082 : 'GL_PATH_FILL_COVER_MODE_NV',
+        0x908B : 'GL_CONVEX_HULL_NV',
+        0x908D : 'GL_BOUNDING_BOX_NV',
+        0x909C : 'GL_BOUNDING_BOX_OF_BOUNDING_BOXES_NV',
+    },
+    'InternalFormat' : {
+        0x1902 : 'GL_DEPTH_COMPONENT',
+        0x1907 : 'GL_RGB',
+        0x1908 : 'GL_RGBA',
+        0x8056 : 'GL_RGBA4',
+        0x8057 : 'GL_RGB5_A1',
+        0x8D62 : 'GL_RGB565',
+        0x81A5 : 'GL_DEPTH_COMPONENT16',
+        0x8D48 : 'GL_STENCIL_INDEX8',
+        0x1903 : 'GL_RED',
+        0x8051 : 'GL_RGB8',
+        0x8058 : 'GL_RGBA8',
+        0x8059 : 'GL_RGB10_A2',
+        0x81A6 : 'GL_DEPTH_COMPONENT24',
+        0x8C40 : 'GL_SRGB',
+        0x8C41 : 'GL_SRGB8',
+        0x8C43 : 'GL_SRGB8_ALPHA8',
+        0x8814 : 'GL_RGBA32F',
+        0x8815 : 'GL_RGB32F',
+        0x881A : 'GL_RGBA16F',
+        0x881B : 'GL_RGB16F',
+        0x8C3A : 'GL_R11F_G11F_B10F',
+        0x8C3D : 'GL_RGB9_E5',
+        0x8D70 : 'GL_RGBA32UI',
+        0x8D71 : 'GL_RGB32UI',
+        0x8D76 : 'GL_RGBA16UI',
+        0x8D77 : 'GL_RGB16UI',
+        0x8D7C : 'GL_RGBA8UI',
+        0x8D7D : 'GL_RGB8UI',
+        0x8D82 : 'GL_RGBA32I',
+        0x8D83 : 'GL_RGB32I',
+        0x8D88 : 'GL_RGBA16I',
+        0x8D89 : 'GL_RGB16I',
+        0x8D8E : 'GL_RGBA8I',
+        0x8D8F : 'GL_RGB8I',
+        0x8CAC : 'GL_DEPTH_COMPONENT32F',
+        0x8CAD : 'GL_DEPTH32F_STENCIL8',
+        0x84F9 : 'GL_DEPTH_STENCIL',
+        0x88F0 : 'GL_DEPTH24_STENCIL8',
+        0x8227 : 'GL_RG',
+        0x8229 : 'GL_R8',
+        0x822B : 'GL_RG8',
+        0x822D : 'GL_R16F',
+        0x822E : 'GL_R32F',
+        0x822F : 'GL_RG16F',
+        0x8230 : 'GL_RG32F',
+        0x8231 : 'GL_R8I',
+        0x8232 : 'GL_R8UI',
+        0x8233 : 'GL_R16I',
+        0x8234 : 'GL_R16UI',
+        0x8235 : 'GL_R32I',
+        0x8236 : 'GL_R32UI',
+        0x8237 : 'GL_RG8I',
+        0x8238 : 'GL_RG8UI',
+        0x8239 : 'GL_RG16I',
+        0x823A : 'GL_RG16UI',
+        0x823B : 'GL_RG32I',
+        0x823C : 'GL_RG32UI',
+        0x8F94 : 'GL_R8_SNORM',
+        0x8F95 : 'GL_RG8_SNORM',
+        0x8F96 : 'GL_RGB8_SNORM',
+        0x8F97 : 'GL_RGBA8_SNORM',
+        0x906F : 'GL_RGB10_A2UI',
+        0x9270 : 'GL_COMPRESSED_R11_EAC',
+        0x9271 : 'GL_COMPRESSED_SIGNED_R11_EAC',
+        0x9272 : 'GL_COMPRESSED_RG11_EAC',
+        0x9273 : 'GL_COMPRESSED_SIGNED_RG11_EAC',
+        0x9274 : 'GL_COMPRESSED_RGB8_ETC2',
+        0x9275 : 'GL_COMPRESSED_SRGB8_ETC2',
+        0x9276 : 'GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2',
+        0x9277 : 'GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2',
+        0x9278 : 'GL_COMPRESSED_RGBA8_ETC2_EAC',
+        0x9279 : 'GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC',
+        0x1901 : 'GL_STENCIL_INDEX',
+        0x93B0 : 'GL_COMPRESSED_RGBA_ASTC_4x4',
+        0x93B1 : 'GL_COMPRESSED_RGBA_ASTC_5x4',
+        0x93B2 : 'GL_COMPRESSED_RGBA_ASTC_5x5',
+        0x93B3 : 'GL_COMPRESSED_RGBA_ASTC_6x5',
+        0x93B4 : 'GL_COMPRESSED_RGBA_ASTC_6x6',
+        0x93B5 : 'GL_COMPRESSED_RGBA_ASTC_8x5',
+        0x93B6 : 'GL_COMPRESSED_RGBA_ASTC_8x6',
+        0x93B7 : 'GL_COMPRESSED_RGBA_ASTC_8x8',
+        0x93B8 : 'GL_COMPRESSED_RGBA_ASTC_10x5',
+        0x93B9 : 'GL_COMPRESSED_RGBA_ASTC_10x6',
+        0x93BA : 'GL_COMPRESSED_RGBA_ASTC_10x8',
+        0x93BB : 'GL_COMPRESSED_RGBA_ASTC_10x10',
+        0x93BC : 'GL_COMPRESSED_RGBA_ASTC_12x10',
+        0x93BD : 'GL_COMPRESSED_RGBA_ASTC_12x12',
+        0x93D0 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4',
+        0x93D1 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4',
+        0x93D2 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5',
+        0x93D3 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5',
+        0x93D4 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6',
+        0x93D5 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5',
+        0x93D6 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6',
+        0x93D7 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8',
+        0x93D8 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5',
+        0x93D9 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6',
+        0x93DA : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8',
+        0x93DB : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10',
+        0x93DC : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10',
+        0x93DD : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12',
+        0x81A7 : 'GL_DEPTH_COMPONENT32_OES',
+        0x83F2 : 'GL_COMPRESSED_RGBA_S3TC_DXT3_ANGLE',
+        0x83F3 : 'GL_COMPRESSED_RGBA_S3TC_DXT5_ANGLE',
+        0x8F98 : 'GL_R16_SNORM_EXT',
+        0x8F99 : 'GL_RG16_SNORM_EXT',
+        0x8F9B : 'GL_RGBA16_SNORM_EXT',
+        0x8C42 : 'GL_SRGB_ALPHA_EXT',
+        0x8E8C : 'GL_COMPRESSED_RGBA_BPTC_UNORM_EXT',
+        0x8E8D : 'GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM_EXT',
+        0x8E8E : 'GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT_EXT',
+        0x8E8F : 'GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT_EXT',
+        0x83F0 : 'GL_COMPRESSED_RGB_S3TC_DXT1_EXT',
+        0x83F1 : 'GL_COMPRESSED_RGBA_S3TC_DXT1_EXT',
+        0x8DBB : 'GL_COMPRESSED_RED_RGTC1_EXT',
+        0x8DBC : 'GL_COMPRESSED_SIGNED_RED_RGTC1_EXT',
+        0x8DBD : 'GL_COMPRESSED_RED_GREEN_RGTC2_EXT',
+        0x8DBE : 'GL_COMPRESSED_SIGNED_RED_GREEN_RGTC2_EXT',
+        0x8C4C : 'GL_COMPRESSED_SRGB_S3TC_DXT1_EXT',
+        0x8C4D : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT',
+        0x8C4E : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT',
+        0x8C4F : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT',
+        0x822A : 'GL_R16_EXT',
+        0x822C : 'GL_RG16_EXT',
+        0x805B : 'GL_RGBA16_EXT',
+        0x8054 : 'GL_RGB16_EXT',
+        0x8F9A : 'GL_RGB16_SNORM_EXT',
+        0x8FBD : 'GL_SR8_EXT',
+        0x8FBE : 'GL_SRG8_EXT',
+        0x803C : 'GL_ALPHA8_EXT',
+        0x8040 : 'GL_LUMINANCE8_EXT',
+        0x8045 : 'GL_LUMINANCE8_ALPHA8_EXT',
+        0x8052 : 'GL_RGB10_EXT',
+        0x8D64 : 'GL_ETC1_RGB8_OES',
+        0x8043 : 'GL_LUMINANCE4_ALPHA4_OES',
+        0x8D46 : 'GL_STENCIL_INDEX1_OES',
+        0x8D47 : 'GL_STENCIL_INDEX4_OES',
+        0x93C0 : 'GL_COMPRESSED_RGBA_ASTC_3x3x3_OES',
+        0x93C1 : 'GL_COMPRESSED_RGBA_ASTC_4x3x3_OES',
+        0x93C2 : 'GL_COMPRESSED_RGBA_ASTC_4x4x3_OES',
+        0x93C3 : 'GL_COMPRESSED_RGBA_ASTC_4x4x4_OES',
+        0x93C4 : 'GL_COMPRESSED_RGBA_ASTC_5x4x4_OES',
+        0x93C5 : 'GL_COMPRESSED_RGBA_ASTC_5x5x4_OES',
+        0x93C6 : 'GL_COMPRESSED_RGBA_ASTC_5x5x5_OES',
+        0x93C7 : 'GL_COMPRESSED_RGBA_ASTC_6x5x5_OES',
+        0x93C8 : 'GL_COMPRESSED_RGBA_ASTC_6x6x5_OES',
+        0x93C9 : 'GL_COMPRESSED_RGBA_ASTC_6x6x6_OES',
+        0x93E0 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_3x3x3_OES',
+        0x93E1 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x3x3_OES',
+        0x93E2 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4x3_OES',
+        0x93E3 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4x4_OES',
+        0x93E4 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4x4_OES',
+        0x93E5 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5x4_OES',
+        0x93E6 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5x5_OES',
+        0x93E7 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5x5_OES',
+        0x93E8 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6x5_OES',
+        0x93E9 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6x6_OES',
+    },
+    'InternalFormatPName' : {
+        0x80A9 : 'GL_SAMPLES',
+        0x9380 : 'GL_NUM_SAMPLE_COUNTS',
+        0x90C7 : 'GL_IMAGE_FORMAT_COMPATIBILITY_TYPE',
+        0x86A1 : 'GL_TEXTURE_COMPRESSED',
+        0x8F6E : 'GL_NUM_SURFACE_COMPRESSION_FIXED_RATES_EXT',
+    },
+    'InvalidateFramebufferAttachment' : {
+        0x8CE0 : 'GL_COLOR_ATTACHMENT0',
+        0x8D00 : 'GL_DEPTH_ATTACHMENT',
+        0x1800 : 'GL_COLOR',
+        0x1801 : 'GL_DEPTH',
+        0x1802 : 'GL_STENCIL',
+        0x821A : 'GL_DEPTH_STENCIL_ATTACHMENT',
+        0x8CE1 : 'GL_COLOR_ATTACHMENT1',
+        0x8CE2 : 'GL_COLOR_ATTACHMENT2',
+        0x8CE3 : 'GL_COLOR_ATTACHMENT3',
+        0x8CE4 : 'GL_COLOR_ATTACHMENT4',
+        0x8CE5 : 'GL_COLOR_ATTACHMENT5',
+        0x8CE6 : 'GL_COLOR_ATTACHMENT6',
+        0x8CE7 : 'GL_COLOR_ATTACHMENT7',
+        0x8CE8 : 'GL_COLOR_ATTACHMENT8',
+        0x8CE9 : 'GL_COLOR_ATTACHMENT9',
+        0x8CEA : 'GL_COLOR_ATTACHMENT10',
+        0x8CEB : 'GL_COLOR_ATTACHMENT11',
+        0x8CEC : 'GL_COLOR_ATTACHMENT12',
+        0x8CED : 'GL_COLOR_ATTACHMENT13',
+        0x8CEE : 'GL_COLOR_ATTACHMENT14',
+        0x8CEF : 'GL_COLOR_ATTACHMENT15',
+        0x8CF0 : 'GL_COLOR_ATTACHMENT16',
+        0x8CF1 : 'GL_COLOR_ATTACHMENT17',
+        0x8CF2 : 'GL_COLOR_ATTACHMENT18',
+        0x8CF3 : 'GL_COLOR_ATTACHMENT19',
+        0x8CF4 : 'GL_COLOR_ATTACHMENT20',
+        0x8CF5 : 'GL_COLOR_ATTACHMENT21',
+        0x8CF6 : 'GL_COLOR_ATTACHMENT22',
+        0x8CF7 : 'GL_COLOR_ATTACHMENT23',
+        0x8CF8 : 'GL_COLOR_ATTACHMENT24',
+        0x8CF9 : 'GL_COLOR_ATTACHMENT25',
+        0x8CFA : 'GL_COLOR_ATTACHMENT26',
+        0x8CFB : 'GL_COLOR_ATTACHMENT27',
+        0x8CFC : 'GL_COLOR_ATTACHMENT28',
+        0x8CFD : 'GL_COLOR_ATTACHMENT29',
+        0x8CFE : 'GL_COLOR_ATTACHMENT30',
+        0x8CFF : 'GL_COLOR_ATTACHMENT31',
+    },
+    'LightEnvModeSGIX' : {
+        0x1E01 : 'GL_REPLACE',
+    },
+    'ListNameType' : {
+        0x1400 : 'GL_BYTE',
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1402 : 'GL_SHORT',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1404 : 'GL_INT',
+        0x1405 : 'GL_UNSIGNED_INT',
+        0x1406 : 'GL_FLOAT',
+    },
+    'LogicOp' : {
+        0x150A : 'GL_INVERT',
+    },
+    'MapBufferAccessMask' : {
+        0x0001 : 'GL_MAP_READ_BIT',
+        0x0002 : 'GL_MAP_WRITE_BIT',
+        0x0004 : 'GL_MAP_INVALIDATE_RANGE_BIT',
+        0x0008 : 'GL_MAP_INVALIDATE_BUFFER_BIT',
+        0x0010 : 'GL_MAP_FLUSH_EXPLICIT_BIT',
+        0x0020 : 'GL_MAP_UNSYNCHRONIZED_BIT',
+        0x0040 : 'GL_MAP_PERSISTENT_BIT_EXT',
+        0x0080 : 'GL_MAP_COHERENT_BIT_EXT',
+    },
+    'MapTypeNV' : {
+        0x1406 : 'GL_FLOAT',
+    },
+    'MatrixIndexPointerTypeARB' : {
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1405 : 'GL_UNSIGNED_INT',
+    },
+    'MatrixMode' : {
+        0x1702 : 'GL_TEXTURE',
+    },
+    'MemoryBarrierMask' : {
+        0x0001 : 'GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT',
+        0x0002 : 'GL_ELEMENT_ARRAY_BARRIER_BIT',
+        0x0004 : 'GL_UNIFORM_BARRIER_BIT',
+        0x0008 : 'GL_TEXTURE_FETCH_BARRIER_BIT',
+        0x0020 : 'GL_SHADER_IMAGE_ACCESS_BARRIER_BIT',
+        0x0040 : 'GL_COMMAND_BARRIER_BIT',
+        0x0080 : 'GL_PIXEL_BUFFER_BARRIER_BIT',
+        0x0100 : 'GL_TEXTURE_UPDATE_BARRIER_BIT',
+        0x0200 : 'GL_BUFFER_UPDATE_BARRIER_BIT',
+        0x0400 : 'GL_FRAMEBUFFER_BARRIER_BIT',
+        0x0800 : 'GL_TRANSFORM_FEEDBACK_BARRIER_BIT',
+        0x1000 : 'GL_ATOMIC_COUNTER_BARRIER_BIT',
+        0xFFFFFFFF : 'GL_ALL_BARRIER_BITS',
+        0x2000 : 'GL_SHADER_STORAGE_BARRIER_BIT',
+        0x4000 : 'GL_CLIENT_MAPPED_BUFFER_BARRIER_BIT_EXT',
+    },
+    'MemoryObjectParameterName' : {
+        0x9581 : 'GL_DEDICATED_MEMORY_OBJECT_EXT',
+        0x959B : 'GL_PROTECTED_MEMORY_OBJECT_EXT',
+    },
+    'NormalPointerType' : {
+        0x1400 : 'GL_BYTE',
+        0x1402 : 'GL_SHORT',
+        0x1404 : 'GL_INT',
+        0x1406 : 'GL_FLOAT',
+    },
+    'ObjectIdentifier' : {
+        0x1702 : 'GL_TEXTURE',
+        0x8D40 : 'GL_FRAMEBUFFER',
+        0x8D41 : 'GL_RENDERBUFFER',
+        0x8E22 : 'GL_TRANSFORM_FEEDBACK',
+        0x82E0 : 'GL_BUFFER',
+        0x82E1 : 'GL_SHADER',
+        0x82E2 : 'GL_PROGRAM',
+        0x8074 : 'GL_VERTEX_ARRAY',
+        0x82E3 : 'GL_QUERY',
+        0x82E4 : 'GL_PROGRAM_PIPELINE',
+        0x82E6 : 'GL_SAMPLER',
+    },
+    'PatchParameterName' : {
+        0x8E72 : 'GL_PATCH_VERTICES',
+    },
+    'PathColorFormat' : {
+        0x1906 : 'GL_ALPHA',
+        0x1907 : 'GL_RGB',
+        0x1908 : 'GL_RGBA',
+        0x1909 : 'GL_LUMINANCE',
+        0x190A : 'GL_LUMINANCE_ALPHA',
+        0x0000 : 'GL_NONE',
+    },
+    'PathCoordType' : {
+        0x0000 : 'GL_CLOSE_PATH_NV',
+        0x0002 : 'GL_MOVE_TO_NV',
+        0x0003 : 'GL_RELATIVE_MOVE_TO_NV',
+        0x0004 : 'GL_LINE_TO_NV',
+        0x0005 : 'GL_RELATIVE_LINE_TO_NV',
+        0x0006 : 'GL_HORIZONTAL_LINE_TO_NV',
+        0x0007 : 'GL_RELATIVE_HORIZONTAL_LINE_TO_NV',
+        0x0008 : 'GL_VERTICAL_LINE_TO_NV',
+        0x0009 : 'GL_RELATIVE_VERTICAL_LINE_TO_NV',
+        0x000A : 'GL_QUADRATIC_CURVE_TO_NV',
+        0x000B : 'GL_RELATIVE_QUADRATIC_CURVE_TO_NV',
+        0x000C : 'GL_CUBIC_CURVE_TO_NV',
+        0x000D : 'GL_RELATIVE_CUBIC_CURVE_TO_NV',
+        0x000E : 'GL_SMOOTH_QUADRATIC_CURVE_TO_NV',
+        0x000F : 'GL_RELATIVE_SMOOTH_QUADRATIC_CURVE_TO_NV',
+        0x0010 : 'GL_SMOOTH_CUBIC_CURVE_TO_NV',
+        0x0011 : 'GL_RELATIVE_SMOOTH_CUBIC_CURVE_TO_NV',
+        0x0012 : 'GL_SMALL_CCW_ARC_TO_NV',
+        0x0013 : 'GL_RELATIVE_SMALL_CCW_ARC_TO_NV',
+        0x0014 : 'GL_SMALL_CW_ARC_TO_NV',
+        0x0015 : 'GL_RELATIVE_SMALL_CW_ARC_TO_NV',
+        0x0016 : 'GL_LARGE_CCW_ARC_TO_NV',
+        0x0017 : 'GL_RELATIVE_LARGE_CCW_ARC_TO_NV',
+        0x0018 : 'GL_LARGE_CW_ARC_TO_NV',
+        0x0019 : 'GL_RELATIVE_LARGE_CW_ARC_TO_NV',
+        0x00F0 : 'GL_RESTART_PATH_NV',
+        0x00F2 : 'GL_DUP_FIRST_CUBIC_CURVE_TO_NV',
+        0x00F4 : 'GL_DUP_LAST_CUBIC_CURVE_TO_NV',
+        0x00F6 : 'GL_RECT_NV',
+        0x00F8 : 'GL_CIRCULAR_CCW_ARC_TO_NV',
+        0x00FA : 'GL_CIRCULAR_CW_ARC_TO_NV',
+        0x00FC : 'GL_CIRCULAR_TANGENT_ARC_TO_NV',
+        0x00FE : 'GL_ARC_TO_NV',
+        0x00FF : 'GL_RELATIVE_ARC_TO_NV',
+        0x00E8 : 'GL_ROUNDED_RECT_NV',
+        0x00E9 : 'GL_RELATIVE_ROUNDED_RECT_NV',
+        0x00EA : 'GL_ROUNDED_RECT2_NV',
+        0x00EB : 'GL_RELATIVE_ROUNDED_RECT2_NV',
+        0x00EC : 'GL_ROUNDED_RECT4_NV',
+        0x00ED : 'GL_RELATIVE_ROUNDED_RECT4_NV',
+        0x00EE : 'GL_ROUNDED_RECT8_NV',
+        0x00EF : 'GL_RELATIVE_ROUNDED_RECT8_NV',
+        0x00F7 : 'GL_RELATIVE_RECT_NV',
+        0x001A : 'GL_CONIC_CURVE_TO_NV',
+        0x001B : 'GL_RELATIVE_CONIC_CURVE_TO_NV',
+    },
+    'PathCoverMode' : {
+        0x9082 : 'GL_PATH_FILL_COVER_MODE_NV',
+        0x908B : 'GL_CONVEX_HULL_NV',
+        0x908D : 'GL_BOUNDING_BOX_NV',
+    },
+    'PathElementType' : {
+        0x909A : 'GL_UTF8_NV',
+        0x909B : 'GL_UTF16_NV',
+    },
+    'PathFillMode' : {
+        0x150A : 'GL_INVERT',
+        0x9080 : 'GL_PATH_FILL_MODE_NV',
+        0x9088 : 'GL_COUNT_UP_NV',
+        0x9089 : 'GL_COUNT_DOWN_NV',
+    },
+    'PathFontStyle' : {
+        0x0000 : 'GL_NONE',
+        0x0001 : 'GL_BOLD_BIT_NV',
+        0x0002 : 'GL_ITALIC_BIT_NV',
+    },
+    'PathFontTarget' : {
+        0x9072 : 'GL_STANDARD_FONT_NAME_NV',
+        0x9073 : 'GL_SYSTEM_FONT_NAME_NV',
+        0x9074 : 'GL_FILE_NAME_NV',
+    },
+    'PathGenMode' : {
+        0x0000 : 'GL_NONE',
+        0x908A : 'GL_PATH_OBJECT_BOUNDING_BOX_NV',
+    },
+    'PathHandleMissingGlyphs' : {
+        0x90A9 : 'GL_SKIP_MISSING_GLYPH_NV',
+        0x90AA : 'GL_USE_MISSING_GLYPH_NV',
+    },
+    'PathListMode' : {
+        0x90AD : 'GL_ACCUM_ADJACENT_PAIRS_NV',
+        0x90AE : 'GL_ADJACENT_PAIRS_NV',
+        0x90AF : 'GL_FIRST_TO_REST_NV',
+    },
+    'PathMetricMask' : {
+        0x0001 : 'GL_GLYPH_WIDTH_BIT_NV',
+        0x0002 : 'GL_GLYPH_HEIGHT_BIT_NV',
+        0x0004 : 'GL_GLYPH_HORIZONTAL_BEARING_X_BIT_NV',
+        0x0008 : 'GL_GLYPH_HORIZONTAL_BEARING_Y_BIT_NV',
+        0x0010 : 'GL_GLYPH_HORIZONTAL_BEARING_ADVANCE_BIT_NV',
+        0x0020 : 'GL_GLYPH_VERTICAL_BEARING_X_BIT_NV',
+        0x0040 : 'GL_GLYPH_VERTICAL_BEARING_Y_BIT_NV',
+        0x0080 : 'GL_GLYPH_VERTICAL_BEARING_ADVANCE_BIT_NV',
+        0x0100 : 'GL_GLYPH_HAS_KERNING_BIT_NV',
+        0x10000 : 'GL_FONT_X_MIN_BOUNDS_BIT_NV',
+        0x20000 : 'GL_FONT_Y_MIN_BOUNDS_BIT_NV',
+        0x40000 : 'GL_FONT_X_MAX_BOUNDS_BIT_NV',
+        0x80000 : 'GL_FONT_Y_MAX_BOUNDS_BIT_NV',
+        0x100000 : 'GL_FONT_UNITS_PER_EM_BIT_NV',
+        0x200000 : 'GL_FONT_ASCENDER_BIT_NV',
+        0x400000 : 'GL_FONT_DESCENDER_BIT_NV',
+        0x800000 : 'GL_FONT_HEIGHT_BIT_NV',
+        0x1000000 : 'GL_FONT_MAX_ADVANCE_WIDTH_BIT_NV',
+        0x2000000 : 'GL_FONT_MAX_ADVANCE_HEIGHT_BIT_NV',
+        0x4000000 : 'GL_FONT_UNDERLINE_POSITION_BIT_NV',
+        0x8000000 : 'GL_FONT_UNDERLINE_THICKNESS_BIT_NV',
+        0x10000000 : 'GL_FONT_HAS_KERNING_BIT_NV',
+        0x20000000 : 'GL_FONT_NUM_GLYPH_INDICES_BIT_NV',
+    },
+    'PathParameter' : {
+        0x9075 : 'GL_PATH_STROKE_WIDTH_NV',
+        0x9076 : 'GL_PATH_END_CAPS_NV',
+        0x9077 : 'GL_PATH_INITIAL_END_CAP_NV',
+        0x9078 : 'GL_PATH_TERMINAL_END_CAP_NV',
+        0x9079 : 'GL_PATH_JOIN_STYLE_NV',
+        0x907A : 'GL_PATH_MITER_LIMIT_NV',
+        0x907B : 'GL_PATH_DASH_CAPS_NV',
+        0x907C : 'GL_PATH_INITIAL_DASH_CAP_NV',
+        0x907D : 'GL_PATH_TERMINAL_DASH_CAP_NV',
+        0x907E : 'GL_PATH_DASH_OFFSET_NV',
+        0x907F : 'GL_PATH_CLIENT_LENGTH_NV',
+        0x9080 : 'GL_PATH_FILL_MODE_NV',
+        0x9081 : 'GL_PATH_FILL_MASK_NV',
+        0x9082 : 'GL_PATH_FILL_COVER_MODE_NV',
+        0x9083 : 'GL_PATH_STROKE_COVER_MODE_NV',
+        0x9084 : 'GL_PATH_STROKE_MASK_NV',
+        0x908A : 'GL_PATH_OBJECT_BOUNDING_BOX_NV',
+        0x909D : 'GL_PATH_COMMAND_COUNT_NV',
+        0x909E : 'GL_PATH_COORD_COUNT_NV',
+        0x909F : 'GL_PATH_DASH_ARRAY_COUNT_NV',
+        0x90A0 : 'GL_PATH_COMPUTED_LENGTH_NV',
+        0x90A1 : 'GL_PATH_FILL_BOUNDING_BOX_NV',
+        0x90A2 : 'GL_PATH_STROKE_BOUNDING_BOX_NV',
+        0x90B4 : 'GL_PATH_DASH_OFFSET_RESET_NV',
+    },
+    'PathStringFormat' : {
+        0x9070 : 'GL_PATH_FORMAT_SVG_NV',
+        0x9071 : 'GL_PATH_FORMAT_PS_NV',
+    },
+    'PathTransformType' : {
+        0x0000 : 'GL_NONE',
+        0x908E : 'GL_TRANSLATE_X_NV',
+        0x908F : 'GL_TRANSLATE_Y_NV',
+        0x9090 : 'GL_TRANSLATE_2D_NV',
+        0x9091 : 'GL_TRANSLATE_3D_NV',
+        0x9092 : 'GL_AFFINE_2D_NV',
+        0x9094 : 'GL_AFFINE_3D_NV',
+        0x9096 : 'GL_TRANSPOSE_AFFINE_2D_NV',
+        0x9098 : 'GL_TRANSPOSE_AFFINE_3D_NV',
+    },
+    'PerfQueryDataFlags' : {
+        0x83FB : 'GL_PERFQUERY_WAIT_INTEL',
+        0x83FA : 'GL_PERFQUERY_FLUSH_INTEL',
+        0x83F9 : 'GL_PERFQUERY_DONOT_FLUSH_INTEL',
+    },
+    'PerformanceQueryCapsMaskINTEL' : {
+        0x0000 : 'GL_PERFQUERY_SINGLE_CONTEXT_INTEL',
+        0x0001 : 'GL_PERFQUERY_GLOBAL_CONTEXT_INTEL',
+    },
+    'PipelineParameterName' : {
+        0x8B30 : 'GL_FRAGMENT_SHADER',
+        0x8B31 : 'GL_VERTEX_SHADER',
+        0x8B84 : 'GL_INFO_LOG_LENGTH',
+        0x8259 : 'GL_ACTIVE_PROGRAM',
+        0x8DD9 : 'GL_GEOMETRY_SHADER',
+        0x8E88 : 'GL_TESS_CONTROL_SHADER',
+        0x8E87 : 'GL_TESS_EVALUATION_SHADER',
+    },
+    'PixelCopyType' : {
+        0x1800 : 'GL_COLOR',
+        0x1801 : 'GL_DEPTH',
+        0x1802 : 'GL_STENCIL',
+    },
+    'PixelFormat' : {
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1405 : 'GL_UNSIGNED_INT',
+        0x1902 : 'GL_DEPTH_COMPONENT',
+        0x1906 : 'GL_ALPHA',
+        0x1907 : 'GL_RGB',
+        0x1908 : 'GL_RGBA',
+        0x1909 : 'GL_LUMINANCE',
+        0x190A : 'GL_LUMINANCE_ALPHA',
+        0x1903 : 'GL_RED',
+        0x8D94 : 'GL_RED_INTEGER',
+        0x8D98 : 'GL_RGB_INTEGER',
+        0x8D99 : 'GL_RGBA_INTEGER',
+        0x84F9 : 'GL_DEPTH_STENCIL',
+        0x8227 : 'GL_RG',
+        0x8228 : 'GL_RG_INTEGER',
+        0x1904 : 'GL_GREEN',
+        0x1905 : 'GL_BLUE',
+        0x1901 : 'GL_STENCIL_INDEX',
+        0x80E1 : 'GL_BGRA_EXT',
+        0x80E0 : 'GL_BGR_EXT',
+    },
+    'PixelStoreParameter' : {
+        0x0CF5 : 'GL_UNPACK_ALIGNMENT',
+        0x0D05 : 'GL_PACK_ALIGNMENT',
+        0x0CF2 : 'GL_UNPACK_ROW_LENGTH',
+        0x0CF3 : 'GL_UNPACK_SKIP_ROWS',
+        0x0CF4 : 'GL_UNPACK_SKIP_PIXELS',
+        0x0D02 : 'GL_PACK_ROW_LENGTH',
+        0x0D03 : 'GL_PACK_SKIP_ROWS',
+        0x0D04 : 'GL_PACK_SKIP_PIXELS',
+        0x806D : 'GL_UNPACK_SKIP_IMAGES',
+        0x806E : 'GL_UNPACK_IMAGE_HEIGHT',
+        0x806C : 'GL_PACK_IMAGE_HEIGHT',
+        0x806B : 'GL_PACK_SKIP_IMAGES',
+    },
+    'PixelTexGenModeSGIX' : {
+        0x1906 : 'GL_ALPHA',
+        0x1907 : 'GL_RGB',
+        0x1908 : 'GL_RGBA',
+        0x0000 : 'GL_NONE',
+    },
+    'PixelType' : {
+        0x1400 : 'GL_BYTE',
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1402 : 'GL_SHORT',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1404 : 'GL_INT',
+        0x1405 : 'GL_UNSIGNED_INT',
+        0x1406 : 'GL_FLOAT',
+        0x8033 : 'GL_UNSIGNED_SHORT_4_4_4_4',
+        0x8034 : 'GL_UNSIGNED_SHORT_5_5_5_1',
+        0x8363 : 'GL_UNSIGNED_SHORT_5_6_5',
+        0x8368 : 'GL_UNSIGNED_INT_2_10_10_10_REV',
+        0x8C3B : 'GL_UNSIGNED_INT_10F_11F_11F_REV',
+        0x8C3E : 'GL_UNSIGNED_INT_5_9_9_9_REV',
+        0x8DAD : 'GL_FLOAT_32_UNSIGNED_INT_24_8_REV',
+        0x84FA : 'GL_UNSIGNED_INT_24_8',
+        0x140B : 'GL_HALF_FLOAT',
+        0x8365 : 'GL_UNSIGNED_SHORT_4_4_4_4_REV_EXT',
+        0x8366 : 'GL_UNSIGNED_SHORT_1_5_5_5_REV_EXT',
+    },
+    'PrecisionType' : {
+        0x8DF0 : 'GL_LOW_FLOAT',
+        0x8DF1 : 'GL_MEDIUM_FLOAT',
+        0x8DF2 : 'GL_HIGH_FLOAT',
+        0x8DF3 : 'GL_LOW_INT',
+        0x8DF4 : 'GL_MEDIUM_INT',
+        0x8DF5 : 'GL_HIGH_INT',
+    },
+    'PrimitiveType' : {
+        0x0000 : 'GL_POINTS',
+        0x0001 : 'GL_LINES',
+        0x0002 : 'GL_LINE_LOOP',
+        0x0003 : 'GL_LINE_STRIP',
+        0x0004 : 'GL_TRIANGLES',
+        0x0005 : 'GL_TRIANGLE_STRIP',
+        0x0006 : 'GL_TRIANGLE_FAN',
+        0x000A : 'GL_LINES_ADJACENCY',
+        0x000B : 'GL_LINE_STRIP_ADJACENCY',
+        0x000C : 'GL_TRIANGLES_ADJACENCY',
+        0x000D : 'GL_TRIANGLE_STRIP_ADJACENCY',
+        0x000E : 'GL_PATCHES',
+        0x0007 : 'GL_QUADS',
+    },
+    'ProgramInterface' : {
+        0x8C8E : 'GL_TRANSFORM_FEEDBACK_BUFFER',
+        0x92E1 : 'GL_UNIFORM',
+        0x92E2 : 'GL_UNIFORM_BLOCK',
+        0x92E3 : 'GL_PROGRAM_INPUT',
+        0x92E4 : 'GL_PROGRAM_OUTPUT',
+        0x92E5 : 'GL_BUFFER_VARIABLE',
+        0x92E6 : 'GL_SHADER_STORAGE_BLOCK',
+        0x92F4 : 'GL_TRANSFORM_FEEDBACK_VARYING',
+    },
+    'ProgramInterfacePName' : {
+        0x92F5 : 'GL_ACTIVE_RESOURCES',
+        0x92F6 : 'GL_MAX_NAME_LENGTH',
+        0x92F7 : 'GL_MAX_NUM_ACTIVE_VARIABLES',
+    },
+    'ProgramParameterPName' : {
+        0x8257 : 'GL_PROGRAM_BINARY_RETRIEVABLE_HINT',
+        0x8258 : 'GL_PROGRAM_SEPARABLE',
+    },
+    'ProgramPropertyARB' : {
+        0x8B80 : 'GL_DELETE_STATUS',
+        0x8B82 : 'GL_LINK_STATUS',
+        0x8B83 : 'GL_VALIDATE_STATUS',
+        0x8B85 : 'GL_ATTACHED_SHADERS',
+        0x8B86 : 'GL_ACTIVE_UNIFORMS',
+        0x8B87 : 'GL_ACTIVE_UNIFORM_MAX_LENGTH',
+        0x8B89 : 'GL_ACTIVE_ATTRIBUTES',
+        0x8B8A : 'GL_ACTIVE_ATTRIBUTE_MAX_LENGTH',
+        0x8B84 : 'GL_INFO_LOG_LENGTH',
+        0x8C76 : 'GL_TRANSFORM_FEEDBACK_VARYING_MAX_LENGTH',
+        0x8C7F : 'GL_TRANSFORM_FEEDBACK_BUFFER_MODE',
+        0x8C83 : 'GL_TRANSFORM_FEEDBACK_VARYINGS',
+        0x8A35 : 'GL_ACTIVE_UNIFORM_BLOCK_MAX_NAME_LENGTH',
+        0x8A36 : 'GL_ACTIVE_UNIFORM_BLOCKS',
+        0x8741 : 'GL_PROGRAM_BINARY_LENGTH',
+        0x8267 : 'GL_COMPUTE_WORK_GROUP_SIZE',
+        0x92D9 : 'GL_ACTIVE_ATOMIC_COUNTER_BUFFERS',
+        0x8916 : 'GL_GEOMETRY_VERTICES_OUT',
+        0x8917 : 'GL_GEOMETRY_INPUT_TYPE',
+        0x8918 : 'GL_GEOMETRY_OUTPUT_TYPE',
+    },
+    'ProgramResourceProperty' : {
+        0x92E1 : 'GL_UNIFORM',
+        0x92F9 : 'GL_NAME_LENGTH',
+        0x92FA : 'GL_TYPE',
+        0x92FB : 'GL_ARRAY_SIZE',
+        0x92FC : 'GL_OFFSET',
+        0x92FD : 'GL_BLOCK_INDEX',
+        0x92FE : 'GL_ARRAY_STRIDE',
+        0x92FF : 'GL_MATRIX_STRIDE',
+        0x9300 : 'GL_IS_ROW_MAJOR',
+        0x9301 : 'GL_ATOMIC_COUNTER_BUFFER_INDEX',
+        0x9302 : 'GL_BUFFER_BINDING',
+        0x9303 : 'GL_BUFFER_DATA_SIZE',
+        0x9304 : 'GL_NUM_ACTIVE_VARIABLES',
+        0x9305 : 'GL_ACTIVE_VARIABLES',
+        0x9306 : 'GL_REFERENCED_BY_VERTEX_SHADER',
+        0x930A : 'GL_REFERENCED_BY_FRAGMENT_SHADER',
+        0x930B : 'GL_REFERENCED_BY_COMPUTE_SHADER',
+        0x930C : 'GL_TOP_LEVEL_ARRAY_SIZE',
+        0x930D : 'GL_TOP_LEVEL_ARRAY_STRIDE',
+        0x930E : 'GL_LOCATION',
+        0x9309 : 'GL_REFERENCED_BY_GEOMETRY_SHADER',
+        0x92E7 : 'GL_IS_PER_PATCH',
+        0x9307 : 'GL_REFERENCED_BY_TESS_CONTROL_SHADER',
+        0x9308 : 'GL_REFERENCED_BY_TESS_EVALUATION_SHADER',
+    },
+    'QueryCounterTarget' : {
+        0x8E28 : 'GL_TIMESTAMP_EXT',
+    },
+    'QueryObjectParameterName' : {
+        0x8866 : 'GL_QUERY_RESULT',
+        0x8867 : 'GL_QUERY_RESULT_AVAILABLE',
+    },
+    'QueryParameterName' : {
+        0x8865 : 'GL_CURRENT_QUERY',
+    },
+    'QueryTarget' : {
+        0x8C88 : 'GL_TRANSFORM_FEEDBACK_PRIMITIVES_WRITTEN',
+        0x8C2F : 'GL_ANY_SAMPLES_PASSED',
+        0x8D6A : 'GL_ANY_SAMPLES_PASSED_CONSERVATIVE',
+        0x8C87 : 'GL_PRIMITIVES_GENERATED',
+    },
+    'ReadBufferMode' : {
+        0x0404 : 'GL_FRONT',
+        0x0405 : 'GL_BACK',
+        0x8CE0 : 'GL_COLOR_ATTACHMENT0',
+        0x0000 : 'GL_NONE',
+        0x8CE1 : 'GL_COLOR_ATTACHMENT1',
+        0x8CE2 : 'GL_COLOR_ATTACHMENT2',
+        0x8CE3 : 'GL_COLOR_ATTACHMENT3',
+        0x8CE4 : 'GL_COLOR_ATTACHMENT4',
+        0x8CE5 : 'GL_COLOR_ATTACHMENT5',
+        0x8CE6 : 'GL_COLOR_ATTACHMENT6',
+        0x8CE7 : 'GL_COLOR_ATTACHMENT7',
+        0x8CE8 : 'GL_COLOR_ATTACHMENT8',
+        0x8CE9 : 'GL_COLOR_ATTACHMENT9',
+        0x8CEA : 'GL_COLOR_ATTACHMENT10',
+        0x8CEB : 'GL_COLOR_ATTACHMENT11',
+        0x8CEC : 'GL_COLOR_ATTACHMENT12',
+        0x8CED : 'GL_COLOR_ATTACHMENT13',
+        0x8CEE : 'GL_COLOR_ATTACHMENT14',
+        0x8CEF : 'GL_COLOR_ATTACHMENT15',
+    },
+    'RenderbufferParameterName' : {
+        0x8D42 : 'GL_RENDERBUFFER_WIDTH',
+        0x8D43 : 'GL_RENDERBUFFER_HEIGHT',
+        0x8D44 : 'GL_RENDERBUFFER_INTERNAL_FORMAT',
+        0x8D50 : 'GL_RENDERBUFFER_RED_SIZE',
+        0x8D51 : 'GL_RENDERBUFFER_GREEN_SIZE',
+        0x8D52 : 'GL_RENDERBUFFER_BLUE_SIZE',
+        0x8D53 : 'GL_RENDERBUFFER_ALPHA_SIZE',
+        0x8D54 : 'GL_RENDERBUFFER_DEPTH_SIZE',
+        0x8D55 : 'GL_RENDERBUFFER_STENCIL_SIZE',
+        0x8CAB : 'GL_RENDERBUFFER_SAMPLES',
+        0x91B2 : 'GL_RENDERBUFFER_STORAGE_SAMPLES_AMD',
+        0x9133 : 'GL_RENDERBUFFER_SAMPLES_IMG',
+    },
+    'RenderbufferTarget' : {
+        0x8D41 : 'GL_RENDERBUFFER',
+    },
+    'ReplacementCodeTypeSUN' : {
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1405 : 'GL_UNSIGNED_INT',
+    },
+    'SamplerParameterF' : {
+        0x813A : 'GL_TEXTURE_MIN_LOD',
+        0x813B : 'GL_TEXTURE_MAX_LOD',
+        0x1004 : 'GL_TEXTURE_BORDER_COLOR',
+        0x8F6A : 'GL_TEXTURE_UNNORMALIZED_COORDINATES_ARM',
+    },
+    'SamplerParameterI' : {
+        0x2800 : 'GL_TEXTURE_MAG_FILTER',
+        0x2801 : 'GL_TEXTURE_MIN_FILTER',
+        0x2802 : 'GL_TEXTURE_WRAP_S',
+        0x2803 : 'GL_TEXTURE_WRAP_T',
+        0x8072 : 'GL_TEXTURE_WRAP_R',
+        0x884C : 'GL_TEXTURE_COMPARE_MODE',
+        0x884D : 'GL_TEXTURE_COMPARE_FUNC',
+        0x8F6A : 'GL_TEXTURE_UNNORMALIZED_COORDINATES_ARM',
+    },
+    'ScalarType' : {
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1405 : 'GL_UNSIGNED_INT',
+    },
+    'SecondaryColorPointerTypeIBM' : {
+        0x1402 : 'GL_SHORT',
+        0x1404 : 'GL_INT',
+        0x1406 : 'GL_FLOAT',
+    },
+    'SemaphoreParameterName' : {
+        0x9595 : 'GL_D3D12_FENCE_VALUE_EXT',
+        0x95B3 : 'GL_SEMAPHORE_TYPE_NV',
+        0x95B4 : 'GL_SEMAPHORE_TYPE_BINARY_NV',
+        0x95B5 : 'GL_SEMAPHORE_TYPE_TIMELINE_NV',
+    },
+    'ShaderBinaryFormat' : {
+        0x8F60 : 'GL_MALI_SHADER_BINARY_ARM',
+        0x9250 : 'GL_SHADER_BINARY_DMP',
+        0x9260 : 'GL_GCCSO_SHADER_BINARY_FJ',
+        0x8C0A : 'GL_SGX_BINARY_IMG',
+        0x8FC4 : 'GL_SHADER_BINARY_VIV',
+    },
+    'ShaderParameterName' : {
+        0x8B4F : 'GL_SHADER_TYPE',
+        0x8B80 : 'GL_DELETE_STATUS',
+        0x8B81 : 'GL_COMPILE_STATUS',
+        0x8B84 : 'GL_INFO_LOG_LENGTH',
+        0x8B88 : 'GL_SHADER_SOURCE_LENGTH',
+    },
+    'ShaderType' : {
+        0x8B30 : 'GL_FRAGMENT_SHADER',
+        0x8B31 : 'GL_VERTEX_SHADER',
+        0x91B9 : 'GL_COMPUTE_SHADER',
+        0x8DD9 : 'GL_GEOMETRY_SHADER',
+        0x8E88 : 'GL_TESS_CONTROL_SHADER',
+        0x8E87 : 'GL_TESS_EVALUATION_SHADER',
+    },
+    'ShadingRate' : {
+        0x96A6 : 'GL_SHADING_RATE_1X1_PIXELS_EXT',
+        0x96A7 : 'GL_SHADING_RATE_1X2_PIXELS_EXT',
+        0x96A8 : 'GL_SHADING_RATE_2X1_PIXELS_EXT',
+        0x96A9 : 'GL_SHADING_RATE_2X2_PIXELS_EXT',
+        0x96AA : 'GL_SHADING_RATE_1X4_PIXELS_EXT',
+        0x96AB : 'GL_SHADING_RATE_4X1_PIXELS_EXT',
+        0x96AC : 'GL_SHADING_RATE_4X2_PIXELS_EXT',
+        0x96AD : 'GL_SHADING_RATE_2X4_PIXELS_EXT',
+        0x96AE : 'GL_SHADING_RATE_4X4_PIXELS_EXT',
+    },
+    'ShadingRateCombinerOp' : {
+        0x96D2 : 'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_KEEP_EXT',
+        0x96D3 : 'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_REPLACE_EXT',
+        0x96D4 : 'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_MIN_EXT',
+        0x96D5 : 'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_MAX_EXT',
+        0x96D6 : 'GL_FRAGMENT_SHADING_RATE_COMBINER_OP_MUL_EXT',
+    },
+    'ShadingRateQCOM' : {
+        0x96A6 : 'GL_SHADING_RATE_1X1_PIXELS_QCOM',
+        0x96A7 : 'GL_SHADING_RATE_1X2_PIXELS_QCOM',
+        0x96A8 : 'GL_SHADING_RATE_2X1_PIXELS_QCOM',
+        0x96A9 : 'GL_SHADING_RATE_2X2_PIXELS_QCOM',
+        0x96AC : 'GL_SHADING_RATE_4X2_PIXELS_QCOM',
+        0x96AE : 'GL_SHADING_RATE_4X4_PIXELS_QCOM',
+    },
+    'SizedInternalFormat' : {
+        0x8056 : 'GL_RGBA4',
+        0x8057 : 'GL_RGB5_A1',
+        0x8D62 : 'GL_RGB565',
+        0x81A5 : 'GL_DEPTH_COMPONENT16',
+        0x8D48 : 'GL_STENCIL_INDEX8',
+        0x8051 : 'GL_RGB8',
+        0x8058 : 'GL_RGBA8',
+        0x8059 : 'GL_RGB10_A2',
+        0x81A6 : 'GL_DEPTH_COMPONENT24',
+        0x8C41 : 'GL_SRGB8',
+        0x8C43 : 'GL_SRGB8_ALPHA8',
+        0x8814 : 'GL_RGBA32F',
+        0x8815 : 'GL_RGB32F',
+        0x881A : 'GL_RGBA16F',
+        0x881B : 'GL_RGB16F',
+        0x8C3A : 'GL_R11F_G11F_B10F',
+        0x8C3D : 'GL_RGB9_E5',
+        0x8D70 : 'GL_RGBA32UI',
+        0x8D71 : 'GL_RGB32UI',
+        0x8D76 : 'GL_RGBA16UI',
+        0x8D77 : 'GL_RGB16UI',
+        0x8D7C : 'GL_RGBA8UI',
+        0x8D7D : 'GL_RGB8UI',
+        0x8D82 : 'GL_RGBA32I',
+        0x8D83 : 'GL_RGB32I',
+        0x8D88 : 'GL_RGBA16I',
+        0x8D89 : 'GL_RGB16I',
+        0x8D8E : 'GL_RGBA8I',
+        0x8D8F : 'GL_RGB8I',
+        0x8CAC : 'GL_DEPTH_COMPONENT32F',
+        0x8CAD : 'GL_DEPTH32F_STENCIL8',
+        0x88F0 : 'GL_DEPTH24_STENCIL8',
+        0x8229 : 'GL_R8',
+        0x822B : 'GL_RG8',
+        0x822D : 'GL_R16F',
+        0x822E : 'GL_R32F',
+        0x822F : 'GL_RG16F',
+        0x8230 : 'GL_RG32F',
+        0x8231 : 'GL_R8I',
+        0x8232 : 'GL_R8UI',
+        0x8233 : 'GL_R16I',
+        0x8234 : 'GL_R16UI',
+        0x8235 : 'GL_R32I',
+        0x8236 : 'GL_R32UI',
+        0x8237 : 'GL_RG8I',
+        0x8238 : 'GL_RG8UI',
+        0x8239 : 'GL_RG16I',
+        0x823A : 'GL_RG16UI',
+        0x823B : 'GL_RG32I',
+        0x823C : 'GL_RG32UI',
+        0x8F94 : 'GL_R8_SNORM',
+        0x8F95 : 'GL_RG8_SNORM',
+        0x8F96 : 'GL_RGB8_SNORM',
+        0x8F97 : 'GL_RGBA8_SNORM',
+        0x906F : 'GL_RGB10_A2UI',
+        0x9270 : 'GL_COMPRESSED_R11_EAC',
+        0x9271 : 'GL_COMPRESSED_SIGNED_R11_EAC',
+        0x9272 : 'GL_COMPRESSED_RG11_EAC',
+        0x9273 : 'GL_COMPRESSED_SIGNED_RG11_EAC',
+        0x9274 : 'GL_COMPRESSED_RGB8_ETC2',
+        0x9275 : 'GL_COMPRESSED_SRGB8_ETC2',
+        0x9276 : 'GL_COMPRESSED_RGB8_PUNCHTHROUGH_ALPHA1_ETC2',
+        0x9277 : 'GL_COMPRESSED_SRGB8_PUNCHTHROUGH_ALPHA1_ETC2',
+        0x9278 : 'GL_COMPRESSED_RGBA8_ETC2_EAC',
+        0x9279 : 'GL_COMPRESSED_SRGB8_ALPHA8_ETC2_EAC',
+        0x93B0 : 'GL_COMPRESSED_RGBA_ASTC_4x4',
+        0x93B1 : 'GL_COMPRESSED_RGBA_ASTC_5x4',
+        0x93B2 : 'GL_COMPRESSED_RGBA_ASTC_5x5',
+        0x93B3 : 'GL_COMPRESSED_RGBA_ASTC_6x5',
+        0x93B4 : 'GL_COMPRESSED_RGBA_ASTC_6x6',
+        0x93B5 : 'GL_COMPRESSED_RGBA_ASTC_8x5',
+        0x93B6 : 'GL_COMPRESSED_RGBA_ASTC_8x6',
+        0x93B7 : 'GL_COMPRESSED_RGBA_ASTC_8x8',
+        0x93B8 : 'GL_COMPRESSED_RGBA_ASTC_10x5',
+        0x93B9 : 'GL_COMPRESSED_RGBA_ASTC_10x6',
+        0x93BA : 'GL_COMPRESSED_RGBA_ASTC_10x8',
+        0x93BB : 'GL_COMPRESSED_RGBA_ASTC_10x10',
+        0x93BC : 'GL_COMPRESSED_RGBA_ASTC_12x10',
+        0x93BD : 'GL_COMPRESSED_RGBA_ASTC_12x12',
+        0x93D0 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4',
+        0x93D1 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4',
+        0x93D2 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5',
+        0x93D3 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5',
+        0x93D4 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6',
+        0x93D5 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x5',
+        0x93D6 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x6',
+        0x93D7 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_8x8',
+        0x93D8 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x5',
+        0x93D9 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x6',
+        0x93DA : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x8',
+        0x93DB : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_10x10',
+        0x93DC : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x10',
+        0x93DD : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_12x12',
+        0x81A7 : 'GL_DEPTH_COMPONENT32_OES',
+        0x83F2 : 'GL_COMPRESSED_RGBA_S3TC_DXT3_ANGLE',
+        0x83F3 : 'GL_COMPRESSED_RGBA_S3TC_DXT5_ANGLE',
+        0x8F98 : 'GL_R16_SNORM_EXT',
+        0x8F99 : 'GL_RG16_SNORM_EXT',
+        0x8F9B : 'GL_RGBA16_SNORM_EXT',
+        0x8E8C : 'GL_COMPRESSED_RGBA_BPTC_UNORM_EXT',
+        0x8E8D : 'GL_COMPRESSED_SRGB_ALPHA_BPTC_UNORM_EXT',
+        0x8E8E : 'GL_COMPRESSED_RGB_BPTC_SIGNED_FLOAT_EXT',
+        0x8E8F : 'GL_COMPRESSED_RGB_BPTC_UNSIGNED_FLOAT_EXT',
+        0x83F0 : 'GL_COMPRESSED_RGB_S3TC_DXT1_EXT',
+        0x83F1 : 'GL_COMPRESSED_RGBA_S3TC_DXT1_EXT',
+        0x8DBB : 'GL_COMPRESSED_RED_RGTC1_EXT',
+        0x8DBC : 'GL_COMPRESSED_SIGNED_RED_RGTC1_EXT',
+        0x8DBD : 'GL_COMPRESSED_RED_GREEN_RGTC2_EXT',
+        0x8DBE : 'GL_COMPRESSED_SIGNED_RED_GREEN_RGTC2_EXT',
+        0x8C4C : 'GL_COMPRESSED_SRGB_S3TC_DXT1_EXT',
+        0x8C4D : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT1_EXT',
+        0x8C4E : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT3_EXT',
+        0x8C4F : 'GL_COMPRESSED_SRGB_ALPHA_S3TC_DXT5_EXT',
+        0x822A : 'GL_R16_EXT',
+        0x822C : 'GL_RG16_EXT',
+        0x805B : 'GL_RGBA16_EXT',
+        0x8054 : 'GL_RGB16_EXT',
+        0x8F9A : 'GL_RGB16_SNORM_EXT',
+        0x803C : 'GL_ALPHA8_EXT',
+        0x8040 : 'GL_LUMINANCE8_EXT',
+        0x8045 : 'GL_LUMINANCE8_ALPHA8_EXT',
+        0x8052 : 'GL_RGB10_EXT',
+        0x8D64 : 'GL_ETC1_RGB8_OES',
+        0x8043 : 'GL_LUMINANCE4_ALPHA4_OES',
+        0x8D46 : 'GL_STENCIL_INDEX1_OES',
+        0x8D47 : 'GL_STENCIL_INDEX4_OES',
+        0x93C0 : 'GL_COMPRESSED_RGBA_ASTC_3x3x3_OES',
+        0x93C1 : 'GL_COMPRESSED_RGBA_ASTC_4x3x3_OES',
+        0x93C2 : 'GL_COMPRESSED_RGBA_ASTC_4x4x3_OES',
+        0x93C3 : 'GL_COMPRESSED_RGBA_ASTC_4x4x4_OES',
+        0x93C4 : 'GL_COMPRESSED_RGBA_ASTC_5x4x4_OES',
+        0x93C5 : 'GL_COMPRESSED_RGBA_ASTC_5x5x4_OES',
+        0x93C6 : 'GL_COMPRESSED_RGBA_ASTC_5x5x5_OES',
+        0x93C7 : 'GL_COMPRESSED_RGBA_ASTC_6x5x5_OES',
+        0x93C8 : 'GL_COMPRESSED_RGBA_ASTC_6x6x5_OES',
+        0x93C9 : 'GL_COMPRESSED_RGBA_ASTC_6x6x6_OES',
+        0x93E0 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_3x3x3_OES',
+        0x93E1 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x3x3_OES',
+        0x93E2 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4x3_OES',
+        0x93E3 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_4x4x4_OES',
+        0x93E4 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x4x4_OES',
+        0x93E5 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5x4_OES',
+        0x93E6 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_5x5x5_OES',
+        0x93E7 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x5x5_OES',
+        0x93E8 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6x5_OES',
+        0x93E9 : 'GL_COMPRESSED_SRGB8_ALPHA8_ASTC_6x6x6_OES',
+    },
+    'SpecialNumbers' : {
+        0x0000 : 'GL_FALSE',
+        0x0001 : 'GL_TRUE',
+        0xFFFFFFFF : 'GL_INVALID_INDEX',
+        0xFFFFFFFFFFFFFFFF : 'GL_TIMEOUT_IGNORED',
+        0x0010 : 'GL_UUID_SIZE_EXT',
+        0x0008 : 'GL_LUID_SIZE_EXT',
+    },
+    'StencilFunction' : {
+        0x0200 : 'GL_NEVER',
+        0x0201 : 'GL_LESS',
+        0x0202 : 'GL_EQUAL',
+        0x0203 : 'GL_LEQUAL',
+        0x0204 : 'GL_GREATER',
+        0x0205 : 'GL_NOTEQUAL',
+        0x0206 : 'GL_GEQUAL',
+        0x0207 : 'GL_ALWAYS',
+    },
+    'StencilOp' : {
+        0x0000 : 'GL_ZERO',
+        0x1E00 : 'GL_KEEP',
+        0x1E01 : 'GL_REPLACE',
+        0x1E02 : 'GL_INCR',
+        0x1E03 : 'GL_DECR',
+        0x150A : 'GL_INVERT',
+        0x8507 : 'GL_INCR_WRAP',
+        0x8508 : 'GL_DECR_WRAP',
+    },
+    'StringName' : {
+        0x8B8C : 'GL_SHADING_LANGUAGE_VERSION',
+        0x1F00 : 'GL_VENDOR',
+        0x1F01 : 'GL_RENDERER',
+        0x1F02 : 'GL_VERSION',
+        0x1F03 : 'GL_EXTENSIONS',
+    },
+    'SubgroupSupportedFeatures' : {
+        0x0001 : 'GL_SUBGROUP_FEATURE_BASIC_BIT_KHR',
+        0x0002 : 'GL_SUBGROUP_FEATURE_VOTE_BIT_KHR',
+        0x0004 : 'GL_SUBGROUP_FEATURE_ARITHMETIC_BIT_KHR',
+        0x0008 : 'GL_SUBGROUP_FEATURE_BALLOT_BIT_KHR',
+        0x0010 : 'GL_SUBGROUP_FEATURE_SHUFFLE_BIT_KHR',
+        0x0020 : 'GL_SUBGROUP_FEATURE_SHUFFLE_RELATIVE_BIT_KHR',
+        0x0040 : 'GL_SUBGROUP_FEATURE_CLUSTERED_BIT_KHR',
+        0x0080 : 'GL_SUBGROUP_FEATURE_QUAD_BIT_KHR',
+        0x0100 : 'GL_SUBGROUP_FEATURE_PARTITIONED_BIT_NV',
+    },
+    'SubroutineParameterName' : {
+        0x8A38 : 'GL_UNIFORM_SIZE',
+        0x8A39 : 'GL_UNIFORM_NAME_LENGTH',
+    },
+    'SyncBehaviorFlags' : {
+        0x0000 : 'GL_NONE',
+    },
+    'SyncCondition' : {
+        0x9117 : 'GL_SYNC_GPU_COMMANDS_COMPLETE',
+    },
+    'SyncObjectMask' : {
+        0x0001 : 'GL_SYNC_FLUSH_COMMANDS_BIT',
+    },
+    'SyncParameterName' : {
+        0x9112 : 'GL_OBJECT_TYPE',
+        0x9113 : 'GL_SYNC_CONDITION',
+        0x9114 : 'GL_SYNC_STATUS',
+        0x9115 : 'GL_SYNC_FLAGS',
+    },
+    'SyncStatus' : {
+        0x911A : 'GL_ALREADY_SIGNALED',
+        0x911B : 'GL_TIMEOUT_EXPIRED',
+        0x911C : 'GL_CONDITION_SATISFIED',
+        0x911D : 'GL_WAIT_FAILED',
+    },
+    'TangentPointerTypeEXT' : {
+        0x1400 : 'GL_BYTE',
+        0x1402 : 'GL_SHORT',
+        0x1404 : 'GL_INT',
+        0x1406 : 'GL_FLOAT',
+    },
+    'TexCoordPointerType' : {
+        0x1402 : 'GL_SHORT',
+        0x1404 : 'GL_INT',
+        0x1406 : 'GL_FLOAT',
+    },
+    'TexStorageAttribs' : {
+        0x96C0 : 'GL_SURFACE_COMPRESSION_EXT',
+        0x96C1 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_NONE_EXT',
+        0x96C2 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_DEFAULT_EXT',
+        0x96C4 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_1BPC_EXT',
+        0x96C5 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_2BPC_EXT',
+        0x96C6 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_3BPC_EXT',
+        0x96C7 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_4BPC_EXT',
+        0x96C8 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_5BPC_EXT',
+        0x96C9 : 'GL_SURFACE_COMPRESSION_FIXED_RATE_6BPC_EXT',
+        0x96CA : 'GL_SURFACE_COMPRESSION_FIXED_RATE_7BPC_EXT',
+        0x96CB : 'GL_SURFACE_COMPRESSION_FIXED_RATE_8BPC_EXT',
+        0x96CC : 'GL_SURFACE_COMPRESSION_FIXED_RATE_9BPC_EXT',
+        0x96CD : 'GL_SURFACE_COMPRESSION_FIXED_RATE_10BPC_EXT',
+        0x96CE : 'GL_SURFACE_COMPRESSION_FIXED_RATE_11BPC_EXT',
+        0x96CF : 'GL_SURFACE_COMPRESSION_FIXED_RATE_12BPC_EXT',
+    },
+    'TextureCompareMode' : {
+        0x0000 : 'GL_NONE',
+        0x884E : 'GL_COMPARE_REF_TO_TEXTURE',
+    },
+    'TextureEnvMode' : {
+        0x0BE2 : 'GL_BLEND',
+        0x1E01 : 'GL_REPLACE',
+    },
+    'TextureEnvParameter' : {
+        0x8589 : 'GL_SRC1_ALPHA_EXT',
+    },
+    'TextureLayout' : {
+        0x958D : 'GL_LAYOUT_GENERAL_EXT',
+        0x958E : 'GL_LAYOUT_COLOR_ATTACHMENT_EXT',
+        0x958F : 'GL_LAYOUT_DEPTH_STENCIL_ATTACHMENT_EXT',
+        0x9590 : 'GL_LAYOUT_DEPTH_STENCIL_READ_ONLY_EXT',
+        0x9591 : 'GL_LAYOUT_SHADER_READ_ONLY_EXT',
+        0x9592 : 'GL_LAYOUT_TRANSFER_SRC_EXT',
+        0x9593 : 'GL_LAYOUT_TRANSFER_DST_EXT',
+        0x9530 : 'GL_LAYOUT_DEPTH_READ_ONLY_STENCIL_ATTACHMENT_EXT',
+        0x9531 : 'GL_LAYOUT_DEPTH_ATTACHMENT_STENCIL_READ_ONLY_EXT',
+    },
+    'TextureMagFilter' : {
+        0x2600 : 'GL_NEAREST',
+        0x2601 : 'GL_LINEAR',
+    },
+    'TextureMinFilter' : {
+        0x2600 : 'GL_NEAREST',
+        0x2601 : 'GL_LINEAR',
+        0x2700 : 'GL_NEAREST_MIPMAP_NEAREST',
+        0x2701 : 'GL_LINEAR_MIPMAP_NEAREST',
+        0x2702 : 'GL_NEAREST_MIPMAP_LINEAR',
+        0x2703 : 'GL_LINEAR_MIPMAP_LINEAR',
+    },
+    'TextureParameterName' : {
+        0x2800 : 'GL_TEXTURE_MAG_FILTER',
+        0x2801 : 'GL_TEXTURE_MIN_FILTER',
+        0x2802 : 'GL_TEXTURE_WRAP_S',
+        0x2803 : 'GL_TEXTURE_WRAP_T',
+        0x8072 : 'GL_TEXTURE_WRAP_R',
+        0x813A : 'GL_TEXTURE_MIN_LOD',
+        0x813B : 'GL_TEXTURE_MAX_LOD',
+        0x813C : 'GL_TEXTURE_BASE_LEVEL',
+        0x813D : 'GL_TEXTURE_MAX_LEVEL',
+        0x884C : 'GL_TEXTURE_COMPARE_MODE',
+        0x884D : 'GL_TEXTURE_COMPARE_FUNC',
+        0x8E42 : 'GL_TEXTURE_SWIZZLE_R',
+        0x8E43 : 'GL_TEXTURE_SWIZZLE_G',
+        0x8E44 : 'GL_TEXTURE_SWIZZLE_B',
+        0x8E45 : 'GL_TEXTURE_SWIZZLE_A',
+        0x90EA : 'GL_DEPTH_STENCIL_TEXTURE_MODE',
+        0x1000 : 'GL_TEXTURE_WIDTH',
+        0x1001 : 'GL_TEXTURE_HEIGHT',
+        0x1003 : 'GL_TEXTURE_INTERNAL_FORMAT',
+        0x805C : 'GL_TEXTURE_RED_SIZE',
+        0x805D : 'GL_TEXTURE_GREEN_SIZE',
+        0x805E : 'GL_TEXTURE_BLUE_SIZE',
+        0x805F : 'GL_TEXTURE_ALPHA_SIZE',
+        0x1004 : 'GL_TEXTURE_BORDER_COLOR',
+        0x8F6A : 'GL_TEXTURE_UNNORMALIZED_COORDINATES_ARM',
+        0x9580 : 'GL_TEXTURE_TILING_EXT',
+        0x96A0 : 'GL_TEXTURE_FOVEATED_CUTOFF_DENSITY_QCOM',
+        0x9710 : 'GL_TEXTURE_Y_DEGAMMA_QCOM',
+        0x9711 : 'GL_TEXTURE_CBCR_DEGAMMA_QCOM',
+    },
+    'TextureSwizzle' : {
+        0x0000 : 'GL_ZERO',
+        0x0001 : 'GL_ONE',
+        0x1906 : 'GL_ALPHA',
+        0x1903 : 'GL_RED',
+        0x1904 : 'GL_GREEN',
+        0x1905 : 'GL_BLUE',
+    },
+    'TextureTarget' : {
+        0x0DE1 : 'GL_TEXTURE_2D',
+        0x8513 : 'GL_TEXTURE_CUBE_MAP',
+        0x8515 : 'GL_TEXTURE_CUBE_MAP_POSITIVE_X',
+        0x8516 : 'GL_TEXTURE_CUBE_MAP_NEGATIVE_X',
+        0x8517 : 'GL_TEXTURE_CUBE_MAP_POSITIVE_Y',
+        0x8518 : 'GL_TEXTURE_CUBE_MAP_NEGATIVE_Y',
+        0x8519 : 'GL_TEXTURE_CUBE_MAP_POSITIVE_Z',
+        0x851A : 'GL_TEXTURE_CUBE_MAP_NEGATIVE_Z',
+        0x8D41 : 'GL_RENDERBUFFER',
+        0x806F : 'GL_TEXTURE_3D',
+        0x8C1A : 'GL_TEXTURE_2D_ARRAY',
+        0x9100 : 'GL_TEXTURE_2D_MULTISAMPLE',
+        0x8C2A : 'GL_TEXTURE_BUFFER',
+        0x9009 : 'GL_TEXTURE_CUBE_MAP_ARRAY',
+        0x9102 : 'GL_TEXTURE_2D_MULTISAMPLE_ARRAY',
+    },
+    'TextureUnit' : {
+        0x84C0 : 'GL_TEXTURE0',
+        0x84C1 : 'GL_TEXTURE1',
+        0x84C2 : 'GL_TEXTURE2',
+        0x84C3 : 'GL_TEXTURE3',
+        0x84C4 : 'GL_TEXTURE4',
+        0x84C5 : 'GL_TEXTURE5',
+        0x84C6 : 'GL_TEXTURE6',
+        0x84C7 : 'GL_TEXTURE7',
+        0x84C8 : 'GL_TEXTURE8',
+        0x84C9 : 'GL_TEXTURE9',
+        0x84CA : 'GL_TEXTURE10',
+        0x84CB : 'GL_TEXTURE11',
+        0x84CC : 'GL_TEXTURE12',
+        0x84CD : 'GL_TEXTURE13',
+        0x84CE : 'GL_TEXTURE14',
+        0x84CF : 'GL_TEXTURE15',
+        0x84D0 : 'GL_TEXTURE16',
+        0x84D1 : 'GL_TEXTURE17',
+        0x84D2 : 'GL_TEXTURE18',
+        0x84D3 : 'GL_TEXTURE19',
+        0x84D4 : 'GL_TEXTURE20',
+        0x84D5 : 'GL_TEXTURE21',
+        0x84D6 : 'GL_TEXTURE22',
+        0x84D7 : 'GL_TEXTURE23',
+        0x84D8 : 'GL_TEXTURE24',
+        0x84D9 : 'GL_TEXTURE25',
+        0x84DA : 'GL_TEXTURE26',
+        0x84DB : 'GL_TEXTURE27',
+        0x84DC : 'GL_TEXTURE28',
+        0x84DD : 'GL_TEXTURE29',
+        0x84DE : 'GL_TEXTURE30',
+        0x84DF : 'GL_TEXTURE31',
+    },
+    'TextureWrapMode' : {
+        0x2901 : 'GL_REPEAT',
+        0x812F : 'GL_CLAMP_TO_EDGE',
+        0x8370 : 'GL_MIRRORED_REPEAT',
+        0x812D : 'GL_CLAMP_TO_BORDER',
+    },
+    'TransformFeedbackBufferMode' : {
+        0x8C8C : 'GL_INTERLEAVED_ATTRIBS',
+        0x8C8D : 'GL_SEPARATE_ATTRIBS',
+    },
+    'TransformFeedbackPName' : {
+        0x8C84 : 'GL_TRANSFORM_FEEDBACK_BUFFER_START',
+        0x8C85 : 'GL_TRANSFORM_FEEDBACK_BUFFER_SIZE',
+        0x8C8F : 'GL_TRANSFORM_FEEDBACK_BUFFER_BINDING',
+        0x8E23 : 'GL_TRANSFORM_FEEDBACK_PAUSED',
+        0x8E24 : 'GL_TRANSFORM_FEEDBACK_ACTIVE',
+    },
+    'TriangleFace' : {
+        0x0404 : 'GL_FRONT',
+        0x0405 : 'GL_BACK',
+        0x0408 : 'GL_FRONT_AND_BACK',
+    },
+    'UniformBlockPName' : {
+        0x8A3F : 'GL_UNIFORM_BLOCK_BINDING',
+        0x8A40 : 'GL_UNIFORM_BLOCK_DATA_SIZE',
+        0x8A41 : 'GL_UNIFORM_BLOCK_NAME_LENGTH',
+        0x8A42 : 'GL_UNIFORM_BLOCK_ACTIVE_UNIFORMS',
+        0x8A43 : 'GL_UNIFORM_BLOCK_ACTIVE_UNIFORM_INDICES',
+        0x8A44 : 'GL_UNIFORM_BLOCK_REFERENCED_BY_VERTEX_SHADER',
+        0x8A46 : 'GL_UNIFORM_BLOCK_REFERENCED_BY_FRAGMENT_SHADER',
+    },
+    'UniformPName' : {
+        0x8A37 : 'GL_UNIFORM_TYPE',
+        0x8A38 : 'GL_UNIFORM_SIZE',
+        0x8A39 : 'GL_UNIFORM_NAME_LENGTH',
+        0x8A3A : 'GL_UNIFORM_BLOCK_INDEX',
+        0x8A3B : 'GL_UNIFORM_OFFSET',
+        0x8A3C : 'GL_UNIFORM_ARRAY_STRIDE',
+        0x8A3D : 'GL_UNIFORM_MATRIX_STRIDE',
+        0x8A3E : 'GL_UNIFORM_IS_ROW_MAJOR',
+    },
+    'UniformType' : {
+        0x1404 : 'GL_INT',
+        0x1405 : 'GL_UNSIGNED_INT',
+        0x1406 : 'GL_FLOAT',
+        0x8B50 : 'GL_FLOAT_VEC2',
+        0x8B51 : 'GL_FLOAT_VEC3',
+        0x8B52 : 'GL_FLOAT_VEC4',
+        0x8B53 : 'GL_INT_VEC2',
+        0x8B54 : 'GL_INT_VEC3',
+        0x8B55 : 'GL_INT_VEC4',
+        0x8B56 : 'GL_BOOL',
+        0x8B57 : 'GL_BOOL_VEC2',
+        0x8B58 : 'GL_BOOL_VEC3',
+        0x8B59 : 'GL_BOOL_VEC4',
+        0x8B5A : 'GL_FLOAT_MAT2',
+        0x8B5B : 'GL_FLOAT_MAT3',
+        0x8B5C : 'GL_FLOAT_MAT4',
+        0x8B5E : 'GL_SAMPLER_2D',
+        0x8B60 : 'GL_SAMPLER_CUBE',
+        0x8B5F : 'GL_SAMPLER_3D',
+        0x8B62 : 'GL_SAMPLER_2D_SHADOW',
+        0x8B65 : 'GL_FLOAT_MAT2x3',
+        0x8B66 : 'GL_FLOAT_MAT2x4',
+        0x8B67 : 'GL_FLOAT_MAT3x2',
+        0x8B68 : 'GL_FLOAT_MAT3x4',
+        0x8B69 : 'GL_FLOAT_MAT4x2',
+        0x8B6A : 'GL_FLOAT_MAT4x3',
+        0x8DC1 : 'GL_SAMPLER_2D_ARRAY',
+        0x8DC4 : 'GL_SAMPLER_2D_ARRAY_SHADOW',
+        0x8DC5 : 'GL_SAMPLER_CUBE_SHADOW',
+        0x8DC6 : 'GL_UNSIGNED_INT_VEC2',
+        0x8DC7 : 'GL_UNSIGNED_INT_VEC3',
+        0x8DC8 : 'GL_UNSIGNED_INT_VEC4',
+        0x8DCA : 'GL_INT_SAMPLER_2D',
+        0x8DCB : 'GL_INT_SAMPLER_3D',
+        0x8DCC : 'GL_INT_SAMPLER_CUBE',
+        0x8DCF : 'GL_INT_SAMPLER_2D_ARRAY',
+        0x8DD2 : 'GL_UNSIGNED_INT_SAMPLER_2D',
+        0x8DD3 : 'GL_UNSIGNED_INT_SAMPLER_3D',
+        0x8DD4 : 'GL_UNSIGNED_INT_SAMPLER_CUBE',
+        0x8DD7 : 'GL_UNSIGNED_INT_SAMPLER_2D_ARRAY',
+        0x9108 : 'GL_SAMPLER_2D_MULTISAMPLE',
+        0x9109 : 'GL_INT_SAMPLER_2D_MULTISAMPLE',
+        0x910A : 'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE',
+        0x8DC2 : 'GL_SAMPLER_BUFFER',
+        0x8DD0 : 'GL_INT_SAMPLER_BUFFER',
+        0x8DD8 : 'GL_UNSIGNED_INT_SAMPLER_BUFFER',
+        0x900C : 'GL_SAMPLER_CUBE_MAP_ARRAY',
+        0x900D : 'GL_SAMPLER_CUBE_MAP_ARRAY_SHADOW',
+        0x900E : 'GL_INT_SAMPLER_CUBE_MAP_ARRAY',
+        0x900F : 'GL_UNSIGNED_INT_SAMPLER_CUBE_MAP_ARRAY',
+        0x910B : 'GL_SAMPLER_2D_MULTISAMPLE_ARRAY',
+        0x910C : 'GL_INT_SAMPLER_2D_MULTISAMPLE_ARRAY',
+        0x910D : 'GL_UNSIGNED_INT_SAMPLER_2D_MULTISAMPLE_ARRAY',
+    },
+    'UseProgramStageMask' : {
+        0x0020 : 'GL_COMPUTE_SHADER_BIT',
+        0x0001 : 'GL_VERTEX_SHADER_BIT',
+        0x0002 : 'GL_FRAGMENT_SHADER_BIT',
+        0xFFFFFFFF : 'GL_ALL_SHADER_BITS',
+        0x0004 : 'GL_GEOMETRY_SHADER_BIT',
+        0x0008 : 'GL_TESS_CONTROL_SHADER_BIT',
+        0x0010 : 'GL_TESS_EVALUATION_SHADER_BIT',
+        0x0040 : 'GL_MESH_SHADER_BIT_NV',
+        0x0080 : 'GL_TASK_SHADER_BIT_NV',
+    },
+    'VertexArrayPName' : {
+        0x8622 : 'GL_VERTEX_ATTRIB_ARRAY_ENABLED',
+        0x8623 : 'GL_VERTEX_ATTRIB_ARRAY_SIZE',
+        0x8624 : 'GL_VERTEX_ATTRIB_ARRAY_STRIDE',
+        0x8625 : 'GL_VERTEX_ATTRIB_ARRAY_TYPE',
+        0x886A : 'GL_VERTEX_ATTRIB_ARRAY_NORMALIZED',
+        0x88FD : 'GL_VERTEX_ATTRIB_ARRAY_INTEGER',
+        0x88FE : 'GL_VERTEX_ATTRIB_ARRAY_DIVISOR',
+        0x82D5 : 'GL_VERTEX_ATTRIB_RELATIVE_OFFSET',
+    },
+    'VertexAttribEnum' : {
+        0x8626 : 'GL_CURRENT_VERTEX_ATTRIB',
+        0x8622 : 'GL_VERTEX_ATTRIB_ARRAY_ENABLED',
+        0x8623 : 'GL_VERTEX_ATTRIB_ARRAY_SIZE',
+        0x8624 : 'GL_VERTEX_ATTRIB_ARRAY_STRIDE',
+        0x8625 : 'GL_VERTEX_ATTRIB_ARRAY_TYPE',
+        0x886A : 'GL_VERTEX_ATTRIB_ARRAY_NORMALIZED',
+        0x889F : 'GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING',
+        0x88FD : 'GL_VERTEX_ATTRIB_ARRAY_INTEGER',
+        0x88FE : 'GL_VERTEX_ATTRIB_ARRAY_DIVISOR',
+    },
+    'VertexAttribIType' : {
+        0x1400 : 'GL_BYTE',
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1402 : 'GL_SHORT',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1404 : 'GL_INT',
+        0x1405 : 'GL_UNSIGNED_INT',
+    },
+    'VertexAttribPointerPropertyARB' : {
+        0x8645 : 'GL_VERTEX_ATTRIB_ARRAY_POINTER',
+    },
+    'VertexAttribPointerType' : {
+        0x1400 : 'GL_BYTE',
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1402 : 'GL_SHORT',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1404 : 'GL_INT',
+        0x1405 : 'GL_UNSIGNED_INT',
+        0x1406 : 'GL_FLOAT',
+        0x140C : 'GL_FIXED',
+        0x8368 : 'GL_UNSIGNED_INT_2_10_10_10_REV',
+        0x8C3B : 'GL_UNSIGNED_INT_10F_11F_11F_REV',
+        0x140B : 'GL_HALF_FLOAT',
+        0x8D9F : 'GL_INT_2_10_10_10_REV',
+        0x140E : 'GL_INT64_NV',
+        0x140F : 'GL_UNSIGNED_INT64_NV',
+    },
+    'VertexAttribPropertyARB' : {
+        0x8626 : 'GL_CURRENT_VERTEX_ATTRIB',
+        0x8622 : 'GL_VERTEX_ATTRIB_ARRAY_ENABLED',
+        0x8623 : 'GL_VERTEX_ATTRIB_ARRAY_SIZE',
+        0x8624 : 'GL_VERTEX_ATTRIB_ARRAY_STRIDE',
+        0x8625 : 'GL_VERTEX_ATTRIB_ARRAY_TYPE',
+        0x886A : 'GL_VERTEX_ATTRIB_ARRAY_NORMALIZED',
+        0x889F : 'GL_VERTEX_ATTRIB_ARRAY_BUFFER_BINDING',
+        0x88FD : 'GL_VERTEX_ATTRIB_ARRAY_INTEGER',
+        0x88FE : 'GL_VERTEX_ATTRIB_ARRAY_DIVISOR',
+        0x82D4 : 'GL_VERTEX_ATTRIB_BINDING',
+        0x82D5 : 'GL_VERTEX_ATTRIB_RELATIVE_OFFSET',
+    },
+    'VertexAttribType' : {
+        0x1400 : 'GL_BYTE',
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1402 : 'GL_SHORT',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1404 : 'GL_INT',
+        0x1405 : 'GL_UNSIGNED_INT',
+        0x1406 : 'GL_FLOAT',
+        0x140C : 'GL_FIXED',
+        0x8368 : 'GL_UNSIGNED_INT_2_10_10_10_REV',
+        0x8C3B : 'GL_UNSIGNED_INT_10F_11F_11F_REV',
+        0x140B : 'GL_HALF_FLOAT',
+        0x8D9F : 'GL_INT_2_10_10_10_REV',
+    },
+    'VertexBufferObjectUsage' : {
+        0x88E0 : 'GL_STREAM_DRAW',
+        0x88E4 : 'GL_STATIC_DRAW',
+        0x88E8 : 'GL_DYNAMIC_DRAW',
+        0x88E1 : 'GL_STREAM_READ',
+        0x88E2 : 'GL_STREAM_COPY',
+        0x88E5 : 'GL_STATIC_READ',
+        0x88E6 : 'GL_STATIC_COPY',
+        0x88E9 : 'GL_DYNAMIC_READ',
+        0x88EA : 'GL_DYNAMIC_COPY',
+    },
+    'VertexPointerType' : {
+        0x1402 : 'GL_SHORT',
+        0x1404 : 'GL_INT',
+        0x1406 : 'GL_FLOAT',
+    },
+    'VertexProvokingMode' : {
+        0x8E4D : 'GL_FIRST_VERTEX_CONVENTION',
+        0x8E4E : 'GL_LAST_VERTEX_CONVENTION',
+    },
+    'VertexShaderWriteMaskEXT' : {
+        0x0000 : 'GL_FALSE',
+        0x0001 : 'GL_TRUE',
+    },
+    'VertexWeightPointerTypeEXT' : {
+        0x1406 : 'GL_FLOAT',
+    },
+    'WeightPointerTypeARB' : {
+        0x1400 : 'GL_BYTE',
+        0x1401 : 'GL_UNSIGNED_BYTE',
+        0x1402 : 'GL_SHORT',
+        0x1403 : 'GL_UNSIGNED_SHORT',
+        0x1404 : 'GL_INT',
+        0x1405 : 'GL_UNSIGNED_INT',
+        0x1406 : 'GL_FLOAT',
+    },
+}
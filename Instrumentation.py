@@ -0,0 +1,163 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import collections, importlib
+from timeit import default_timer as timer
+
+# methods timed while instrumentation is enabled : (module, class, method prefix)
+INSTRUMENTED_METHODS = [
+    ('GLESContext', 'Context', 'gl'),
+    ('ShaderLexer', 'ShaderLexer', 'token'),
+    ('ShaderLexer', 'RegexLexer', 'input'),
+    ('Tools.TextureCollector', 'TextureCollector', 'collect'),
+    ('Tools.ShaderCollector', 'ShaderCollector', 'collect'),
+]
+
+# report name of the instrumented methods whose name is not self-explanatory
+METHOD_NAMES = {
+    'ShaderLexer.token' : 'ShaderParser.lex',
+    'RegexLexer.input' : 'ShaderParser.lex',
+}
+
+class Statistics(object):
+
+    def __init__(self):
+        self.count = 0
+        # wall time including and excluding the nested measurements
+        self.seconds = 0.0
+        self.self_seconds = 0.0
+
+class Measurement(object):
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.nested_seconds = 0.0
+        self.profiler.stack.append(self)
+        self.start = timer()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = timer() - self.start
+        stack = self.profiler.stack
+        stack.pop()
+        if stack:
+            stack[-1].nested_seconds += elapsed
+
+        stats = self.profiler.statistics[self.name]
+        stats.count += 1
+        stats.seconds += elapsed
+        stats.self_seconds += elapsed - self.nested_seconds
+        return False
+
+class Profiler(object):
+
+    def __init__(self):
+        self.statistics = collections.defaultdict(Statistics)
+        self.stack = []
+
+    def measure(self, name):
+        return Measurement(self, name)
+
+    def report(self):
+        """ Returns the statistics as {category : {name : {count, seconds, self_seconds}}},
+            where the category is the part of the name before the first dot,
+            ordered by decreasing self time
+        """
+        report = collections.OrderedDict()
+        items = sorted(self.statistics.items(), key=lambda item : -item[1].self_seconds)
+        for name, stats in items:
+            category = name.split('.')[0]
+            report.setdefault(category, collections.OrderedDict())[name] = {
+                'count' : stats.count,
+                'seconds' : stats.seconds,
+                'self_seconds' : stats.self_seconds,
+            }
+        return report
+
+    def format_report(self):
+        lines = ['%-48s %10s %12s %12s' % ('name', 'count', 'seconds', 'self seconds')]
+        for category, entries in self.report().items():
+            for name, entry in entries.items():
+                lines.append('%-48s %10d %12.6f %12.6f' % (name, entry['count'], entry['seconds'], entry['self_seconds']))
+        return '\n'.join(lines)
+
+class NullMeasurement(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+NULL_MEASUREMENT = NullMeasurement()
+
+# the enabled profiler, None when instrumentation is disabled
+profiler = None
+
+# original methods replaced by timed ones : (class, method name) -> function
+_original_methods = {}
+
+def phase(name):
+    """ Measures a block of code, e.g. "with phase('ShaderParser.preprocess'):"
+        Only costs a function call when instrumentation is disabled.
+    """
+    if profiler is None:
+        return NULL_MEASUREMENT
+    return profiler.measure(name)
+
+def _timed_method(name, method):
+    def timed(*args, **kwargs):
+        with profiler.measure(name):
+            return method(*args, **kwargs)
+    timed.__name__ = method.__name__
+    timed.__doc__ = method.__doc__
+    return timed
+
+def enable():
+    """ Starts a new profiler and times the instrumented methods,
+        returns the profiler
+    """
+    global profiler
+    if profiler is not None:
+        disable()
+    profiler = Profiler()
+
+    for module_name, class_name, prefix in INSTRUMENTED_METHODS:
+        cls = getattr(importlib.import_module(module_name), class_name)
+        for attr in dir(cls):
+            method = cls.__dict__.get(attr)
+            if not attr.startswith(prefix) or not callable(method):
+                continue
+            name = '%s.%s' % (class_name, attr)
+            _original_methods[(cls, attr)] = method
+            setattr(cls, attr, _timed_method(METHOD_NAMES.get(name, name), method))
+    return profiler
+
+def disable():
+    """ Restores the instrumented methods, returns the stopped profiler
+    """
+    global profiler
+    for (cls, attr), method in _original_methods.items():
+        setattr(cls, attr, method)
+    _original_methods.clear()
+
+    stopped, profiler = profiler, None
+    return stopped
+
+class profiling(object):
+    """ Enables instrumentation within a with-statement:
+
+        with profiling() as profiler:
+            ...
+        print(profiler.format_report())
+    """
+
+    def __enter__(self):
+        return enable()
+
+    def __exit__(self, *exc_info):
+        disable()
+        return False
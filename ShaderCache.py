@@ -0,0 +1,75 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import hashlib, mmap, os, pickle, tempfile
+
+class ShaderCache(object):
+    """ On-disk cache of ShaderParser results, one pickle per parsed shader:
+
+        cache = ShaderCache('shaders/.cache')
+        parser = ShaderParser()
+        parser.parse(source, fragment_shader=True, cache=cache)
+
+        Entries are keyed by the hash of the source, the shader stage, the
+        parse mode and ShaderParser.VERSION, so a changed shader or parser
+        simply misses. Entries are stored under a subdirectory named by the
+        first two digits of the key, and are only read when looked up.
+        Only load caches written by yourself, entries are unpickled.
+    """
+
+    suffix = '.ast'
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, text, fragment_shader, parser_version, interface_only=False):
+        digest = hashlib.sha1(text.encode('utf-8'))
+        digest.update(('\0%s\0%d\0%s' % (
+            'fragment' if fragment_shader else 'vertex',
+            parser_version,
+            'interface' if interface_only else 'full')).encode('ascii'))
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], key + self.suffix)
+
+    def load(self, key):
+        """ Returns the saved state of key, None if not cached
+        """
+        try:
+            with open(self.path(key), 'rb') as f:
+                # mapping the file saves copying it in a bytes object
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    state = pickle.loads(data)
+        except (IOError, OSError, ValueError):
+            # missing, or empty which mmap refuses
+            self.misses += 1
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning('Ignoring unreadable cache entry %s : %s' % (key, e))
+            self.misses += 1
+            return None
+        self.hits += 1
+        return state
+
+    def store(self, key, state):
+        path = self.path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        # written aside then renamed, so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def clear(self):
+        for root, dirs, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(self.suffix):
+                    os.remove(os.path.join(root, name))
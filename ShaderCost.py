@@ -0,0 +1,270 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import collections, re
+
+import ShaderVisitor
+from ShaderParser import is_floating_point_type, is_integer_type
+
+# Static cost of a parsed shader, without a GPU : the operations of main and
+# of the functions it calls, each call counting the whole callee, and both
+# sides of every branch. The cost vector counts
+#   alu            : arithmetic, comparison and built-in function operations,
+#                    by component, e.g. a vec4 addition is 4
+#   texture        : texture fetches
+#   branch         : if statements
+#   discard        : discard statements
+#   transcendental : sin, exp, sqrt, ... by component, which run on slower units
+COST_FIELDS = ('alu', 'texture', 'branch', 'discard', 'transcendental')
+
+BUILTIN_VARIABLES = {
+    'gl_Position' : 'vec4', 'gl_PointSize' : 'float',
+    'gl_VertexID' : 'int', 'gl_InstanceID' : 'int',
+    'gl_FragCoord' : 'vec4', 'gl_FrontFacing' : 'bool', 'gl_PointCoord' : 'vec2',
+    'gl_FragColor' : 'vec4', 'gl_FragData' : 'vec4[]', 'gl_FragDepth' : 'float',
+}
+
+TRANSCENDENTAL_FUNCTIONS = set(['sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'pow',
+    'exp', 'log', 'exp2', 'log2', 'sqrt', 'inversesqrt'])
+
+# built-in functions returning a scalar, or their own type, and costing
+# one square root on top of their operations
+SCALAR_FUNCTIONS = set(['dot', 'length', 'distance'])
+SQRT_FUNCTIONS = set(['length', 'distance', 'normalize'])
+
+# operations per component of the built-in functions costing more than one
+BUILTIN_ALU = {'mix' : 2, 'clamp' : 2, 'smoothstep' : 4, 'normalize' : 2, 'distance' : 2,
+    'reflect' : 2, 'refract' : 4, 'cross' : 2, 'faceforward' : 2}
+
+# the sampling functions, textureSize only reads the size of a texture
+texture_function_pattern = re.compile(r'(texture(2D|3D|Cube)?(Proj)?(Lod|Grad)?(Offset)?(EXT)?|texelFetch(Offset)?'
+    r'|textureGather(Offset)?|shadow2D(Proj)?(EXT)?)$')
+vector_pattern = re.compile(r'([biu]?)vec(\d)$')
+matrix_pattern = re.compile(r'mat(\d)(?:x(\d))?$')
+
+def matrix_size(type):
+    """ Returns (columns, rows) of a matrix type, None for other types
+    """
+    match = matrix_pattern.match(type or '')
+    if not match:
+        return None
+    columns = int(match.group(1))
+    return columns, int(match.group(2) or columns)
+
+def components(type):
+    """ Returns the number of scalar components of a type, 1 when unknown
+    """
+    match = vector_pattern.match(type or '')
+    if match:
+        return int(match.group(2))
+    size = matrix_size(type)
+    if size:
+        return size[0] * size[1]
+    return 1
+
+def vector_type(type, count):
+    """ Returns the type of count components of the scalar kind of type
+    """
+    prefix = {'b' : 'b', 'i' : 'i', 'u' : 'u'}.get((type or 'v')[0], '')
+    if count == 1:
+        return {'b' : 'bool', 'i' : 'int', 'u' : 'uint'}.get(prefix, 'float')
+    return '%svec%d' % (prefix, count)
+
+def literal_type(text):
+    if text in ('true', 'false'):
+        return 'bool'
+    if text[0].isdigit() or text[0] == '.':
+        if re.match(r'\d+[uU]$', text):
+            return 'uint'
+        return 'int' if text.isdigit() else 'float'
+    return None
+
+class CostAnalysis(ShaderVisitor.NodeVisitor):
+    """ Infers the type of the expressions of a function and counts its
+        operations into cost, and its calls of user functions into calls
+    """
+
+    def __init__(self, parser, function):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.user_functions = parser.function_definitions
+        self.cost = collections.OrderedDict((field, 0) for field in COST_FIELDS)
+        self.calls = collections.Counter()
+        global_types = dict(BUILTIN_VARIABLES)
+        for var in parser.variable_declarations.values():
+            global_types[var.name] = var.type_specifier + '[]' * len(var.array_sizes)
+        self.scopes = [global_types]
+        # types of the expressions visited, those of the children of a node being on top
+        self.types = []
+        self.marks = []
+        self.visit(function)
+
+    def type_of(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return literal_type(name)
+
+    def pre_any(self, node):
+        self.marks.append(len(self.types))
+        if type(node).__name__ in ('FunctionDefinition', 'CompoundStatement'):
+            self.scopes.append({})
+
+    def pre_str(self, name):
+        self.types.append(self.type_of(name))
+
+    def post_str(self, name):
+        pass
+
+    def post_any(self, node):
+        mark = self.marks.pop()
+        children = self.types[mark:]
+        del self.types[mark:]
+        name = type(node).__name__
+        if name in ('FunctionDefinition', 'CompoundStatement'):
+            self.scopes.pop()
+        analyze = getattr(self, 'analyze_' + name, None)
+        if analyze:
+            result = analyze(node, children)
+            if result is not False:
+                self.types.append(result)
+
+    # declarations and statements, which have no type
+
+    def analyze_VariableDeclaration(self, node, children):
+        self.scopes[-1][node.name] = node.type_specifier + '[]' * len(node.array_sizes)
+        return False
+
+    def analyze_ParameterDeclaration(self, node, children):
+        if node.name:
+            self.scopes[-1][node.name] = node.type
+        return False
+
+    def analyze_IfStatement(self, node, children):
+        self.cost['branch'] += 1
+        return False
+
+    def analyze_DiscardStatement(self, node, children):
+        self.cost['discard'] += 1
+        return False
+
+    # expressions
+
+    def analyze_FieldSelection(self, node, children):
+        base = children[0]
+        if base is None or not vector_pattern.match(base):
+            return None
+        return vector_type(base, len(node.field))
+
+    def analyze_IndexExpression(self, node, children):
+        base = children[0] or ''
+        if base.endswith('[]'):
+            return base[:-2]
+        size = matrix_size(base)
+        if size:
+            return vector_type('vec', size[1])
+        return vector_type(base, 1) if vector_pattern.match(base) else None
+
+    def analyze_UnaryExpression(self, node, children):
+        operand = children[0]
+        if node.op != '+':
+            self.cost['alu'] += components(operand)
+        return operand
+
+    def analyze_BinaryExpression(self, node, children):
+        left, right = children
+        left_size, right_size = matrix_size(left), matrix_size(right)
+        if node.op == '*' and left_size and right_size:
+            # one multiply-add per column of the right and component of the left
+            self.cost['alu'] += components(left) * right_size[0]
+            return 'mat%dx%d' % (right_size[0], left_size[1]) if right_size[0] != left_size[1] else 'mat%d' % right_size[0]
+        if node.op == '*' and left_size and vector_pattern.match(right or ''):
+            self.cost['alu'] += components(left)
+            return vector_type('vec', left_size[1])
+        if node.op == '*' and right_size and vector_pattern.match(left or ''):
+            self.cost['alu'] += components(right)
+            return vector_type('vec', right_size[0])
+
+        result = left if components(left) >= components(right) else right
+        self.cost['alu'] += components(result)
+        if node.op in ('<', '<=', '>', '>=', '==', '!=', '||', '&&'):
+            return 'bool'
+        if result in (None, 'int') and 'float' in (left, right):
+            return 'float'
+        return result
+
+    def analyze_AssignmentExpression(self, node, children):
+        left = children[0]
+        if node.op != '=':
+            self.cost['alu'] += components(left)
+        return left
+
+    def analyze_FunctionCall(self, node, children):
+        name = node.name
+        arguments = children[1:]
+        argument = arguments[0] if arguments else None
+        # constructors only move components
+        if is_floating_point_type(name) or is_integer_type(name):
+            return name
+        if name in self.user_functions:
+            self.calls[name] += 1
+            return self.user_functions[name].return_type
+        if texture_function_pattern.match(name):
+            self.cost['texture'] += 1
+            return 'float' if 'shadow' in name.lower() else 'vec4'
+
+        width = components(argument)
+        if name in TRANSCENDENTAL_FUNCTIONS:
+            self.cost['transcendental'] += width
+            return argument
+        self.cost['alu'] += width * BUILTIN_ALU.get(name, 1)
+        if name in SQRT_FUNCTIONS:
+            self.cost['transcendental'] += 1
+        if name in SCALAR_FUNCTIONS:
+            return vector_type(argument, 1)
+        if name == 'cross':
+            return 'vec3'
+        return argument
+
+def shader_cost(parser, entry='main'):
+    """ Returns the cost vector of a parsed shader, an OrderedDict of
+        COST_FIELDS, from its entry function, see above
+    """
+    analyses = {}
+    for name, function in parser.function_definitions.items():
+        analyses[name] = CostAnalysis(parser, function)
+
+    totals = {}
+    def total(name):
+        if name not in totals:
+            # GLSL forbids recursion, a recursive call is counted once
+            totals[name] = analyses[name].cost
+            cost = collections.OrderedDict(analyses[name].cost)
+            for callee, count in analyses[name].calls.items():
+                callee_cost = total(callee)
+                for field in COST_FIELDS:
+                    cost[field] += count * callee_cost[field]
+            totals[name] = cost
+        return totals[name]
+
+    if entry not in analyses:
+        return collections.OrderedDict((field, 0) for field in COST_FIELDS)
+    return total(entry)
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    from ShaderParser import ShaderParser
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v', '--vertex', action='store_true',
+            help='Specify this shader is a vertex shader')
+    parser.add_argument('input_shader')
+
+    args = parser.parse_args()
+
+    with open(args.input_shader) as f:
+        sp = ShaderParser()
+        sp.parse(f.read(), fragment_shader=not args.vertex)
+    for field, count in shader_cost(sp).items():
+        print('%-16s %d' % (field, count))
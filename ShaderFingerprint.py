@@ -0,0 +1,149 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import copy, hashlib
+
+import ShaderVisitor
+
+# Fingerprints of parsed shaders which ignore formatting, comments, the names
+# of the user identifiers and the order of the global declarations.
+#
+# The user identifiers (globals, functions, parameters and locals) are renamed
+# by order of first appearance in a traversal starting at main and following
+# the calls, so two shaders only differing by their names get the same names.
+# main, the built-in variables and the built-in functions are kept. The global declarations are then
+# sorted by their renamed source, the functions kept in traversal order, each
+# with the default precisions in scope at its definition.
+
+class DeclaredNames(ShaderVisitor.NodeVisitor):
+    """ Collects the names declared by the shader and the user functions called by each function
+    """
+
+    def __init__(self):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.names = set()
+        self.calls = []
+
+    def pre_VariableDeclaration(self, node):
+        self.names.add(node.name)
+
+    def pre_ParameterDeclaration(self, node):
+        if node.name:
+            self.names.add(node.name)
+
+    def pre_FunctionCall(self, node):
+        self.calls.append(node.name)
+
+class FirstAppearance(ShaderVisitor.NodeVisitor):
+    """ Records the user identifiers in order of first appearance
+    """
+
+    def __init__(self, user_names):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.user_names = user_names
+        self.names = []
+        self.seen = set()
+
+    def pre_str(self, name):
+        if name in self.user_names and name not in self.seen:
+            self.seen.add(name)
+            self.names.append(name)
+
+    def pre_VariableDeclaration(self, node):
+        self.pre_str(node.name)
+
+    def pre_ParameterDeclaration(self, node):
+        if node.name:
+            self.pre_str(node.name)
+
+    def pre_FunctionPrototype(self, node):
+        self.pre_str(node.name)
+
+class Renamer(ShaderVisitor.NodeTransformer):
+    """ Renames the identifiers of names = {old name : new name} in place
+    """
+
+    def __init__(self, names):
+        ShaderVisitor.NodeTransformer.__init__(self)
+        self.names = names
+
+    def post_str(self, name):
+        return self.names.get(name, name)
+
+    def post_VariableDeclaration(self, node):
+        node.name = self.names.get(node.name, node.name)
+        return node
+
+    def post_ParameterDeclaration(self, node):
+        if node.name:
+            node.name = self.names.get(node.name, node.name)
+        return node
+
+    def post_FunctionPrototype(self, node):
+        node.name = self.names.get(node.name, node.name)
+        return node
+
+def function_order(function_definitions):
+    """ Returns the function names from main in order of first call,
+        then the functions not called by signature
+    """
+    calls = {}
+    for name, function in function_definitions.items():
+        visitor = DeclaredNames()
+        visitor.visit(function)
+        calls[name] = [callee for callee in visitor.calls if callee in function_definitions]
+
+    order = []
+    pending = ['main'] if 'main' in function_definitions else []
+    while pending:
+        name = pending.pop(0)
+        if name in order:
+            continue
+        order.append(name)
+        pending += calls[name]
+
+    def signature(name):
+        function = function_definitions[name]
+        return (function.return_type, [parameter.type for parameter in function.parameters], name)
+    return order + sorted([name for name in function_definitions if name not in order], key=signature)
+
+def declaration_signature(declaration):
+    return (declaration.layout_qualifier or '', declaration.type_qualifier or '', declaration.precision_qualifier or '',
+        declaration.type_specifier, len(declaration.array_sizes))
+
+def canonical_source(parser):
+    """ Returns the normalized source of a parsed shader, see above.
+        The AST of parser is left untouched.
+    """
+    declarations = copy.deepcopy(list(parser.variable_declarations.values()))
+    functions = copy.deepcopy(parser.function_definitions)
+    order = function_order(functions)
+
+    declared = DeclaredNames()
+    declared.visit(declarations + list(functions.values()))
+    # main is the entry point of every shader
+    user_names = (declared.names | set(functions)) - set(['main'])
+
+    appearance = FirstAppearance(user_names)
+    appearance.visit([functions[name] for name in order])
+    # then the unused globals, which only differ by their declaration
+    appearance.visit(sorted(declarations, key=declaration_signature))
+
+    # '$' keeps the new names apart from the old ones
+    renamer = Renamer(dict((name, '$%d' % index) for index, name in enumerate(appearance.names)))
+    renamer.transform(declarations)
+    renamer.transform(list(functions.values()))
+
+    lines = sorted(ShaderVisitor.to_source(declaration) + ';' for declaration in declarations)
+    for name in order:
+        # the default precisions in scope give theirs to the parameters, locals and return value
+        precisions = parser.function_precision_qualifiers.get(name, parser.default_precision_qualifier)
+        lines += ['precision %s %s;' % (qualifier, type) for type, qualifier in sorted(precisions.items())]
+        lines.append(ShaderVisitor.to_source(functions[name]))
+    return '\n'.join(lines)
+
+def fingerprint(parser):
+    """ Returns a hash of the version and the normalized source of a parsed shader
+    """
+    text = 'version %d\n%s' % (parser.version, canonical_source(parser))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
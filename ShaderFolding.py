@@ -0,0 +1,229 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import copy, math, re, struct
+
+import ShaderVisitor
+from ShaderParser import UnaryExpression, CompoundStatement
+
+# Constant folding and simplification of the ShaderParser AST :
+#   - the arithmetic, comparison and logical operations of literals, typed as
+#     GLSL ES does : ints and floats never mix, ints divide toward zero,
+#     floats are rounded to 32 bits, and no operation dividing by zero or
+#     overflowing is folded, the int results being limited to the range
+#     highp ints are guaranteed, see INT_LIMITS
+#   - the identities x * 1, 1 * x, x + 0, 0 + x, x - 0, x / 1, true && x,
+#     false || x, whose result has the type of x
+#   - the if statements of a constant condition, replaced by their taken branch
+# A negative constant is a '-' UnaryExpression of its literal, e.g. 2.0 - 3.0
+# folds to -1.0.
+
+# largest magnitude of the highp ints by version, ESSL 1.00 only guarantees 17 bits
+INT_LIMITS = {100 : 2 ** 16 - 1}
+INT_LIMIT = 2 ** 31 - 1
+
+int_literal_pattern = re.compile(r'(0|[1-9]\d*)$')
+# other int spellings, e.g. octal 010, are left unfolded
+float_literal_pattern = re.compile(r'((\d+\.\d*|\.\d+)([eE][-+]?\d+)?|\d+[eE][-+]?\d+)$')
+
+def to_float32(value):
+    return struct.unpack('f', struct.pack('f', value))[0]
+
+def format_float(value):
+    """ Returns the shortest GLSL float literal of a positive 32 bits float
+    """
+    if value == int(value) and value < 1e7:
+        return '%.1f' % value
+    for digits in range(1, 10):
+        text = '%.*g' % (digits, value)
+        if to_float32(float(text)) == value:
+            break
+    if '.' not in text and 'e' not in text:
+        text += '.0'
+    return text
+
+def literal_value(text):
+    """ Returns (type, value) of a literal, None for other strings
+    """
+    if text in ('true', 'false'):
+        return ('bool', text == 'true')
+    if int_literal_pattern.match(text):
+        return ('int', int(text))
+    if float_literal_pattern.match(text):
+        return ('float', to_float32(float(text)))
+    return None
+
+def constant_value(node):
+    """ Returns (type, value) of a literal or of a negated literal, None otherwise
+    """
+    if type(node) is str:
+        return literal_value(node)
+    if type(node) is UnaryExpression and node.op == '-' and type(node.operand) is str:
+        constant = literal_value(node.operand)
+        if constant and constant[0] in ('int', 'float'):
+            return (constant[0], -constant[1])
+    return None
+
+def constant_node(constant):
+    """ Returns the AST of a (type, value), None if it has no literal
+    """
+    kind, value = constant
+    if kind == 'bool':
+        return 'true' if value else 'false'
+    if kind == 'float':
+        if math.isinf(value) or math.isnan(value):
+            return None
+        text = format_float(abs(value))
+    else:
+        text = str(abs(value))
+    # -0.0 is kept negative
+    if value < 0 or (kind == 'float' and math.copysign(1.0, value) < 0):
+        return UnaryExpression('-', text)
+    return text
+
+def evaluate_binary(op, left, right):
+    """ Returns the (type, value) of a binary operation of constants, None
+        when GLSL ES rejects or does not define it
+    """
+    (kind, x), (right_kind, y) = left, right
+    if kind != right_kind:
+        return None
+    if op in ('==', '!='):
+        return ('bool', (x == y) == (op == '=='))
+    if kind == 'bool':
+        if op == '&&':
+            return ('bool', x and y)
+        if op == '||':
+            return ('bool', x or y)
+        return None
+    if op in ('<', '<=', '>', '>='):
+        return ('bool', {'<' : x < y, '<=' : x <= y, '>' : x > y, '>=' : x >= y}[op])
+    if op == '/':
+        if y == 0:
+            return None
+        if kind == 'int':
+            # truncated toward zero
+            quotient = abs(x) // abs(y)
+            return ('int', quotient if (x < 0) == (y < 0) else -quotient)
+        return ('float', to_float32(x / y))
+    if op in ('+', '-', '*'):
+        value = x + y if op == '+' else x - y if op == '-' else x * y
+        return (kind, value if kind == 'int' else to_float32(value))
+    if kind == 'int' and op in ('&', '|', '^'):
+        return ('int', x & y if op == '&' else x | y if op == '|' else x ^ y)
+    return None
+
+def evaluate_unary(op, operand):
+    kind, x = operand
+    if op == '+' and kind != 'bool':
+        return operand
+    if op == '-' and kind != 'bool':
+        return (kind, -x)
+    if op == '!' and kind == 'bool':
+        return ('bool', not x)
+    if op == '~' and kind == 'int':
+        return ('int', ~x)
+    return None
+
+def is_constant(node, kind, value):
+    constant = constant_value(node)
+    return constant is not None and constant[0] == kind and constant[1] == value
+
+class ConstantFolder(ShaderVisitor.NodeTransformer):
+    """ Folds an AST in place, counting the folded operations in folds.
+        The int results larger than int_limit in magnitude are not folded.
+    """
+
+    def __init__(self, int_limit=INT_LIMIT):
+        ShaderVisitor.NodeTransformer.__init__(self)
+        self.int_limit = int_limit
+        self.folds = 0
+
+    def folded(self, node):
+        self.folds += 1
+        return node
+
+    def result_node(self, result):
+        if result is None or (result[0] == 'int' and abs(result[1]) > self.int_limit):
+            return None
+        return constant_node(result)
+
+    def post_UnaryExpression(self, node):
+        operand = constant_value(node.operand)
+        # a negated literal is already folded
+        if operand is None or (node.op == '-' and type(node.operand) is str):
+            return node
+        result = self.result_node(evaluate_unary(node.op, operand))
+        return self.folded(result) if result is not None else node
+
+    def post_BinaryExpression(self, node):
+        op, left, right = node.op, constant_value(node.left), constant_value(node.right)
+        if left and right:
+            result = self.result_node(evaluate_binary(op, left, right))
+            return self.folded(result) if result is not None else node
+
+        # identities, keeping the type of the other operand
+        for one in (('int', 1), ('float', 1.0)):
+            if op == '*' and is_constant(node.left, *one) and not right:
+                return self.folded(node.right)
+            if op in ('*', '/') and is_constant(node.right, *one) and not left:
+                return self.folded(node.left)
+        for zero in (('int', 0), ('float', 0.0)):
+            if op == '+' and is_constant(node.left, *zero) and not right:
+                return self.folded(node.right)
+            if op in ('+', '-') and is_constant(node.right, *zero) and not left:
+                return self.folded(node.left)
+        if (op == '&&' and is_constant(node.left, 'bool', True)) or (op == '||' and is_constant(node.left, 'bool', False)):
+            return self.folded(node.right)
+        return node
+
+    def post_IfStatement(self, node):
+        condition = constant_value(node.condition)
+        if not condition or condition[0] != 'bool':
+            return node
+        branch = node.if_true if condition[1] else node.if_false
+        if branch is None:
+            # a statement of a block is dropped, a branch is left empty
+            branch = ShaderVisitor.REMOVE if type(self.path[-1]) is CompoundStatement else CompoundStatement([])
+        return self.folded(branch)
+
+def fold(parser):
+    """ Folds the global initializers and the function bodies of a parsed
+        shader in place, returns the number of folded operations
+    """
+    folder = ConstantFolder(INT_LIMITS.get(parser.version, INT_LIMIT))
+    folder.transform(list(parser.variable_declarations.values()))
+    folder.transform(list(parser.function_definitions.values()))
+    return folder.folds
+
+def folded_source(parser):
+    """ Returns (source of the folded shader, number of folded operations),
+        the parser is left untouched
+    """
+    folded = copy.deepcopy(parser)
+    folds = fold(folded)
+    return ShaderVisitor.shader_header(folded) + '\n' + ShaderVisitor.shader_to_source(folded), folds
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    from ShaderParser import ShaderParser
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v', '--vertex', action='store_true',
+            help='Specify the shaders are vertex shaders')
+    parser.add_argument('-s', '--source', action='store_true',
+            help='Print the folded source of each shader')
+    parser.add_argument('input_shaders', nargs='+')
+
+    args = parser.parse_args()
+
+    for filename in args.input_shaders:
+        with open(filename) as f:
+            sp = ShaderParser()
+            sp.parse(f.read(), fragment_shader=not args.vertex)
+        source, folds = folded_source(sp)
+        print('%s : %d folded operations' % (filename, folds))
+        if args.source:
+            print(source)
@@ -1,6 +1,7 @@
 import logging
 logger = logging.getLogger(__name__)
 
+import re
 from ply import lex
 
 class ShaderLexer(object):
@@ -15,8 +16,12 @@ class ShaderLexer(object):
         self.last_token = self.lexer.token()
         return self.last_token
 
-    def reset_lineno(self):
-        self.lexer.lineno = 1
+    def reset_lineno(self, lineno=1):
+        self.lexer.lineno = lineno
+
+    def tokenize(self, text):
+        self.input(text)
+        return list(iter(self.token, None))
 
     keywords = (
         'const', #'struct',
@@ -45,7 +50,7 @@ class ShaderLexer(object):
     )
     keywords_mapping = { k : k.upper() for k in keywords}
 
-    tokens = keywords_mapping.values() + [
+    tokens = list(keywords_mapping.values()) + [
         'IDENTIFIER',
         # literal
         'INT_CONSTANT', 'FLOAT_CONSTANT', 'BOOL_CONSTANT',
@@ -144,10 +149,10 @@ class ShaderLexer(object):
         r'\n+'
         t.lexer.lineno += t.value.count("\n")
 
-    #def t_COMMENT(self, t):
-        #r'/\*(.|\n)*?\*/'
-        #t.lexer.lineno += t.value.count("\n")
-        #return t
+    # comments only reach the lexer when the preprocessor is bypassed
+    def t_COMMENT(self, t):
+        r'/\*[\s\S]*?\*/|//[^\n]*'
+        t.lexer.lineno += t.value.count("\n")
 
     def t_IDENTIFIER(self, t):
         r'[A-Za-z_][0-9A-Za-z_]*'
@@ -159,3 +164,158 @@ class ShaderLexer(object):
 
     def build(self, **kwargs):
         self.lexer = lex.lex(object=self, **kwargs)
+
+class TokenStream(object):
+    """ Replays a list of tokens through the lexer interface used by yacc
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.index = 0
+        self.last_token = None
+
+    def input(self, text):
+        pass
+
+    def token(self):
+        if self.index < len(self.tokens):
+            self.last_token = self.tokens[self.index]
+            self.index += 1
+        else:
+            self.last_token = None
+        return self.last_token
+
+class RegexLexer(object):
+    """ The lexer object of FastShaderLexer, lexes its whole input at once
+        with the master pattern of the rules, no rule function is called
+    """
+
+    def __init__(self, pattern, keywords_mapping, literal_types, whitespace):
+        self.pattern = pattern
+        self.keywords_mapping = keywords_mapping
+        self.literal_types = literal_types
+        self.whitespace = whitespace
+        self.lineno = 1
+        self.tokens = []
+        self.index = 0
+
+    def input(self, text):
+        keywords_mapping = self.keywords_mapping
+        literal_types = self.literal_types
+        LexToken = lex.LexToken
+        lineno = self.lineno
+        tokens = []
+        append = tokens.append
+        position = 0
+        for match in self.pattern.finditer(text):
+            kind = match.lastgroup
+            start = match.start(kind)
+            # the pattern skips the whitespace before each token
+            if match.start() != position:
+                break
+            if start != position:
+                lineno += text.count('\n', position, start)
+            position = match.end()
+
+            value = match.group(kind)
+            if kind == 'IDENTIFIER':
+                kind = keywords_mapping.get(value, 'IDENTIFIER')
+            elif kind in literal_types:
+                kind = literal_types[kind][value]
+            elif kind == 'COMMENT':
+                lineno += value.count('\n')
+                continue
+            token = LexToken()
+            token.type = kind
+            token.value = value
+            token.lineno = lineno
+            token.lexpos = start
+            append(token)
+
+        # only trailing whitespace is left unmatched
+        rest = text[position:]
+        lineno += rest.count('\n')
+        self.lineno = lineno
+        rest = rest.lstrip(self.whitespace)
+        if rest:
+            logger.error('Illegal character %s' % repr(rest[0]))
+            raise lex.LexError("Scanning error. Illegal character '%s'" % rest[0], rest)
+        self.tokens = tokens
+        self.index = 0
+
+    def token(self):
+        if self.index < len(self.tokens):
+            self.index += 1
+            return self.tokens[self.index - 1]
+        return None
+
+# regex characters which are not literals when unescaped, in verbose mode
+REGEX_SYNTAX = set('.^$*+?{}[]|() \t\n#')
+
+def literal_of(regex):
+    """ Returns the text matched by regex if it only matches it, otherwise None
+    """
+    if REGEX_SYNTAX.intersection(re.sub(r'\\.', '', regex)):
+        return None
+    return re.sub(r'\\(.)', r'\1', regex)
+
+class FastShaderLexer(ShaderLexer):
+    """ Lexes the same tokens, with the same line numbers, as ShaderLexer
+        through a single precompiled pattern, keywords being looked up in
+        keywords_mapping. Tokenizing is about twice as fast as with ply,
+        and building the lexer is free.
+    """
+
+    # compiled on the first build : (pattern, {literal group : {literal : type}})
+    compiled = None
+
+    @classmethod
+    def whitespace(cls):
+        return cls.t_ignore + '\n'
+
+    @classmethod
+    def master_pattern(cls):
+        """ Returns the alternation of the rules in the order ply tries them,
+            i.e. the rule functions in definition order, then the rule strings
+            by decreasing length, and the types of its literal groups.
+            Consecutive rules matching a literal are merged into one group,
+            whose token type is looked up from the text. The pattern starts by
+            skipping the ignored characters and the newlines, which t_NEWLINE
+            would only count.
+        """
+        rules = [(name, getattr(cls, name)) for name in dir(cls)
+            if name.startswith('t_') and name not in ('t_ignore', 't_error', 't_NEWLINE')]
+        functions = sorted([rule for rule in rules if callable(rule[1])], key=lambda rule : rule[1].__code__.co_firstlineno)
+        strings = sorted([rule for rule in rules if not callable(rule[1])], key=lambda rule : len(rule[1]), reverse=True)
+
+        groups = [(name[2:], function.__doc__) for name, function in functions]
+        literal_types = {}
+        for name, regex in strings:
+            literal = literal_of(regex)
+            if literal is None:
+                groups.append((name[2:], regex))
+                continue
+            if groups[-1][0] not in literal_types:
+                group = 'LITERALS%d' % len(literal_types)
+                literal_types[group] = {}
+                groups.append((group, []))
+            group, regexes = groups[-1]
+            literal_types[group].setdefault(literal, name[2:])
+            regexes.append(regex)
+
+        groups = ['(?P<%s>%s)' % (group, regex if group not in literal_types else '|'.join(regex))
+            for group, regex in groups]
+        pattern = re.compile('[%s]*(?:%s)' % (re.escape(cls.whitespace()), '|'.join(groups)), re.VERBOSE)
+        return pattern, literal_types
+
+    def build(self, **kwargs):
+        cls = type(self)
+        if cls.compiled is None:
+            cls.compiled = cls.master_pattern()
+        pattern, literal_types = cls.compiled
+        self.lexer = RegexLexer(pattern, self.keywords_mapping, literal_types, cls.whitespace())
+
+    def tokenize(self, text):
+        self.input(text)
+        self.last_token = None
+        return self.lexer.tokens
@@ -0,0 +1,316 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import collections
+
+import ShaderVisitor
+from ShaderCost import texture_function_pattern, matrix_size
+from ShaderFolding import literal_value
+from ShaderParser import is_floating_point_type, is_integer_type
+from ShaderPrecision import root_name
+from ShaderPruner import identifiers
+
+# Performance lint of parsed shaders. The rules are classes registered with
+# the @rule decorator, defining NodeVisitor hooks : Linter walks a shader
+# once, calling the hooks of every rule for each node.
+
+RULES = collections.OrderedDict()
+
+def rule(cls):
+    """ Registers a Rule class under its name
+    """
+    RULES[cls.name] = cls
+    return cls
+
+class Rule(object):
+    """ Base of the lint rules. A rule defines pre_<ClassName>(node) and
+        post_<ClassName>(node) hooks, called while the Linter walks the
+        shader, which holds the state of the walk, and finish(), called
+        after the walk. stages lists the shader stages the rule applies to.
+    """
+
+    name = None
+    stages = ('vertex', 'fragment')
+
+    def __init__(self, linter):
+        self.linter = linter
+
+    def report(self, node, message):
+        self.linter.report(self.name, node, message)
+
+    def finish(self):
+        pass
+
+class Linter(ShaderVisitor.NodeVisitor):
+    """ Runs lint rules, all of RULES by default, over a parsed shader in a
+        single walk. opaque tells whether the shader is drawn without
+        blending, None if unknown.
+    """
+
+    def __init__(self, parser, fragment_shader=True, rules=None, opaque=None):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.parser = parser
+        self.stage = 'fragment' if fragment_shader else 'vertex'
+        self.opaque = opaque
+        self.rules = [RULES[name](self) for name in (rules or RULES) if self.stage in RULES[name].stages]
+        self.findings = []
+        self.function = None
+        # names of the local variables and parameters of the current function
+        self.locals = set()
+
+    def _hook(self, prefix, cls):
+        key = (prefix, cls)
+        if key not in self._hooks:
+            hooks = [getattr(rule, prefix + cls.__name__) for rule in self.rules if hasattr(rule, prefix + cls.__name__)]
+            own = getattr(self, prefix + cls.__name__, None)
+            if own:
+                # the state of the walk is updated before the rules see a node, and after they left it
+                hooks = [own] + hooks if prefix == 'pre_' else hooks + [own]
+            if not hooks:
+                self._hooks[key] = None
+            elif len(hooks) == 1:
+                self._hooks[key] = hooks[0]
+            else:
+                def dispatch(node, hooks=hooks):
+                    for hook in hooks:
+                        hook(node)
+                self._hooks[key] = dispatch
+        return self._hooks[key]
+
+    def pre_FunctionDefinition(self, node):
+        self.function = node.name
+        self.locals = set(parameter.name for parameter in node.parameters if parameter.name)
+
+    def post_FunctionDefinition(self, node):
+        self.function = None
+
+    def pre_VariableDeclaration(self, node):
+        if self.function:
+            self.locals.add(node.name)
+
+    def global_variable(self, name):
+        """ Returns the global declaration a name refers to, None for locals and other names
+        """
+        if name in self.locals:
+            return None
+        return self.parser.variable_declarations.get(name)
+
+    def is_input(self, name):
+        var = self.global_variable(name)
+        return var is not None and var.is_input_variable(self.stage == 'fragment')
+
+    def is_uniform(self, name):
+        var = self.global_variable(name)
+        return var is not None and var.layout_qualifier == 'uniform'
+
+    def report(self, rule, node, message):
+        self.findings.append(collections.OrderedDict([
+            ('rule', rule),
+            ('stage', self.stage),
+            ('function', self.function),
+            ('message', message),
+            ('source', ShaderVisitor.to_source(node)),
+        ]))
+
+    def run(self):
+        """ Walks the shader, returns the findings as a list of OrderedDicts
+            of rule, stage, function, message and source
+        """
+        self.visit(list(self.parser.variable_declarations.values()) + list(self.parser.function_definitions.values()))
+        for lint_rule in self.rules:
+            lint_rule.finish()
+        return self.findings
+
+def is_texture_call(node):
+    return type(node).__name__ == 'FunctionCall' and texture_function_pattern.match(node.name) is not None
+
+@rule
+class DependentTextureRead(Rule):
+    """ Texture coordinates computed in the fragment shader rather than read
+        from a varying, which prevents the texture prefetch
+    """
+
+    name = 'dependent-texture-read'
+    stages = ('fragment', )
+
+    def pre_FunctionCall(self, node):
+        if not is_texture_call(node) or len(node.arguments) < 2:
+            return
+        coordinates = node.arguments[1]
+        # a varying, or its leading components
+        if type(coordinates).__name__ == 'FieldSelection' and coordinates.field in ('xy', 'st', 'xyz', 'stp', 'x', 's'):
+            coordinates = coordinates.base
+        if type(coordinates) is str and self.linter.is_input(coordinates):
+            return
+        self.report(node, 'texture coordinates computed in the fragment shader')
+
+@rule
+class RepeatedTextureSample(Rule):
+    """ Identical texture fetches in a function, none of whose variables
+        is assigned in the function
+    """
+
+    name = 'repeated-texture-sample'
+
+    def __init__(self, linter):
+        Rule.__init__(self, linter)
+        self.pre_FunctionDefinition(None)
+
+    def pre_FunctionDefinition(self, node):
+        self.samples = collections.OrderedDict()
+        self.assigned = set()
+
+    def pre_FunctionCall(self, node):
+        if is_texture_call(node):
+            self.samples.setdefault(ShaderVisitor.to_source(node), []).append(node)
+
+    def pre_AssignmentExpression(self, node):
+        self.assigned.add(root_name(node.left))
+
+    def pre_VariableDeclaration(self, node):
+        if node.initializer is not None:
+            self.assigned.add(node.name)
+
+    def post_FunctionDefinition(self, node):
+        for source, calls in self.samples.items():
+            if len(calls) > 1 and not identifiers(calls[0]) & self.assigned:
+                self.report(calls[0], 'sampled %d times, sample once into a local variable' % len(calls))
+
+@rule
+class DiscardInOpaquePass(Rule):
+    """ discard in a shader drawn without blending, which disables the early
+        depth test of many GPUs
+    """
+
+    name = 'discard-in-opaque-pass'
+    stages = ('fragment', )
+
+    def pre_DiscardStatement(self, node):
+        if self.linter.opaque is not False:
+            self.report(node, 'discard disables early depth testing, use alpha blending or depth pre-pass')
+
+@rule
+class BranchOnVarying(Rule):
+    """ if statements on values derived from varyings, which may diverge
+        between the fragments shaded together
+    """
+
+    name = 'branch-on-varying'
+    stages = ('fragment', )
+
+    def __init__(self, linter):
+        Rule.__init__(self, linter)
+        self.pre_FunctionDefinition(None)
+
+    def pre_FunctionDefinition(self, node):
+        # locals assigned from varyings
+        self.tainted = set()
+
+    def depends_on_varying(self, node):
+        return any(name in self.tainted or self.linter.is_input(name) for name in identifiers(node))
+
+    def post_VariableDeclaration(self, node):
+        if self.linter.function and node.initializer is not None and self.depends_on_varying(node.initializer):
+            self.tainted.add(node.name)
+
+    def post_AssignmentExpression(self, node):
+        if self.linter.function and self.depends_on_varying(node.right):
+            self.tainted.add(root_name(node.left))
+
+    def pre_IfStatement(self, node):
+        if self.depends_on_varying(node.condition):
+            self.report(node.condition, 'dynamic branch on a varying')
+
+@rule
+class HoistableMatrixMath(Rule):
+    """ Products of a uniform matrix with uniforms and varyings only, which
+        can be computed once per vertex, or once per draw, rather than once
+        per fragment
+    """
+
+    name = 'hoistable-matrix-math'
+    stages = ('fragment', )
+
+    def __init__(self, linter):
+        Rule.__init__(self, linter)
+        self.pre_FunctionDefinition(None)
+
+    def pre_FunctionDefinition(self, node):
+        self.hoisted = set()
+
+    def varying_dependence(self, node):
+        # literals, uniforms, varyings, their linear combinations and their
+        # constructors, whose interpolation commutes with the product: None for
+        # other nodes, e.g. a product of varyings, else whether it reads varyings
+        name = type(node).__name__
+        if name == 'str':
+            if self.linter.is_input(node):
+                return True
+            if literal_value(node) is not None or self.linter.is_uniform(node):
+                return False
+            return None
+        if name == 'FieldSelection':
+            return self.varying_dependence(node.base)
+        if name == 'IndexExpression':
+            base, index = self.varying_dependence(node.base), self.varying_dependence(node.index)
+            return None if base is None or index is not False else base
+        if name == 'UnaryExpression':
+            return self.varying_dependence(node.operand) if node.op in ('+', '-') else None
+        if name == 'BinaryExpression':
+            left, right = self.varying_dependence(node.left), self.varying_dependence(node.right)
+            if left is None or right is None:
+                return None
+            if node.op in ('+', '-'):
+                return left or right
+            if node.op == '*' and not (left and right):
+                return left or right
+            if node.op == '/' and not right:
+                return left
+            return None
+        if name == 'FunctionCall' and (is_floating_point_type(node.name) or is_integer_type(node.name)):
+            arguments = [self.varying_dependence(argument) for argument in node.arguments]
+            return None if None in arguments else any(arguments)
+        # built-in variables and functions, e.g. gl_FragCoord or dFdx, may vary per fragment
+        return None
+
+    def is_uniform_matrix(self, node):
+        if type(node) is not str or not self.linter.is_uniform(node):
+            return False
+        return matrix_size(self.linter.global_variable(node).type_specifier) is not None
+
+    def pre_BinaryExpression(self, node):
+        if node.op != '*' or any(id(ancestor) in self.hoisted for ancestor in self.linter.path):
+            return
+        if not (self.is_uniform_matrix(node.left) or self.is_uniform_matrix(node.right)):
+            return
+        if self.varying_dependence(node) is not None:
+            self.hoisted.add(id(node))
+            self.report(node, 'matrix product of uniforms and varyings, move it to the vertex shader')
+
+def lint(parser, fragment_shader=True, rules=None, opaque=None):
+    """ Returns the findings of the rules, all of RULES by default, on a parsed shader
+    """
+    return Linter(parser, fragment_shader, rules, opaque).run()
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse, json
+    from ShaderParser import ShaderParser
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v', '--vertex', action='store_true',
+            help='Specify this shader is a vertex shader')
+    parser.add_argument('-r', '--rule', action='append', choices=list(RULES),
+            help='Rule to run, all by default')
+    parser.add_argument('--blended', action='store_true',
+            help='Specify this shader is drawn with blending')
+    parser.add_argument('input_shader')
+
+    args = parser.parse_args()
+
+    with open(args.input_shader) as f:
+        sp = ShaderParser()
+        sp.parse(f.read(), fragment_shader=not args.vertex)
+    for finding in lint(sp, not args.vertex, args.rule, opaque=False if args.blended else None):
+        print(json.dumps(finding))
@@ -0,0 +1,286 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import collections, copy, io, itertools, re, string, types
+
+import ShaderVisitor
+from ShaderParser import ShaderParser
+from ShaderFingerprint import Renamer
+
+# Minification of parsed shaders : no layout whitespace, the fewest
+# parentheses the GLSL ES precedences allow, short float literals, and short
+# names for the identifiers which are not part of the interface of the
+# shader, the most used first. main, the built-in names and the uniforms,
+# attributes, varyings, inputs and outputs keep their names.
+
+# keywords and reserved words of GLSL ES 1.00 and 3.00
+RESERVED = set('''attribute const uniform varying layout centroid flat smooth noperspective
+break continue do for while switch case default if else in out inout
+float int uint void bool true false invariant discard return
+mat2 mat3 mat4 mat2x2 mat2x3 mat2x4 mat3x2 mat3x3 mat3x4 mat4x2 mat4x3 mat4x4
+vec2 vec3 vec4 ivec2 ivec3 ivec4 uvec2 uvec3 uvec4 bvec2 bvec3 bvec4
+lowp mediump highp precision sampler2D sampler3D samplerCube sampler2DShadow samplerCubeShadow
+sampler2DArray sampler2DArrayShadow isampler2D isampler3D isamplerCube isampler2DArray
+usampler2D usampler3D usamplerCube usampler2DArray struct
+attribute packed asm class union enum typedef template this goto inline noinline volatile
+public static extern external interface long short double half fixed unsigned superp
+input output hvec2 hvec3 hvec4 dvec2 dvec3 dvec4 fvec2 fvec3 fvec4 sampler1D sampler1DShadow
+sampler2DRect sampler3DRect sampler2DRectShadow sizeof cast namespace using'''.split())
+
+# built-in functions, which a variable of the same name would hide
+BUILTIN_FUNCTIONS = set('''radians degrees sin cos tan asin acos atan sinh cosh tanh asinh acosh atanh
+pow exp log exp2 log2 sqrt inversesqrt abs sign floor trunc round roundEven ceil fract mod modf
+min max clamp mix step smoothstep isnan isinf floatBitsToInt floatBitsToUint intBitsToFloat
+uintBitsToFloat packSnorm2x16 unpackSnorm2x16 packUnorm2x16 unpackUnorm2x16 packHalf2x16
+unpackHalf2x16 length distance dot cross normalize faceforward reflect refract matrixCompMult
+outerProduct transpose determinant inverse lessThan lessThanEqual greaterThan greaterThanEqual
+equal notEqual any all not textureSize texture textureProj textureLod textureOffset texelFetch
+texelFetchOffset textureProjOffset textureLodOffset textureProjLod textureProjLodOffset
+textureGrad textureGradOffset textureProjGrad textureProjGradOffset texture2D texture2DProj
+texture2DLod texture2DProjLod textureCube textureCubeLod dFdx dFdy fwidth'''.split())
+
+# binding of the binary operators, the lowest binding tightest
+PRECEDENCE = {
+    '*' : 3, '/' : 3, '%' : 3,
+    '+' : 4, '-' : 4,
+    '<<' : 5, '>>' : 5,
+    '<' : 6, '>' : 6, '<=' : 6, '>=' : 6,
+    '==' : 7, '!=' : 7,
+    '&' : 8, '^' : 9, '|' : 10,
+    '&&' : 11, '^^' : 12, '||' : 13,
+}
+
+float_pattern = re.compile(r'(\d*)\.(\d*)$')
+
+def short_float(text):
+    """ Returns the shortest spelling of a float literal without exponent, e.g. .5 for 0.50
+    """
+    match = float_pattern.match(text)
+    if not match:
+        return text
+    integer, fraction = match.group(1).lstrip('0'), match.group(2).rstrip('0')
+    if not integer and not fraction:
+        return '0.'
+    return integer + '.' + fraction
+
+def short_names(excluded):
+    """ Yields a, b, ... z, A, ... Z, aa, ab, ... skipping the names of excluded
+    """
+    first = string.ascii_letters
+    rest = string.ascii_letters + string.digits + '_'
+    for length in itertools.count(1):
+        for letters in itertools.product(*([first] + [rest] * (length - 1))):
+            name = ''.join(letters)
+            if name not in excluded and name not in RESERVED and name not in BUILTIN_FUNCTIONS:
+                yield name
+
+class Occurrences(ShaderVisitor.NodeVisitor):
+
+    def __init__(self):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.counts = collections.Counter()
+
+    def pre_str(self, name):
+        self.counts[name] += 1
+
+    def pre_VariableDeclaration(self, node):
+        self.counts[node.name] += 1
+
+    def pre_ParameterDeclaration(self, node):
+        if node.name:
+            self.counts[node.name] += 1
+
+    def pre_FunctionPrototype(self, node):
+        self.counts[node.name] += 1
+
+class MinifyingRenamer(Renamer):
+    """ Renames the identifiers of names and shortens the float literals
+    """
+
+    def post_str(self, name):
+        if name in self.names:
+            return self.names[name]
+        return short_float(name)
+
+class MinifyingEmitter(ShaderVisitor.CodeEmitter):
+    """ Emits without layout whitespace nor redundant parentheses, the
+        precision of the global declarations being left out when it is the
+        default one of parser
+    """
+
+    indent_width = 0
+    newline = ''
+
+    def __init__(self, stream, parser):
+        ShaderVisitor.CodeEmitter.__init__(self, stream)
+        self.parser = parser
+        self.global_declarations = set(parser.variable_declarations.values())
+
+    def operand(self, node):
+        # the operand of a postfix or unary operator
+        if type(node).__name__ in ('BinaryExpression', 'AssignmentExpression', 'UnaryExpression'):
+            return ['(', node, ')']
+        return [node]
+
+    def binary_operand(self, node, precedence, right):
+        name = type(node).__name__
+        if name == 'AssignmentExpression':
+            return ['(', node, ')']
+        if name == 'BinaryExpression':
+            # same precedence on the right keeps the evaluation order
+            child = PRECEDENCE.get(node.op, 0)
+            if child > precedence or (right and child == precedence):
+                return ['(', node, ')']
+        return [node]
+
+    def expand_VariableDeclaration(self, node):
+        precision = node.precision_qualifier
+        # the parser gives the global declarations the default precision back
+        if node in self.global_declarations:
+            if precision == self.parser.get_default_precision_qualifier(node.type_specifier):
+                precision = None
+        qualifiers = [node.type_qualifier, node.layout_qualifier, precision, node.type_specifier]
+        parts = [' '.join([qualifier for qualifier in qualifiers if qualifier] + [node.name])]
+        for size in node.array_sizes:
+            parts += ['[', size, ']']
+        if node.initializer:
+            parts += ['=', node.initializer]
+        return parts
+
+    def expand_ParameterDeclaration(self, node):
+        tokens = [node.type]
+        # in is the default qualifier
+        if node.parameter_qualifier != 'in':
+            tokens.insert(0, node.parameter_qualifier)
+        if node.name: tokens.append(node.name)
+        return [' '.join(tokens)]
+
+    def expand_FunctionPrototype(self, node):
+        return ['%s %s(' % (node.return_type, node.name)] + self.separated(node.parameters, ',') + [')']
+
+    def expand_FunctionDefinition(self, node):
+        return [node.function_prototype, node.compound_statements]
+
+    def expand_CompoundStatement(self, node):
+        return ['{'] + [ShaderVisitor.Statement(item) for item in node.block_items] + ['}']
+
+    def expand_IfStatement(self, node):
+        if_true = ShaderVisitor.Statement(node.if_true)
+        parts = ['if(', node.condition, ')']
+        if node.if_false is None:
+            return parts + [if_true]
+        # braces keep the else of an inner if without else from binding to it
+        if type(node.if_true).__name__ == 'IfStatement':
+            parts += ['{', if_true, '}']
+        else:
+            parts.append(if_true)
+        if type(node.if_false).__name__ == 'CompoundStatement':
+            return parts + ['else', ShaderVisitor.Statement(node.if_false)]
+        return parts + ['else ', ShaderVisitor.Statement(node.if_false)]
+
+    def expand_ReturnStatement(self, node):
+        if node.return_value:
+            return ['return ', node.return_value, ';']
+        return ['return;']
+
+    def expand_FunctionCall(self, node):
+        return [node.name, '('] + self.separated(node.arguments, ',') + [')']
+
+    def expand_BinaryExpression(self, node):
+        precedence = PRECEDENCE.get(node.op, 0)
+        op = node.op
+        # a - -b is not a -- b
+        if type(node.right).__name__ == 'UnaryExpression' and node.right.op == op[-1]:
+            op += ' '
+        return self.binary_operand(node.left, precedence, False) + [op] + self.binary_operand(node.right, precedence, True)
+
+    def expand_AssignmentExpression(self, node):
+        return [node.left, node.op, node.right]
+
+class DeclaredLocals(ShaderVisitor.NodeVisitor):
+
+    def __init__(self):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.names = set()
+
+    def pre_VariableDeclaration(self, node):
+        self.names.add(node.name)
+
+def user_names(parser):
+    """ Returns the names the minifier may rename : the functions but main,
+        the global variables out of the interface, the locals and parameters
+    """
+    names = set(name for name in parser.function_definitions if name != 'main')
+    names |= set(name for name, var in parser.variable_declarations.items() if not var.layout_qualifier)
+    for function in parser.function_definitions.values():
+        names |= set(parameter.name for parameter in function.parameters if parameter.name)
+    locals = DeclaredLocals()
+    locals.visit(list(parser.function_definitions.values()))
+    names |= locals.names
+    kept = set(name for name, var in parser.variable_declarations.items() if var.layout_qualifier)
+    return names - kept - set(['main'])
+
+def implicit_precisions(fragment_shader):
+    """ Returns the default precisions of a stage, which need no precision statement
+    """
+    defaults = types.SimpleNamespace(default_precision_qualifier={})
+    ShaderParser.initialize_default_precision_qualifiers(defaults, fragment_shader)
+    return defaults.default_precision_qualifier
+
+def minify(parser, fragment_shader=True, rename=True):
+    """ Returns the minified source of a parsed shader, the parser is left untouched
+    """
+    minified = copy.deepcopy(parser)
+    declarations = list(minified.variable_declarations.values())
+    functions = list(minified.function_definitions.values())
+
+    occurrences = Occurrences()
+    occurrences.visit(declarations + functions)
+    names = {}
+    if rename:
+        renamed = user_names(minified)
+        # the new names must not be any name left as it is
+        generator = short_names(set(occurrences.counts) - renamed)
+        for name in sorted(renamed, key=lambda name : (-occurrences.counts[name], name)):
+            names[name] = next(generator)
+    renamer = MinifyingRenamer(names)
+    renamer.transform(declarations)
+    renamer.transform(functions)
+    minified.variable_declarations = collections.OrderedDict((declaration.name, declaration) for declaration in declarations)
+    minified.function_precision_qualifiers = dict((names.get(name, name), precisions)
+        for name, precisions in parser.function_precision_qualifiers.items())
+
+    lines = []
+    if minified.version != 100:
+        lines.append('#version %d es\n' % minified.version)
+    implicit = implicit_precisions(fragment_shader)
+    for type, qualifier in sorted(minified.default_precision_qualifier.items()):
+        if implicit.get(type) != qualifier:
+            lines.append('precision %s %s;' % (qualifier, type))
+
+    stream = io.StringIO()
+    # the functions defined under other default precisions are preceded by their precision statements
+    MinifyingEmitter(stream, minified).emit_items(declarations + functions, minified)
+    return ''.join(lines) + stream.getvalue()
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v', '--vertex', action='store_true',
+            help='Specify this shader is a vertex shader')
+    parser.add_argument('-k', '--keep-names', action='store_true',
+            help='Only strip the layout, keep the identifiers')
+    parser.add_argument('input_shader')
+
+    args = parser.parse_args()
+
+    with open(args.input_shader) as f:
+        source = f.read()
+    sp = ShaderParser()
+    sp.parse(source, fragment_shader=not args.vertex)
+    minified = minify(sp, not args.vertex, rename=not args.keep_names)
+    print(minified)
+    logger.info('%d bytes, %d minified' % (len(source), len(minified)))
@@ -1,10 +1,10 @@
 import logging
 logger = logging.getLogger(__name__)
 
-import collections
+import collections, sys
 from ply import yacc
 
-import ShaderLexer, ShaderUtility
+import ShaderLexer, ShaderUtility, ShaderVisitor, Instrumentation
 
 # categories of variable types
 def is_floating_point_type(type):
@@ -29,13 +29,49 @@ def is_sampler_type(type):
         'isampler2D', 'isampler2DArray', 'isampler3D', 'isamplerCube',
         'usampler2D', 'usampler2DArray', 'usampler3D', 'usamplerCube')
 
-class PrecisionStatement(object):
+def skip_function_bodies(tokens):
+    """ Returns the global tokens of a translation unit, where every function
+        body is left empty, its braces only being kept
+    """
+    global_tokens = []
+    depth = 0
+    for token in tokens:
+        if depth == 0:
+            global_tokens.append(token)
+            # only function bodies open a brace at global scope
+            if token.type == 'LBRACE' and len(global_tokens) > 1 and global_tokens[-2].type == 'RPAREN':
+                depth = 1
+        elif token.type == 'LBRACE':
+            depth += 1
+        elif token.type == 'RBRACE':
+            depth -= 1
+            if depth == 0:
+                global_tokens.append(token)
+    return global_tokens
+
+class Node(object):
+    """ Base of the AST nodes, _fields lists the attributes holding the
+        children of the node in source order, see ShaderVisitor
+    """
+
+    __slots__ = ()
+    _fields = ()
+
+    def __repr__(self):
+        return ShaderVisitor.to_source(self)
+
+class PrecisionStatement(Node):
+
+    __slots__ = ('precision_qualifier', 'type_specifier')
 
     def __init__(self, precision_qualifier, type_specifier):
         self.precision_qualifier = precision_qualifier
         self.type_specifier = type_specifier
 
-class VariableDeclaration(object):
+class VariableDeclaration(Node):
+
+    __slots__ = ('name', 'type_specifier', 'type_qualifier', 'layout_qualifier', 'precision_qualifier', 'initializer', 'array_sizes')
+    _fields = ('array_sizes', 'initializer')
 
     def __init__(self, name, type_specifier=None, type_qualifier=None, layout_qualifier=None, precision_qualifier=None):
         self.name = name
@@ -44,18 +80,8 @@ class VariableDeclaration(object):
         self.layout_qualifier = layout_qualifier
         self.precision_qualifier = precision_qualifier
         self.initializer = None
-
-    def __repr__(self):
-        tokens = []
-        if self.type_qualifier: tokens.append(self.type_qualifier)
-        if self.layout_qualifier: tokens.append(self.layout_qualifier)
-        if self.precision_qualifier: tokens.append(self.precision_qualifier)
-        if self.type_specifier: tokens.append(self.type_specifier)
-        tokens.append(self.name)
-        if self.initializer:
-            tokens.append('=')
-            tokens.append(str(self.initializer))
-        return ' '.join(tokens)
+        # size expression of each array dimension
+        self.array_sizes = []
 
     def is_input_variable(self, fragment_shader):
         if not self.layout_qualifier:
@@ -73,33 +99,62 @@ class VariableDeclaration(object):
         else:
             return self.layout_qualifier in ('varying', 'out')
 
-class ParameterDeclaration(object):
+class ParameterDeclaration(Node):
+
+    __slots__ = ('type', 'name', 'parameter_qualifier')
 
     def __init__(self, type, name=None, parameter_qualifier='in'):
         self.type = type
         self.name = name
         self.parameter_qualifier = parameter_qualifier
 
-    def __repr__(self):
-        tokens = [self.parameter_qualifier, self.type]
-        if self.name: tokens.append(self.name)
-        return ' '.join(tokens)
+class FunctionPrototype(Node):
 
-class FunctionPrototype(object):
+    __slots__ = ('name', 'return_type', 'parameters')
+    _fields = ('parameters', )
 
     def __init__(self, name, return_type, parameters=[]):
         self.name = name
         self.return_type = return_type
         self.parameters = parameters
 
-    def __repr__(self):
-        return '%s %s(%s)' % (self.return_type, self.name, ', '.join(map(lambda k:str(k), self.parameters)))
+class FunctionDefinition(Node):
+    """ With ShaderParser.parse(lazy=True), only the span of the body in the
+        source is kept, it is parsed on the first access to compound_statements
+    """
 
-class FunctionDefinition(object):
+    __slots__ = ('function_prototype', '_compound_statements', '_body')
+    _fields = ('function_prototype', 'compound_statements')
 
     def __init__(self, function_prototype, compound_statements):
         self.function_prototype = function_prototype
-        self.compound_statements = compound_statements
+        self._compound_statements = compound_statements
+        self._body = None
+
+    def set_body_span(self, parser, text, start, end, lineno):
+        self._compound_statements = None
+        self._body = (parser, text, start, end, lineno)
+
+    @property
+    def is_parsed(self):
+        return self._body is None
+
+    @property
+    def compound_statements(self):
+        if self._body is not None:
+            parser, text, start, end, lineno = self._body
+            self._compound_statements = parser.parse_function_body(text[start:end], lineno)
+            self._body = None
+        return self._compound_statements
+
+    @compound_statements.setter
+    def compound_statements(self, value):
+        self._compound_statements = value
+        self._body = None
+
+    def __reduce__(self):
+        # the body is parsed rather than pickling the parser
+        return (FunctionDefinition, (self.function_prototype, self.compound_statements))
 
     @property
     def name(self):
@@ -113,74 +168,88 @@ class FunctionDefinition(object):
     def parameters(self):
         return self.function_prototype.parameters
 
-    def __repr__(self):
-        return '\n'.join([str(self.function_prototype), str(self.compound_statements)])
+class FunctionCall(Node):
 
-class FunctionCall(object):
+    __slots__ = ('name', 'arguments')
+    _fields = ('name', 'arguments')
 
     def __init__(self, name, arguments):
         self.name = name
         self.arguments = arguments
 
-    def __repr__(self):
-        return '%s(%s)' % (self.name, ', '.join(map(lambda a:str(a), self.arguments)))
+class IndexExpression(Node):
 
-class BinaryExpression(object):
+    __slots__ = ('base', 'index')
+    _fields = ('base', 'index')
+
+    def __init__(self, base, index):
+        self.base = base
+        self.index = index
+
+class FieldSelection(Node):
+
+    __slots__ = ('base', 'field')
+    _fields = ('base', )
+
+    def __init__(self, base, field):
+        self.base = base
+        self.field = field
+
+class UnaryExpression(Node):
+
+    __slots__ = ('op', 'operand')
+    _fields = ('operand', )
+
+    def __init__(self, op, operand):
+        self.op = op
+        self.operand = operand
+
+class BinaryExpression(Node):
+
+    __slots__ = ('op', 'left', 'right')
+    _fields = ('left', 'right')
 
     def __init__(self, op, left, right):
         self.op = op
         self.left = left
         self.right = right
 
-    def __repr__(self):
-        tokens = ['(%s)' % str(self.left) if isinstance(self.left, BinaryExpression) else str(self.left)]
-        tokens.append(str(self.op))
-        tokens.append('(%s)' % str(self.right) if isinstance(self.right, BinaryExpression) else str(self.right))
-        return ' '.join(tokens)
+class AssignmentExpression(Node):
 
-class AssignmentExpression(object):
+    __slots__ = ('op', 'left', 'right')
+    _fields = ('left', 'right')
 
     def __init__(self, op, left, right):
         self.op = op
         self.left = left
         self.right = right
 
-    def __repr__(self):
-        str = '%s %s %s;' % (self.left, self.op, self.right)
-        return str
+class IfStatement(Node):
 
-class IfStatement(object):
+    __slots__ = ('condition', 'if_true', 'if_false')
+    _fields = ('condition', 'if_true', 'if_false')
 
     def __init__(self, condition, if_true, if_false=None):
         self.condition = condition
         self.if_true = if_true
         self.if_false = if_false
 
-    def __repr__(self):
-        lines = ['if (%s)' % str(self.condition)]
-        lines += str(self.if_true).splitlines()
-        if self.if_false:
-            lines += ['else']
-            lines += str(self.if_false).splitlines()
-        return '\n'.join(lines)
+class DiscardStatement(Node):
 
-class DiscardStatement(object):
+    __slots__ = ()
 
-    def __repr__(self):
-        return 'discard;'
+class ReturnStatement(Node):
 
-class ReturnStatement(object):
+    __slots__ = ('return_value', )
+    _fields = ('return_value', )
 
     def __init__(self, return_value=None):
         self.return_value = return_value
 
-    def __repr__(self):
-        if self.return_value:
-            return 'return %s;' % str(self.return_value)
-        else:
-            return 'return;'
+class CompoundStatement(Node):
 
-class CompoundStatement(object):
+    __slots__ = ('block_items', )
+    _fields = ('block_items', )
 
     def __init__(self, block_items):
         self.block_items = []
@@ -196,22 +265,68 @@ class CompoundStatement(object):
     def __len__(self):
         return len(self.block_items)
 
-    def __repr__(self):
-        lines = []
-        lines.append('{')
-        for item in self.block_items:
-            if isinstance(item, VariableDeclaration):
-                lines += ['    %s;' % str(item)]
-            else:
-                lines += map(lambda l : ' '*4+l, str(item).splitlines())
-        lines.append('}')
-        return '\n'.join(lines)
+class NodeInterner(object):
+    """ Shares structurally identical expression subtrees, e.g. repeated
+        texture2D(u_tex, v_uv) calls, between all the shaders parsed by the
+        parsers using this interner. Interned nodes are shared, so they must
+        not be modified in place.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+        self.hits = 0
+        self.saved_bytes = 0
+
+    @staticmethod
+    def _key(value):
+        if isinstance(value, str):
+            return value
+        if isinstance(value, list):
+            return tuple(map(NodeInterner._key, value))
+        # children are built, hence interned, before their parents
+        return id(value)
+
+    def intern(self, node):
+        key = (type(node), ) + tuple(self._key(getattr(node, slot)) for slot in node.__slots__)
+        interned = self.nodes.get(key)
+        if interned is None:
+            self.nodes[key] = node
+            for slot in node.__slots__:
+                value = getattr(node, slot)
+                if isinstance(value, str):
+                    setattr(node, slot, sys.intern(value))
+            return node
+
+        self.hits += 1
+        self.saved_bytes += sys.getsizeof(node)
+        if isinstance(node, FunctionCall):
+            self.saved_bytes += sys.getsizeof(node.arguments)
+        return interned
+
+    def report(self):
+        return {
+            'nodes' : len(self.nodes),
+            'hits' : self.hits,
+            'saved_bytes' : self.saved_bytes,
+        }
 
 class ShaderParser(object):
 
-    def __init__(self, debug=False):
-        self.lexer = ShaderLexer.ShaderLexer()
+    # bumped whenever the AST or the parse results change, invalidates ShaderCache entries
+    VERSION = 4
+
+    # attributes holding the results of parse(), saved by ShaderCache and pickle
+    RESULT_ATTRIBUTES = ('version', 'variable_declarations',
+        'input_variables', 'output_variables', 'uniform_variables',
+        'default_precision_qualifier', 'function_definitions', 'function_precision_qualifiers')
+
+    def __init__(self, debug=False, interner=None, lexer_class=ShaderLexer.ShaderLexer):
+        """ lexer_class is ShaderLexer.ShaderLexer or the faster ShaderLexer.FastShaderLexer
+        """
+        self.lexer = lexer_class()
+        self.interner = interner
         self.tokens = self.lexer.tokens
+        self.debug = debug
 
         rules_with_opt = [ 'block_item_list',
             'parameter_declaration_list',
@@ -219,9 +334,8 @@ class ShaderParser(object):
         for rule in rules_with_opt:
             self._create_opt_rule(rule)
 
-        self.parser = yacc.yacc(module=self,
-            start='translation_unit_or_empty',
-            debug=debug)
+        # the yacc tables are loaded on the first parse, see build_parser()
+        self.parser = None
 
         self.version = 100
         self.variable_declarations = collections.OrderedDict()
@@ -232,10 +346,33 @@ class ShaderParser(object):
         self.default_precision_qualifier = {}
 
         self.function_definitions = collections.OrderedDict()
+        # default precision qualifiers in scope at each function definition,
+        # the precision statements may change them between the functions
+        self.function_precision_qualifiers = {}
+
+    def build_parser(self):
+        if self.parser is None:
+            self.parser = yacc.yacc(module=self,
+                start='translation_unit_or_empty',
+                debug=self.debug)
+        return self.parser
+
+    def __getstate__(self):
+        return dict((attr, getattr(self, attr)) for attr in self.RESULT_ATTRIBUTES)
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.load_state(state)
+
+    def load_state(self, state):
+        """ Adds the results of a previous parse, as returned by __getstate__
+        """
+        self.version = state['version']
+        for attr in self.RESULT_ATTRIBUTES[1:]:
+            getattr(self, attr).update(state[attr])
 
     def to_str(self):
-        return '\n'.join(map(lambda var : str(var) + ';', self.variable_declarations.values()) +
-            map(lambda d : str(d), self.function_definitions.values()))
+        return ShaderVisitor.shader_to_source(self)
 
     def _create_opt_rule(self, rulename):
         """ Given a rule name, creates an optional ply.yacc rule
@@ -251,8 +388,19 @@ class ShaderParser(object):
         optrule.__name__ = 'p_%s' % optname
         setattr(self.__class__, optrule.__name__, optrule)
 
+    def intern(self, node):
+        return self.interner.intern(node) if self.interner else node
+
+    # the binary operators of GLSL ES, from the lowest precedence
     precedence = (
         ('right', 'EQUALS'),
+        ('left', 'LOR'),
+        ('left', 'LAND'),
+        ('left', 'OR'),
+        ('left', 'XOR'),
+        ('left', 'AND'),
+        ('left', 'EQ', 'NE'),
+        ('left', 'LT', 'GT', 'LE', 'GE'),
         ('left', 'PLUS', 'MINUS'),
         ('left', 'TIMES', 'DIVIDE'),
     )
@@ -271,7 +419,11 @@ class ShaderParser(object):
         ''' argument_expression_list : assignment_expression
                                      | argument_expression_list COMMA assignment_expression
         '''
-        p[0] = [p[1]] if len(p) == 2 else (p[1] + [p[3]])
+        if len(p) == 2:
+            p[0] = [p[1]]
+        else:
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_postfix_expression1(self, p):
         ''' postfix_expression : primary_expression
@@ -281,20 +433,17 @@ class ShaderParser(object):
     def p_postfix_expression2(self, p):
         ''' postfix_expression : primary_expression LBRACKET expression RBRACKET
         '''
-        p[0] = '%s[%s]' % (p[1], p[3])
+        p[0] = self.intern(IndexExpression(base=p[1], index=p[3]))
 
     def p_postfix_expression3(self, p):
         ''' postfix_expression : postfix_expression DOT IDENTIFIER
         '''
-        if isinstance(p[1], BinaryExpression):
-            p[0] = '(%s).%s' % (str(p[1]), p[3])
-        else:
-            p[0] = '.'.join([str(p[1]), p[3]])
+        p[0] = self.intern(FieldSelection(base=p[1], field=p[3]))
 
     def p_postfix_expression4(self, p):
         ''' postfix_expression : postfix_expression LPAREN argument_expression_list RPAREN
         '''
-        p[0] = FunctionCall(name=p[1], arguments=p[3])
+        p[0] = self.intern(FunctionCall(name=p[1], arguments=p[3]))
 
     def p_unary_expression1(self, p):
         ''' unary_expression : postfix_expression
@@ -304,7 +453,7 @@ class ShaderParser(object):
     def p_unary_expression2(self, p):
         ''' unary_expression : unary_operator unary_expression
         '''
-        p[0] = p[1] + p[2]
+        p[0] = self.intern(UnaryExpression(op=p[1], operand=p[2]))
 
     def p_unary_operator(self, p):
         ''' unary_operator : AND
@@ -334,13 +483,13 @@ class ShaderParser(object):
                               | binary_expression LOR binary_expression
                               | binary_expression LAND binary_expression
         '''
-        p[0] = p[1] if len(p) == 2 else BinaryExpression(p[2], p[1], p[3])
+        p[0] = p[1] if len(p) == 2 else self.intern(BinaryExpression(p[2], p[1], p[3]))
 
     def p_assignment_expression(self, p):
         ''' assignment_expression : binary_expression
                                   | unary_expression assignment_operator assignment_expression
         '''
-        p[0] = p[1] if len(p) == 2 else AssignmentExpression(p[2], p[1], p[3])
+        p[0] = p[1] if len(p) == 2 else self.intern(AssignmentExpression(p[2], p[1], p[3]))
 
     def p_expression(self, p):
         ''' expression : assignment_expression
@@ -397,7 +546,8 @@ class ShaderParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_compound_statement(self, p):
         ''' compound_statement : LBRACE block_item_list_opt RBRACE
@@ -427,7 +577,9 @@ class ShaderParser(object):
         if len(p) == 2:
             p[0] = [p[1]] if p[1] else []
         else:
-            p[0] = p[1] + [p[3]] if p[3] else p[1]
+            if p[3]:
+                p[1].append(p[3])
+            p[0] = p[1]
 
     def p_function_prototype(self, p):
         ''' function_prototype : type_specifier IDENTIFIER LPAREN parameter_declaration_list_opt RPAREN
@@ -452,7 +604,8 @@ class ShaderParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[2])
+            p[0] = p[1]
 
     def p_translation_unit_or_empty(self, p):
         ''' translation_unit_or_empty : translation_unit
@@ -514,6 +667,14 @@ class ShaderParser(object):
             dec.type_specifier = p[3]
         p[0] = p[4]
 
+    def p_declaration_body7(self, p):
+        ''' declaration_body : precision_qualifier type_specifier init_declarator_list
+        '''
+        for dec in p[3]:
+            dec.precision_qualifier = p[1]
+            dec.type_specifier = p[2]
+        p[0] = p[3]
+
     def p_type_qualifier(self, p):
         ''' type_qualifier : CONST
         '''
@@ -526,7 +687,8 @@ class ShaderParser(object):
         if len(p) == 2:
             p[0] = [p[1]]
         else:
-            p[0] = p[1] + [p[2]]
+            p[1].append(p[3])
+            p[0] = p[1]
 
     def p_init_declarator(self, p):
         ''' init_declarator : declarator
@@ -554,7 +716,7 @@ class ShaderParser(object):
     def p_direct_declarator2(self, p):
         ''' direct_declarator : direct_declarator LBRACKET assignment_expression RBRACKET
         '''
-        p[1].name += '[%s]' % p[3]
+        p[1].array_sizes.append(p[3])
         p[0] = p[1]
 
     def p_layout_qualifier(self, p):
@@ -648,29 +810,95 @@ class ShaderParser(object):
         p[0] = []
 
     def p_error(self, p):
+        if p is None:
+            # nothing is left to recover from
+            raise SyntaxError('Parser error in %s : unexpected end of input' % (self.lexer.filename or 'shader'))
         logger.error('Parser error in line #%d before token %s' % (p.lineno, p.value))
 
-    def parse(self, text, fragment_shader=True, filename='', debug=False):
+    def parse(self, text, fragment_shader=True, filename='', debug=False, interface_only=False, lazy=False, cache=None):
+        """ Parses the shader source, with interface_only only the global
+            declarations are parsed: the function bodies are skipped and
+            function_definitions is left empty. With lazy, the function
+            bodies are only parsed when their compound_statements are first
+            accessed, so their syntax errors are reported then. With a
+            ShaderCache, the results of an unchanged source are loaded
+            instead of parsed.
+        """
+        if cache is not None:
+            key = cache.key(text, fragment_shader, self.VERSION, interface_only)
+            with Instrumentation.phase('ShaderParser.cache-load'):
+                state = cache.load(key)
+            if state is not None:
+                self.load_state(state)
+                return
+
+        logger.debug('Input before pre-processor : "%s"' % (text))
+
+        with Instrumentation.phase('ShaderParser.preprocess'):
+            preprocessed_text, version = ShaderUtility.FastPreprocess(text)
+
+        self.parse_preprocessed(preprocessed_text, version, fragment_shader, filename, debug, interface_only, lazy)
+
+        if cache is not None:
+            with Instrumentation.phase('ShaderParser.cache-store'):
+                cache.store(key, self.__getstate__())
+
+    def parse_preprocessed(self, text, version, fragment_shader=True, filename='', debug=False, interface_only=False, lazy=False):
+        """ Same as parse, for a source already preprocessed by ShaderUtility, of the given version
+        """
         self.lexer.filename = filename
         self.lexer.build()
         self.lexer.reset_lineno()
 
         self.initialize_default_precision_qualifiers(fragment_shader)
-
-        logger.debug('Input before pre-processor : "%s"' % (text))
-
-        text, self.version = ShaderUtility.Preprocess(text)
+        self.version = version
 
         logger.debug('Input after pre-processor : "%s"' % (text))
 
-        external_declarations = self.parser.parse(input=text,
-            lexer=self.lexer,
-            debug=1 if debug else 0)
+        lexer = self.lexer
+        if interface_only or lazy:
+            source = text
+            global_tokens = skip_function_bodies(self.lexer.tokenize(text))
+            lexer, text = ShaderLexer.TokenStream(global_tokens), None
+
+        # tokens are pulled by the parser, so the lexing time is nested in this phase
+        with Instrumentation.phase('ShaderParser.parse'):
+            external_declarations = self.build_parser().parse(input=text,
+                lexer=lexer,
+                debug=1 if debug else 0)
+
+        with Instrumentation.phase('ShaderParser.post-processing'):
+            if interface_only:
+                external_declarations = [decal for decal in external_declarations if not isinstance(decal, FunctionDefinition)]
+            elif lazy:
+                # the braces left at global scope delimit the function bodies, in order
+                lbraces = [token for token in global_tokens if token.type == 'LBRACE']
+                rbraces = [token for token in global_tokens if token.type == 'RBRACE']
+                definitions = [decal for decal in external_declarations if isinstance(decal, FunctionDefinition)]
+                for definition, lbrace, rbrace in zip(definitions, lbraces, rbraces):
+                    definition.set_body_span(self, source, lbrace.lexpos + 1, rbrace.lexpos, lbrace.lineno)
+            self.process_external_declarations(external_declarations, fragment_shader)
+
+    def parse_function_body(self, text, lineno):
+        """ Parses the source of a function body, without its braces and
+            starting at line lineno, into a CompoundStatement
+        """
+        self.lexer.reset_lineno(lineno)
+        with Instrumentation.phase('ShaderParser.parse-body'):
+            # wrapped on the first line, so the line numbers stay right
+            external_declarations = self.build_parser().parse(input='void __body__() {' + text + '}',
+                lexer=self.lexer)
+        if not external_declarations:
+            return CompoundStatement([])
+        return external_declarations[0].compound_statements
+
+    def process_external_declarations(self, external_declarations, fragment_shader):
         for decal in external_declarations:
             if isinstance(decal, PrecisionStatement):
                 self.set_default_precision_qualifier(decal.type_specifier, decal.precision_qualifier)
             elif isinstance(decal, FunctionDefinition):
                 self.function_definitions[decal.name] = decal
+                self.function_precision_qualifiers[decal.name] = dict(self.default_precision_qualifier)
             elif isinstance(decal, list): # variable declaration come as a list
                 for var in decal:
                     if isinstance(var, VariableDeclaration):
@@ -727,11 +955,17 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('-v', '--vertex', action='store_true',
             help='Specify this shader is a vertex shader')
+    parser.add_argument('-p', '--profile', action='store_true',
+            help='Report where the parsing time goes')
     parser.add_argument('input_shader')
 
     args = parser.parse_args()
 
     with open(args.input_shader) as f:
         sp = ShaderParser()
+        if args.profile:
+            Instrumentation.enable()
         sp.parse(f.read(), fragment_shader=not args.vertex)
-        print sp.to_str()
+        print(sp.to_str())
+        if args.profile:
+            print(Instrumentation.disable().format_report())
@@ -0,0 +1,110 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import collections, itertools, multiprocessing, re
+import pandas
+
+import ShaderUtility
+from ShaderParser import ShaderParser
+
+# Expansion of an uber-shader under every combination of a macro matrix,
+# e.g. {'LIGHTING' : [None, 1], 'QUALITY' : [0, 1, 2]} where None leaves
+# the macro undefined. A permutation is identified by its macro set : the
+# (name, value) pairs of its defined macros, sorted by name.
+
+def macro_sets(macros):
+    names = sorted(macros)
+    for values in itertools.product(*[macros[name] for name in names]):
+        yield tuple((name, value) for name, value in zip(names, values) if value is not None)
+
+def define_macros(source, macro_set):
+    """ Returns source with the macros of macro_set defined after its version
+        line, the following lines keeping their line numbers
+    """
+    if not macro_set:
+        return source
+    lines = source.splitlines()
+    header = 1 if lines and re.match(ShaderUtility.version_declaration_pattern, lines[0]) else 0
+    defines = ['#define %s %s' % (name, value) for name, value in macro_set]
+    return '\n'.join(lines[:header] + defines + ['#line %d' % (header + 1)] + lines[header:])
+
+def _parse(args):
+    text, version, fragment_shader, interface_only = args
+    parser = ShaderParser()
+    parser.parse_preprocessed(text, version, fragment_shader, interface_only=interface_only)
+    return parser
+
+def expand(source, macros, fragment_shader=True, interface_only=False, processes=None, chunk_size=64):
+    """ Preprocesses and parses source under every macro set of macros,
+        returns {macro set : ShaderParser}. Permutations preprocessed to the
+        same text are parsed once and share their ShaderParser. Both steps
+        are spread over processes worker processes, all the cores by
+        default, the preprocessing by chunks of chunk_size shaders.
+    """
+    keys = list(macro_sets(macros))
+    texts = [define_macros(source, key) for key in keys]
+    chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+
+    pool = multiprocessing.Pool(processes) if processes != 1 and len(keys) > 1 else None
+    run = pool.map if pool else lambda function, items : list(map(function, items))
+    try:
+        preprocessed = [result for chunk in run(ShaderUtility.PreprocessBatch, chunks) for result in chunk]
+
+        # permutations by preprocessed (text, version)
+        variants = collections.OrderedDict()
+        for key, result in zip(keys, preprocessed):
+            variants.setdefault(result, []).append(key)
+        logger.info('%d permutations, %d distinct' % (len(keys), len(variants)))
+
+        parsers = run(_parse, [(text, version, fragment_shader, interface_only) for text, version in variants])
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    results = {}
+    for parser, variant_keys in zip(parsers, variants.values()):
+        for key in variant_keys:
+            results[key] = parser
+    return collections.OrderedDict((key, results[key]) for key in keys)
+
+def table(results):
+    """ Returns a DataFrame of expand() results, one row per permutation with
+        the value of each macro (missing when undefined), the index of its
+        distinct variant and the size of its interface
+    """
+    names = sorted(set(name for key in results for name, value in key))
+    variants = {}
+    rows = []
+    for key, parser in results.items():
+        values = dict(key)
+        variant = variants.setdefault(id(parser), len(variants))
+        rows.append([values.get(name) for name in names] + [variant,
+            len(parser.uniform_variables), len(parser.input_variables),
+            len(parser.output_variables), len(parser.function_definitions)])
+    return pandas.DataFrame(rows, columns=names + ['variant', 'uniforms', 'inputs', 'outputs', 'functions'])
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v', '--vertex', action='store_true',
+            help='Specify this shader is a vertex shader')
+    parser.add_argument('-D', '--define', action='append', default=[],
+            help='Macro values as NAME=VALUE,VALUE... , an empty value leaves it undefined')
+    parser.add_argument('-j', '--processes', type=int,
+            help='Number of worker processes, all the cores by default')
+    parser.add_argument('input_shader')
+
+    args = parser.parse_args()
+
+    macros = {}
+    for define in args.define:
+        name, values = define.split('=', 1)
+        macros[name] = [value or None for value in values.split(',')]
+
+    with open(args.input_shader) as f:
+        results = expand(f.read(), macros, fragment_shader=not args.vertex, processes=args.processes)
+    print(table(results).to_string())
@@ -0,0 +1,387 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import math
+
+import ShaderVisitor
+from ShaderParser import is_floating_point_type, is_integer_type
+from ShaderCost import texture_function_pattern
+
+# Precision audit of fragment shaders : finds the highp float variables whose
+# values do not need it, and rewrites them as mediump.
+#
+# The magnitude of every value is bounded by an abstract evaluation of the
+# functions : a variable is bounded by the largest value ever assigned to it,
+# computed from the literals and the built-in functions with a known range,
+# e.g. the normalized texture fetches, clamp, normalize, sin or fract. The
+# shader inputs and the uniforms are unbounded. Local variables also keep
+# their current bound, replaced by the assignments outside of branches. As the language has no loops
+# here, the evaluation is repeated until the bounds are stable, the bounds
+# still growing after MAX_PASSES being unbounded.
+#
+# A highp variable is reported when
+#   range    : its bound is at most MEDIUMP_RANGE, e.g. a color
+#   texcoord : it is a shader input only used as the coordinates of texture
+#              fetches, e.g. normalized texture coordinates
+
+# largest magnitude lowered to mediump, whose precision is still 1/256 there
+MEDIUMP_RANGE = 4.0
+MAX_PASSES = 8
+
+UNBOUNDED = float('inf')
+
+# qualifiers of the global variables set outside of the shader
+INPUT_QUALIFIERS = ('uniform', 'varying', 'in')
+
+BUILTIN_BOUNDS = {
+    'gl_FragCoord' : UNBOUNDED, 'gl_PointCoord' : 1.0, 'gl_FrontFacing' : 1.0,
+}
+
+# built-in functions whose result is bounded whatever their arguments
+BOUNDED_FUNCTIONS = {
+    'sin' : 1.0, 'cos' : 1.0, 'normalize' : 1.0, 'fract' : 1.0, 'step' : 1.0,
+    'smoothstep' : 1.0, 'sign' : 1.0, 'asin' : math.pi / 2, 'acos' : math.pi, 'atan' : math.pi,
+}
+
+# bound of the result of built-in functions from the bounds of their arguments
+def _mix(x, y, a=1.0):
+    return max(x, y) if a <= 1.0 else x + a * (x + y)
+
+BOUND_FUNCTIONS = {
+    'abs' : lambda x : x,
+    'floor' : lambda x : x + 1.0,
+    'ceil' : lambda x : x + 1.0,
+    'min' : max,
+    'max' : max,
+    'clamp' : lambda x, low, high : max(low, high),
+    'mix' : _mix,
+    'sqrt' : math.sqrt,
+    'dot' : lambda x, y : 4.0 * x * y,
+    'length' : lambda x : 2.0 * x,
+    'distance' : lambda x, y : 2.0 * (x + y),
+    'cross' : lambda x, y : 2.0 * x * y,
+    'reflect' : lambda i, n : i * (1.0 + 8.0 * n * n),
+    'mod' : lambda x, y : y,
+}
+
+def multiply(x, y):
+    # an unbounded value times zero is zero
+    return 0.0 if x == 0.0 or y == 0.0 else x * y
+
+def literal_bound(text):
+    if text in ('true', 'false'):
+        return 1.0
+    try:
+        return abs(float(text.rstrip('fFlLuU')))
+    except ValueError:
+        return None
+
+def root_name(node):
+    """ Returns the variable written by an assignment to node, None if unknown
+    """
+    while type(node).__name__ in ('FieldSelection', 'IndexExpression'):
+        node = node.base
+    return node if type(node) is str else None
+
+class BoundAnalysis(ShaderVisitor.NodeVisitor):
+    """ One pass of the abstract evaluation of a function, raising the bounds
+        of its declarations, in bounds = {declaration : bound}, and of its
+        return value, at bounds[('return', function name)]
+    """
+
+    def __init__(self, parser, bounds, globals):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.user_functions = parser.function_definitions
+        self.bounds = bounds
+        self.scopes = [globals]
+        self.function = None
+        # current bounds of the local variables of the function
+        self.current = {}
+        # bounds of the expressions visited, those of the children of a node being on top
+        self.values = []
+        self.marks = []
+        # shader inputs used as texture coordinates, and used otherwise
+        self.texcoords = set()
+        self.other_uses = set()
+
+    def declaration(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    def bound(self, key):
+        return self.bounds.get(key, 0.0)
+
+    def raise_bound(self, key, value):
+        if value > self.bound(key):
+            self.bounds[key] = value
+
+    def pre_any(self, node):
+        self.marks.append(len(self.values))
+        name = type(node).__name__
+        if name == 'FunctionDefinition':
+            self.function = node.name
+            self.current = {}
+        if name in ('FunctionDefinition', 'CompoundStatement'):
+            self.scopes.append({})
+
+    def pre_str(self, name):
+        declaration = self.declaration(name)
+        if declaration is not None:
+            self.values.append(self.current.get(declaration, self.bound(declaration)))
+            if self.is_texture_coordinate(name):
+                self.texcoords.add(declaration)
+            else:
+                self.other_uses.add(declaration)
+            return
+        value = literal_bound(name)
+        self.values.append(BUILTIN_BOUNDS.get(name, UNBOUNDED) if value is None else value)
+
+    def post_str(self, name):
+        pass
+
+    def is_texture_coordinate(self, name):
+        # the second argument of a texture function, or a swizzle of it
+        child = name
+        for parent in reversed(self.path):
+            if type(parent).__name__ != 'FieldSelection':
+                break
+            child = parent
+        else:
+            return False
+        if type(parent).__name__ != 'FunctionCall' or not texture_function_pattern.match(parent.name):
+            return False
+        return len(parent.arguments) > 1 and (parent.arguments[1] is child or
+            (type(child) is str and parent.arguments[1] == child))
+
+    def post_any(self, node):
+        mark = self.marks.pop()
+        children = self.values[mark:]
+        del self.values[mark:]
+        name = type(node).__name__
+        if name in ('FunctionDefinition', 'CompoundStatement'):
+            self.scopes.pop()
+        analyze = getattr(self, 'analyze_' + name, None)
+        if analyze:
+            result = analyze(node, children)
+            if result is not None:
+                self.values.append(result)
+
+    # declarations and statements
+
+    def analyze_VariableDeclaration(self, node, children):
+        self.scopes[-1][node.name] = node
+        value = children[-1] if node.initializer is not None else 0.0
+        self.raise_bound(node, value)
+        if self.function:
+            self.current[node] = value
+
+    def analyze_ParameterDeclaration(self, node, children):
+        if node.name:
+            self.scopes[-1][node.name] = node
+
+    def analyze_ReturnStatement(self, node, children):
+        if children:
+            self.raise_bound(('return', self.function), children[0])
+
+    # expressions
+
+    def analyze_FieldSelection(self, node, children):
+        return children[0]
+
+    def analyze_IndexExpression(self, node, children):
+        return children[0]
+
+    def analyze_UnaryExpression(self, node, children):
+        return 1.0 if node.op == '!' else children[0]
+
+    def analyze_BinaryExpression(self, node, children):
+        left, right = children
+        if node.op in ('+', '-'):
+            return left + right
+        if node.op == '*':
+            return multiply(left, right)
+        if node.op == '/':
+            divisor = literal_bound(node.right) if type(node.right) is str else None
+            return left / divisor if divisor else UNBOUNDED
+        return 1.0
+
+    def analyze_AssignmentExpression(self, node, children):
+        left, right = children
+        if node.op in ('=', ):
+            value = right
+        elif node.op in ('+=', '-='):
+            value = left + right
+        elif node.op == '*=':
+            value = multiply(left, right)
+        else:
+            value = UNBOUNDED
+        name = root_name(node.left)
+        strong = node.left is name and not any(type(parent).__name__ == 'IfStatement' for parent in self.path)
+        self.write(name, value, strong)
+        return value
+
+    def write(self, name, value, strong):
+        """ Raises the bound of the variable written, replaces its current
+            bound with a strong update
+        """
+        declaration = self.declaration(name) if name else None
+        if declaration is not None:
+            self.raise_bound(declaration, value)
+            if declaration in self.current:
+                self.current[declaration] = value if strong else max(self.current[declaration], value)
+
+    def analyze_FunctionCall(self, node, children):
+        name = node.name
+        arguments = children[1:]
+        if name in self.user_functions:
+            parameters = self.user_functions[name].parameters
+            for parameter, argument in zip(parameters, arguments):
+                self.raise_bound(parameter, argument)
+            # the arguments of the out parameters are written by the call
+            for parameter, argument in zip(parameters, node.arguments):
+                if parameter.parameter_qualifier in ('out', 'inout'):
+                    self.write(root_name(argument), self.bound(parameter), False)
+            return self.bound(('return', name))
+        if is_floating_point_type(name) or name in ('int', 'bool', 'ivec2', 'ivec3', 'ivec4', 'bvec2', 'bvec3', 'bvec4'):
+            return max(arguments) if arguments else 0.0
+        if texture_function_pattern.match(name):
+            # normalized texture formats
+            return 1.0
+        if name in BOUNDED_FUNCTIONS:
+            return BOUNDED_FUNCTIONS[name]
+        if name in BOUND_FUNCTIONS:
+            try:
+                return BOUND_FUNCTIONS[name](*arguments)
+            except (TypeError, OverflowError, ValueError):
+                return UNBOUNDED
+        return UNBOUNDED
+
+def value_bounds(parser):
+    """ Returns ({declaration or ('return', function name) : bound},
+        set of the shader inputs only used as texture coordinates)
+    """
+    globals = {}
+    bounds = {}
+    for var in parser.variable_declarations.values():
+        globals[var.name] = var
+        if var.layout_qualifier in INPUT_QUALIFIERS:
+            bounds[var] = UNBOUNDED
+
+    functions = list(parser.function_definitions.values())
+    stable = False
+    for index in range(MAX_PASSES):
+        previous = dict(bounds)
+        analysis = BoundAnalysis(parser, bounds, globals)
+        analysis.visit([var for var in parser.variable_declarations.values() if var.initializer is not None])
+        analysis.visit(functions)
+        if index == 0:
+            texcoords = analysis.texcoords - analysis.other_uses
+        if bounds == previous:
+            stable = True
+            break
+    if not stable:
+        # widen the bounds which did not converge
+        for key, value in bounds.items():
+            if previous.get(key) != value:
+                bounds[key] = UNBOUNDED
+    return bounds, texcoords
+
+def default_precision(precisions, type):
+    if is_integer_type(type):
+        type = 'int'
+    elif is_floating_point_type(type):
+        type = 'float'
+    return precisions.get(type)
+
+class DeclarationCollector(ShaderVisitor.NodeVisitor):
+    """ Collects the local declarations of functions with their precision,
+        the default one being the one in scope where they are declared
+    """
+
+    def __init__(self, parser):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.parser = parser
+        self.declarations = []
+        self.precisions = {}
+        self.scopes = []
+
+    def pre_FunctionDefinition(self, node):
+        self.scopes = [self.parser.function_precision_qualifiers.get(node.name, self.parser.default_precision_qualifier)]
+
+    def pre_CompoundStatement(self, node):
+        self.scopes.append(dict(self.scopes[-1]))
+
+    def post_CompoundStatement(self, node):
+        self.scopes.pop()
+
+    def pre_PrecisionStatement(self, node):
+        self.scopes[-1][node.type_specifier] = node.precision_qualifier
+
+    def pre_VariableDeclaration(self, node):
+        self.declarations.append((self.path[0].name if self.path else None, node))
+        self.precisions[node] = node.precision_qualifier or default_precision(self.scopes[-1], node.type_specifier)
+
+def audit(parser):
+    """ Returns the highp float variables of a parsed fragment shader which
+        can be mediump, as (function name or None, declaration, bound, reason)
+        where reason is 'range' or 'texcoord', see above
+    """
+    bounds, texcoords = value_bounds(parser)
+    collector = DeclarationCollector(parser)
+    collector.visit(list(parser.function_definitions.values()))
+    declarations = [(None, var) for var in parser.variable_declarations.values()] + collector.declarations
+
+    findings = []
+    for function, declaration in declarations:
+        if not is_floating_point_type(declaration.type_specifier) or declaration.layout_qualifier == 'uniform':
+            continue
+        # the parser gives the global declarations their precision
+        if collector.precisions.get(declaration, declaration.precision_qualifier) != 'highp':
+            continue
+        bound = bounds.get(declaration, 0.0)
+        if declaration in texcoords and declaration.layout_qualifier in INPUT_QUALIFIERS:
+            findings.append((function, declaration, bound, 'texcoord'))
+        elif bound <= MEDIUMP_RANGE:
+            findings.append((function, declaration, bound, 'range'))
+    return findings
+
+def lower_precision(parser, findings=None, precision='mediump'):
+    """ Returns the source of the shader with the variables of the audit
+        findings declared with precision, the AST is left untouched
+    """
+    if findings is None:
+        findings = audit(parser)
+    lines = [ShaderVisitor.shader_header(parser)]
+    original = [(declaration, declaration.precision_qualifier) for function, declaration, bound, reason in findings]
+    try:
+        for declaration, qualifier in original:
+            declaration.precision_qualifier = precision
+        lines.append(ShaderVisitor.shader_to_source(parser))
+    finally:
+        for declaration, qualifier in original:
+            declaration.precision_qualifier = qualifier
+    return '\n'.join(lines)
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    from ShaderParser import ShaderParser
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-r', '--rewrite', action='store_true',
+            help='Print the shader with the reported variables lowered to mediump')
+    parser.add_argument('input_shader', help='Fragment shader')
+
+    args = parser.parse_args()
+
+    with open(args.input_shader) as f:
+        sp = ShaderParser()
+        sp.parse(f.read())
+    findings = audit(sp)
+    for function, declaration, bound, reason in findings:
+        print('%-16s %-24s %-8s %s' % (function or '<global>', declaration.name, reason, bound))
+    if args.rewrite:
+        print(lower_precision(sp, findings))
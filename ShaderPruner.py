@@ -0,0 +1,268 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import collections, copy, io, re
+
+import ShaderVisitor
+from ShaderCost import components
+from ShaderParser import CompoundStatement, is_sampler_type
+from ShaderPrecision import root_name
+
+# Removal of the global variables and functions main never reaches, the
+# global declarations being reached through the identifiers of the reached
+# functions and of the initializers of the reached declarations.
+#
+# Across a program, the varyings the fragment shader does not read are dead
+# outputs of the vertex shader : their assignments are removed first, so the
+# uniforms and functions only computing them are removed as well.
+
+SAVING_FIELDS = ('uniforms', 'uniform_components', 'samplers', 'attributes',
+    'varyings', 'varying_components', 'functions')
+
+class Identifiers(ShaderVisitor.NodeVisitor):
+
+    def __init__(self):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.names = set()
+
+    def pre_str(self, name):
+        self.names.add(name)
+
+def identifiers(node):
+    visitor = Identifiers()
+    visitor.visit(node)
+    return visitor.names
+
+def reachable(function_definitions, variable_declarations, entry='main'):
+    """ Returns the names of the functions and of the global variables reached from entry
+    """
+    functions, variables = set(), set()
+    pending = [entry]
+    while pending:
+        name = pending.pop()
+        if name in function_definitions and name not in functions:
+            functions.add(name)
+            pending += identifiers(function_definitions[name])
+        elif name in variable_declarations and name not in variables:
+            variables.add(name)
+            pending += identifiers(variable_declarations[name])
+    return functions, variables
+
+class Assignments(ShaderVisitor.NodeVisitor):
+
+    def __init__(self):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.names = set()
+
+    def pre_AssignmentExpression(self, node):
+        self.names.add(root_name(node.left))
+
+class Reads(ShaderVisitor.NodeVisitor):
+
+    def __init__(self):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.uses = collections.Counter()
+        self.writes = collections.Counter()
+
+    def pre_str(self, name):
+        self.uses[name] += 1
+
+    def pre_AssignmentExpression(self, node):
+        if node.op == '=':
+            self.writes[root_name(node.left)] += 1
+
+def read_variables(function_definitions):
+    """ Returns the names the functions read, i.e. use other than as the
+        variable written by an = assignment
+    """
+    visitor = Reads()
+    visitor.visit(list(function_definitions.values()))
+    return set(name for name, count in visitor.uses.items() if count > visitor.writes[name])
+
+def side_effect_functions(function_definitions, variable_declarations):
+    """ Returns the names of the functions assigning global variables or
+        out parameters, or calling such functions
+    """
+    impure = set()
+    for name, function in function_definitions.items():
+        visitor = Assignments()
+        visitor.visit(function)
+        if visitor.names & set(variable_declarations) or \
+                any(parameter.parameter_qualifier in ('out', 'inout') for parameter in function.parameters):
+            impure.add(name)
+    calls = dict((name, identifiers(function) & set(function_definitions)) for name, function in function_definitions.items())
+    changed = True
+    while changed:
+        changed = False
+        for name in function_definitions:
+            if name not in impure and calls[name] & impure:
+                impure.add(name)
+                changed = True
+    return impure
+
+class SideEffects(ShaderVisitor.NodeVisitor):
+
+    def __init__(self, impure):
+        ShaderVisitor.NodeVisitor.__init__(self)
+        self.impure = impure
+        self.found = False
+
+    def pre_AssignmentExpression(self, node):
+        self.found = True
+
+    def pre_UnaryExpression(self, node):
+        if node.op in ('++', '--'):
+            self.found = True
+
+    def pre_str(self, name):
+        if name in self.impure:
+            self.found = True
+
+def has_side_effects(node, impure):
+    """ Whether evaluating node assigns a variable or calls a function of impure
+    """
+    visitor = SideEffects(impure)
+    visitor.visit(node)
+    return visitor.found
+
+class WriteRemover(ShaderVisitor.NodeTransformer):
+    """ Removes the assignment statements to the variables of names, unless
+        their expressions have side effects : nested assignments, or calls
+        to a function of impure
+    """
+
+    def __init__(self, names, impure):
+        ShaderVisitor.NodeTransformer.__init__(self)
+        self.names = names
+        self.impure = impure
+
+    def post_AssignmentExpression(self, node):
+        if root_name(node.left) not in self.names or not self.path:
+            return node
+        parent = self.path[-1]
+        if type(parent).__name__ == 'IfStatement' and parent.condition is node:
+            return node
+        if type(parent).__name__ not in ('CompoundStatement', 'IfStatement'):
+            return node
+        if has_side_effects(node.right, self.impure) or has_side_effects(node.left, self.impure):
+            return node
+        if type(parent).__name__ == 'CompoundStatement':
+            return ShaderVisitor.REMOVE
+        # a branch can not be removed, it becomes empty
+        return CompoundStatement([])
+
+def interface_kind(var, fragment_shader):
+    """ Returns the kind of interface slot of a global variable : 'uniform',
+        'sampler', 'attribute', 'varying', 'output' or None
+    """
+    if var.layout_qualifier == 'uniform':
+        return 'sampler' if is_sampler_type(var.type_specifier) else 'uniform'
+    if var.is_input_variable(fragment_shader):
+        return 'varying' if fragment_shader else 'attribute'
+    if var.is_output_variable(fragment_shader):
+        return 'output' if fragment_shader else 'varying'
+    return None
+
+def declaration_components(var):
+    """ Returns the number of scalar components of a variable, arrays of a
+        non literal size counting as one element
+    """
+    count = components(var.type_specifier)
+    for size in var.array_sizes:
+        if type(size) is str and re.match(r'\d+$', size):
+            count *= int(size)
+    return count
+
+class ShaderPruner(object):
+    """ The declarations of a parsed shader reached from main. dead_outputs
+        names the output variables whose assignments are removed first.
+        The parser is left untouched.
+    """
+
+    def __init__(self, parser, fragment_shader=True, dead_outputs=(), entry='main'):
+        self.parser = parser
+        self.fragment_shader = fragment_shader
+
+        function_definitions = parser.function_definitions
+        if dead_outputs:
+            function_definitions = copy.deepcopy(function_definitions)
+            impure = side_effect_functions(function_definitions, parser.variable_declarations)
+            WriteRemover(set(dead_outputs), impure).transform(list(function_definitions.values()))
+
+        functions, variables = reachable(function_definitions, parser.variable_declarations, entry)
+        self.functions = collections.OrderedDict((name, function) for name, function in function_definitions.items()
+            if name in functions)
+        self.variables = collections.OrderedDict((name, var) for name, var in parser.variable_declarations.items()
+            if name in variables)
+        self.removed_functions = [name for name in function_definitions if name not in functions]
+        self.removed_variables = [var for name, var in parser.variable_declarations.items() if name not in variables]
+
+    def source(self):
+        """ Returns the source of the pruned shader
+        """
+        stream = io.StringIO()
+        ShaderVisitor.CodeEmitter(stream).emit_items(list(self.variables.values()) + list(self.functions.values()), self.parser)
+        return ShaderVisitor.shader_header(self.parser) + '\n' + stream.getvalue()
+
+def prune_program(vertex_parser, fragment_parser):
+    """ Returns the ShaderPruner of the vertex and of the fragment shader of
+        a program, the vertex outputs read by neither the pruned fragment
+        shader nor the vertex shader being dead
+    """
+    fragment = ShaderPruner(fragment_parser, fragment_shader=True)
+    read = set(name for name, var in fragment.variables.items() if var.is_input_variable(True))
+    # the outputs the vertex shader reads back stay written
+    read |= read_variables(vertex_parser.function_definitions)
+    dead_outputs = [name for name in vertex_parser.output_variables if name not in read]
+    vertex = ShaderPruner(vertex_parser, fragment_shader=False, dead_outputs=dead_outputs)
+    return vertex, fragment
+
+def savings(pruners):
+    """ Returns an OrderedDict of SAVING_FIELDS : the interface slots declared
+        by the shaders of a program but kept by none of them, and the
+        removed functions
+    """
+    declared, kept = collections.OrderedDict(), set()
+    for pruner in pruners:
+        for name, var in pruner.parser.variable_declarations.items():
+            kind = interface_kind(var, pruner.fragment_shader)
+            if kind:
+                declared.setdefault((kind, name), var)
+                if name in pruner.variables:
+                    kept.add((kind, name))
+
+    result = collections.OrderedDict((field, 0) for field in SAVING_FIELDS)
+    for (kind, name), var in declared.items():
+        if (kind, name) in kept:
+            continue
+        if kind in ('uniform', 'sampler', 'attribute', 'varying'):
+            result[kind + 's'] += 1
+        if kind in ('uniform', 'varying'):
+            result[kind + '_components'] += declaration_components(var)
+    result['functions'] = sum(len(pruner.removed_functions) for pruner in pruners)
+    return result
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    from ShaderParser import ShaderParser
+    parser = argparse.ArgumentParser()
+    parser.add_argument('vertex_shader')
+    parser.add_argument('fragment_shader')
+
+    args = parser.parse_args()
+
+    parsers = []
+    for filename, fragment_shader in ((args.vertex_shader, False), (args.fragment_shader, True)):
+        with open(filename) as f:
+            sp = ShaderParser()
+            sp.parse(f.read(), fragment_shader=fragment_shader)
+            parsers.append(sp)
+    pruners = prune_program(*parsers)
+    for pruner in pruners:
+        print(pruner.source())
+        print('')
+    for field, count in savings(pruners).items():
+        print('%-20s %d' % (field, count))
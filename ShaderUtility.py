@@ -1,15 +1,44 @@
 import logging
 logger = logging.getLogger(__name__)
 
-import re
+import collections, glob, multiprocessing, os, pickle, re, uuid
 from subprocess import Popen, PIPE
 
 version_declaration_pattern = r'\s*#\s*version\s+(\d+)\s+es\s*'
 layour_qualifier_pattern = r'layout\s*\(\s*location\s*=\s*(\d+)\s*\)\s*'
 sampler2DArray_pattern = r'\bsampler2DArray\b'
 
-def Preprocess(input_text):
+# what only cpp handles : directives, line continuations and predefined macros
+preprocessor_pattern = re.compile(r'#|\\\n|\b(GL_ES|__LINE__|__FILE__|__VERSION__)\b')
+
+class PreprocessStatistics(object):
+    """ Counts the inputs of FastPreprocess passed to cpp or bypassing it
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.fast_path = 0
+        self.cpp = 0
+
+    @property
+    def fast_path_ratio(self):
+        total = self.fast_path + self.cpp
+        return float(self.fast_path) / total if total else 0.0
+
+    def report(self):
+        return {
+            'fast_path' : self.fast_path,
+            'cpp' : self.cpp,
+            'fast_path_ratio' : self.fast_path_ratio,
+        }
 
+preprocess_statistics = PreprocessStatistics()
+
+def SplitVersion(input_text):
+    """ Returns the text with its version declaration line emptied, and the version
+    """
     version = 100
     lines = input_text.splitlines()
 
@@ -24,8 +53,28 @@ def Preprocess(input_text):
     if match:
         version = int(match.group(1))
         lines[0] = ''
-    input_text = '\n'.join(lines)
+    return '\n'.join(lines), version
+
+def NeedsPreprocessing(text):
+    """ Whether cpp would change more than the comments of text, given without its version line
+    """
+    return preprocessor_pattern.search(text) is not None
 
+def FastPreprocess(input_text):
+    """ Same as Preprocess, except that cpp is not run on inputs without
+        directives, which are returned as they are : their comments are
+        left to the lexer
+    """
+    text, version = SplitVersion(input_text)
+    if NeedsPreprocessing(text):
+        preprocess_statistics.cpp += 1
+        return Preprocess(input_text)
+    preprocess_statistics.fast_path += 1
+    return text, version
+
+def RunCpp(input_text):
+    """ Returns the output of cpp on input_text, with its line markers
+    """
     try:
         # Note the use of universal_newlines to treat all newlines
         # as \n for Python's purpose
@@ -40,38 +89,192 @@ def Preprocess(input_text):
         raise RuntimeError("Unable to invoke 'cpp'.  " +
             'Make sure its path was passed correctly\n' +
             ('Original error: %s' % e))
+    return text
+
+line_marker_pattern = re.compile(r'# (\d+) "(.*)"')
 
-    # remove the leading comment lines
-    new_lines = []
-    line_number = 1
-    line_marker_pattern = r'# (\d+) ".*"'
+def SplitLineMarkers(text):
+    """ Splits the output of cpp by the file named in its line markers,
+        returns {file name : text} where the lines are at their line number
+    """
+    files = collections.OrderedDict()
+    lines = None
     for line in text.splitlines():
-        match = re.match(line_marker_pattern, line)
+        match = line_marker_pattern.match(line)
         if match:
-            next_line_number = int(match.group(1))
-            new_lines += [''] * (next_line_number - line_number)
-            line_number = next_line_number
-        else:
-            new_lines.append(line)
-            line_number += 1
-    text = '\n'.join(new_lines)
+            lines = files.setdefault(match.group(2), [])
+            lines += [''] * (int(match.group(1)) - 1 - len(lines))
+        elif lines is not None:
+            lines.append(line)
+    return collections.OrderedDict((name, '\n'.join(lines)) for name, lines in files.items())
+
+def Preprocess(input_text):
 
+    input_text, version = SplitVersion(input_text)
+    if not input_text:
+        return '', version
+
+    # the predefined macros of cpp come from other files
+    text = SplitLineMarkers(RunCpp(input_text)).get('<stdin>', '')
     return text, version
 
+# macros defined by a shader, undefined before the next one of a batch
+define_pattern = re.compile(r'^\s*#\s*define\s+([A-Za-z_]\w*)', re.MULTILINE)
+
+def PreprocessBatch(input_texts, chunk_size=256):
+    """ Same as [Preprocess(text) for text in input_texts], with one cpp
+        process per chunk of shaders. The shaders of a chunk are
+        concatenated, each one starting with a #line directive naming it
+        and the macros of the previous one undefined. A chunk whose output
+        misses a shader, e.g. after an unterminated #if, is preprocessed
+        shader by shader instead.
+    """
+    results = []
+    batch_id = uuid.uuid4().hex
+    for chunk_start in range(0, len(input_texts), chunk_size):
+        chunk = [SplitVersion(text) for text in input_texts[chunk_start:chunk_start + chunk_size]]
+        names = ['%s-%d' % (batch_id, chunk_start + index) for index in range(len(chunk))]
+
+        parts = []
+        defined = []
+        for name, (text, version) in zip(names, chunk):
+            parts += ['#undef %s' % macro for macro in defined]
+            parts += ['#undef GL_ES', '#define GL_ES 1', '#line 1 "%s"' % name, text]
+            defined = define_pattern.findall(text)
+
+        files = SplitLineMarkers(RunCpp('\n'.join(parts) + '\n'))
+        if not all(name in files for name in names):
+            logger.warning('Preprocessing shaders %d to %d one by one' % (chunk_start, chunk_start + len(chunk) - 1))
+            results += [Preprocess(input_text) for input_text in input_texts[chunk_start:chunk_start + chunk_size]]
+            continue
+        results += [(files[name], version) for name, (text, version) in zip(names, chunk)]
+    return results
+
+class RewriteRule(object):
+    """ A source rewrite : the matches of pattern, a regular expression
+        without named groups, are replaced by replacement, a string or a
+        function of the match returning one. Only the rules replacing with
+        strings or module-level functions can be sent to worker processes.
+    """
+
+    def __init__(self, name, pattern, replacement):
+        self.name = name
+        self.pattern = pattern
+        self.replacement = replacement
+
+    def replace(self, match):
+        if callable(self.replacement):
+            return self.replacement(match)
+        return self.replacement
+
+class VersionRule(RewriteRule):
+    """ Replaces the '#version N es' line starting a source by versions[N],
+        other versions being left as they are
+    """
+
+    def __init__(self, versions, name='version'):
+        RewriteRule.__init__(self, name, r'\A[ \t]*#[ \t]*version[ \t]+(\d+)[ \t]+es[^\n]*', None)
+        self.versions = versions
+
+    def replace(self, match):
+        version = int(re.match(version_declaration_pattern, match.group()).group(1))
+        return self.versions.get(version, match.group())
+
+class RewritePipeline(object):
+    """ Applies rewrite rules in a single pass over a source : the patterns
+        of the rules are alternatives of one regular expression, the rule
+        of each match being the one of the alternative it took
+    """
+
+    def __init__(self, rules):
+        self.rules = dict((rule.name, rule) for rule in rules)
+        self.pattern = re.compile('|'.join('(?P<%s>%s)' % (rule.name, rule.pattern) for rule in rules))
+
+    def replace(self, match):
+        return self.rules[match.lastgroup].replace(match)
+
+    def rewrite(self, source):
+        return self.pattern.sub(self.replace, source)
+
+    def rewrite_file(self, filenames):
+        """ Rewrites the file of (input file name, output file name)
+        """
+        input_filename, output_filename = filenames
+        with open(input_filename) as f:
+            source = f.read()
+        with open(output_filename, 'w') as f:
+            f.write(self.rewrite(source))
+
+    def rewrite_directory(self, input_dir, output_dir, pattern='*', processes=None):
+        """ Rewrites the files of input_dir matching pattern to the files of
+            the same name in output_dir, in worker processes, all the cores
+            by default. Symbolic links, like the programs of ShaderCollector,
+            are copied as links. Returns the number of rewritten files.
+        """
+        if not os.path.isdir(output_dir):
+            os.makedirs(output_dir)
+        files, links = [], []
+        for filename in sorted(glob.glob(os.path.join(input_dir, pattern))):
+            output_filename = os.path.join(output_dir, os.path.basename(filename))
+            if os.path.islink(filename):
+                links.append((os.readlink(filename), output_filename))
+            elif os.path.isfile(filename):
+                files.append((filename, output_filename))
+
+        if processes != 1 and len(files) > 1:
+            try:
+                pickle.dumps(self)
+            except (pickle.PicklingError, AttributeError, TypeError) as e:
+                logger.warning('Rewriting in a single process, the rules can not be sent to workers : %s' % e)
+                processes = 1
+
+        if processes == 1 or len(files) < 2:
+            for filenames in files:
+                self.rewrite_file(filenames)
+        else:
+            pool = multiprocessing.Pool(processes)
+            try:
+                # each worker writes its outputs as it goes
+                for _ in pool.imap_unordered(self.rewrite_file, files, chunksize=16):
+                    pass
+            finally:
+                pool.close()
+                pool.join()
+
+        for target, output_filename in links:
+            if os.path.lexists(output_filename):
+                os.remove(output_filename)
+            os.symlink(target, output_filename)
+        return len(files)
+
+# the rewrites making ESSL 3.00 compilable by cgc
+CGC_REWRITE_PIPELINE = RewritePipeline([
+    VersionRule({300 : '#version 300\n#extension GL_NV_shadow : enable\n#extension GL_OES_texture_3D : enable'}),
+    # the whitespace after the qualifier, up to the end of its line
+    RewriteRule('layout', r'\blayout\s*\(\s*location\s*=\s*\d+\s*\)[ \t]*', ''),
+    RewriteRule('sampler2DArray', sampler2DArray_pattern, 'sampler3D'),
+])
+
 def ConvertESSLToCGCCompilable(source):
-    lines = source.splitlines()
-    # convert "#version 300 es" to "#version 300"
-    if re.match(version_declaration_pattern, lines[0]):
-        lines[0] = '#version 300\n#extension GL_NV_shadow : enable\n#extension GL_OES_texture_3D : enable'
-
-    for i in range(len(lines)):
-        # filter away layout qualifiers
-        match = re.search(layour_qualifier_pattern, lines[i])
-        if match:
-            lines[i] = lines[i].replace(match.group(), '')
+    return CGC_REWRITE_PIPELINE.rewrite(source)
 
-        # replace sampler2DArray with sampler3D
-        match = re.search(sampler2DArray_pattern, lines[i])
-        if match:
-            lines[i] = lines[i].replace(match.group(), 'sampler3D')
-    return '\n'.join(lines)
+def ConvertDirectoryToCGCCompilable(input_dir, output_dir, pattern='*', processes=None):
+    """ ConvertESSLToCGCCompilable of the files of a directory, see RewritePipeline.rewrite_directory
+    """
+    return CGC_REWRITE_PIPELINE.rewrite_directory(input_dir, output_dir, pattern, processes)
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    parser = argparse.ArgumentParser(description='Makes ESSL shaders compilable by cgc')
+    parser.add_argument('input_dir')
+    parser.add_argument('output_dir')
+    parser.add_argument('-p', '--pattern', default='*', help='Pattern of the converted file names')
+    parser.add_argument('-j', '--processes', type=int, help='Number of worker processes, all the cores by default')
+
+    args = parser.parse_args()
+
+    count = ConvertDirectoryToCGCCompilable(args.input_dir, args.output_dir, args.pattern, args.processes)
+    logger.info('%d shaders converted' % count)
@@ -0,0 +1,339 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import io
+
+# Traversal and printing of the ShaderParser AST.
+#
+# Every node class lists the fields holding its children in _fields, in
+# source order. A child is another node, a string (an identifier, a literal
+# or a type constructor), None or a list of those. All walks below keep an
+# explicit stack, so deep expression chains do not hit the recursion limit.
+
+def iter_children(node):
+    for field in getattr(type(node), '_fields', ()):
+        value = getattr(node, field)
+        if type(value) is list:
+            for item in value:
+                yield item
+        elif value is not None:
+            yield value
+
+class NodeVisitor(object):
+    """ Walks an AST and calls pre_<ClassName>(node) before and
+        post_<ClassName>(node) after visiting the children of a node, or
+        pre_any/post_any when the class has no hook of its own. Strings are
+        leaves, hooked with pre_str/post_str. A pre hook returning False
+        skips the children of the node. While hooks run, self.path holds the
+        ancestors of the node, its parent last.
+    """
+
+    def __init__(self):
+        self.path = []
+        self._hooks = {}
+
+    def _hook(self, prefix, cls):
+        key = (prefix, cls)
+        if key not in self._hooks:
+            self._hooks[key] = getattr(self, prefix + cls.__name__, None) or getattr(self, prefix + 'any', None)
+        return self._hooks[key]
+
+    def visit(self, root):
+        path = self.path
+        stack = [(root, False)]
+        while stack:
+            node, leaving = stack.pop()
+            cls = type(node)
+
+            if leaving:
+                path.pop()
+                post = self._hook('post_', cls)
+                if post:
+                    post(node)
+                continue
+
+            if cls is list:
+                stack.extend([(item, False) for item in reversed(node)])
+                continue
+
+            pre = self._hook('pre_', cls)
+            descend = not (pre and pre(node) is False)
+
+            stack.append((node, True))
+            path.append(node)
+            if descend:
+                stack.extend([(child, False) for child in reversed(list(iter_children(node)))])
+
+# post hook result of NodeTransformer removing the node from its list
+REMOVE = object()
+
+class NodeTransformer(NodeVisitor):
+    """ A NodeVisitor whose post hooks return the replacement of the node:
+        the node itself to keep it, another node or string to replace it, or
+        REMOVE to drop it from the list holding it (None outside of lists).
+        Nodes are rewritten in place, so do not transform ASTs parsed with a
+        shared NodeInterner.
+    """
+
+    def transform(self, root):
+        path = self.path
+        holder = [root]
+        stack = [(root, False, holder, 0)]
+        while stack:
+            node, leaving, container, key = stack.pop()
+            cls = type(node)
+
+            if not leaving:
+                if cls is list:
+                    stack.extend([(node[index], False, node, index) for index in reversed(range(len(node)))])
+                    continue
+
+                pre = self._hook('pre_', cls)
+                descend = not (pre and pre(node) is False)
+
+                stack.append((node, True, container, key))
+                path.append(node)
+                if descend:
+                    for field in reversed(getattr(cls, '_fields', ())):
+                        value = getattr(node, field)
+                        if value is not None:
+                            stack.append((value, False, node, field))
+                continue
+
+            path.pop()
+            # drop the children removed from the lists of this node
+            for field in getattr(cls, '_fields', ()):
+                value = getattr(node, field)
+                if type(value) is list and any(item is REMOVE for item in value):
+                    value[:] = [item for item in value if item is not REMOVE]
+
+            post = self._hook('post_', cls)
+            result = post(node) if post else node
+            if result is node:
+                continue
+            if type(container) is list:
+                container[key] = result
+            else:
+                setattr(container, key, None if result is REMOVE else result)
+
+        if holder[0] is REMOVE:
+            return None
+        return holder[0]
+
+# layout markers of CodeEmitter
+class Marker(object):
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+NEWLINE = Marker('NEWLINE')
+INDENT = Marker('INDENT')
+DEDENT = Marker('DEDENT')
+
+class Statement(object):
+    """ Wraps a node emitted as a statement, i.e. terminated by ';' if needed
+    """
+
+    __slots__ = ('node', )
+
+    def __init__(self, node):
+        self.node = node
+
+# nodes which are complete statements on their own
+STATEMENT_CLASSES = ('IfStatement', 'ReturnStatement', 'DiscardStatement', 'CompoundStatement',
+    'PrecisionStatement', 'FunctionDefinition')
+
+class CodeEmitter(object):
+    """ Writes the GLSL source of an AST to a stream. Each node class is
+        expanded by expand_<ClassName>(node) into a list of parts: strings
+        written as they are, nodes expanded in turn, Statement wrappers and
+        layout markers.
+    """
+
+    indent_width = 4
+    newline = '\n'
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.indent = 0
+        self._expanders = {}
+
+    def _expander(self, cls):
+        expander = self._expanders.get(cls)
+        if expander is None:
+            expander = getattr(self, 'expand_' + cls.__name__, None)
+            if expander is None:
+                raise TypeError('Unable to emit %s' % cls.__name__)
+            self._expanders[cls] = expander
+        return expander
+
+    def emit(self, node):
+        write = self.stream.write
+        stack = [node]
+        while stack:
+            part = stack.pop()
+            cls = type(part)
+            if cls is str:
+                write(part)
+            elif part is NEWLINE:
+                write(self.newline + ' ' * self.indent)
+            elif part is INDENT:
+                self.indent += self.indent_width
+            elif part is DEDENT:
+                self.indent -= self.indent_width
+            else:
+                parts = self._expander(cls)(part)
+                parts.reverse()
+                stack += parts
+
+    def emit_statement(self, node):
+        self.emit(Statement(node))
+
+    def emit_shader(self, parser):
+        """ Emits the global variables and the function definitions of a ShaderParser
+        """
+        self.emit_items(list(parser.variable_declarations.values()) + list(parser.function_definitions.values()), parser)
+
+    def emit_items(self, items, parser=None):
+        """ Emits global declarations and function definitions, one per line.
+            With the ShaderParser of the items, a function defined under
+            other default precisions than the final ones, which shader_header
+            writes, is preceded by the precision statements restoring them.
+        """
+        precisions = dict(parser.default_precision_qualifier) if parser else {}
+        for index, item in enumerate(items):
+            if index:
+                self.emit(NEWLINE)
+            if parser and type(item).__name__ == 'FunctionDefinition':
+                in_scope = parser.function_precision_qualifiers.get(item.name, {})
+                for type_specifier, qualifier in sorted(in_scope.items()):
+                    if precisions.get(type_specifier) != qualifier:
+                        precisions[type_specifier] = qualifier
+                        self.emit('precision %s %s;' % (qualifier, type_specifier))
+                        self.emit(NEWLINE)
+            self.emit_statement(item)
+
+    # helpers
+
+    def separated(self, items, separator):
+        parts = []
+        for item in items:
+            if parts:
+                parts.append(separator)
+            parts.append(item)
+        return parts
+
+    def operand(self, node):
+        # binary expressions and assignments are parenthesized when nested
+        if type(node).__name__ in ('BinaryExpression', 'AssignmentExpression'):
+            return ['(', node, ')']
+        return [node]
+
+    def postfix_operand(self, node):
+        # only primary and postfix expressions bind tighter than [] and .
+        if type(node).__name__ == 'UnaryExpression':
+            return ['(', node, ')']
+        return self.operand(node)
+
+    # statements
+
+    def expand_Statement(self, statement):
+        node = statement.node
+        if type(node).__name__ in STATEMENT_CLASSES:
+            return [node]
+        return [node, ';']
+
+    def expand_PrecisionStatement(self, node):
+        return ['precision %s %s;' % (node.precision_qualifier, node.type_specifier)]
+
+    def expand_VariableDeclaration(self, node):
+        qualifiers = [node.type_qualifier, node.layout_qualifier, node.precision_qualifier, node.type_specifier]
+        parts = [qualifier + ' ' for qualifier in qualifiers if qualifier]
+        parts.append(node.name)
+        for size in node.array_sizes:
+            parts += ['[', size, ']']
+        if node.initializer:
+            parts += [' = ', node.initializer]
+        return parts
+
+    def expand_ParameterDeclaration(self, node):
+        tokens = [node.parameter_qualifier, node.type]
+        if node.name: tokens.append(node.name)
+        return [' '.join(tokens)]
+
+    def expand_FunctionPrototype(self, node):
+        return ['%s %s(' % (node.return_type, node.name)] + self.separated(node.parameters, ', ') + [')']
+
+    def expand_FunctionDefinition(self, node):
+        return [node.function_prototype, NEWLINE, node.compound_statements]
+
+    def expand_CompoundStatement(self, node):
+        parts = ['{', INDENT]
+        for item in node.block_items:
+            parts += [NEWLINE, Statement(item)]
+        parts += [DEDENT, NEWLINE, '}']
+        return parts
+
+    def expand_IfStatement(self, node):
+        parts = ['if (', node.condition, ')', NEWLINE, Statement(node.if_true)]
+        if node.if_false:
+            parts += [NEWLINE, 'else', NEWLINE, Statement(node.if_false)]
+        return parts
+
+    def expand_DiscardStatement(self, node):
+        return ['discard;']
+
+    def expand_ReturnStatement(self, node):
+        if node.return_value:
+            return ['return ', node.return_value, ';']
+        return ['return;']
+
+    # expressions
+
+    def expand_FunctionCall(self, node):
+        return [node.name, '('] + self.separated(node.arguments, ', ') + [')']
+
+    def expand_IndexExpression(self, node):
+        return self.postfix_operand(node.base) + ['[', node.index, ']']
+
+    def expand_FieldSelection(self, node):
+        return self.postfix_operand(node.base) + ['.', node.field]
+
+    def expand_UnaryExpression(self, node):
+        # nested unary operators would read as -- or ++
+        if type(node.operand).__name__ == 'UnaryExpression':
+            return [node.op, '(', node.operand, ')']
+        return [node.op] + self.operand(node.operand)
+
+    def expand_BinaryExpression(self, node):
+        return self.operand(node.left) + [' %s ' % node.op] + self.operand(node.right)
+
+    def expand_AssignmentExpression(self, node):
+        return [node.left, ' %s ' % node.op, node.right]
+
+def to_source(node, emitter=CodeEmitter):
+    """ Returns the GLSL source of a node, statements terminated by ';'
+    """
+    stream = io.StringIO()
+    statement = type(node).__name__ in STATEMENT_CLASSES + ('AssignmentExpression', )
+    emitter(stream).emit(Statement(node) if statement else node)
+    return stream.getvalue()
+
+def shader_to_source(parser, emitter=CodeEmitter):
+    stream = io.StringIO()
+    emitter(stream).emit_shader(parser)
+    return stream.getvalue()
+
+def shader_header(parser):
+    """ Returns the version line, if not 100, and the default precision
+        statements of a ShaderParser, which emit_shader leaves out
+    """
+    lines = []
+    if parser.version != 100:
+        lines.append('#version %d es' % parser.version)
+    for type, qualifier in sorted(parser.default_precision_qualifier.items()):
+        lines.append('precision %s %s;' % (qualifier, type))
+    return '\n'.join(lines)
@@ -0,0 +1,125 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import collections, os
+from xml.etree import ElementTree
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REGISTRY_FILE = os.path.join(REPOSITORY_DIR, 'Registry', 'gl.xml')
+OUTPUT_FILE = os.path.join(REPOSITORY_DIR, 'GLESEnumTables.py')
+
+API = 'gles2'
+
+# enums outside of the API which are still tracked by GLESContext
+EXTRA_ENUMS = ('GL_PACK_IMAGE_HEIGHT', 'GL_PACK_SKIP_IMAGES')
+
+def _required_enum_names(registry, api):
+    """ Names of the enums required by any version of the given API
+        or by an extension supporting it. Core names come first.
+    """
+    core, extension = [], list(EXTRA_ENUMS)
+
+    for feature in registry.iter('feature'):
+        if feature.get('api') != api:
+            continue
+        for require in feature.iter('require'):
+            core += [enum.get('name') for enum in require.iter('enum')]
+
+    for ext in registry.iter('extension'):
+        if api not in ext.get('supported', '').split('|'):
+            continue
+        for require in ext.iter('require'):
+            if require.get('api', api) != api:
+                continue
+            extension += [enum.get('name') for enum in require.iter('enum')]
+
+    names = collections.OrderedDict()
+    for name in core + extension:
+        names[name] = True
+    return list(names.keys())
+
+def load_registry(filename=REGISTRY_FILE, api=API):
+    """ Returns (values, groups) for the given API, where values maps every
+        enum name to its value and groups maps every group name to the
+        list of enum names belonging to it.
+    """
+    registry = ElementTree.parse(filename).getroot()
+
+    definitions = {}
+    for enums in registry.iter('enums'):
+        for enum in enums.iter('enum'):
+            if enum.get('api', api) != api and enum.get('name') not in EXTRA_ENUMS:
+                continue
+            definitions[enum.get('name')] = enum
+
+    values = collections.OrderedDict()
+    groups = collections.defaultdict(list)
+    for name in _required_enum_names(registry, api):
+        enum = definitions.get(name)
+        if enum is None:
+            logger.warning('Enum without definition : %s' % name)
+            continue
+        values[name] = int(enum.get('value'), 0)
+        for group in enum.get('group', '').split(','):
+            if group:
+                groups[group].append(name)
+    return values, groups
+
+def _format_dict(name, items, indent=4):
+    lines = ['%s = {' % name]
+    lines += ['%s%s : %s,' % (' ' * indent, key, value) for key, value in items]
+    lines.append('}')
+    return lines
+
+def generate(values, groups):
+    # the first name defined for a value is its canonical name,
+    # later ones (e.g. extension suffixed ones) are aliases
+    aliases = collections.OrderedDict()
+    for name, value in values.items():
+        aliases.setdefault(value, []).append(name)
+
+    lines = [
+        '# Generated by Tools/GenerateGLESEnum.py from Registry/gl.xml, do not edit.',
+        '',
+        '# enum name -> value',
+    ]
+    lines += _format_dict('VALUES',
+        [(repr(name), '0x%04X' % value) for name, value in values.items()])
+
+    lines += ['', '# value -> canonical enum name']
+    lines += _format_dict('NAMES',
+        [('0x%04X' % value, repr(names[0])) for value, names in aliases.items()])
+
+    lines += ['', '# value -> all enum names of the value, for values shared by several enums']
+    lines += _format_dict('ALIASES',
+        [('0x%04X' % value, repr(tuple(names))) for value, names in aliases.items() if len(names) > 1])
+
+    lines += ['', '# group -> value -> enum name in the group']
+    lines.append('GROUPS = {')
+    for group in sorted(groups):
+        group_names = collections.OrderedDict()
+        for name in groups[group]:
+            group_names.setdefault(values[name], name)
+        lines.append('    %s : {' % repr(group))
+        lines += ['        0x%04X : %s,' % (value, repr(name)) for value, name in group_names.items()]
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-r', '--registry', default=REGISTRY_FILE,
+            help='Path of the Khronos registry XML')
+    parser.add_argument('-o', '--output', default=OUTPUT_FILE,
+            help='Path of the generated python module')
+
+    args = parser.parse_args()
+
+    values, groups = load_registry(args.registry)
+    with open(args.output, 'w') as output:
+        output.write(generate(values, groups))
+    logger.info('Generated %d enums in %d groups' % (len(values), len(groups)))
@@ -0,0 +1,92 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import pandas, collections, os
+
+import ShaderFingerprint
+from Tools.ShaderCollector import VERTEX_SHADER_SUFFIX, FRAGMENT_SHADER_SUFFIX
+from Tools.ShaderCorpus import corpus_files, program_shaders, shader_stage, parse_shader, map_files
+
+# Groups the shaders written by ShaderCollector by ShaderFingerprint, i.e.
+# shaders only differing by formatting, comments, identifier names or
+# declaration order, and reports the compile work spent on duplicates.
+
+def shader_fingerprint(filename):
+    """ Returns (stage, fingerprint, source size) of a shader file, fingerprint
+        being None if the shader can not be parsed
+    """
+    parser = parse_shader(filename, 'fingerprint')
+    fingerprint = ShaderFingerprint.fingerprint(parser) if parser else None
+    return shader_stage(filename), fingerprint, os.path.getsize(filename)
+
+class ShaderClusters(object):
+    """ Fingerprints the shaders of a ShaderCollector directory, in worker processes
+    """
+
+    def __init__(self, directory, processes=None):
+        shader_files, program_links = corpus_files(directory)
+        results = map_files(shader_fingerprint, shader_files, processes)
+
+        names = [os.path.basename(filename) for filename in shader_files]
+        self.shaders = pandas.DataFrame(results, index=names, columns=['stage', 'fingerprint', 'size'])
+
+        # program -> fingerprints of its shaders, by stage
+        programs = collections.defaultdict(dict)
+        for program, stages in program_shaders(program_links).items():
+            for stage, target in stages.items():
+                if target in self.shaders.index:
+                    programs[program][stage] = self.shaders.at[target, 'fingerprint']
+        self.programs = pandas.DataFrame.from_dict(programs, orient='index',
+            columns=[VERTEX_SHADER_SUFFIX, FRAGMENT_SHADER_SUFFIX])
+
+    @property
+    def clusters(self):
+        """ One row per fingerprint : its stage, number of shaders, total source
+            size, size of the duplicates of its first shader, and shaders
+        """
+        rows = []
+        fingerprinted = self.shaders.dropna(subset=['fingerprint'])
+        for (stage, fingerprint), group in fingerprinted.groupby(['stage', 'fingerprint']):
+            size = int(group['size'].sum())
+            rows.append((stage, fingerprint, len(group), size, size - int(group['size'].iloc[0]), list(group.index)))
+        clusters = pandas.DataFrame(rows, columns=['stage', 'fingerprint', 'count', 'size', 'duplicate_size', 'shaders'])
+        return clusters.sort_values(['count', 'stage', 'fingerprint'], ascending=[False, True, True]).reset_index(drop=True)
+
+    def report(self):
+        """ Returns the number of shaders and programs, and how many of them,
+            and of the source bytes, are duplicates which need not be compiled
+        """
+        clusters = self.clusters
+        fingerprinted = int(clusters['count'].sum())
+        duplicates = fingerprinted - len(clusters)
+        programs = self.programs.dropna()
+        return collections.OrderedDict([
+            ('shaders', len(self.shaders)),
+            ('unparsed_shaders', len(self.shaders) - fingerprinted),
+            ('clusters', len(clusters)),
+            ('duplicate_shaders', duplicates),
+            ('duplicate_ratio', float(duplicates) / fingerprinted if fingerprinted else 0.0),
+            ('source_bytes', int(self.shaders['size'].sum())),
+            ('duplicate_source_bytes', int(clusters['duplicate_size'].sum())),
+            ('programs', len(self.programs)),
+            ('duplicate_programs', len(programs) - len(programs.drop_duplicates())),
+        ])
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('shader_dir', help='Directory of the shaders collected by ShaderCollector')
+    parser.add_argument('-j', '--processes', type=int, help='Number of worker processes, all the cores by default')
+    parser.add_argument('-c', '--clusters', action='store_true', help='List the clusters of duplicate shaders')
+
+    args = parser.parse_args()
+
+    clusters = ShaderClusters(args.shader_dir, args.processes)
+    for key, value in clusters.report().items():
+        print('%-24s %s' % (key, value))
+    if args.clusters:
+        duplicates = clusters.clusters[clusters.clusters['count'] > 1]
+        print(duplicates[['count', 'size', 'shaders']].to_string())
@@ -17,8 +17,13 @@ SHADER_DIR = 'shaders'
 class ShaderCollector(object):
 
     def __init__(self):
-        self.shaders = pandas.DataFrame(columns=ShaderObject.Attributes)
-        self.programs = pandas.DataFrame(columns=ProgramObject.Attributes)
+        self.shader_index = []
+        self.shader_columns = collections.OrderedDict((attr, []) for attr in ShaderObject.Attributes)
+        self.program_index = []
+
+        # exported data frames, rebuilt when new records are collected
+        self._shaders = None
+        self._programs = None
 
     # next available index for each GLES name
     NextShaderIndex = collections.defaultdict(int)
@@ -36,6 +41,18 @@ class ShaderCollector(object):
         ShaderCollector.NextProgramIndex[gles_name] += 1
         return '%04d_%04d' % (gles_name, second_part)
 
+    @property
+    def shaders(self):
+        if self._shaders is None:
+            self._shaders = pandas.DataFrame(self.shader_columns, index=self.shader_index, columns=ShaderObject.Attributes)
+        return self._shaders
+
+    @property
+    def programs(self):
+        if self._programs is None:
+            self._programs = pandas.DataFrame(index=self.program_index, columns=ProgramObject.Attributes)
+        return self._programs
+
     def collect(self, context):
         current_program_name = context.glGet(Enum.GL_CURRENT_PROGRAM)
         if not context.glIsProgram(current_program_name):
@@ -46,8 +63,8 @@ class ShaderCollector(object):
             return
 
         program_index = self.generate_program_index(current_program_name)
-        df = pandas.DataFrame({}, index=[program_index])
-        self.programs = self.programs.append(df)
+        self.program_index.append(program_index)
+        self._programs = None
 
         for shader_name in current_program.attached_shaders:
             shader = context.shader_objects[shader_name]
@@ -55,8 +72,6 @@ class ShaderCollector(object):
             if shader.modified:
                 shader_index = self.generate_shader_index(shader_name)
 
-                shader_attrs = collections.OrderedDict()
-                shader_attrs['type'] = Enum.names[shader.type]
                 filename = os.path.join(SHADER_DIR, '.'.join([shader_index, SHADER_SUFFIX[shader.type]]))
 
                 if not os.path.exists(SHADER_DIR):
@@ -64,10 +79,11 @@ class ShaderCollector(object):
 
                 with open(filename, 'w') as output:
                     output.write(shader.source)
-                shader_attrs['filename'] = filename
 
-                df = pandas.DataFrame(shader_attrs, index=[shader_index])
-                self.shaders = self.shaders.append(df)
+                self.shader_index.append(shader_index)
+                self.shader_columns['type'].append(Enum.names[shader.type])
+                self.shader_columns['filename'].append(filename)
+                self._shaders = None
 
                 shader.modified = False
                 shader.filename = filename
@@ -0,0 +1,62 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import collections, glob, multiprocessing, os
+
+from ply.lex import LexError
+
+from ShaderLexer import FastShaderLexer
+from ShaderParser import ShaderParser
+from Tools.ShaderCollector import VERTEX_SHADER_SUFFIX, FRAGMENT_SHADER_SUFFIX
+
+# Helpers of the tools reading a ShaderCollector directory, where the shaders
+# are files named <shader index>.<stage> and the programs symbolic links
+# named <program index>.<stage> to the shaders they link.
+
+def shader_stage(filename):
+    return FRAGMENT_SHADER_SUFFIX if filename.endswith('.' + FRAGMENT_SHADER_SUFFIX) else VERTEX_SHADER_SUFFIX
+
+def corpus_files(directory):
+    """ Returns the sorted (shader files, program links) of a ShaderCollector directory
+    """
+    filenames = sorted(glob.glob(os.path.join(directory, '*.' + VERTEX_SHADER_SUFFIX)) +
+        glob.glob(os.path.join(directory, '*.' + FRAGMENT_SHADER_SUFFIX)))
+    shader_files = [filename for filename in filenames if not os.path.islink(filename)]
+    program_links = [filename for filename in filenames if os.path.islink(filename)]
+    return shader_files, program_links
+
+def program_shaders(program_links):
+    """ Returns {program name : {stage : shader name}} of program links, sorted by name
+    """
+    programs = collections.defaultdict(dict)
+    for filename in program_links:
+        program, stage = os.path.basename(filename).rsplit('.', 1)
+        programs[program][stage] = os.path.basename(os.readlink(filename))
+    return collections.OrderedDict(sorted(programs.items()))
+
+def parse_shader(filename, action, lazy=False):
+    """ Parses a shader file, returns its ShaderParser, or None with a
+        warning 'Unable to <action> <filename>' if it can not be parsed
+    """
+    with open(filename) as f:
+        source = f.read()
+    parser = ShaderParser(lexer_class=FastShaderLexer)
+    try:
+        parser.parse(source, fragment_shader=shader_stage(filename) == FRAGMENT_SHADER_SUFFIX, filename=filename, lazy=lazy)
+    except (LexError, SyntaxError) as e:
+        logger.warning('Unable to %s %s : %s' % (action, filename, e))
+        return None
+    return parser
+
+def map_files(function, items, processes=None):
+    """ Returns [function(item) for item in items], computed in processes
+        worker processes, all the cores by default, by chunks of 16 items
+    """
+    if processes == 1 or len(items) < 2:
+        return [function(item) for item in items]
+    pool = multiprocessing.Pool(processes)
+    try:
+        return pool.map(function, items, chunksize=16)
+    finally:
+        pool.close()
+        pool.join()
@@ -0,0 +1,96 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import pandas, collections, os
+
+import ShaderCost
+from ShaderCost import COST_FIELDS
+from Tools.ShaderCollector import VERTEX_SHADER_SUFFIX, FRAGMENT_SHADER_SUFFIX
+from Tools.ShaderCorpus import corpus_files, program_shaders, shader_stage, parse_shader, map_files
+
+# Ranks the shaders and programs written by ShaderCollector by their static
+# ShaderCost. The score of a cost vector is its dot product with WEIGHTS,
+# roughly the cycles of each operation relative to a scalar ALU operation.
+WEIGHTS = collections.OrderedDict([
+    ('alu', 1.0),
+    ('texture', 8.0),
+    ('branch', 4.0),
+    ('discard', 4.0),
+    ('transcendental', 4.0),
+])
+
+def shader_cost(filename):
+    """ Returns (stage, ) + the cost vector of a shader file, the costs
+        being None if the shader can not be parsed
+    """
+    parser = parse_shader(filename, 'estimate the cost of')
+    if parser is None:
+        return (shader_stage(filename), ) + (None, ) * len(COST_FIELDS)
+    return (shader_stage(filename), ) + tuple(ShaderCost.shader_cost(parser).values())
+
+class ShaderCostRanking(object):
+    """ Estimates the cost of the shaders of a ShaderCollector directory, in
+        worker processes. shaders holds one cost vector per shader, programs
+        the shaders of each program.
+    """
+
+    def __init__(self, directory, processes=None):
+        shader_files, program_links = corpus_files(directory)
+        results = map_files(shader_cost, shader_files, processes)
+
+        names = [os.path.basename(filename) for filename in shader_files]
+        self.shaders = pandas.DataFrame(results, index=names, columns=('stage', ) + COST_FIELDS)
+
+        programs = collections.defaultdict(dict)
+        for program, stages in program_shaders(program_links).items():
+            for stage, target in stages.items():
+                if target in self.shaders.index:
+                    programs[program][stage] = target
+        self.programs = pandas.DataFrame.from_dict(programs, orient='index',
+            columns=[VERTEX_SHADER_SUFFIX, FRAGMENT_SHADER_SUFFIX]).dropna()
+
+    def program_costs(self, fragment_weight=1.0):
+        """ Returns the cost vectors of the programs : the cost of their vertex
+            shader plus fragment_weight times the cost of their fragment shader,
+            e.g. the number of fragments shaded per vertex
+        """
+        costs = self.shaders[list(COST_FIELDS)]
+        vertex = costs.reindex(self.programs[VERTEX_SHADER_SUFFIX]).values
+        fragment = costs.reindex(self.programs[FRAGMENT_SHADER_SUFFIX]).values
+        return pandas.DataFrame(vertex + fragment_weight * fragment, index=self.programs.index, columns=COST_FIELDS)
+
+    @staticmethod
+    def rank(costs, weights=WEIGHTS, top=None):
+        """ Returns costs with a score column, sorted by decreasing score,
+            the top first rows only if given
+        """
+        ranked = costs.assign(score=costs[list(weights)].dot(pandas.Series(weights)))
+        ranked = ranked.sort_values('score', ascending=False, kind='mergesort')
+        return ranked if top is None else ranked.head(top)
+
+    def ranked_shaders(self, weights=WEIGHTS, top=None):
+        return self.rank(self.shaders.dropna(), weights, top)
+
+    def ranked_programs(self, weights=WEIGHTS, top=None, fragment_weight=1.0):
+        return self.rank(self.program_costs(fragment_weight).dropna(), weights, top)
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('shader_dir', help='Directory of the shaders collected by ShaderCollector')
+    parser.add_argument('-j', '--processes', type=int, help='Number of worker processes, all the cores by default')
+    parser.add_argument('-n', '--top', type=int, default=20, help='Number of programs or shaders listed')
+    parser.add_argument('-f', '--fragment-weight', type=float, default=1.0,
+            help='Weight of the fragment shaders in the cost of a program, e.g. fragments per vertex')
+    parser.add_argument('-s', '--shaders', action='store_true', help='Rank the shaders rather than the programs')
+
+    args = parser.parse_args()
+
+    ranking = ShaderCostRanking(args.shader_dir, args.processes)
+    if args.shaders:
+        print(ranking.ranked_shaders(top=args.top).to_string())
+    else:
+        print(ranking.ranked_programs(top=args.top, fragment_weight=args.fragment_weight).to_string())
@@ -0,0 +1,185 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import collections, os, sqlite3
+
+from Tools.ShaderCollector import FRAGMENT_SHADER_SUFFIX
+from Tools.ShaderCorpus import corpus_files, program_shaders, parse_shader, map_files
+
+# Inverted index of the symbols declared by the shaders of a ShaderCollector
+# directory, kept in an SQLite database. Each symbol is a (kind, name, type,
+# precision) row pointing to its shader, where kind is one of KINDS.
+KINDS = ('uniform', 'attribute', 'varying', 'output', 'function')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS shaders (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL,
+    fragment INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    shader INTEGER NOT NULL REFERENCES shaders(id),
+    kind INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT,
+    precision TEXT
+);
+CREATE INDEX IF NOT EXISTS symbols_name ON symbols (name, kind);
+CREATE INDEX IF NOT EXISTS symbols_type ON symbols (type, kind);
+CREATE INDEX IF NOT EXISTS symbols_shader ON symbols (shader);
+CREATE TABLE IF NOT EXISTS programs (
+    name TEXT NOT NULL,
+    shader INTEGER NOT NULL REFERENCES shaders(id),
+    PRIMARY KEY (name, shader)
+);
+'''
+
+def variable_kind(var, fragment_shader):
+    if var.layout_qualifier == 'uniform':
+        return 'uniform'
+    if var.is_input_variable(fragment_shader):
+        return 'varying' if fragment_shader else 'attribute'
+    if var.is_output_variable(fragment_shader):
+        return 'output' if fragment_shader else 'varying'
+    return None
+
+def shader_symbols(filename):
+    """ Parses a shader file, returns its symbols as (kind, name, type, precision)
+    """
+    fragment_shader = filename.endswith('.' + FRAGMENT_SHADER_SUFFIX)
+    # only the declarations and the prototypes are needed, bodies stay unparsed
+    parser = parse_shader(filename, 'index', lazy=True)
+    if parser is None:
+        return []
+
+    symbols = []
+    for var in parser.variable_declarations.values():
+        kind = variable_kind(var, fragment_shader)
+        if kind:
+            symbols.append((kind, var.name, var.type_specifier, var.precision_qualifier))
+    for function in parser.function_definitions.values():
+        symbols.append(('function', function.name, function.return_type, None))
+    return symbols
+
+class ShaderIndex(object):
+    """ Index of the shaders written by ShaderCollector, e.g.
+
+        index = ShaderIndex('shaders.index')
+        index.update('shaders')
+        index.lookup(name='u_shadowMap', kind='uniform')
+        index.programs_with('varying', 8)
+
+        update() only parses the shaders added or modified since the last
+        update, in worker processes.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def update(self, directory, processes=None):
+        """ Indexes the new and modified shaders of directory, forgets the
+            removed ones, returns the number of parsed shaders
+        """
+        db = self.connection
+        shader_files, program_links = corpus_files(directory)
+
+        indexed = dict((name, (shader_id, mtime, size)) for shader_id, name, mtime, size in
+            db.execute('SELECT id, name, mtime, size FROM shaders'))
+        current = {}
+        changed = []
+        for filename in shader_files:
+            stat = os.stat(filename)
+            name = os.path.basename(filename)
+            current[name] = (stat.st_mtime, stat.st_size)
+            if indexed.get(name, (None, ))[1:] != current[name]:
+                changed.append(filename)
+        removed = [indexed[name][0] for name in indexed if name not in current]
+
+        results = map_files(shader_symbols, changed, processes)
+
+        with db:
+            stale = removed + [indexed[os.path.basename(filename)][0] for filename in changed
+                if os.path.basename(filename) in indexed]
+            db.executemany('DELETE FROM symbols WHERE shader = ?', [(shader_id, ) for shader_id in stale])
+            db.executemany('DELETE FROM shaders WHERE id = ?', [(shader_id, ) for shader_id in stale])
+
+            for filename, symbols in zip(changed, results):
+                name = os.path.basename(filename)
+                mtime, size = current[name]
+                cursor = db.execute('INSERT INTO shaders (name, fragment, mtime, size) VALUES (?, ?, ?, ?)',
+                    (name, filename.endswith('.' + FRAGMENT_SHADER_SUFFIX), mtime, size))
+                db.executemany('INSERT INTO symbols VALUES (?, ?, ?, ?, ?)',
+                    [(cursor.lastrowid, KINDS.index(kind), symbol, type, precision) for kind, symbol, type, precision in symbols])
+
+            # programs are symbolic links to their shaders, cheap to rescan
+            shader_ids = dict(db.execute('SELECT name, id FROM shaders'))
+            db.execute('DELETE FROM programs')
+            programs = [(program, shader_ids[target]) for program, stages in program_shaders(program_links).items()
+                for target in stages.values() if target in shader_ids]
+            db.executemany('INSERT OR IGNORE INTO programs VALUES (?, ?)', programs)
+
+        logger.info('Indexed %d shaders, %d removed' % (len(changed), len(removed)))
+        return len(changed)
+
+    def lookup(self, name=None, kind=None, type=None, precision=None):
+        """ Returns the names of the shaders declaring a symbol matching all the given criteria
+        """
+        conditions, parameters = [], []
+        for column, value in (('symbols.name', name), ('symbols.kind', kind), ('symbols.type', type), ('symbols.precision', precision)):
+            if value is not None:
+                conditions.append('%s = ?' % column)
+                parameters.append(KINDS.index(value) if column == 'symbols.kind' else value)
+        query = 'SELECT DISTINCT shaders.name FROM symbols JOIN shaders ON shaders.id = symbols.shader'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        return sorted(row[0] for row in self.connection.execute(query, parameters))
+
+    def counts(self, kind):
+        """ Returns {shader name : number of symbols of kind}
+        """
+        counts = collections.OrderedDict((name, 0) for name, in self.connection.execute('SELECT name FROM shaders ORDER BY name'))
+        counts.update(self.connection.execute('SELECT shaders.name, COUNT(*) FROM symbols JOIN shaders ON shaders.id = symbols.shader '
+            'WHERE symbols.kind = ? GROUP BY shaders.name', (KINDS.index(kind), )))
+        return counts
+
+    def programs_with(self, kind, more_than):
+        """ Returns the names of the programs declaring more than more_than
+            distinct symbols of kind across their shaders
+        """
+        rows = self.connection.execute('SELECT programs.name FROM programs JOIN symbols ON symbols.shader = programs.shader '
+            'WHERE symbols.kind = ? GROUP BY programs.name HAVING COUNT(DISTINCT symbols.name) > ?', (KINDS.index(kind), more_than))
+        return sorted(row[0] for row in rows)
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('index', help='Index file, created if missing')
+    parser.add_argument('-d', '--shader-dir', help='Update the index with the shaders of this directory')
+    parser.add_argument('-j', '--processes', type=int, help='Number of worker processes, all the cores by default')
+    parser.add_argument('-n', '--name', help='Look up the shaders declaring this symbol')
+    parser.add_argument('-k', '--kind', choices=KINDS)
+    parser.add_argument('-t', '--type')
+    parser.add_argument('-p', '--precision')
+    parser.add_argument('--programs-with', type=int, metavar='COUNT',
+            help='List the programs declaring more than COUNT symbols of --kind')
+
+    args = parser.parse_args()
+
+    index = ShaderIndex(args.index)
+    if args.shader_dir:
+        index.update(args.shader_dir, args.processes)
+    if args.programs_with is not None:
+        print('\n'.join(index.programs_with(args.kind or 'varying', args.programs_with)))
+    elif args.name or args.kind or args.type or args.precision:
+        print('\n'.join(index.lookup(args.name, args.kind, args.type, args.precision)))
+    index.close()
@@ -0,0 +1,73 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import pandas, collections, json, os
+
+import ShaderLint
+from Tools.ShaderCollector import FRAGMENT_SHADER_SUFFIX
+from Tools.ShaderCorpus import corpus_files, parse_shader, map_files
+
+# Runs ShaderLint over the shaders written by ShaderCollector, in worker
+# processes, the findings being written as JSON lines.
+
+def shader_findings(args):
+    """ Returns the findings of the rules on a shader file of (filename, rules),
+        each with its shader name
+    """
+    filename, rules = args
+    parser = parse_shader(filename, 'lint')
+    if parser is None:
+        return []
+    findings = ShaderLint.lint(parser, filename.endswith('.' + FRAGMENT_SHADER_SUFFIX), rules)
+    for finding in findings:
+        finding['shader'] = os.path.basename(filename)
+    return findings
+
+class ShaderLinting(object):
+    """ Lints the shaders of a ShaderCollector directory, findings holding
+        the findings of all the shaders in order
+    """
+
+    def __init__(self, directory, rules=None, processes=None):
+        shader_files = corpus_files(directory)[0]
+        results = map_files(shader_findings, [(filename, rules) for filename in shader_files], processes)
+
+        self.shaders = len(shader_files)
+        self.findings = [finding for findings in results for finding in findings]
+
+    def counts(self):
+        """ Returns a DataFrame of the number of findings and of shaders with findings, by rule
+        """
+        rules = list(ShaderLint.RULES)
+        frame = pandas.DataFrame(self.findings, columns=['rule', 'shader'])
+        counts = pandas.DataFrame(collections.OrderedDict([
+            ('findings', frame.groupby('rule').size()),
+            ('shaders', frame.groupby('rule')['shader'].nunique()),
+        ]))
+        return counts.reindex(rules).fillna(0).astype(int)
+
+    def write(self, stream):
+        for finding in self.findings:
+            stream.write(json.dumps(finding) + '\n')
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse, sys
+    parser = argparse.ArgumentParser()
+    parser.add_argument('shader_dir', help='Directory of the shaders collected by ShaderCollector')
+    parser.add_argument('-j', '--processes', type=int, help='Number of worker processes, all the cores by default')
+    parser.add_argument('-r', '--rule', action='append', choices=list(ShaderLint.RULES),
+            help='Rule to run, all by default')
+    parser.add_argument('-o', '--output', help='File the findings are written to as JSON lines, standard output by default')
+
+    args = parser.parse_args()
+
+    linting = ShaderLinting(args.shader_dir, args.rule, args.processes)
+    if args.output:
+        with open(args.output, 'w') as output:
+            linting.write(output)
+        print(linting.counts().to_string())
+    else:
+        linting.write(sys.stdout)
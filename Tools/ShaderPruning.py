@@ -0,0 +1,73 @@
+import logging
+logger = logging.getLogger(__name__)
+
+import pandas, collections, os
+
+import ShaderPruner
+from ShaderPruner import SAVING_FIELDS
+from Tools.ShaderCollector import VERTEX_SHADER_SUFFIX, FRAGMENT_SHADER_SUFFIX
+from Tools.ShaderCorpus import corpus_files, program_shaders, parse_shader, map_files
+
+# Savings of ShaderPruner over the programs written by ShaderCollector, i.e.
+# the uniforms, samplers, attributes and varyings they declare but never use.
+
+def program_savings(filenames):
+    """ Returns the savings of pruning the program of (vertex shader file,
+        fragment shader file), as a tuple of SAVING_FIELDS, None when a
+        shader can not be parsed
+    """
+    parsers = []
+    for filename in filenames:
+        parser = parse_shader(filename, 'prune')
+        if parser is None:
+            return None
+        parsers.append(parser)
+    return tuple(ShaderPruner.savings(ShaderPruner.prune_program(*parsers)).values())
+
+class ShaderPruning(object):
+    """ Prunes the programs of a ShaderCollector directory, in worker
+        processes. savings holds one row of SAVING_FIELDS per program.
+    """
+
+    def __init__(self, directory, processes=None):
+        programs = program_shaders(corpus_files(directory)[1])
+        names = [name for name, stages in programs.items() if len(stages) == 2]
+        program_files = [(os.path.join(directory, programs[name][VERTEX_SHADER_SUFFIX]),
+            os.path.join(directory, programs[name][FRAGMENT_SHADER_SUFFIX])) for name in names]
+        results = map_files(program_savings, program_files, processes)
+
+        rows = [result or (None, ) * len(SAVING_FIELDS) for result in results]
+        self.savings = pandas.DataFrame(rows, index=names, columns=SAVING_FIELDS)
+
+    def report(self):
+        """ Returns the number of programs, of programs with something to
+            prune, and the total of each saving
+        """
+        savings = self.savings.dropna()
+        report = collections.OrderedDict([
+            ('programs', len(self.savings)),
+            ('unparsed_programs', len(self.savings) - len(savings)),
+            ('prunable_programs', int((savings.sum(axis=1) > 0).sum())),
+        ])
+        for field in SAVING_FIELDS:
+            report[field] = int(savings[field].sum())
+        return report
+
+if __name__ == '__main__':
+
+    logging.basicConfig(level=logging.INFO)
+
+    import argparse
+    parser = argparse.ArgumentParser()
+    parser.add_argument('shader_dir', help='Directory of the shaders collected by ShaderCollector')
+    parser.add_argument('-j', '--processes', type=int, help='Number of worker processes, all the cores by default')
+    parser.add_argument('-n', '--top', type=int, default=20, help='Number of programs listed')
+    parser.add_argument('-s', '--sort', choices=SAVING_FIELDS, default='uniform_components',
+            help='Saving the programs are listed by')
+
+    args = parser.parse_args()
+
+    pruning = ShaderPruning(args.shader_dir, args.processes)
+    for key, value in pruning.report().items():
+        print('%-20s %s' % (key, value))
+    print(pruning.savings.sort_values(args.sort, ascending=False).head(args.top).to_string())
@@ -1,15 +1,27 @@
 import logging
 logger = logging.getLogger(__name__)
 
-import pandas, collections
+import pandas, numpy, collections, array
 
 from GLESContext import TextureObject
 from GLESEnum import Enum
 
 class TextureCollector(object):
 
+    # attributes holding GL enums, kept as integers and decoded to names of their group on export
+    EnumAttributes = collections.OrderedDict([('type', 'TextureTarget'), ('internalformat', 'InternalFormat')])
+
     def __init__(self):
-        self.textures = pandas.DataFrame(columns=TextureObject.Attributes)
+        self.index = []
+        self.columns = collections.OrderedDict()
+        for attr in TextureObject.Attributes:
+            if attr in self.EnumAttributes:
+                self.columns[attr] = array.array('L')
+            else:
+                self.columns[attr] = []
+
+        # exported data frame, rebuilt when new records are collected
+        self._textures = None
 
     # next available index for each GLES name
     NextIndex = collections.defaultdict(int)
@@ -20,18 +32,39 @@ class TextureCollector(object):
         TextureCollector.NextIndex[gles_name] += 1
         return '%04d_%04d' % (gles_name, second_part)
 
+    @staticmethod
+    def decode_enum(value, group):
+        # 0 is no texture target nor format, rather than GL_FALSE
+        if value == 0 and value not in Enum.groups[group]:
+            return 'GL_NONE'
+        return Enum.name(value, group)
+
+    @staticmethod
+    def decode_enums(values, group):
+        # decode each distinct enum only once
+        codes, uniques = pandas.factorize(numpy.asarray(values, dtype=numpy.uint64))
+        return pandas.Categorical.from_codes(codes, [TextureCollector.decode_enum(int(value), group) for value in uniques])
+
+    @property
+    def textures(self):
+        if self._textures is None:
+            data = collections.OrderedDict()
+            for attr, values in self.columns.items():
+                if attr in self.EnumAttributes:
+                    data[attr] = self.decode_enums(values, self.EnumAttributes[attr])
+                else:
+                    data[attr] = values
+            self._textures = pandas.DataFrame(data, index=self.index, columns=TextureObject.Attributes)
+        return self._textures
+
     def collect(self, context):
         for tex_name, tex_obj in context.texture_objects.items():
             if not tex_obj.modified:
                 continue
 
-            tex_attrs = collections.OrderedDict()
-            for attr in TextureObject.Attributes:
-                attr_value = getattr(tex_obj, attr)
-                if attr in ['type', 'internalformat']:
-                    attr_value = Enum.names[attr_value]
-                tex_attrs[attr] = attr_value
+            self.index.append(self.generate_index(tex_name))
+            for attr, values in self.columns.items():
+                values.append(getattr(tex_obj, attr))
 
-            df = pandas.DataFrame(tex_attrs, index=[self.generate_index(tex_name)])
-            self.textures = self.textures.append(df)
+            self._textures = None
             tex_obj.modified = False
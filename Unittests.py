@@ -1,4 +1,5 @@
 import unittest, os
+from binascii import unhexlify
 
 from ShaderParser import ShaderParser
 from ShaderUtility import Preprocess
@@ -31,6 +32,31 @@ class GLESCallsPlayer(object):
                 for collector in self.collectors:
                     collector.collect(self.context)
 
+class TestGLESEnum(unittest.TestCase):
+
+    def test_lazy_tables(self):
+        from GLESEnum import EnumTable
+        enum = EnumTable()
+        self.assertEqual(enum._tables, None)
+        self.assertEqual(enum.GL_TEXTURE_2D, 0x0DE1)
+        self.assertNotEqual(enum._tables, None)
+        self.assertRaises(AttributeError, getattr, enum, 'GL_NOT_AN_ENUM')
+
+    def test_colliding_values(self):
+        self.assertEqual(Enum.GL_NONE, 0)
+        self.assertEqual(Enum.GL_POINTS, 0)
+        self.assertTrue('GL_NONE' in Enum.aliases(0))
+        self.assertTrue('GL_POINTS' in Enum.aliases(0))
+        self.assertEqual(Enum.name(Enum.GL_POINTS, 'PrimitiveType'), 'GL_POINTS')
+        self.assertEqual(Enum.name(Enum.GL_LINES, 'PrimitiveType'), 'GL_LINES')
+        self.assertEqual(Enum.name(Enum.GL_TEXTURE_2D_ARRAY, 'TextureTarget'), 'GL_TEXTURE_2D_ARRAY')
+
+    def test_canonical_names(self):
+        self.assertEqual(Enum.names[Enum.GL_RGB8], 'GL_RGB8')
+        self.assertEqual(Enum.aliases(Enum.GL_RGB8), ('GL_RGB8', 'GL_RGB8_OES'))
+        self.assertEqual(Enum.names[Enum.GL_VERTEX_SHADER], 'GL_VERTEX_SHADER')
+        self.assertEqual(Enum.aliases(Enum.GL_VERTEX_SHADER), ('GL_VERTEX_SHADER',))
+
 class TestPreprocessor(unittest.TestCase):
 
     def test_empty_shader(self):
@@ -151,6 +177,56 @@ void main()
         self.assertEqual(output, expected_output)
         self.assertEqual(version, 300)
 
+    def test_fast_path(self):
+        import ShaderUtility
+        input = '''#version 300 es
+/* no directive
+   in this shader */
+precision mediump float; // default precision
+uniform vec4 color; /* tint */ uniform float alpha;
+out vec4 frag_color;
+void main()
+{
+    frag_color = color * alpha; // 1.0 / 2.0
+}'''
+        self.assertFalse(ShaderUtility.NeedsPreprocessing(ShaderUtility.SplitVersion(input)[0]))
+        self.assertTrue(ShaderUtility.NeedsPreprocessing('#define X 1\n'))
+        self.assertTrue(ShaderUtility.NeedsPreprocessing('float a = \\\n1.0;'))
+        self.assertTrue(ShaderUtility.NeedsPreprocessing('bool es = GL_ES;'))
+
+        statistics = ShaderUtility.preprocess_statistics
+        statistics.reset()
+        sp = ShaderParser()
+        sp.parse(input)
+        self.assertEqual(statistics.report(), {'fast_path' : 1, 'cpp' : 0, 'fast_path_ratio' : 1.0})
+        self.assertEqual(sp.version, 300)
+        self.assertEqual(list(sp.uniform_variables.keys()), ['color', 'alpha'])
+        self.assertEqual(str(sp.function_definitions['main']), 'void main()\n{\n    frag_color = color * alpha;\n}')
+        self.assertEqual(sp.lexer.lexer.lineno, 10)
+
+        sp = ShaderParser()
+        sp.parse(input.replace('/* tint */', '/* tint */\n#define TINT\n'))
+        self.assertEqual(statistics.fast_path_ratio, 0.5)
+        self.assertEqual(list(sp.uniform_variables.keys()), ['color', 'alpha'])
+
+    def test_batch(self):
+        from ShaderUtility import PreprocessBatch
+        inputs = [
+            '#version 300 es\n#define FOO 2.0\nfloat x = FOO;\n',
+            'float y = FOO;',
+            '#undef GL_ES\n#ifdef GL_ES\nfloat z;\n#endif',
+            '',
+            '#ifdef GL_ES\n\n\nfloat w;\n#endif\n',
+        ]
+        expected = [Preprocess(input) for input in inputs]
+        self.assertEqual(expected[1], ('float y = FOO;', 100))
+        self.assertEqual(PreprocessBatch(inputs), expected)
+        self.assertEqual(PreprocessBatch(inputs, chunk_size=2), expected)
+
+        # an unterminated #if hides the next shaders, the chunk is redone one by one
+        inputs.insert(1, '#if 0\nfloat v;')
+        self.assertEqual(PreprocessBatch(inputs), [Preprocess(input) for input in inputs])
+
 class TestShaderVariables(unittest.TestCase):
 
     def test_varying(self):
@@ -292,6 +368,16 @@ class TestShaderVariables(unittest.TestCase):
         self.assertEqual(len(sp.function_definitions), 0)
 
         self.assertEqual(sp.to_str(), 'uniform highp vec4 bones[3 * 2];\nhighp float matrix[4][4];')
+        self.assertTrue('bones' in sp.uniform_variables)
+        self.assertEqual(len(sp.variable_declarations['matrix'].array_sizes), 2)
+
+    def test_multiple_declarators(self):
+        sp = ShaderParser()
+        sp.parse('uniform vec2 offset0, offset1, offset2;varying vec2 texcoord0, texcoord1;', fragment_shader=False)
+
+        self.assertEqual(list(sp.uniform_variables.keys()), ['offset0', 'offset1', 'offset2'])
+        self.assertEqual(list(sp.output_variables.keys()), ['texcoord0', 'texcoord1'])
+        self.assertEqual(sp.uniform_variables['offset2'].type_specifier, 'vec2')
 
     def test_const_variable_def(self):
         sp = ShaderParser()
@@ -515,6 +601,27 @@ class TestFunction(unittest.TestCase):
     return;
 }""")
 
+    def test_postfix_and_unary_expressions(self):
+        from ShaderParser import IndexExpression, FieldSelection, UnaryExpression
+        sp = ShaderParser()
+        sp.parse('''
+        void main()
+        {
+            color = -(a + b)[1].xy;
+            color = !colors[i].w;
+        }''', fragment_shader=False)
+
+        statements = sp.function_definitions['main'].compound_statements
+        negation = statements[0].right
+        self.assertTrue(isinstance(negation, UnaryExpression))
+        self.assertEqual(negation.op, '-')
+        self.assertTrue(isinstance(negation.operand, FieldSelection))
+        self.assertEqual(negation.operand.field, 'xy')
+        self.assertTrue(isinstance(negation.operand.base, IndexExpression))
+        self.assertEqual(negation.operand.base.index, '1')
+        self.assertEqual(str(statements[0]), 'color = -(a + b)[1].xy;')
+        self.assertEqual(str(statements[1]), 'color = !colors[i].w;')
+
     def test_function_with_return(self):
         sp = ShaderParser()
         sp.parse('vec3 calculate_normal( vec2 tc){return vec3(tc, 0.1);}', fragment_shader=False)
@@ -525,6 +632,302 @@ class TestFunction(unittest.TestCase):
 
         self.assertEqual(str(fun_def), 'vec3 calculate_normal(in vec2 tc)\n{\n    return vec3(tc, 0.1);\n}')
 
+class TestInterfaceOnly(unittest.TestCase):
+
+    SHADER = '''precision highp float;
+varying vec2 texcoord;
+uniform sampler2D texture_unit0;
+uniform vec4 colors[2];
+vec4 blend(vec4 a, vec4 b)
+{
+    if (a.w > 0.5)
+    {
+        precision lowp float;
+        return a;
+    }
+    return b;
+}
+precision mediump float;
+uniform float alpha;
+void main()
+{
+    gl_FragColor = blend(texture2D(texture_unit0, texcoord), colors[1]) * alpha;
+}'''
+
+    def test_same_interface(self):
+        full = ShaderParser()
+        full.parse(self.SHADER)
+        interface = ShaderParser()
+        interface.parse(self.SHADER, interface_only=True)
+
+        for attr in ('input_variables', 'output_variables', 'uniform_variables', 'variable_declarations'):
+            self.assertEqual([str(var) for var in getattr(interface, attr).values()],
+                [str(var) for var in getattr(full, attr).values()])
+        self.assertEqual(interface.default_precision_qualifier, full.default_precision_qualifier)
+        self.assertEqual(interface.uniform_variables['alpha'].precision_qualifier, 'mediump')
+        self.assertEqual(len(interface.function_definitions), 0)
+
+    def test_lazy_bodies(self):
+        full = ShaderParser()
+        full.parse(self.SHADER)
+        lazy = ShaderParser()
+        lazy.parse(self.SHADER, lazy=True)
+
+        self.assertEqual(list(lazy.function_definitions.keys()), ['blend', 'main'])
+        blend = lazy.function_definitions['blend']
+        main = lazy.function_definitions['main']
+        self.assertEqual(str(blend.function_prototype), 'vec4 blend(in vec4 a, in vec4 b)')
+        self.assertFalse(blend.is_parsed or main.is_parsed)
+
+        self.assertEqual(str(main), str(full.function_definitions['main']))
+        self.assertTrue(main.is_parsed)
+        self.assertFalse(blend.is_parsed)
+        self.assertEqual(lazy.to_str(), full.to_str())
+
+class TestFastShaderLexer(unittest.TestCase):
+
+    TEXT = '''a += b^=c /* two
+lines */ d // e
+ 1.5e3 .2 3. 12u 7 true <= >= == != && || !a; ~b[1].x
+'''
+
+    def tokens(self, lexer_class, text):
+        lexer = lexer_class()
+        lexer.build()
+        tokens = [(token.type, token.value, token.lineno, token.lexpos) for token in lexer.tokenize(text)]
+        return tokens, lexer.lexer.lineno
+
+    def test_same_tokens(self):
+        from ShaderLexer import ShaderLexer, FastShaderLexer
+        for text in (self.TEXT, TestInterfaceOnly.SHADER, '', '  \n\t'):
+            self.assertEqual(self.tokens(FastShaderLexer, text), self.tokens(ShaderLexer, text))
+        tokens, lineno = self.tokens(FastShaderLexer, self.TEXT)
+        self.assertEqual(lineno, 4)
+        self.assertEqual(tokens[:5], [('IDENTIFIER', 'a', 1, 0), ('PLUSEQUAL', '+=', 1, 2),
+            ('IDENTIFIER', 'b', 1, 5), ('XOR', '^', 1, 6), ('EQUALS', '=', 1, 7)])
+        self.assertEqual(tokens[6], ('IDENTIFIER', 'd', 2, 26))
+
+    def test_illegal_character(self):
+        from ply.lex import LexError
+        from ShaderLexer import FastShaderLexer
+        self.assertRaises(LexError, self.tokens, FastShaderLexer, 'a = b % c;')
+
+    def test_parse(self):
+        from ShaderLexer import FastShaderLexer
+        sp = ShaderParser()
+        sp.parse(TestInterfaceOnly.SHADER)
+        fast = ShaderParser(lexer_class=FastShaderLexer)
+        fast.parse(TestInterfaceOnly.SHADER)
+        self.assertEqual(fast.to_str(), sp.to_str())
+        fast = ShaderParser(lexer_class=FastShaderLexer)
+        fast.parse(TestInterfaceOnly.SHADER, lazy=True)
+        self.assertEqual(fast.to_str(), sp.to_str())
+
+class TestNodeInterner(unittest.TestCase):
+
+    SHADER = '''
+varying vec2 v_uv;
+uniform sampler2D u_tex;
+void main()
+{
+    gl_FragColor = texture2D(u_tex, v_uv) * 0.5 + texture2D(u_tex, v_uv) * 0.5;
+}'''
+
+    def test_shared_subtrees(self):
+        from ShaderParser import NodeInterner
+        interner = NodeInterner()
+
+        sp1 = ShaderParser(interner=interner)
+        sp1.parse(self.SHADER)
+        expression = sp1.function_definitions['main'].compound_statements[0].right
+        self.assertTrue(expression.left is expression.right)
+        self.assertTrue(expression.left.left.name == 'texture2D')
+        hits = interner.report()['hits']
+        self.assertTrue(hits > 0)
+
+        sp2 = ShaderParser(interner=interner)
+        sp2.parse(self.SHADER)
+        self.assertTrue(sp1.function_definitions['main'].compound_statements[0] is sp2.function_definitions['main'].compound_statements[0])
+        self.assertTrue(interner.report()['hits'] > hits)
+        self.assertTrue(interner.report()['saved_bytes'] > 0)
+        self.assertEqual(str(sp2.function_definitions['main']), str(sp1.function_definitions['main']))
+
+    def test_slots(self):
+        from ShaderParser import BinaryExpression
+        self.assertRaises(AttributeError, setattr, BinaryExpression('+', 'a', 'b'), 'anything', 1)
+
+class TestShaderCache(unittest.TestCase):
+
+    SHADER = TestInterfaceOnly.SHADER
+
+    def setUp(self):
+        import tempfile
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.directory)
+
+    def test_warm_parse(self):
+        from ShaderCache import ShaderCache
+        import ShaderUtility
+        cache = ShaderCache(self.directory)
+
+        cold = ShaderParser()
+        cold.parse(self.SHADER, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        # a hit neither preprocesses nor builds the yacc parser
+        preprocess = ShaderUtility.FastPreprocess
+        ShaderUtility.FastPreprocess = None
+        try:
+            # a miss does preprocess
+            self.assertRaises(TypeError, ShaderParser().parse, self.SHADER)
+            warm = ShaderParser()
+            warm.parse(self.SHADER, cache=cache)
+        finally:
+            ShaderUtility.FastPreprocess = preprocess
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertTrue(warm.parser is None)
+        self.assertEqual(warm.to_str(), cold.to_str())
+        self.assertEqual(list(warm.uniform_variables.keys()), ['texture_unit0', 'colors', 'alpha'])
+        self.assertEqual(warm.uniform_variables['alpha'].precision_qualifier, 'mediump')
+
+    def test_key(self):
+        from ShaderCache import ShaderCache
+        cache = ShaderCache(self.directory)
+
+        for fragment_shader, interface_only in ((True, True), (False, False)):
+            sp = ShaderParser()
+            sp.parse(self.SHADER, fragment_shader=fragment_shader, interface_only=interface_only, cache=cache)
+        self.assertEqual(cache.misses, 2)
+        key = cache.key(self.SHADER, True, ShaderParser.VERSION)
+        self.assertNotEqual(key, cache.key(self.SHADER, True, ShaderParser.VERSION + 1))
+        self.assertNotEqual(key, cache.key(self.SHADER + ' ', True, ShaderParser.VERSION))
+        self.assertTrue(cache.load(key) is None)
+
+class TestShaderPermutations(unittest.TestCase):
+
+    SHADER = '''#version 300 es
+precision mediump float;
+in vec2 uv;
+out vec4 color;
+uniform sampler2D base;
+#ifdef LIGHTING
+uniform vec3 light;
+#endif
+void main()
+{
+#if QUALITY > 1
+    color = texture(base, uv) * 2.0;
+#else
+    color = texture(base, uv);
+#endif
+}'''
+
+    MACROS = {'LIGHTING' : [None, 1], 'QUALITY' : [0, 1, 2]}
+
+    def test_expand(self):
+        import ShaderPermutations
+        results = ShaderPermutations.expand(self.SHADER, self.MACROS, processes=1)
+        self.assertEqual(list(results.keys())[:3], [(('QUALITY', 0), ), (('QUALITY', 1), ), (('QUALITY', 2), )])
+        self.assertEqual(len(results), 6)
+
+        # QUALITY 0 and 1 preprocess to the same shader
+        self.assertTrue(results[(('QUALITY', 0), )] is results[(('QUALITY', 1), )])
+        self.assertFalse(results[(('QUALITY', 1), )] is results[(('QUALITY', 2), )])
+        lit = results[(('LIGHTING', 1), ('QUALITY', 2))]
+        self.assertEqual(lit.version, 300)
+        self.assertEqual(list(lit.uniform_variables.keys()), ['base', 'light'])
+        self.assertEqual(str(lit.function_definitions['main'].compound_statements[0]), 'color = texture(base, uv) * 2.0;')
+
+        table = ShaderPermutations.table(results)
+        self.assertEqual(list(table['variant']), [0, 0, 1, 2, 2, 3])
+        self.assertEqual(list(table['uniforms']), [1, 1, 1, 2, 2, 2])
+
+        parallel = ShaderPermutations.expand(self.SHADER, self.MACROS, processes=2, chunk_size=2)
+        self.assertEqual([parser.to_str() for parser in parallel.values()],
+            [parser.to_str() for parser in results.values()])
+
+class TestShaderVisitor(unittest.TestCase):
+
+    SHADER = '''precision mediump float;
+varying vec2 v_uv;
+uniform sampler2D u_tex;
+void main()
+{
+    vec4 color = texture2D(u_tex, v_uv);
+    if (color.w < 0.5)
+        discard;
+    gl_FragColor = color * 2.0;
+}'''
+
+    def test_visit_order(self):
+        from ShaderVisitor import NodeVisitor
+
+        class Recorder(NodeVisitor):
+            def __init__(self):
+                NodeVisitor.__init__(self)
+                self.events = []
+            def pre_any(self, node):
+                self.events.append('pre ' + type(node).__name__)
+            def post_any(self, node):
+                self.events.append('post ' + type(node).__name__)
+            def pre_str(self, value):
+                self.events.append(value)
+            def post_str(self, value):
+                pass
+            def pre_IfStatement(self, node):
+                self.events.append('if in ' + type(self.path[-1]).__name__)
+                return False
+
+        sp = ShaderParser()
+        sp.parse(self.SHADER)
+        recorder = Recorder()
+        recorder.visit(sp.function_definitions['main'].compound_statements)
+        self.assertEqual(recorder.events, [
+            'pre CompoundStatement',
+            'pre VariableDeclaration', 'pre FunctionCall', 'texture2D', 'u_tex', 'v_uv', 'post FunctionCall', 'post VariableDeclaration',
+            'if in CompoundStatement', 'post IfStatement',
+            'pre AssignmentExpression', 'gl_FragColor', 'pre BinaryExpression', 'color', '2.0', 'post BinaryExpression', 'post AssignmentExpression',
+            'post CompoundStatement'])
+        self.assertEqual(recorder.path, [])
+
+    def test_transform(self):
+        from ShaderVisitor import NodeTransformer, REMOVE
+
+        class Rewriter(NodeTransformer):
+            def post_str(self, value):
+                return 'final_color' if value == 'color' else value
+            def post_IfStatement(self, node):
+                return REMOVE
+
+        sp = ShaderParser()
+        sp.parse(self.SHADER)
+        main = sp.function_definitions['main']
+        self.assertTrue(Rewriter().transform(main) is main)
+        self.assertEqual(str(main), '''void main()
+{
+    vec4 color = texture2D(u_tex, v_uv);
+    gl_FragColor = final_color * 2.0;
+}''')
+
+    def test_deep_expression(self):
+        import sys
+        terms = sys.getrecursionlimit() * 2
+        sp = ShaderParser()
+        sp.parse('void main() { x = %s; }' % ' + '.join(['a'] * terms))
+        source = str(sp.function_definitions['main'])
+        self.assertEqual(source.count('a'), terms + 1)
+        self.assertTrue(source.startswith('void main()\n{\n    x = ((('))
+
+    def test_emit_operands(self):
+        from ShaderVisitor import to_source
+        sp = ShaderParser()
+        sp.parse('void main() { x = (a = b).x + (-c).y * (a + b)[0] - -(a = b); }')
+        self.assertEqual(to_source(sp.function_definitions['main'].compound_statements[0].right),
+            '((a = b).x + ((-c).y * (a + b)[0])) - -(a = b)')
+
 class TestTextures(unittest.TestCase):
 
     def test_pixel_store(self):
@@ -724,7 +1127,7 @@ class TestTextures(unittest.TestCase):
         tex_obj.modified = False
 
         # set level 1 with data
-        gles.glTexSubImage2D(Enum.GL_TEXTURE_2D, 1, 0, 0, 1, 1, Enum.GL_RGB, Enum.GL_UNSIGNED_SHORT_5_5_5_1, 'FFFF'.decode('hex'))
+        gles.glTexSubImage2D(Enum.GL_TEXTURE_2D, 1, 0, 0, 1, 1, Enum.GL_RGB, Enum.GL_UNSIGNED_SHORT_5_5_5_1, unhexlify('FFFF'))
         self.assertEqual(tex_obj.type, Enum.GL_TEXTURE_2D)
         self.assertEqual(tex_obj.mipmap, True)
         self.assertEqual(tex_obj.internalformat, Enum.GL_RGB5_A1)
@@ -741,7 +1144,7 @@ class TestTextures(unittest.TestCase):
 
         # try to set the data for a cubemap texture
         gles.glBindTexture(Enum.GL_TEXTURE_CUBE_MAP, 2)
-        gles.glTexImage2D(Enum.GL_TEXTURE_CUBE_MAP_POSITIVE_X, 0, Enum.GL_RGB565, 1, 1, 0, Enum.GL_RGB, Enum.GL_UNSIGNED_SHORT_5_6_5, '0000'.decode('hex'))
+        gles.glTexImage2D(Enum.GL_TEXTURE_CUBE_MAP_POSITIVE_X, 0, Enum.GL_RGB565, 1, 1, 0, Enum.GL_RGB, Enum.GL_UNSIGNED_SHORT_5_6_5, unhexlify('0000'))
         tex_obj = gles.GetBoundTexture(Enum.GL_TEXTURE_CUBE_MAP)
         self.assertEqual(tex_obj.type, Enum.GL_TEXTURE_CUBE_MAP)
         self.assertEqual(tex_obj.mipmap, False)
@@ -789,7 +1192,7 @@ class TestTextures(unittest.TestCase):
         tex_obj.modified = False
 
         # set level 1 with data
-        gles.glTexSubImage3D(Enum.GL_TEXTURE_2D_ARRAY, 1, 0, 0, 1, 1, 1, 1, Enum.GL_RGB, Enum.GL_UNSIGNED_SHORT_5_5_5_1, 'FFFF'.decode('hex'))
+        gles.glTexSubImage3D(Enum.GL_TEXTURE_2D_ARRAY, 1, 0, 0, 1, 1, 1, 1, Enum.GL_RGB, Enum.GL_UNSIGNED_SHORT_5_5_5_1, unhexlify('FFFF'))
         self.assertEqual(tex_obj.type, Enum.GL_TEXTURE_2D_ARRAY)
         self.assertEqual(tex_obj.mipmap, True)
         self.assertEqual(tex_obj.internalformat, Enum.GL_RGB5_A1)
@@ -806,7 +1209,7 @@ class TestTextures(unittest.TestCase):
 
         # try to set the data for a 3D texture
         gles.glBindTexture(Enum.GL_TEXTURE_3D, 2)
-        gles.glTexImage3D(Enum.GL_TEXTURE_3D, 0, Enum.GL_RGB565, 1, 1, 1, 0, Enum.GL_RGB, Enum.GL_UNSIGNED_SHORT_5_6_5, '0000'.decode('hex'))
+        gles.glTexImage3D(Enum.GL_TEXTURE_3D, 0, Enum.GL_RGB565, 1, 1, 1, 0, Enum.GL_RGB, Enum.GL_UNSIGNED_SHORT_5_6_5, unhexlify('0000'))
         tex_obj = gles.GetBoundTexture(Enum.GL_TEXTURE_3D)
         self.assertEqual(tex_obj.type, Enum.GL_TEXTURE_3D)
         self.assertEqual(tex_obj.mipmap, False)
@@ -854,7 +1257,7 @@ class TestTextures(unittest.TestCase):
         tex_obj.modified = False
 
         # set level 1 with data
-        gles.glCompressedTexSubImage2D(Enum.GL_TEXTURE_2D, 1, 0, 0, 1, 1, Enum.GL_ETC1_RGB8_OES, 8, 'FFFF0000FFFF0000'.decode('hex'))
+        gles.glCompressedTexSubImage2D(Enum.GL_TEXTURE_2D, 1, 0, 0, 1, 1, Enum.GL_ETC1_RGB8_OES, 8, unhexlify('FFFF0000FFFF0000'))
         self.assertEqual(tex_obj.type, Enum.GL_TEXTURE_2D)
         self.assertEqual(tex_obj.mipmap, True)
         self.assertEqual(tex_obj.internalformat, Enum.GL_ETC1_RGB8_OES)
@@ -871,7 +1274,7 @@ class TestTextures(unittest.TestCase):
 
         # try to set the data for a cubemap texture
         gles.glBindTexture(Enum.GL_TEXTURE_CUBE_MAP, 2)
-        gles.glCompressedTexImage2D(Enum.GL_TEXTURE_CUBE_MAP_POSITIVE_X, 0, Enum.GL_COMPRESSED_RGB8_ETC2, 1, 1, 0, 8, '0000111122223333'.decode('hex'))
+        gles.glCompressedTexImage2D(Enum.GL_TEXTURE_CUBE_MAP_POSITIVE_X, 0, Enum.GL_COMPRESSED_RGB8_ETC2, 1, 1, 0, 8, unhexlify('0000111122223333'))
         tex_obj = gles.GetBoundTexture(Enum.GL_TEXTURE_CUBE_MAP)
         self.assertEqual(tex_obj.type, Enum.GL_TEXTURE_CUBE_MAP)
         self.assertEqual(tex_obj.mipmap, False)
@@ -919,7 +1322,7 @@ class TestTextures(unittest.TestCase):
         tex_obj.modified = False
 
         # set level 1 with data
-        gles.glCompressedTexSubImage3D(Enum.GL_TEXTURE_2D_ARRAY, 1, 0, 0, 1, 1, 1, 1, Enum.GL_ETC1_RGB8_OES, 8, 'FFFF222233338888'.decode('hex'))
+        gles.glCompressedTexSubImage3D(Enum.GL_TEXTURE_2D_ARRAY, 1, 0, 0, 1, 1, 1, 1, Enum.GL_ETC1_RGB8_OES, 8, unhexlify('FFFF222233338888'))
         self.assertEqual(tex_obj.type, Enum.GL_TEXTURE_2D_ARRAY)
         self.assertEqual(tex_obj.mipmap, True)
         self.assertEqual(tex_obj.internalformat, Enum.GL_ETC1_RGB8_OES)
@@ -936,7 +1339,7 @@ class TestTextures(unittest.TestCase):
 
         # try to set the data for a 3D texture
         gles.glBindTexture(Enum.GL_TEXTURE_3D, 2)
-        gles.glCompressedTexImage3D(Enum.GL_TEXTURE_3D, 0, Enum.GL_COMPRESSED_RGBA8_ETC2_EAC, 1, 1, 1, 0, 16, ('00' * 16).decode('hex'))
+        gles.glCompressedTexImage3D(Enum.GL_TEXTURE_3D, 0, Enum.GL_COMPRESSED_RGBA8_ETC2_EAC, 1, 1, 1, 0, 16, unhexlify('00' * 16))
         tex_obj = gles.GetBoundTexture(Enum.GL_TEXTURE_3D)
         self.assertEqual(tex_obj.type, Enum.GL_TEXTURE_3D)
         self.assertEqual(tex_obj.mipmap, False)
@@ -959,7 +1362,7 @@ class TestTextures(unittest.TestCase):
         # create a 2D array texture
         calls = [
             ('glBindTexture', (Enum.GL_TEXTURE_2D_ARRAY, 1)),
-            ('glCompressedTexImage2D', (Enum.GL_TEXTURE_2D_ARRAY, 0, Enum.GL_COMPRESSED_RGB8_ETC2, 1, 1, 0, 8, '0000111122223333'.decode('hex'))),
+            ('glCompressedTexImage2D', (Enum.GL_TEXTURE_2D_ARRAY, 0, Enum.GL_COMPRESSED_RGB8_ETC2, 1, 1, 0, 8, unhexlify('0000111122223333'))),
             ('glDrawArrays', (Enum.GL_LINES, 1, 100)),
         ]
         call_replayer.play_calls(calls)
@@ -976,6 +1379,14 @@ class TestTextures(unittest.TestCase):
         self.assertEqual(tc.textures.mipmap['0001_0000'], False)
         self.assertEqual(tc.textures.initialized['0001_0000'], True)
 
+        # enums are recorded as integers and only decoded on export
+        self.assertEqual(tc.columns['type'][0], Enum.GL_TEXTURE_2D_ARRAY)
+        self.assertEqual(tc.columns['internalformat'][0], Enum.GL_COMPRESSED_RGB8_ETC2)
+        # decoded by the group of the column
+        self.assertEqual(list(TextureCollector.decode_enums([Enum.GL_COMPRESSED_RGBA_ASTC_4x4_KHR, 0], 'InternalFormat')),
+            ['GL_COMPRESSED_RGBA_ASTC_4x4', 'GL_NONE'])
+        self.assertEqual(list(TextureCollector.decode_enums([Enum.GL_TEXTURE_2D, 0], 'TextureTarget')), ['GL_TEXTURE_2D', 'GL_NONE'])
+
         # create a mipmapped but empty cubemap texture
         calls = [
             ('glBindTexture', (Enum.GL_TEXTURE_CUBE_MAP, 3)),
@@ -999,7 +1410,7 @@ class TestTextures(unittest.TestCase):
         # modify the cubemap texture
         calls = [
             ('glBindTexture', (Enum.GL_TEXTURE_CUBE_MAP, 3)),
-            ('glTexSubImage2D', (Enum.GL_TEXTURE_CUBE_MAP_POSITIVE_X, 1, 0, 0, 1, 1, Enum.GL_RGB, Enum.GL_UNSIGNED_BYTE, '001122'.decode('hex'))),
+            ('glTexSubImage2D', (Enum.GL_TEXTURE_CUBE_MAP_POSITIVE_X, 1, 0, 0, 1, 1, Enum.GL_RGB, Enum.GL_UNSIGNED_BYTE, unhexlify('001122'))),
             ('glDrawArrays', (Enum.GL_LINES, 1, 100)),
         ]
         call_replayer.play_calls(calls)
@@ -1205,6 +1616,739 @@ void main()
 }'''
 ]
 
+class ShaderCorpusTestCase(unittest.TestCase):
+    """ Test case writing ShaderCollector directories, removed after each test
+    """
+
+    def make_corpus(self, shaders, programs=()):
+        """ Returns a temporary directory of the (name, source) shaders and
+            the (target, link) program links
+        """
+        import tempfile, shutil
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        for name, source in shaders:
+            with open(os.path.join(directory, name), 'w') as f:
+                f.write(source)
+        for target, link in programs:
+            os.symlink(target, os.path.join(directory, link))
+        return directory
+
+class TestShaderIndex(ShaderCorpusTestCase):
+
+    VERTEX_SHADER = '''attribute vec4 position;
+attribute vec2 texcoord;
+uniform highp mat4 mvp;
+varying vec2 v_texcoord;
+varying vec4 v_shadow;
+void main()
+{
+    gl_Position = mvp * position;
+}'''
+
+    FRAGMENT_SHADER = '''precision mediump float;
+varying vec2 v_texcoord;
+varying vec4 v_shadow;
+uniform sampler2D u_shadowMap;
+vec4 shade(vec4 color)
+{
+    return color;
+}
+void main()
+{
+    gl_FragColor = shade(texture2D(u_shadowMap, v_texcoord));
+}'''
+
+    def setUp(self):
+        self.directory = self.make_corpus((('0001_0000.vertex', self.VERTEX_SHADER), ('0002_0000.fragment', self.FRAGMENT_SHADER)),
+            (('0001_0000.vertex', '0003_0000.vertex'), ('0002_0000.fragment', '0003_0000.fragment')))
+
+    def write(self, name, source):
+        with open(os.path.join(self.directory, name), 'w') as f:
+            f.write(source)
+
+    def test_lookup(self):
+        from Tools.ShaderIndex import ShaderIndex
+        index = ShaderIndex(os.path.join(self.directory, 'index.db'))
+        self.assertEqual(index.update(self.directory, processes=1), 2)
+
+        self.assertEqual(index.lookup(name='u_shadowMap'), ['0002_0000.fragment'])
+        self.assertEqual(index.lookup(name='v_texcoord', kind='varying'), ['0001_0000.vertex', '0002_0000.fragment'])
+        self.assertEqual(index.lookup(kind='attribute', type='vec2'), ['0001_0000.vertex'])
+        self.assertEqual(index.lookup(name='mvp', precision='highp'), ['0001_0000.vertex'])
+        self.assertEqual(index.lookup(name='shade', kind='function', type='vec4'), ['0002_0000.fragment'])
+        self.assertEqual(index.lookup(name='u_shadowMap', kind='attribute'), [])
+        self.assertEqual(index.counts('varying'), {'0001_0000.vertex' : 2, '0002_0000.fragment' : 2})
+        self.assertEqual(index.programs_with('varying', 1), ['0003_0000'])
+        self.assertEqual(index.programs_with('varying', 2), [])
+        index.close()
+
+    def test_incremental_update(self):
+        from Tools.ShaderIndex import ShaderIndex
+        path = os.path.join(self.directory, 'index.db')
+        index = ShaderIndex(path)
+        index.update(self.directory, processes=1)
+        self.assertEqual(index.update(self.directory, processes=1), 0)
+        index.close()
+
+        # a new shader and a removed one
+        self.write('0004_0000.fragment', self.FRAGMENT_SHADER.replace('u_shadowMap', 'u_lightMap'))
+        os.remove(os.path.join(self.directory, '0002_0000.fragment'))
+        index = ShaderIndex(path)
+        self.assertEqual(index.update(self.directory, processes=1), 1)
+        self.assertEqual(index.lookup(name='u_shadowMap'), [])
+        self.assertEqual(index.lookup(name='u_lightMap'), ['0004_0000.fragment'])
+        self.assertEqual(index.lookup(name='v_texcoord'), ['0001_0000.vertex', '0004_0000.fragment'])
+        index.close()
+
+    def test_syntax_error(self):
+        from Tools.ShaderIndex import ShaderIndex
+        for source in ('void main() { x = 1.0;', 'uniform float a', 'float f('):
+            self.assertRaises(SyntaxError, ShaderParser().parse, source)
+        # an unparsed shader is indexed without symbols
+        self.write('0004_0000.fragment', self.FRAGMENT_SHADER[:-1])
+        index = ShaderIndex(os.path.join(self.directory, 'index.db'))
+        self.assertEqual(index.update(self.directory, processes=2), 3)
+        self.assertEqual(index.lookup(name='v_texcoord'), ['0001_0000.vertex', '0002_0000.fragment'])
+        index.close()
+
+class TestShaderFingerprint(ShaderCorpusTestCase):
+
+    FRAGMENT_SHADER = TestShaderIndex.FRAGMENT_SHADER
+
+    # FRAGMENT_SHADER reformatted, commented, renamed and reordered
+    RENAMED_SHADER = '''precision mediump float;
+uniform sampler2D shadows; // shadow map
+varying vec4 shadowCoord;
+varying vec2 uv;
+vec4 tint(vec4 c) { return c; }
+void main() { gl_FragColor = tint(texture2D(shadows, uv)); }'''
+
+    def fingerprint(self, source):
+        import ShaderFingerprint
+        parser = ShaderParser()
+        parser.parse(source)
+        return ShaderFingerprint.fingerprint(parser)
+
+    def test_fingerprint(self):
+        self.assertEqual(self.fingerprint(self.FRAGMENT_SHADER), self.fingerprint(self.RENAMED_SHADER))
+        self.assertNotEqual(self.fingerprint(self.FRAGMENT_SHADER),
+            self.fingerprint(self.RENAMED_SHADER.replace('return c;', 'return c * 0.5;')))
+        # the built-in functions are not renamed
+        self.assertNotEqual(self.fingerprint(self.FRAGMENT_SHADER),
+            self.fingerprint(self.FRAGMENT_SHADER.replace('texture2D', 'texture2DProj')))
+
+    def test_precision(self):
+        source = '''precision highp float;
+varying mediump vec2 uv;
+void main() { float t = uv.x * 3.0; gl_FragColor = vec4(t); }'''
+        # the precision of t is the default one
+        self.assertNotEqual(self.fingerprint(source), self.fingerprint(source.replace('highp', 'lowp')))
+        self.assertEqual(self.fingerprint(source), self.fingerprint(source.replace('vec2 uv', 'vec2 st').replace('uv.x', 'st.x')))
+
+    def test_clusters(self):
+        from Tools.ShaderClusters import ShaderClusters, shader_fingerprint
+        directory = self.make_corpus((('0001_0000.vertex', TestShaderIndex.VERTEX_SHADER),
+            ('0002_0000.fragment', self.FRAGMENT_SHADER), ('0003_0000.fragment', self.RENAMED_SHADER)),
+            (('0001_0000.vertex', '0004_0000.vertex'), ('0002_0000.fragment', '0004_0000.fragment'),
+            ('0001_0000.vertex', '0005_0000.vertex'), ('0003_0000.fragment', '0005_0000.fragment')))
+
+        clusters = ShaderClusters(directory, processes=1)
+        report = clusters.report()
+        self.assertEqual(report['shaders'], 3)
+        self.assertEqual(report['clusters'], 2)
+        self.assertEqual(report['duplicate_shaders'], 1)
+        self.assertEqual(report['duplicate_source_bytes'], len(self.RENAMED_SHADER))
+        self.assertEqual(report['programs'], 2)
+        self.assertEqual(report['duplicate_programs'], 1)
+        self.assertEqual(clusters.clusters['shaders'][0], ['0002_0000.fragment', '0003_0000.fragment'])
+        # a shader ending in the middle of its body is logged as unparsed
+        truncated = os.path.join(directory, '0009_0000.fragment')
+        with open(truncated, 'w') as f:
+            f.write(self.FRAGMENT_SHADER[:-1])
+        self.assertEqual(shader_fingerprint(truncated), ('fragment', None, len(self.FRAGMENT_SHADER) - 1))
+
+class TestShaderCost(ShaderCorpusTestCase):
+
+    FRAGMENT_SHADER = '''precision mediump float;
+uniform sampler2D u_tex;
+uniform highp mat4 u_mat;
+uniform vec4 u_color;
+varying vec2 v_uv;
+vec4 shade(vec4 color, float k)
+{
+    if (k > 0.5)
+        discard;
+    return color * sin(k);
+}
+void main()
+{
+    vec4 c = texture2D(u_tex, v_uv);
+    vec4 p = u_mat * c;
+    float d = dot(p.xyz, u_color.xyz);
+    gl_FragColor = shade(c, d) + shade(p, 1.0);
+}'''
+
+    def test_shader_cost(self):
+        import ShaderCost
+        parser = ShaderParser()
+        parser.parse(self.FRAGMENT_SHADER)
+        cost = ShaderCost.shader_cost(parser)
+        # main : mat4 * vec4 (16), dot of vec3 (3), vec4 + (4), shade twice : float > (1), vec4 * float (4)
+        self.assertEqual(list(cost.items()), [('alu', 33), ('texture', 1), ('branch', 2), ('discard', 2), ('transcendental', 2)])
+        self.assertEqual(ShaderCost.shader_cost(parser, entry='shade')['alu'], 5)
+
+    def test_texture_size(self):
+        import ShaderCost, ShaderLint
+        parser = ShaderParser()
+        parser.parse('''#version 300 es
+precision mediump float;
+uniform sampler2D u_tex;
+out vec4 color;
+void main()
+{
+    vec2 size = vec2(textureSize(u_tex, 0));
+    color = texture(u_tex, size * 0.5);
+}''')
+        # only texture samples
+        self.assertEqual(ShaderCost.shader_cost(parser)['texture'], 1)
+        self.assertEqual([finding['source'] for finding in ShaderLint.lint(parser, rules=['dependent-texture-read'])],
+            ['texture(u_tex, size * 0.5)'])
+
+    def test_ranking(self):
+        from Tools.ShaderCostRanking import ShaderCostRanking, shader_cost
+        from ShaderCost import COST_FIELDS
+        directory = self.make_corpus((('0001_0000.vertex', TestShaderIndex.VERTEX_SHADER),
+            ('0002_0000.fragment', TestShaderIndex.FRAGMENT_SHADER), ('0003_0000.fragment', self.FRAGMENT_SHADER)),
+            (('0001_0000.vertex', '0004_0000.vertex'), ('0002_0000.fragment', '0004_0000.fragment'),
+            ('0001_0000.vertex', '0005_0000.vertex'), ('0003_0000.fragment', '0005_0000.fragment')))
+
+        ranking = ShaderCostRanking(directory, processes=1)
+        self.assertEqual(list(ranking.ranked_shaders().index), ['0003_0000.fragment', '0001_0000.vertex', '0002_0000.fragment'])
+        programs = ranking.ranked_programs()
+        self.assertEqual(list(programs.index), ['0005_0000', '0004_0000'])
+        # mat4 * vec4 in the vertex shader, one texture fetch in the fragment shader
+        self.assertEqual(list(programs.loc['0004_0000', ['alu', 'texture']]), [16, 1])
+        # a shader ending in the middle of its body is logged as unparsed
+        truncated = os.path.join(directory, '0009_0000.fragment')
+        with open(truncated, 'w') as f:
+            f.write(self.FRAGMENT_SHADER[:-1])
+        self.assertEqual(shader_cost(truncated)[1:], (None, ) * len(COST_FIELDS))
+        self.assertEqual(programs.loc['0004_0000', 'score'], 24)
+        self.assertEqual(ranking.program_costs(fragment_weight=2).loc['0005_0000', 'alu'], 16 + 2 * 33)
+
+class TestShaderPrecision(unittest.TestCase):
+
+    FRAGMENT_SHADER = '''precision highp float;
+uniform sampler2D u_tex;
+uniform vec4 u_scale;
+varying vec2 v_uv;
+varying vec2 v_world;
+vec4 tint(vec4 color)
+{
+    return color * 0.5;
+}
+void main()
+{
+    vec4 base = texture2D(u_tex, v_uv.xy);
+    vec3 n = normalize(base.xyz * 2.0 - 1.0);
+    float fog = clamp(v_world.x, 0.0, 1.0);
+    vec4 scaled = base * u_scale;
+    vec4 grow = base;
+    grow = grow * 2.0;
+    if (fog > 0.5)
+        grow = grow * 4.0;
+    gl_FragColor = tint(mix(base, scaled, fog)) + vec4(n, 1.0) + grow;
+}'''
+
+    def test_audit(self):
+        import ShaderPrecision
+        parser = ShaderParser()
+        parser.parse(self.FRAGMENT_SHADER)
+        findings = [(function, declaration.name, bound, reason) for function, declaration, bound, reason in ShaderPrecision.audit(parser)]
+        # v_world is not only a texture coordinate, scaled depends on a uniform, grow reaches 8
+        self.assertEqual(findings, [(None, 'v_uv', float('inf'), 'texcoord'),
+            ('main', 'base', 1.0, 'range'), ('main', 'n', 1.0, 'range'), ('main', 'fog', 1.0, 'range')])
+
+        bounds, texcoords = ShaderPrecision.value_bounds(parser)
+        self.assertEqual(bounds[('return', 'tint')], 0.5 * ShaderPrecision.UNBOUNDED)
+
+    def test_lower_precision(self):
+        import ShaderPrecision
+        parser = ShaderParser()
+        parser.parse(self.FRAGMENT_SHADER)
+        source = ShaderPrecision.lower_precision(parser)
+        self.assertTrue('varying mediump vec2 v_uv;' in source)
+        self.assertTrue('mediump vec4 base = texture2D(u_tex, v_uv.xy);' in source)
+        self.assertTrue('vec4 grow = base;' in source)
+        # the AST is left untouched
+        self.assertEqual(parser.input_variables['v_uv'].precision_qualifier, 'highp')
+
+        lowered = ShaderParser()
+        lowered.parse(source)
+        self.assertEqual(lowered.input_variables['v_uv'].precision_qualifier, 'mediump')
+        self.assertEqual(ShaderPrecision.audit(lowered), [])
+
+    def test_precision_statements(self):
+        import ShaderPrecision
+        source = '''precision highp float;
+uniform float u_scale;
+float big(float x)
+{
+    float y = x * u_scale;
+    return y;
+}
+precision mediump float;
+void main()
+{
+    float c = 0.5;
+    {
+        precision highp float;
+        float d = 0.25;
+        c = c + d;
+    }
+    gl_FragColor = vec4(big(c));
+}'''
+        parser = ShaderParser()
+        parser.parse(source)
+        # c is mediump already, d is highp in its block
+        self.assertEqual([(function, declaration.name) for function, declaration, bound, reason in ShaderPrecision.audit(parser)],
+            [('main', 'd')])
+        lowered = ShaderParser()
+        lowered.parse(ShaderPrecision.lower_precision(parser))
+        # big keeps its highp parameter, local and return value
+        self.assertEqual(lowered.function_precision_qualifiers['big']['float'], 'highp')
+        self.assertEqual(lowered.function_precision_qualifiers['main']['float'], 'mediump')
+        self.assertEqual(ShaderPrecision.audit(lowered), [])
+
+    def test_out_parameters(self):
+        import ShaderPrecision
+        parser = ShaderParser()
+        parser.parse('''precision highp float;
+uniform float u_scale;
+void big(out float x) { x = 1000.0 * u_scale; }
+void halve(inout float x) { x = x * 0.5; }
+void main()
+{
+    float c = 0.5;
+    big(c);
+    float d = 0.5;
+    halve(d);
+    gl_FragColor = vec4(c, d, 0.0, 1.0);
+}''')
+        # c is written through the out parameter of big
+        self.assertEqual([(declaration.name, bound) for function, declaration, bound, reason in ShaderPrecision.audit(parser)],
+            [('d', 0.5)])
+
+class TestShaderPruner(ShaderCorpusTestCase):
+
+    VERTEX_SHADER = '''attribute vec4 position;
+attribute vec2 texcoord;
+attribute vec3 normal;
+uniform mat4 mvp;
+uniform mat3 u_normalMatrix;
+uniform vec4 u_unused[4];
+varying vec2 v_uv;
+varying vec3 v_normal;
+vec3 transform(vec3 n)
+{
+    return u_normalMatrix * n;
+}
+void main()
+{
+    gl_Position = mvp * position;
+    v_uv = texcoord;
+    v_normal = transform(normal);
+}'''
+
+    FRAGMENT_SHADER = '''precision mediump float;
+uniform sampler2D u_tex;
+uniform sampler2D u_unusedMap;
+uniform vec4 u_tint;
+varying vec2 v_uv;
+varying vec3 v_normal;
+vec4 unused(vec4 c)
+{
+    return c * u_tint;
+}
+void main()
+{
+    gl_FragColor = texture2D(u_tex, v_uv);
+}'''
+
+    def parse(self, source, fragment_shader):
+        parser = ShaderParser()
+        parser.parse(source, fragment_shader=fragment_shader)
+        return parser
+
+    def test_prune_shader(self):
+        import ShaderPruner
+        pruner = ShaderPruner.ShaderPruner(self.parse(self.FRAGMENT_SHADER, True))
+        self.assertEqual(list(pruner.variables), ['u_tex', 'v_uv'])
+        self.assertEqual(pruner.removed_functions, ['unused'])
+        self.assertEqual([var.name for var in pruner.removed_variables], ['u_unusedMap', 'u_tint', 'v_normal'])
+
+        pruned = self.parse(pruner.source(), True)
+        self.assertEqual(list(pruned.variable_declarations), ['u_tex', 'v_uv'])
+        self.assertEqual(list(pruned.function_definitions), ['main'])
+
+    def test_prune_program(self):
+        import ShaderPruner
+        vertex_parser = self.parse(self.VERTEX_SHADER, False)
+        vertex, fragment = ShaderPruner.prune_program(vertex_parser, self.parse(self.FRAGMENT_SHADER, True))
+        # v_normal is not read, so neither its computation nor its inputs are needed
+        self.assertEqual(list(vertex.variables), ['position', 'texcoord', 'mvp', 'v_uv'])
+        self.assertEqual(vertex.removed_functions, ['transform'])
+        self.assertFalse('v_normal' in vertex.source())
+        # the parser is left untouched
+        self.assertEqual(len(vertex_parser.function_definitions['main'].compound_statements), 3)
+
+        self.assertEqual(list(ShaderPruner.savings([vertex, fragment]).items()), [('uniforms', 3),
+            ('uniform_components', 9 + 16 + 4), ('samplers', 1), ('attributes', 1),
+            ('varyings', 1), ('varying_components', 3), ('functions', 2)])
+
+    def test_side_effects(self):
+        import ShaderPruner
+        vertex_source = self.VERTEX_SHADER.replace('return u_normalMatrix * n;', 'v_uv = n.xy;\n    return n;')
+        vertex, fragment = ShaderPruner.prune_program(self.parse(vertex_source, False), self.parse(self.FRAGMENT_SHADER, True))
+        self.assertEqual(vertex.removed_functions, [])
+        self.assertTrue('v_normal = transform(normal);' in vertex.source())
+
+    def test_nested_assignment(self):
+        import ShaderPruner
+        vertex_source = '''attribute vec2 texcoord;
+varying vec2 v_uv;
+varying vec3 v_normal;
+void main()
+{
+    float i = 0.0;
+    v_normal = vec3(i += 1.0);
+    v_uv = texcoord * i;
+}'''
+        vertex, fragment = ShaderPruner.prune_program(self.parse(vertex_source, False), self.parse(self.FRAGMENT_SHADER, True))
+        # v_normal is dead, but its assignment increments i
+        self.assertTrue('v_normal = vec3(i += 1.0);' in vertex.source())
+
+    def test_read_back_output(self):
+        import ShaderPruner
+        vertex_source = '''attribute vec4 a_pos;
+uniform mat4 u_mvp;
+varying vec4 v_pos;
+void main()
+{
+    v_pos = u_mvp * a_pos;
+    gl_Position = v_pos;
+}'''
+        pruners = ShaderPruner.prune_program(self.parse(vertex_source, False), self.parse(self.FRAGMENT_SHADER, True))
+        # v_pos is not read by the fragment shader, but still computes gl_Position
+        self.assertEqual(list(pruners[0].variables), ['a_pos', 'u_mvp', 'v_pos'])
+        self.assertTrue('v_pos = u_mvp * a_pos;' in pruners[0].source())
+        savings = ShaderPruner.savings(pruners)
+        self.assertEqual((savings['attributes'], savings['uniform_components']), (0, 4))
+
+    def test_pruning(self):
+        from Tools.ShaderPruning import ShaderPruning, program_savings
+        directory = self.make_corpus((('0001_0000.vertex', self.VERTEX_SHADER), ('0002_0000.fragment', self.FRAGMENT_SHADER)),
+            (('0001_0000.vertex', '0003_0000.vertex'), ('0002_0000.fragment', '0003_0000.fragment')))
+        pruning = ShaderPruning(directory, processes=1)
+        self.assertEqual(pruning.savings.loc['0003_0000', 'uniform_components'], 29)
+        report = pruning.report()
+        self.assertEqual(report['prunable_programs'], 1)
+        self.assertEqual(report['varyings'], 1)
+        # a shader ending in the middle of its body is logged as unparsed
+        truncated = os.path.join(directory, '0009_0000.fragment')
+        with open(truncated, 'w') as f:
+            f.write(self.FRAGMENT_SHADER[:-1])
+        self.assertTrue(program_savings((os.path.join(directory, '0001_0000.vertex'), truncated)) is None)
+
+class TestShaderFolding(unittest.TestCase):
+
+    FRAGMENT_SHADER = '''precision mediump float;
+const float k = 2.0 * 0.5;
+uniform vec4 u_color;
+void main()
+{
+    vec4 c = 2.0 * 0.5 * u_color;
+    float a = 1.0 / 3.0 + 0.0;
+    int i = 7 / 2 - 10;
+    float m = 2.0 * 3;
+    if (false)
+        discard;
+    gl_FragColor = c * -(-a) - (2.0 - 3.0);
+}'''
+
+    def fold(self, expression, header=''):
+        import ShaderFolding, ShaderVisitor
+        parser = ShaderParser()
+        parser.parse(header + 'void main() { x = %s; }' % expression)
+        ShaderFolding.fold(parser)
+        return ShaderVisitor.to_source(parser.function_definitions['main'].compound_statements[0].right)
+
+    def test_fold(self):
+        self.assertEqual(self.fold('2.0 * 0.5 * x'), 'x')
+        self.assertEqual(self.fold('x * (3.0 - 1.0)'), 'x * 2.0')
+        self.assertEqual(self.fold('0.1 + 0.2'), '0.3')
+        self.assertEqual(self.fold('1.0 - 3.0'), '-2.0')
+        self.assertEqual(self.fold('-7 / 2'), '-3')
+        # int results stay within the range highp ints are guaranteed
+        self.assertEqual(self.fold('30000 + 30000'), '60000')
+        self.assertEqual(self.fold('60000 + 10000'), '60000 + 10000')
+        self.assertEqual(self.fold('60000 + 10000', '#version 300 es\n'), '70000')
+        self.assertEqual(self.fold('2147483647 + 1', '#version 300 es\n'), '2147483647 + 1')
+        self.assertEqual(self.fold('-(-2147483647 - 1)', '#version 300 es\n'), '-(-2147483647 - 1)')
+        self.assertEqual(self.fold('1 == 1'), 'true')
+        # ints and floats do not mix, no division by zero
+        self.assertEqual(self.fold('2 * 0.5'), '2 * 0.5')
+        self.assertEqual(self.fold('1.0 / 0.0'), '1.0 / 0.0')
+        self.assertEqual(self.fold('-(-x)'), '-(-x)')
+        # an octal int is not folded, nor taken for a float
+        self.assertEqual(self.fold('010 + 1.0'), '010 + 1.0')
+        self.assertEqual(self.fold('1e2 + 1.0'), '101.0')
+
+    def test_folded_source(self):
+        import ShaderFolding
+        parser = ShaderParser()
+        parser.parse(self.FRAGMENT_SHADER)
+        source, folds = ShaderFolding.folded_source(parser)
+        self.assertEqual(folds, 9)
+        self.assertTrue('const mediump float k = 1.0;' in source)
+        self.assertTrue('vec4 c = u_color;' in source)
+        self.assertTrue('float a = 0.33333334;' in source)
+        self.assertTrue('int i = -7;' in source)
+        self.assertTrue('float m = 2.0 * 3;' in source)
+        self.assertTrue('gl_FragColor = (c * -(-a)) - -1.0;' in source)
+        self.assertFalse('discard' in source)
+        # the parser is left untouched
+        self.assertEqual(len(parser.function_definitions['main'].compound_statements), 6)
+
+        folded = ShaderParser()
+        folded.parse(source)
+        self.assertEqual(ShaderFolding.fold(folded), 0)
+
+class TestShaderLint(ShaderCorpusTestCase):
+
+    FRAGMENT_SHADER = '''precision mediump float;
+uniform sampler2D u_tex;
+uniform sampler2D u_noise;
+uniform mat4 u_matrix;
+uniform vec4 u_light;
+varying vec2 v_uv;
+varying vec4 v_position;
+void main()
+{
+    vec4 base = texture2D(u_tex, v_uv);
+    vec2 offset = texture2D(u_noise, v_uv * 2.0).xy;
+    vec4 again = texture2D(u_tex, v_uv);
+    vec4 moved = texture2D(u_tex, v_uv + offset);
+    vec4 world = u_matrix * v_position;
+    float d = v_position.z;
+    if (d > 0.5)
+        discard;
+    if (u_light.w > 0.5)
+        base = base * 0.5;
+    gl_FragColor = base + again + moved + world;
+}'''
+
+    def lint(self, source, **kwargs):
+        import ShaderLint
+        parser = ShaderParser()
+        parser.parse(source)
+        return [(finding['rule'], finding['source']) for finding in ShaderLint.lint(parser, **kwargs)]
+
+    def test_rules(self):
+        self.assertEqual(sorted(self.lint(self.FRAGMENT_SHADER)), [
+            ('branch-on-varying', 'd > 0.5'),
+            ('dependent-texture-read', 'texture2D(u_noise, v_uv * 2.0)'),
+            ('dependent-texture-read', 'texture2D(u_tex, v_uv + offset)'),
+            ('discard-in-opaque-pass', 'discard;'),
+            ('hoistable-matrix-math', 'u_matrix * v_position'),
+            ('repeated-texture-sample', 'texture2D(u_tex, v_uv)'),
+        ])
+        self.assertEqual(self.lint(self.FRAGMENT_SHADER, rules=['discard-in-opaque-pass'], opaque=False), [])
+
+    def test_per_fragment_matrix_math(self):
+        source = '''precision mediump float;
+uniform mat4 u_m;
+uniform vec4 u_v;
+varying vec4 v_position;
+void main()
+{
+    gl_FragColor = u_m * gl_FragCoord + u_m * vec4(gl_PointCoord, 0.0, 1.0) + u_m * dFdx(v_position)
+        + u_m * vec4(v_position.xyz * 2.0, 1.0) + u_m * u_v;
+}'''
+        self.assertEqual(self.lint(source, rules=['hoistable-matrix-math']), [
+            ('hoistable-matrix-math', 'u_m * vec4(v_position.xyz * 2.0, 1.0)'),
+            ('hoistable-matrix-math', 'u_m * u_v')])
+
+    def test_nonlinear_matrix_math(self):
+        # products of varyings differ once interpolated
+        source = '''precision mediump float;
+uniform mat4 u_m;
+uniform vec4 u_v;
+varying vec4 v_a;
+varying vec4 v_b;
+void main()
+{
+    gl_FragColor = u_m * (v_a * v_b) + u_m * (u_v / v_a.x) + u_m * vec4(v_a.xy * v_b.zw, 0.0, 1.0)
+        + u_m * (v_a * 2.0 - v_b / 2.0);
+}'''
+        self.assertEqual(self.lint(source, rules=['hoistable-matrix-math']), [
+            ('hoistable-matrix-math', 'u_m * ((v_a * 2.0) - (v_b / 2.0))')])
+
+    def test_register(self):
+        import ShaderLint
+
+        @ShaderLint.rule
+        class CountNodes(ShaderLint.Rule):
+            name = 'count-nodes'
+            visits = []
+
+            def pre_any(self, node):
+                CountNodes.visits.append(node)
+
+            def finish(self):
+                self.report(self.linter.parser.function_definitions['main'], '%d nodes' % len(self.visits))
+
+        try:
+            self.assertEqual(len(self.lint(self.FRAGMENT_SHADER, rules=['count-nodes'])), 1)
+            # every node is visited once, whatever the number of rules
+            visits = len(CountNodes.visits)
+            del CountNodes.visits[:]
+            self.lint(self.FRAGMENT_SHADER)
+            self.assertEqual(len(CountNodes.visits), visits)
+        finally:
+            del ShaderLint.RULES['count-nodes']
+
+    def test_linting(self):
+        import io, json
+        from Tools.ShaderLinting import ShaderLinting, shader_findings
+        directory = self.make_corpus((('0001_0000.vertex', TestShaderIndex.VERTEX_SHADER), ('0002_0000.fragment', self.FRAGMENT_SHADER)))
+        linting = ShaderLinting(directory, processes=1)
+        self.assertEqual(len(linting.findings), 6)
+        self.assertEqual(linting.counts().loc['dependent-texture-read', 'findings'], 2)
+        self.assertEqual(linting.counts().loc['dependent-texture-read', 'shaders'], 1)
+        stream = io.StringIO()
+        linting.write(stream)
+        finding = json.loads(stream.getvalue().splitlines()[0])
+        self.assertEqual(finding['shader'], '0002_0000.fragment')
+        # a shader ending in the middle of its body is logged as unparsed
+        truncated = os.path.join(directory, '0009_0000.fragment')
+        with open(truncated, 'w') as f:
+            f.write(self.FRAGMENT_SHADER[:-1])
+        self.assertEqual(shader_findings((truncated, None)), [])
+
+class TestShaderMinifier(unittest.TestCase):
+
+    FRAGMENT_SHADER = '''precision mediump float;
+uniform sampler2D u_tex;
+uniform vec4 u_color;
+varying vec2 v_uv;
+const float scale = .5;
+vec4 shade(vec4 color, float amount)
+{
+    vec4 result = color * (amount + 1.);
+    if (amount > 0.)
+        if (amount < 1.)
+            result = result - -color;
+        else
+            discard;
+    return result / (amount - (1. - amount));
+}
+void main()
+{
+    vec4 texel = texture2D(u_tex, v_uv);
+    float a = (texel.a * scale);
+    bool b = a < .5 && texel.r > .1 || a == 0.;
+    gl_FragColor = shade(texel, a) * u_color + (-texel).xyzw;
+}'''
+
+    def minify(self, source, fragment_shader=True, **kwargs):
+        import ShaderMinifier
+        parser = ShaderParser()
+        parser.parse(source, fragment_shader=fragment_shader)
+        minified = ShaderMinifier.minify(parser, fragment_shader, **kwargs)
+        reparsed = ShaderParser()
+        reparsed.parse(minified, fragment_shader=fragment_shader)
+        return parser, minified, reparsed
+
+    def test_minify(self):
+        import ShaderFingerprint
+        parser, minified, reparsed = self.minify(self.FRAGMENT_SHADER)
+        self.assertEqual(ShaderFingerprint.fingerprint(parser), ShaderFingerprint.fingerprint(reparsed))
+        self.assertLess(len(minified), len(self.FRAGMENT_SHADER) * 2 // 3)
+        self.assertNotIn('\n', minified)
+        for name in ('u_tex', 'u_color', 'v_uv', 'main', 'gl_FragColor', 'texture2D'):
+            self.assertIn(name, minified)
+        for name in ('scale', 'shade', 'amount', 'result', 'texel'):
+            self.assertNotIn(name, minified)
+        self.assertIn('=c<.5&&b.r>.1||c==0.;', minified)
+        self.assertIn('if(a>0.)if(a<1.)d=d- -e;else discard;return d/(a-(1.-a));', minified)
+
+        # the else of the outer if keeps its braces
+        parser, minified, reparsed = self.minify('void main() { if (x) { if (y) z = 1.; } else z = 2.; }', rename=False)
+        self.assertEqual(minified, 'void main(){if(x){if(y)z=1.;}else z=2.;}')
+
+        parser, minified, reparsed = self.minify(self.FRAGMENT_SHADER, rename=False)
+        self.assertIn('vec4 shade(vec4 color,float amount)', minified)
+
+    def test_vertex_shader(self):
+        source = '''#version 300 es
+in vec4 a_position;
+uniform mat4 u_matrix;
+out vec2 v_uv;
+void main() { vec4 p = u_matrix * a_position; v_uv = p.xy * 0.50 + 0.5; gl_Position = p; }'''
+        parser, minified, reparsed = self.minify(source, fragment_shader=False)
+        self.assertEqual(reparsed.version, 300)
+        self.assertEqual(minified, '#version 300 es\nin vec4 a_position;uniform mat4 u_matrix;out vec2 v_uv;'
+            'void main(){vec4 a=u_matrix*a_position;v_uv=a.xy*.5+.5;gl_Position=a;}')
+
+    def test_precision_statements(self):
+        source = '''precision highp float;
+uniform float u_scale;
+float big(float x) { float y = x * u_scale; return y; }
+precision mediump float;
+void main() { float c = 0.5; gl_FragColor = vec4(big(c)); }'''
+        parser, minified, reparsed = self.minify(source)
+        # big keeps its highp parameter, local and return value
+        self.assertEqual([precisions['float'] for precisions in reparsed.function_precision_qualifiers.values()], ['highp', 'mediump'])
+        self.assertTrue(minified.startswith('precision mediump float;uniform highp float u_scale;precision highp float;'))
+
+    def test_short_float(self):
+        from ShaderMinifier import short_float
+        self.assertEqual([short_float(text) for text in ('0.50', '1.0', '0.0', '10.250', '1e3', 'x')],
+            ['.5', '1.', '0.', '10.25', '1e3', 'x'])
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_disabled(self):
+        import Instrumentation
+        self.assertEqual(Instrumentation.profiler, None)
+        self.assertTrue(Instrumentation.phase('anything') is Instrumentation.NULL_MEASUREMENT)
+        self.assertEqual(len(Instrumentation._original_methods), 0)
+
+    def test_report(self):
+        import Instrumentation
+        from Tools.TextureCollector import TextureCollector
+
+        original_bind_texture = GLES.glBindTexture
+        with Instrumentation.profiling() as profiler:
+            gles = GLES()
+            gles.glBindTexture(Enum.GL_TEXTURE_2D, 1)
+            gles.glBindTexture(Enum.GL_TEXTURE_2D, 2)
+            TextureCollector().collect(gles)
+            ShaderParser().parse('varying vec2 texcoord;')
+        self.assertTrue(GLES.glBindTexture is original_bind_texture)
+
+        report = profiler.report()
+        self.assertEqual(report['Context']['Context.glBindTexture']['count'], 2)
+        self.assertEqual(report['TextureCollector']['TextureCollector.collect']['count'], 1)
+        for phase in ('preprocess', 'lex', 'parse', 'post-processing'):
+            self.assertTrue('ShaderParser.' + phase in report['ShaderParser'])
+        parse = report['ShaderParser']['ShaderParser.parse']
+        lex = report['ShaderParser']['ShaderParser.lex']
+        self.assertTrue(lex['count'] > 1)
+        self.assertAlmostEqual(parse['seconds'] - parse['self_seconds'], lex['seconds'])
+
 class TestShaderUtility(unittest.TestCase):
 
     def test_gles_cgc_compilable(self):
@@ -1215,6 +2359,49 @@ class TestShaderUtility(unittest.TestCase):
             expected_output = CGC_COMPILIBILITY_OUTPUT[index]
             self.assertEqual(ConvertESSLToCGCCompilable(input), expected_output)
 
+    def test_rewrite_pipeline(self):
+        from ShaderUtility import RewritePipeline, RewriteRule, VersionRule
+        pipeline = RewritePipeline([
+            VersionRule({300 : '#version 310 es'}),
+            RewriteRule('precision', r'\b(lowp|mediump)\b', 'highp'),
+            RewriteRule('swizzle', r'\.(\w+)\b', lambda match : '.' + match.group()[:0:-1]),
+        ])
+        self.assertEqual(pipeline.rewrite('#version 300 es\nlowp vec4 a = b.xy;\n#version 300 es'),
+            '#version 310 es\nhighp vec4 a = b.yx;\n#version 300 es')
+        self.assertEqual(pipeline.rewrite('#version 100 es\nmediump float a;'), '#version 100 es\nhighp float a;')
+
+        # the lambda can not be sent to worker processes, the files are rewritten in this one
+        import tempfile, shutil
+        input_dir, output_dir = tempfile.mkdtemp(), tempfile.mkdtemp()
+        try:
+            for name in ('a.vertex', 'b.vertex'):
+                with open(os.path.join(input_dir, name), 'w') as f:
+                    f.write('lowp vec2 a = b.xy;')
+            self.assertEqual(pipeline.rewrite_directory(input_dir, output_dir, processes=2), 2)
+            with open(os.path.join(output_dir, 'b.vertex')) as f:
+                self.assertEqual(f.read(), 'highp vec2 a = b.yx;')
+        finally:
+            shutil.rmtree(input_dir)
+            shutil.rmtree(output_dir)
+
+    def test_convert_directory(self):
+        import tempfile, shutil
+        from ShaderUtility import ConvertDirectoryToCGCCompilable, ConvertESSLToCGCCompilable
+        input_dir, output_dir = tempfile.mkdtemp(), tempfile.mkdtemp()
+        try:
+            for index, source in enumerate(CGC_COMPILIBILITY_INPUT * 2):
+                with open(os.path.join(input_dir, '%d.fragment' % index), 'w') as f:
+                    f.write(source)
+            os.symlink('0.fragment', os.path.join(input_dir, 'program.fragment'))
+            self.assertEqual(ConvertDirectoryToCGCCompilable(input_dir, output_dir, '*.fragment', processes=2), 4)
+            for index, expected_output in enumerate(CGC_COMPILIBILITY_OUTPUT * 2):
+                with open(os.path.join(output_dir, '%d.fragment' % index)) as f:
+                    self.assertEqual(f.read(), expected_output)
+            self.assertEqual(os.readlink(os.path.join(output_dir, 'program.fragment')), '0.fragment')
+        finally:
+            shutil.rmtree(input_dir)
+            shutil.rmtree(output_dir)
+
 if __name__ == '__main__':
     import logging
     logging.basicConfig(level=logging.INFO)